@@ -48,10 +48,12 @@ a = Analysis(
         'psm.cli',
         'psm.cli.helpers',
         'psm.cli.core',
+        'psm.cli.embedded',
         'psm.cli.__init__',
         'psm.cli.analyze_cmds',
         'psm.cli.config_cmds',
         'psm.cli.diagnose_cmds',
+        'psm.cli.device_cmds',
         'psm.cli.export_cmds',
         'psm.cli.match_cmds',
         'psm.cli.oauth_cmds',
@@ -60,6 +62,10 @@ a = Analysis(
         'psm.cli.provider_cmds',
         'psm.cli.report_cmds',
         'psm.cli.scan_cmds',
+        'psm.cli.serve_cmds',
+        'psm.daemon',
+        'psm.daemon.client',
+        'psm.daemon.server',
         'psm.auth',
         'psm.db',
         'psm.export',
@@ -69,6 +75,12 @@ a = Analysis(
         'psm.push',
         'psm.reporting',
         'psm.services',
+        'psm.services.analysis_service',
+        'psm.services.device_sync_service',
+        'psm.services.export_service',
+        'psm.services.match_service',
+        'psm.services.playlist_service',
+        'psm.services.pull_service',
         'psm.utils',
         'psm.utils.first_run',
         '_ctypes',
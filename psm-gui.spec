@@ -65,6 +65,21 @@ a = Analysis(
         'psm.gui.utils',
         'psm.gui.views',
         'psm.gui.controllers',
+        'psm.gui.inprocess',
+        # In-process commands load CLI subcommands lazily (psm.cli.helpers.LAZY_COMMANDS)
+        'psm.cli',
+        'psm.cli.core',
+        'psm.cli.embedded',
+        'psm.cli.analyze_cmds',
+        'psm.cli.config_cmds',
+        'psm.cli.diagnose_cmds',
+        'psm.cli.device_cmds',
+        'psm.cli.export_cmds',
+        'psm.cli.match_cmds',
+        'psm.cli.playlist_cmds',
+        'psm.cli.report_cmds',
+        'psm.cli.scan_cmds',
+        'psm.daemon',
         'psm.auth',
         'psm.db',
         'psm.export',
@@ -74,6 +89,11 @@ a = Analysis(
         'psm.push',
         'psm.reporting',
         'psm.services',
+        'psm.services.analysis_service',
+        'psm.services.device_sync_service',
+        'psm.services.export_service',
+        'psm.services.match_service',
+        'psm.services.playlist_service',
         'psm.utils',
         'tkinter',
         'tkinter.ttk',
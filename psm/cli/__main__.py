@@ -19,6 +19,14 @@ if __name__ == "__main__":  # pragma: no cover (invocation driven)
         if hasattr(sys.stderr, "reconfigure"):
             sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
+    # Opt-in: hand the command to a running `psm serve` daemon (skips the heavy imports below)
+    if os.environ.get("PSM_USE_DAEMON"):
+        from psm.daemon import forward_to_daemon
+
+        exit_code = forward_to_daemon(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
     # Use absolute import for PyInstaller compatibility
     from psm.cli import cli
 
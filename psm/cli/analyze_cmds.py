@@ -6,8 +6,6 @@ import logging
 from pathlib import Path
 
 from .helpers import cli, get_db
-from ..services.analysis_service import analyze_library_quality, print_quality_report
-from ..reporting.generator import write_analysis_quality_reports, write_index_page
 
 logger = logging.getLogger(__name__)
 
@@ -16,14 +14,21 @@ logger = logging.getLogger(__name__)
 @click.option("--min-bitrate", type=int, help="Minimum acceptable bitrate in kbps (overrides config)")
 @click.option("--max-issues", type=int, default=50, help="Max number of detailed issues to show")
 @click.option("--top-offenders", type=int, default=10, help="Number of top offenders to show per category")
+@click.option("--duplicates", is_flag=True, help="Also list files with identical content (hashes same-size files)")
 @click.pass_context
-def analyze(ctx: click.Context, min_bitrate: int | None, max_issues: int, top_offenders: int):
+def analyze(ctx: click.Context, min_bitrate: int | None, max_issues: int, top_offenders: int, duplicates: bool):
     """Analyze local library quality (missing tags, low bitrate).
 
     Automatically generates detailed reports:
     - metadata_quality.csv: All files with quality issues
     - metadata_quality.html: Sortable HTML table
+
+    With --duplicates, files sharing a size are partially hashed (once; the
+    hash is stored) and groups with identical content are listed.
     """
+    from ..services.analysis_service import analyze_library_quality, print_quality_report
+    from ..reporting.generator import write_analysis_quality_reports, write_index_page
+
     cfg = ctx.obj
     if min_bitrate is None:
         min_bitrate = cfg.get("library", {}).get("min_bitrate_kbps", 320)
@@ -46,5 +51,29 @@ def analyze(ctx: click.Context, min_bitrate: int | None, max_issues: int, top_of
             logger.info("")
             logger.info("✓ No quality issues found - library metadata is excellent!")
 
+        if duplicates:
+            _print_duplicates(db, cfg)
+
+
+def _print_duplicates(db, cfg) -> None:
+    """List groups of library files with identical content, with hash latency."""
+    from ..ingest.library import find_duplicate_files
+    from ..utils.latency import PhaseTimings
+
+    timings = PhaseTimings()
+    groups = find_duplicate_files(db, cfg.get("library", {}).get("hash_algorithm"), timings)
+    logger.info("")
+    if not groups:
+        logger.info("✓ No duplicate files found")
+    else:
+        extra = sum(len(group) - 1 for group in groups)
+        logger.info(f"Duplicate files: {len(groups)} group(s), {extra} redundant cop{'y' if extra == 1 else 'ies'}")
+        for group in groups:
+            logger.info(f"  • {group[0]}")
+            for path in group[1:]:
+                logger.info(f"    = {path}")
+    for line in timings.summary_lines():
+        logger.info(f"  {line}")
+
 
 __all__ = ["analyze"]
@@ -10,6 +10,10 @@ Command modules are organized by functionality:
 - analyze_cmds: Library analysis
 - export_cmds: Playlist export
 - diagnose_cmds: Track matching diagnostics
+- serve_cmds: Persistent daemon (psm serve)
+
+Each module is imported the first time one of its commands is looked up (see
+helpers.LAZY_COMMANDS), so `psm <cmd>` only pays for the imports <cmd> needs.
 """
 
 from __future__ import annotations
@@ -18,17 +22,6 @@ import logging
 
 from .helpers import cli, get_db
 
-# Import command modules to register commands with cli group
-from . import report_cmds
-from . import provider_cmds
-from . import scan_cmds
-from . import match_cmds
-from . import export_cmds
-from . import analyze_cmds
-from . import diagnose_cmds
-from . import config_cmds
-from . import oauth_cmds
-
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +59,8 @@ def build(ctx: click.Context, no_report: bool, no_export: bool, watch: bool, deb
         return
 
     # Normal build mode (non-watch): Run full pipeline
+    from . import export_cmds, match_cmds, provider_cmds, report_cmds, scan_cmds
+
     ctx.invoke(provider_cmds.pull)
     ctx.invoke(
         scan_cmds.scan, since=None, deep=True, paths=(), watch=False, debounce=2.0
@@ -0,0 +1,84 @@
+"""Device sync command."""
+
+from __future__ import annotations
+import click
+from pathlib import Path
+
+from .helpers import cli, get_db
+
+
+@cli.command(name="sync-device")
+@click.option(
+    "--target",
+    required=True,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Device directory (player or SD card mount point)",
+)
+@click.option("--playlist", "playlist_ids", multiple=True, help="Playlist ID to sync (repeatable; default: all)")
+@click.option(
+    "--liked/--no-liked",
+    default=None,
+    help="Include Liked Songs (default: export.include_liked_songs, off when --playlist is given)",
+)
+@click.option("--workers", type=click.IntRange(min=1), default=4, show_default=True, help="Parallel copy workers")
+@click.option("--bwlimit", type=click.FloatRange(min=0, min_open=True), default=None, help="Cap copy throughput (MB/s)")
+@click.option("--keep-orphans", is_flag=True, help="Keep files psm copied earlier that no synced playlist references")
+@click.pass_context
+def sync_device(
+    ctx: click.Context,
+    target: Path,
+    playlist_ids: tuple[str, ...],
+    liked: bool | None,
+    workers: int,
+    bwlimit: float | None,
+    keep_orphans: bool,
+):
+    """Copy matched audio files of playlists to a device and write M3Us for it.
+
+    Files go to TARGET/Music (laid out below their library root), playlists to
+    TARGET/Playlists with paths relative to the copies. Files whose size and
+    modification time already match are skipped, so repeated syncs only copy
+    what changed. Files and playlists psm copied earlier that no synced
+    playlist references any more are removed unless --keep-orphans; anything
+    else on the device is never touched. --playlist leaves other playlists
+    synced earlier in place.
+
+    \b
+    Examples:
+        psm sync-device --target /media/SDCARD
+        psm sync-device --target E:\\ --playlist 37i9dQZF1DXcBWIGoYBM5M --bwlimit 20
+    """
+    from ..services.device_sync_service import sync_device as run_sync
+    from ..utils import events
+    from ..utils.output import section_header, success
+
+    cfg = ctx.obj
+    if liked is None:
+        liked = not playlist_ids and cfg["export"].get("include_liked_songs", True)
+
+    click.echo(section_header(f"Syncing playlists to {target}"))
+    events.stage_start("Syncing device")
+    with get_db(cfg) as db:
+        result = run_sync(
+            db,
+            target,
+            library_paths=cfg.get("library", {}).get("paths", []),
+            playlist_ids=list(playlist_ids) or None,
+            liked_songs=liked,
+            workers=workers,
+            max_bandwidth=bwlimit * 1_000_000 if bwlimit else None,
+            delete_orphans=not keep_orphans,
+        )
+    events.stage_end("Syncing device")
+
+    click.echo(
+        f"Copied {result.files_copied} file(s), {result.bytes_copied / 1_000_000:.1f} MB "
+        f"in {result.copy_seconds:.1f}s ({result.throughput_mb_s:.1f} MB/s)"
+    )
+    click.echo(f"Unchanged: {result.files_unchanged}  Missing at source: {result.files_missing}")
+    if result.orphans_removed:
+        click.echo(f"Removed {len(result.orphans_removed)} orphaned file(s)")
+    click.echo(success(f"Synced {result.playlist_count} playlist(s) to {target}"))
+
+
+__all__ = ["sync_device"]
@@ -5,8 +5,6 @@ import click
 import logging
 
 from .helpers import cli, get_db
-from ..services.diagnostic_service import diagnose_track, format_diagnostic_output
-from ..utils.output import section_header
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +30,9 @@ def diagnose(ctx: click.Context, track_id: str, provider: str, top_n: int):
         psm diagnose 3n3Ppam7vgaVa1iaRUc9Lp
         psm diagnose --provider spotify --top-n 10 3n3Ppam7vgaVa1iaRUc9Lp
     """
+    from ..services.diagnostic_service import diagnose_track, format_diagnostic_output
+    from ..utils.output import section_header
+
     cfg = ctx.obj
 
     click.echo(section_header(f"Diagnosing Track: {track_id}"))
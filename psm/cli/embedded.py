@@ -0,0 +1,117 @@
+"""Run CLI commands inside a long-lived host process (`psm serve`, the GUI).
+
+Hosts call invoke_cli() instead of spawning `psm` subprocesses. Commands run
+through the regular click group, so behaviour and output match the CLI; the
+host supplies warm state (a MatchIndexPool) through the click context and
+captures output with LineSink.
+"""
+
+from __future__ import annotations
+import json
+import threading
+import traceback
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+import click
+
+from .helpers import EMBEDDED_META_KEY, MATCH_INDEX_META_KEY, cli
+from ..utils.cancellation import OperationCancelled
+
+if TYPE_CHECKING:
+    from ..services.match_service import WarmMatchIndex
+
+
+class LineSink:
+    """Text stream that hands complete lines to a callback (stands in for sys.stdout/stderr)."""
+
+    encoding = "utf-8"
+    errors = "replace"
+
+    def __init__(self, emit: Callable[[str], None]):
+        self._emit = emit
+        self._buffer = ""
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._buffer += text
+            *lines, self._buffer = self._buffer.split("\n")
+            for line in lines:
+                self._emit(line.rstrip("\r"))
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def close_partial(self) -> None:
+        """Emit a trailing line that never got its newline."""
+        with self._lock:
+            if self._buffer:
+                line, self._buffer = self._buffer, ""
+                self._emit(line)
+
+    def isatty(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return True
+
+
+class MatchIndexPool:
+    """WarmMatchIndex instances keyed by provider and matching settings (created on first use)."""
+
+    def __init__(self):
+        self._indexes: Dict[str, "WarmMatchIndex"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, cfg: Dict[str, Any]) -> "WarmMatchIndex":
+        from ..services.match_service import WarmMatchIndex
+
+        key = json.dumps([cfg.get("provider", "spotify"), cfg.get("matching", {})], sort_keys=True, default=str)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = WarmMatchIndex(cfg)
+            return index
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+
+def invoke_cli(args: List[str], obj: Dict[str, Any] | None = None, match_indexes: MatchIndexPool | None = None) -> int:
+    """Run a psm command line in this process and return its exit code.
+
+    Output goes to the current sys.stdout/sys.stderr. Errors are reported the
+    way the standalone CLI reports them. Client disconnects (BrokenPipeError,
+    ConnectionError) and OperationCancelled propagate to the host.
+
+    Args:
+        args: Command line without the program name
+        obj: Configuration dict; None loads .env/environment like a fresh CLI process
+        match_indexes: Warm match indexes offered to matching commands
+    """
+    try:
+        with cli.make_context("psm", list(args), obj=obj) as ctx:
+            ctx.meta[EMBEDDED_META_KEY] = True
+            if match_indexes is not None:
+                ctx.meta[MATCH_INDEX_META_KEY] = match_indexes.get
+            cli.invoke(ctx)
+        return 0
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except (BrokenPipeError, ConnectionError, OperationCancelled):
+        raise
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+__all__ = ["LineSink", "MatchIndexPool", "invoke_cli"]
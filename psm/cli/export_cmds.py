@@ -6,21 +6,44 @@ import logging
 from pathlib import Path
 
 from .helpers import cli, get_db
-from ..services.export_service import export_playlists
 
 logger = logging.getLogger(__name__)
 
 
 @cli.command()
+@click.option(
+    "--delta-since",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Also write a bundle of the playlists added, changed or removed since this manifest generation",
+)
+@click.option(
+    "--bundle",
+    "bundle_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Delta bundle file (default: psm-delta-<since>-<generation>.zip)",
+)
 @click.pass_context
-def export(ctx: click.Context):
-    """Export matched playlists to M3U files."""
+def export(ctx: click.Context, delta_since: int | None, bundle_path: Path | None):
+    """Export matched playlists to M3U files.
+
+    The export directory keeps a manifest (.psm-manifest.json) whose
+    generation increases with every export that changes something. Mirrors
+    that last synced at generation N can fetch only what changed with
+    --delta-since N: a zip holding delta.json and the added/changed M3Us.
+    """
+    from ..services.export_service import export_playlists
+    from ..utils import events
     from ..utils.output import section_header, success, warning, info
 
     cfg = ctx.obj
+    if delta_since is not None and not cfg["export"].get("manifest", True):
+        raise click.UsageError("--delta-since needs the export manifest (export.manifest is disabled)")
 
     # Print styled header for user experience
     click.echo(section_header("Exporting playlists to M3U"))
+    events.stage_start("Exporting playlists")
 
     organize_by_owner = cfg["export"].get("organize_by_owner", False)
     library_paths = cfg.get("library", {}).get("paths", [])
@@ -33,6 +56,7 @@ def export(ctx: click.Context):
             current_user_id=current_user_id,
             library_paths=library_paths,
         )
+    events.stage_end("Exporting playlists")
 
     # Handle obsolete files (if detected)
     if result.obsolete_files:
@@ -55,7 +79,26 @@ def export(ctx: click.Context):
         else:
             click.echo(info("Kept obsolete playlists"))
 
+    if delta_since is not None:
+        from ..export.manifest import ExportManifest, write_delta_bundle
+
+        export_dir = Path(cfg["export"]["directory"])
+        manifest = ExportManifest.load(export_dir)
+        bundle_path = bundle_path or Path(f"psm-delta-{delta_since}-{manifest.generation}.zip")
+        try:
+            delta = write_delta_bundle(export_dir, manifest, delta_since, bundle_path)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--delta-since")
+        click.echo(
+            info(
+                f"Delta bundle {bundle_path}: {len(delta['added'])} added, {len(delta['changed'])} changed, "
+                f"{len(delta['removed'])} removed (generation {delta_since} -> {delta['generation']})"
+            )
+        )
+
     # Service already logs the summary, no need to repeat here
+    if result.manifest_generation is not None:
+        click.echo(info(f"Manifest generation: {result.manifest_generation}"))
     click.echo(success("Export complete"))
 
 
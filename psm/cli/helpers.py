@@ -2,13 +2,58 @@ from __future__ import annotations
 import os
 import click
 import copy
+import importlib
+from typing import Dict, List
 from ..config import load_typed_config
+from ..utils import events
 from ..version import __version__
-from ..providers import get_provider_instance
 
 # Import shared utilities (also used by GUI)
 from .shared import get_db
 
+# Subcommand name -> module (in this package) whose decorators register it.
+# Modules are imported on first use, so `psm config` never loads matching, tag
+# reading or provider HTTP code. Keep in sync when adding commands
+# (tests/unit/test_cli_lazy.py checks it).
+LAZY_COMMANDS: Dict[str, str] = {
+    "analyze": "analyze_cmds",
+    "build": "core",
+    "config": "config_cmds",
+    "diagnose": "diagnose_cmds",
+    "export": "export_cmds",
+    "gui": "core",
+    "login": "provider_cmds",
+    "match": "match_cmds",
+    "playlist": "playlist_cmds",
+    "playlists": "playlists",
+    "providers": "provider_cmds",
+    "pull": "provider_cmds",
+    "redirect-uri": "oauth_cmds",
+    "remove-match": "match_cmds",
+    "report": "report_cmds",
+    "scan": "scan_cmds",
+    "serve": "serve_cmds",
+    "set-match": "match_cmds",
+    "sync-device": "device_cmds",
+    "token-info": "oauth_cmds",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when the subcommand is resolved."""
+
+    def __init__(self, *args, lazy_commands: Dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            importlib.import_module(f"{__package__}.{self.lazy_commands[cmd_name]}")
+        return super().get_command(ctx, cmd_name)
+
 
 def check_first_run() -> bool:
     """Check for first run and handle .env creation.
@@ -59,7 +104,7 @@ def _redact_spotify_config(cfg: dict) -> dict:
     return result
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name="playlist-sync-matcher")
 @click.option(
     "--config-file",
@@ -69,8 +114,21 @@ def _redact_spotify_config(cfg: dict) -> dict:
 )
 @click.option("--progress/--no-progress", default=None, help="Enable/disable progress logging (overrides config)")
 @click.option("--progress-interval", type=int, default=None, help="Log progress every N items (overrides config)")
+@click.option(
+    "--events",
+    "events_format",
+    type=click.Choice(["json"]),
+    default=None,
+    help="Also emit JSON-lines progress events on the fd in PSM_EVENTS_FD (default: stderr)",
+)
 @click.pass_context
-def cli(ctx: click.Context, config_file: str | None, progress: bool | None, progress_interval: int | None):
+def cli(
+    ctx: click.Context,
+    config_file: str | None,
+    progress: bool | None,
+    progress_interval: int | None,
+    events_format: str | None,
+):
     """Spotify-to-local music library synchronization tool.
 
     \b
@@ -86,6 +144,7 @@ def cli(ctx: click.Context, config_file: str | None, progress: bool | None, prog
       psm pull         # Download playlists from Spotify
       psm match        # Match tracks to local files
       psm export       # Generate M3U playlist files
+      psm sync-device --target /media/SDCARD  # Copy files + M3Us to a player
 
     \b
     Single Playlist Workflow:
@@ -111,8 +170,9 @@ def cli(ctx: click.Context, config_file: str | None, progress: bool | None, prog
     You can run pull, scan, and match simultaneously in different terminals.
     """
     # Check for first run and offer to create .env
-    # Only check if not running --version (which doesn't need config)
-    if ctx.invoked_subcommand is not None:
+    # Only check if not running --version (which doesn't need config), and never
+    # inside a host process (daemon, GUI), which has no terminal to prompt on
+    if ctx.invoked_subcommand is not None and not ctx.meta.get(EMBEDDED_META_KEY):
         if not check_first_run():
             ctx.exit(1)
 
@@ -127,6 +187,23 @@ def cli(ctx: click.Context, config_file: str | None, progress: bool | None, prog
     if progress_interval is not None:
         ctx.obj.setdefault("logging", {})["progress_interval"] = progress_interval
 
+    # Structured events for the GUI (the daemon installs its own emitter per command)
+    if events_format == "json" and not events.is_enabled():
+        events.enable_json_output()
+        ctx.call_on_close(events.disable)
+
+
+# ctx.meta key under which `psm serve` provides a warm match-index factory (cfg -> WarmMatchIndex)
+MATCH_INDEX_META_KEY = "psm.match_index"
+# ctx.meta flag set when a host process runs the command in-process (see embedded.invoke_cli)
+EMBEDDED_META_KEY = "psm.embedded"
+
+
+def get_match_index(ctx: click.Context, cfg: dict):
+    """Return the daemon's warm match index for cfg, or None when running as a one-shot CLI."""
+    factory = ctx.meta.get(MATCH_INDEX_META_KEY)
+    return factory(cfg) if factory is not None else None
+
 
 def build_auth(cfg):
     """Build authentication provider from config.
@@ -137,6 +214,8 @@ def build_auth(cfg):
     Returns:
         AuthProvider instance
     """
+    from ..providers import get_provider_instance
+
     provider_config = get_provider_config(cfg)
     provider = get_provider_instance("spotify")
     provider.validate_config(provider_config)
@@ -157,4 +236,16 @@ def get_token(cfg):
     return tok["access_token"]
 
 
-__all__ = ["cli", "get_db", "get_token", "build_auth", "get_provider_config", "_redact_spotify_config"]
+__all__ = [
+    "cli",
+    "get_db",
+    "get_token",
+    "build_auth",
+    "get_provider_config",
+    "get_match_index",
+    "MATCH_INDEX_META_KEY",
+    "EMBEDDED_META_KEY",
+    "LazyGroup",
+    "LAZY_COMMANDS",
+    "_redact_spotify_config",
+]
@@ -6,12 +6,8 @@ import logging
 from pathlib import Path
 import time
 
-from .helpers import cli, get_db
-from ..services.match_service import run_matching
-from ..reporting.generator import write_match_reports, write_index_page
-from ..ingest.library import extract_tags, normalize_library_path, partial_hash
-from ..utils.normalization import normalize_title_artist
-import mutagen
+from .helpers import cli, get_db, get_match_index
+from ..utils.fs import normalize_library_path
 import re
 
 logger = logging.getLogger(__name__)
@@ -72,6 +68,10 @@ def _ingest_file_to_library(db, path: Path, normalized_path: str, cfg: dict, ctx
     Raises:
         ctx.exit(1) on error
     """
+    import mutagen
+    from ..ingest.library import extract_tags
+    from ..utils.normalization import normalize_title_artist
+
     click.echo(f"File not in library, ingesting: {normalized_path}")
 
     # Get file stats
@@ -95,7 +95,6 @@ def _ingest_file_to_library(db, path: Path, normalized_path: str, cfg: dict, ctx
     year = _extract_year_from_tags(tags)
     duration = _extract_duration(audio)
     bitrate_kbps = _extract_bitrate(audio)
-    ph = partial_hash(path)
 
     # Build normalized string for matching
     use_year = cfg.get("matching", {}).get("use_year", False)
@@ -109,7 +108,7 @@ def _ingest_file_to_library(db, path: Path, normalized_path: str, cfg: dict, ctx
             "path": normalized_path,
             "size": st.st_size,
             "mtime": st.st_mtime,
-            "partial_hash": ph,
+            "partial_hash": None,  # Computed lazily (see ensure_partial_hashes)
             "title": title,
             "album": album,
             "artist": artist,
@@ -244,7 +243,7 @@ def match(ctx: click.Context, top_tracks: int, top_albums: int, full: bool, trac
                 click.echo(click.style("⚠ Track not found in database", fg="yellow"))
                 return
 
-            matched_count = match_changed_tracks(db, cfg, track_ids=[track_id])
+            matched_count = match_changed_tracks(db, cfg, track_ids=[track_id], index=get_match_index(ctx, cfg))
 
             if matched_count > 0:
                 click.echo(f"✓ Matched track {track_id}")
@@ -259,6 +258,12 @@ def match(ctx: click.Context, top_tracks: int, top_albums: int, full: bool, trac
     else:
         click.echo(click.style("=== Matching tracks to library files ===", fg="cyan", bold=True))
 
+    from ..services.match_service import run_matching
+    from ..reporting.generator import write_match_reports, write_index_page
+    from ..utils import events
+
+    events.stage_start("Matching tracks")
+
     # Use short-lived connection; avoid holding DB beyond required scope
     result = None
     with get_db(cfg) as db:
@@ -269,7 +274,9 @@ def match(ctx: click.Context, top_tracks: int, top_albums: int, full: bool, trac
             top_unmatched_tracks=top_tracks,
             top_unmatched_albums=top_albums,
             force_full=full,
+            index=get_match_index(ctx, cfg),
         )
+        events.stage_end("Matching tracks", result.duration_seconds)
 
         # Auto-generate match reports
         if result.matched > 0 or result.unmatched > 0:
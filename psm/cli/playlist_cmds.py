@@ -3,13 +3,6 @@ import click
 import logging
 from pathlib import Path
 from .helpers import get_db, cli, get_token, get_provider_config
-from ..services.playlist_service import (
-    pull_single_playlist,
-    match_single_playlist,
-    export_single_playlist,
-    build_single_playlist,
-)
-from ..services.push_service import push_playlist
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +19,8 @@ def playlist_group(ctx: click.Context):  # pragma: no cover - simple container
 @click.pass_context
 def playlist_pull(ctx: click.Context, playlist_id: str, force_auth: bool):
     """Pull and ingest a single playlist by ID."""
+    from ..services.playlist_service import pull_single_playlist
+
     cfg = ctx.obj
     provider_cfg = get_provider_config(cfg)
     if not provider_cfg.get("client_id"):
@@ -48,6 +43,8 @@ def playlist_pull(ctx: click.Context, playlist_id: str, force_auth: bool):
 @click.pass_context
 def playlist_match(ctx: click.Context, playlist_id: str):
     """Match tracks from a single playlist to local files."""
+    from ..services.playlist_service import match_single_playlist
+
     cfg = ctx.obj
     with get_db(cfg) as db:
         result = match_single_playlist(db=db, playlist_id=playlist_id, config=cfg)
@@ -61,6 +58,8 @@ def playlist_match(ctx: click.Context, playlist_id: str):
 @click.pass_context
 def playlist_export(ctx: click.Context, playlist_id: str):
     """Export a single playlist to M3U file."""
+    from ..services.playlist_service import export_single_playlist
+
     cfg = ctx.obj
     provider = cfg.get("provider", "spotify")
     organize_by_owner = cfg["export"].get("organize_by_owner", False)
@@ -87,6 +86,8 @@ def playlist_export(ctx: click.Context, playlist_id: str):
 @click.pass_context
 def playlist_build(ctx: click.Context, playlist_id: str, force_auth: bool):
     """Pull, match, and export a single playlist (complete pipeline)."""
+    from ..services.playlist_service import build_single_playlist
+
     cfg = ctx.obj
     provider_cfg = get_provider_config(cfg)
     if not provider_cfg.get("client_id"):
@@ -115,6 +116,8 @@ def playlist_build(ctx: click.Context, playlist_id: str, force_auth: bool):
 @click.pass_context
 def playlist_push(ctx: click.Context, playlist_id: str, file_path: Path | None, apply: bool):
     """Push local changes to update a remote playlist (Spotify only)."""
+    from ..services.push_service import push_playlist
+
     cfg = ctx.obj
     provider = cfg.get("provider", "spotify")
 
@@ -146,6 +149,9 @@ def playlist_push(ctx: click.Context, playlist_id: str, file_path: Path | None,
     click.echo(f"Changes -> positional:{preview.positional_changes} added:{preview.added} removed:{preview.removed}")
     if preview.unmatched_file_paths:
         click.echo(f"Unresolved file paths (skipped): {preview.unmatched_file_paths}")
+    if preview.changed:
+        how = "incremental edits" if preview.incremental else "full replace"
+        click.echo(f"API calls: {preview.api_calls} ({how})")
     click.echo(f"Changed: {'yes' if preview.changed else 'no'} | Applied: {'yes' if preview.applied else 'no'}")
 
 
@@ -6,8 +6,6 @@ import time
 import logging
 
 from .helpers import cli, get_db, build_auth, get_provider_config
-from ..services.pull_service import pull_data
-from ..providers import available_provider_instances, get_provider_instance
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +42,8 @@ def pull(ctx: click.Context, force_auth: bool, force_refresh: bool):
     Note: Currently only one provider can be configured at a time.
     Multi-provider support is planned for a future release.
     """
+    from ..services.pull_service import pull_data
+
     cfg = ctx.obj
 
     # Validate single provider configuration
@@ -70,11 +70,8 @@ def pull(ctx: click.Context, force_auth: bool, force_refresh: bool):
             force_refresh=force_refresh,
         )
 
-        # Store changed track IDs in metadata for incremental matching in watch mode
+        # Watch mode picks up the changed tracks from the change_log journal
         if result.changed_track_ids:
-            changed_ids_str = ",".join(result.changed_track_ids)
-            db.set_meta("last_pull_changed_tracks", changed_ids_str)
-            db.commit()
             click.echo(f"  → {len(result.changed_track_ids)} track(s) added/updated")
 
         # Set write signal for GUI auto-refresh
@@ -129,6 +126,8 @@ def providers_group(ctx: click.Context):  # pragma: no cover simple group
 @click.pass_context
 def providers_capabilities(ctx: click.Context):
     """List registered providers and their capabilities."""
+    from ..providers import available_provider_instances, get_provider_instance
+
     rows = []
     for p in available_provider_instances():
         get_provider_instance(p)
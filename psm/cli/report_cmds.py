@@ -6,7 +6,6 @@ import logging
 from pathlib import Path
 
 from .helpers import cli, get_db
-from ..reporting.generator import write_analysis_quality_reports, write_match_reports, write_index_page
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +35,7 @@ def report(ctx: click.Context, match_reports: bool, analysis_reports: bool, min_
     - Analysis Reports: metadata_quality (if library has been scanned)
     - index.html: Navigation dashboard for all reports
     """
+    from ..reporting.generator import write_analysis_quality_reports, write_match_reports, write_index_page
     from ..utils.output import section_header, success, error, warning, clickable_path, report_files, count_badge
 
     cfg = ctx.obj
@@ -5,7 +5,6 @@ import click
 import logging
 
 from .helpers import cli, get_db
-from ..ingest.library import scan_library, scan_library_incremental, parse_time_string, scan_specific_files
 
 logger = logging.getLogger(__name__)
 
@@ -15,13 +14,28 @@ logger = logging.getLogger(__name__)
     "--since", type=str, help='Only scan files modified since this time (e.g., "2 hours ago", "2025-10-08 10:00")'
 )
 @click.option("--deep", is_flag=True, help="Force full rescan of all library paths (default: smart incremental)")
+@click.option(
+    "--refresh-tags", is_flag=True, help="Re-parse tags instead of reusing the tag cache (the cache is refreshed)"
+)
 @click.option("--paths", multiple=True, help="Override config: scan only these specific paths")
 @click.option("--watch", is_flag=True, help="Watch library paths and continuously update DB on changes")
 @click.option(
     "--debounce", type=float, default=2.0, help="Seconds to wait after last change before processing (watch mode only)"
 )
+@click.option(
+    "--network", is_flag=True, help="High-latency filesystem mode (SMB/NFS): concurrent listing, stat and tag reads"
+)
 @click.pass_context
-def scan(ctx: click.Context, since: str | None, deep: bool, paths: tuple, watch: bool, debounce: float):
+def scan(
+    ctx: click.Context,
+    since: str | None,
+    deep: bool,
+    refresh_tags: bool,
+    paths: tuple,
+    watch: bool,
+    debounce: float,
+    network: bool,
+):
     """Scan local music library and index track metadata.
 
     Default mode: Smart incremental (only new/modified files)
@@ -31,6 +45,8 @@ def scan(ctx: click.Context, since: str | None, deep: bool, paths: tuple, watch:
     - --since "TIME": Only files modified after specified time
     - --paths PATH...: Scan only specific directories or files
     - --watch: Monitor filesystem and update DB automatically
+    - --network: Concurrent prefetching for network shares (library.network_mode)
+    - --refresh-tags: Re-parse tags, bypassing the tag cache (library.tag_cache_refresh)
 
     Examples:
       psm scan                              # Smart incremental (default)
@@ -39,8 +55,23 @@ def scan(ctx: click.Context, since: str | None, deep: bool, paths: tuple, watch:
       psm scan --paths ./newalbum/          # Scan specific directory
       psm scan --watch                      # Monitor and auto-update
       psm scan --watch --debounce 5         # Watch with 5s debounce
+      psm scan --deep --network             # Full rescan of an SMB/NFS library
+      psm scan --deep --refresh-tags        # Full rescan, re-reading every file's tags
     """
+    from ..ingest.library import (
+        scan_library,
+        scan_library_incremental,
+        parse_time_string,
+        scan_specific_files,
+        log_scan_timings,
+        apply_library_moves,
+    )
+
     cfg = ctx.obj
+    if network:
+        cfg["library"]["network_mode"] = True
+    if refresh_tags:
+        cfg["library"]["tag_cache_refresh"] = True
 
     # Watch mode - continuous monitoring
     if watch:
@@ -80,13 +111,52 @@ def scan(ctx: click.Context, since: str | None, deep: bool, paths: tuple, watch:
                 click.echo(warning(f"Error processing changes: {e}"), err=True)
                 logger.error(f"Watch mode error: {e}", exc_info=True)
 
+        def handle_storm(directories: list):
+            """Callback for event storms: rescan the affected directories as a whole."""
+            click.echo(info(f"Detected event storm; rescanning {len(directories)} director(ies)"))
+            try:
+                with get_db(cfg) as db:
+                    result = scan_library_incremental(db, cfg, specific_paths=directories)
+                    import time
+
+                    db.set_meta("last_scan_time", str(time.time()))
+                    db.set_meta("library_last_modified", str(time.time()))
+                click.echo(success(f"✓ {result.inserted} new, {result.updated} updated, {result.deleted} deleted"))
+            except Exception as e:
+                click.echo(warning(f"Error processing changes: {e}"), err=True)
+                logger.error(f"Watch mode error: {e}", exc_info=True)
+
+        def handle_moves(moves: list):
+            """Callback for renames/moves: update stored paths without re-parsing tags."""
+            try:
+                with get_db(cfg) as db:
+                    result = apply_library_moves(db, [(m.src, m.dest, m.is_directory) for m in moves])
+                    if result.unresolved:
+                        # Source was never indexed; scan the destination as a new file
+                        scan_specific_files(db, cfg, result.unresolved)
+                    import time
+
+                    db.set_meta("library_last_modified", str(time.time()))
+
+                if result.moved:
+                    click.echo(success(f"✓ {result.moved} moved"))
+            except Exception as e:
+                click.echo(warning(f"Error applying moves: {e}"), err=True)
+                logger.error(f"Watch mode error: {e}", exc_info=True)
+
         click.echo(info(f"Starting watch mode (debounce={debounce}s)..."))
         click.echo(info("Press Ctrl+C to stop"))
         click.echo("")
 
         watcher = None
         try:
-            watcher = LibraryWatcher(cfg, handle_changes, debounce_seconds=debounce)
+            watcher = LibraryWatcher(
+                cfg,
+                handle_changes,
+                debounce_seconds=debounce,
+                on_move_callback=handle_moves,
+                on_storm_callback=handle_storm,
+            )
             watcher.start()
 
             # Keep running until interrupted
@@ -174,6 +244,7 @@ def scan(ctx: click.Context, since: str | None, deep: bool, paths: tuple, watch:
             item_name="Library",
         )
         logger.info(summary)
+        log_scan_timings(result)
         if result.errors:
             logger.debug(f"Errors: {result.errors}")
     else:
@@ -0,0 +1,63 @@
+"""Daemon command: keep a warm psm process for the CLI and GUI."""
+
+from __future__ import annotations
+import click
+
+from .helpers import cli
+from ..daemon import find_daemon, state_path
+
+
+@cli.command()
+@click.option("--port", type=int, default=0, help="Localhost TCP port (default: any free port)")
+@click.option("--no-warm", is_flag=True, help="Skip preloading tracks and library files at startup")
+@click.option("--stop", is_flag=True, help="Stop the running daemon and exit")
+@click.pass_context
+def serve(ctx: click.Context, port: int, no_warm: bool, stop: bool):
+    """Run a persistent daemon that executes commands without per-command startup cost.
+
+    The daemon keeps imports and the match index (all tracks and library files)
+    in memory and listens on 127.0.0.1. The GUI uses it automatically while it
+    runs; the CLI forwards commands to it when PSM_USE_DAEMON=1 is set. Watch
+    mode, login and gui always run in their own process.
+
+    \b
+    Examples:
+        psm serve                          # Terminal 1
+        PSM_USE_DAEMON=1 psm match         # Terminal 2
+        psm serve --stop
+    """
+    cfg = ctx.obj
+
+    running = find_daemon(cfg)
+    if stop:
+        if running is None:
+            click.echo("No psm daemon running")
+            return
+        from ..daemon import DaemonClient
+
+        DaemonClient(running, timeout=5).shutdown()
+        click.echo(f"✓ Stopped psm daemon (pid {running.pid})")
+        return
+    if running is not None:
+        raise click.ClickException(f"psm daemon already running (pid {running.pid}, port {running.port})")
+
+    from ..daemon.server import PsmDaemon, install_log_handler
+
+    daemon = PsmDaemon(state_path(cfg), port=port)
+    if not no_warm:
+        elapsed = daemon.warm_up(cfg)
+        click.echo(f"✓ Match index loaded in {elapsed:.2f}s")
+    daemon.start()
+    click.echo(click.style(f"=== psm daemon listening on 127.0.0.1:{daemon.port} ===", fg="cyan", bold=True))
+    click.echo("Press Ctrl+C to stop.")
+
+    # Command output (including log records) is streamed to the requesting client
+    install_log_handler()
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    click.echo("✓ psm daemon stopped")
+
+
+__all__ = ["serve"]
@@ -39,6 +39,19 @@ _DEFAULTS: Dict[str, Any] = {
         "fast_scan": True,
         "commit_interval": 100,
         "min_bitrate_kbps": 320,
+        "fast_tags": True,  # Header-only MP3/FLAC tag reader (falls back to mutagen)
+        "hash_algorithm": "auto",  # Partial hash algorithm: auto|blake2b|sha1|xxh3|xxh64 (xxh* need xxhash)
+        "tag_cache": True,  # Sidecar tag cache reused across DB rebuilds
+        "tag_cache_path": None,  # Default: tag_cache.db next to the database file
+        "tag_cache_max_age_days": 90,  # Evict entries for files not seen for this long
+        "tag_cache_refresh": False,  # Ignore cached tags (re-parse) but refresh the cache; set by scan --refresh-tags
+        "watch_max_batch_seconds": 30.0,  # Watch mode: process a batch at least this often during sustained copies
+        "watch_max_pending": 10000,  # Watch mode: bound on distinct pending paths (excess events are dropped)
+        "watch_storm_threshold": 2000,  # Watch mode: batches larger than this are rescanned per directory
+        "parallel_roots": True,  # Scan multiple library.paths concurrently (one lane per root)
+        "network_mode": False,  # Concurrent prefetching scan for SMB/NFS shares
+        "min_concurrency": 4,  # Initial/minimum in-flight I/O operations per root (concurrent scans)
+        "max_concurrency": 32,  # Global cap on in-flight I/O operations across roots
     },
     "matching": {
         "fuzzy_threshold": 0.78,
@@ -65,6 +78,8 @@ _DEFAULTS: Dict[str, Any] = {
         "clean_before_export": False,  # Delete all .m3u files before export (safest but loses manual additions)
         "auto_overwrite": True,  # Automatically overwrite existing files (false = prompt if file is newer)
         "detect_obsolete": True,  # Detect playlists that exist on disk but not in database
+        "workers": 4,  # Playlists rendered and written in parallel (1 = serial)
+        "manifest": True,  # Keep .psm-manifest.json (hashes, generations) for delta bundles and obsolete detection
     },
     "reports": {"directory": "data/export/reports"},
     "database": {"path": "data/db/spotify_sync.db", "pragma_journal_mode": "WAL"},
@@ -40,6 +40,19 @@ class LibraryConfig:
     fast_scan: bool = True
     commit_interval: int = 100
     min_bitrate_kbps: int = 320
+    fast_tags: bool = True  # Header-only MP3/FLAC tag reader (falls back to mutagen)
+    hash_algorithm: str = "auto"  # Partial hash algorithm (auto picks xxh3 if available, else blake2b)
+    tag_cache: bool = True  # Sidecar tag cache reused across DB rebuilds
+    tag_cache_path: str | None = None  # Default: tag_cache.db next to the database file
+    tag_cache_max_age_days: float = 90  # Evict entries for files not seen for this long
+    tag_cache_refresh: bool = False  # Ignore cached tags (re-parse) but refresh the cache; set by scan --refresh-tags
+    watch_max_batch_seconds: float = 30.0  # Watch mode: process a batch at least this often during sustained copies
+    watch_max_pending: int = 10000  # Watch mode: bound on distinct pending paths (excess events are dropped)
+    watch_storm_threshold: int = 2000  # Watch mode: batches larger than this are rescanned per directory
+    parallel_roots: bool = True  # Scan multiple library.paths concurrently (one lane per root)
+    network_mode: bool = False  # Concurrent prefetching scan for SMB/NFS shares
+    min_concurrency: int = 4  # Initial/minimum in-flight I/O operations per root (concurrent scans)
+    max_concurrency: int = 32  # Global cap on in-flight I/O operations across roots
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for backward compatibility."""
@@ -101,6 +114,8 @@ class ExportConfig:
     clean_before_export: bool = False  # Delete all existing .m3u files before export
     auto_overwrite: bool = True  # Automatically overwrite existing files (false = prompt if newer)
     detect_obsolete: bool = True  # Detect and report/prompt about obsolete playlists
+    workers: int = 4  # Playlists rendered and written in parallel (1 = serial)
+    manifest: bool = True  # Keep .psm-manifest.json in the export directory (delta bundles)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for backward compatibility."""
@@ -0,0 +1,32 @@
+"""Persistent `psm serve` daemon and its client.
+
+The daemon keeps one warm Python process (imports, match indexes) and runs
+pipeline commands on behalf of the CLI and GUI over a token-protected
+localhost HTTP API, streaming command output back line by line.
+
+Only the client is imported here; it uses the standard library alone so the
+CLI/GUI can probe for a running daemon without paying for heavy imports. The
+server lives in :mod:`psm.daemon.server`.
+"""
+
+from .client import (
+    DAEMON_STATE_FILE,
+    DaemonClient,
+    DaemonInfo,
+    find_daemon,
+    forward_to_daemon,
+    psm_environ,
+    runs_locally,
+    state_path,
+)
+
+__all__ = [
+    "DAEMON_STATE_FILE",
+    "DaemonClient",
+    "DaemonInfo",
+    "find_daemon",
+    "forward_to_daemon",
+    "psm_environ",
+    "runs_locally",
+    "state_path",
+]
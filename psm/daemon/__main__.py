@@ -0,0 +1,18 @@
+"""Thin client entry point: `python -m psm.daemon <psm args>`.
+
+Runs the command in a running `psm serve` daemon without importing the CLI
+(click, matching, providers). Falls back to a normal in-process CLI run when
+no daemon is available or the command must run locally.
+"""
+
+import sys
+
+if __name__ == "__main__":  # pragma: no cover (invocation driven)
+    from psm.daemon import forward_to_daemon
+
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is None:
+        from psm.cli import cli
+
+        cli(args=sys.argv[1:], prog_name="psm")
+    sys.exit(exit_code)
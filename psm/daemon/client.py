@@ -0,0 +1,231 @@
+"""Client for the `psm serve` daemon.
+
+Protocol (localhost HTTP, every request carries ``Authorization: Bearer <token>``):
+
+- ``GET /status`` -> JSON daemon status
+- ``POST /run`` with ``{"args": [...], "cwd": "...", "env": {...}, "events": bool}`` ->
+  newline-delimited JSON events: ``{"event": "log", "line": "..."}`` per output line,
+  ``{"event": "progress", "data": {...}}`` per structured progress event (when
+  requested; see psm.utils.events), then ``{"event": "exit", "code": N}``. 409 when
+  another command is running.
+- ``POST /shutdown``
+
+The daemon publishes its port and token in a state file next to the database
+(``psm-daemon.json``, readable only by the owner).
+"""
+
+from __future__ import annotations
+import http.client
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+DAEMON_STATE_FILE = "psm-daemon.json"
+
+# Commands that must run in their own process: interactive, never-ending, or the daemon/GUI itself
+LOCAL_ONLY_COMMANDS = frozenset({"serve", "gui", "login"})
+# Root group options that take a value (skipped when locating the subcommand name)
+_GROUP_VALUE_OPTIONS = frozenset({"--config-file", "--progress-interval", "--events"})
+
+
+@dataclass
+class DaemonInfo:
+    """Connection details published by a running daemon."""
+
+    host: str
+    port: int
+    token: str
+    pid: int
+    version: str = ""
+
+
+def state_path(config: Dict[str, Any]) -> Path:
+    """Location of the daemon state file for the database configured in config."""
+    return Path(config["database"]["path"]).parent / DAEMON_STATE_FILE
+
+
+def runs_locally(args: Sequence[str]) -> bool:
+    """True if the command line must not be sent to the daemon (see LOCAL_ONLY_COMMANDS, --watch)."""
+    if "--watch" in args:
+        return True
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+        elif arg in _GROUP_VALUE_OPTIONS:
+            skip_value = True
+        elif not arg.startswith("-"):
+            return arg in LOCAL_ONLY_COMMANDS
+    return True  # No subcommand (--help, --version): nothing worth a round trip
+
+
+def psm_environ() -> Dict[str, str]:
+    """PSM* environment variables of this process, forwarded so the daemon sees the same config."""
+    return {key: value for key, value in os.environ.items() if key.startswith("PSM")}
+
+
+def find_daemon(config: Dict[str, Any] | None = None, timeout: float = 0.5) -> Optional[DaemonInfo]:
+    """Return the running daemon for config's database, or None.
+
+    A state file left behind by a daemon that died is ignored (status probe fails).
+    """
+    try:
+        if config is None:
+            from ..config import load_typed_config
+
+            config = load_typed_config().to_dict()
+        data = json.loads(state_path(config).read_text(encoding="utf-8"))
+        info = DaemonInfo(
+            host=data["host"],
+            port=int(data["port"]),
+            token=data["token"],
+            pid=int(data["pid"]),
+            version=data.get("version", ""),
+        )
+        DaemonClient(info, timeout=timeout).status()
+        return info
+    except Exception:
+        return None
+
+
+class DaemonClient:
+    """Talks to one daemon; run() streams a command's output through a callback."""
+
+    def __init__(self, info: DaemonInfo, timeout: float | None = None):
+        self.info = info
+        self.timeout = timeout
+        self._conn: http.client.HTTPConnection | None = None
+
+    def _request(self, method: str, path: str, body: Dict[str, Any] | None = None) -> http.client.HTTPResponse:
+        conn = http.client.HTTPConnection(self.info.host, self.info.port, timeout=self.timeout)
+        self._conn = conn
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Authorization": f"Bearer {self.info.token}"}
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+        conn.request(method, path, body=payload, headers=headers)
+        return conn.getresponse()
+
+    def _json(self, method: str, path: str) -> Dict[str, Any]:
+        try:
+            resp = self._request(method, path)
+            data = json.loads(resp.read().decode("utf-8") or "{}")
+            if resp.status != 200:
+                raise ConnectionError(f"daemon returned {resp.status}: {data.get('error', '')}")
+            return data
+        finally:
+            self.close()
+
+    def status(self) -> Dict[str, Any]:
+        return self._json("GET", "/status")
+
+    def shutdown(self) -> None:
+        self._json("POST", "/shutdown")
+
+    def run(
+        self,
+        args: List[str],
+        on_line: Callable[[str], None],
+        cwd: str | None = None,
+        env: Dict[str, str] | None = None,
+        on_event: Callable[[Dict[str, Any]], None] | None = None,
+    ) -> Optional[int]:
+        """Run a CLI command line in the daemon, calling on_line for each output line.
+
+        on_event, if given, receives each structured progress event (see psm.utils.events).
+
+        Returns:
+            The command's exit code, or None if the daemon is busy with another command
+
+        Raises:
+            ConnectionError: Connection lost before the command finished (daemon died,
+                or close() was called to cancel)
+        """
+        body = {
+            "args": list(args),
+            "cwd": cwd or os.getcwd(),
+            "env": psm_environ() if env is None else env,
+            "events": on_event is not None,
+        }
+        try:
+            resp = self._request("POST", "/run", body)
+            if resp.status == 409:
+                return None
+            if resp.status != 200:
+                error = json.loads(resp.read().decode("utf-8") or "{}").get("error", "")
+                raise ConnectionError(f"daemon returned {resp.status}: {error}")
+            while True:
+                raw = resp.readline()
+                if not raw:
+                    raise ConnectionError("daemon closed the connection before the command finished")
+                event = json.loads(raw)
+                if event["event"] == "log":
+                    on_line(event["line"])
+                elif event["event"] == "progress":
+                    if on_event is not None:
+                        on_event(event["data"])
+                elif event["event"] == "exit":
+                    return int(event["code"])
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            if isinstance(e, ConnectionError):
+                raise
+            raise ConnectionError(str(e)) from e
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the current connection; cancels a running command at its next output line."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                if conn.sock is not None:
+                    conn.sock.shutdown(2)  # socket.SHUT_RDWR: unblocks a reader in another thread
+            except OSError:
+                pass
+            conn.close()
+
+
+def forward_to_daemon(args: Sequence[str]) -> Optional[int]:
+    """Run a CLI command line through a running daemon (used by `python -m psm.cli`).
+
+    Returns:
+        Exit code, or None if the command should run locally (no daemon, busy,
+        or a command that must not be forwarded)
+    """
+    if runs_locally(args):
+        return None
+    info = find_daemon()
+    if info is None:
+        return None
+    on_event: Callable[[Dict[str, Any]], None] | None = None
+    if "--events" in args:
+        from ..utils.events import open_channel
+
+        channel = open_channel()
+
+        def write_event(event: Dict[str, Any]) -> None:
+            channel.write(json.dumps(event, ensure_ascii=False) + "\n")
+            channel.flush()
+
+        on_event = write_event
+
+    try:
+        return DaemonClient(info).run(list(args), on_line=lambda line: print(line, flush=True), on_event=on_event)
+    except ConnectionError as e:
+        print(f"✗ Lost connection to psm daemon: {e}", flush=True)
+        return 1
+
+
+__all__ = [
+    "DAEMON_STATE_FILE",
+    "LOCAL_ONLY_COMMANDS",
+    "DaemonClient",
+    "DaemonInfo",
+    "find_daemon",
+    "forward_to_daemon",
+    "psm_environ",
+    "runs_locally",
+    "state_path",
+]
@@ -0,0 +1,301 @@
+"""`psm serve` daemon: runs CLI commands in one warm process.
+
+A fresh `psm` subprocess re-imports click, rapidfuzz, mutagen and requests and
+reloads every track and library file before matching. The daemon pays those
+costs once: commands run in-process through the regular click group, and
+matching commands reuse WarmMatchIndex instances (kept current through the
+change_log journal) supplied via the click context.
+
+Commands run one at a time (output capture swaps sys.stdout, cwd and PSM*
+environment variables for the duration of a command). A client that
+disconnects cancels its command at the next line of output.
+"""
+
+from __future__ import annotations
+import copy
+import hmac
+import io
+import json
+import logging
+import os
+import secrets
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from ..cli.embedded import LineSink, MatchIndexPool, invoke_cli
+from ..cli.shared import get_db
+from ..services.match_service import WarmMatchIndex
+from ..utils import events
+from ..version import __version__
+from .client import LOCAL_ONLY_COMMANDS, runs_locally
+
+logger = logging.getLogger(__name__)
+
+
+class _CurrentStdout:
+    """Logging stream that follows sys.stdout, so log records land in the running command's output."""
+
+    def write(self, text: str) -> int:
+        return sys.stdout.write(text)
+
+    def flush(self) -> None:
+        sys.stdout.flush()
+
+
+class PsmDaemon:
+    """Warm process state plus the command runner behind the HTTP API."""
+
+    def __init__(self, state_file: Path, config: Dict[str, Any] | None = None, host: str = "127.0.0.1", port: int = 0):
+        """Initialize daemon state (call start() to bind the server).
+
+        Args:
+            state_file: Where to publish host/port/token for clients
+            config: Fixed configuration for every command (tests, benchmarks). None
+                reloads .env/environment per command, like a fresh CLI process.
+            host: Interface to bind (loopback only in normal use)
+            port: TCP port; 0 picks a free one
+        """
+        self.state_file = Path(state_file)
+        self.config = config
+        self.host = host
+        self.port = port
+        self.token = secrets.token_urlsafe(32)
+        self.command_lock = threading.Lock()
+        self.commands_run = 0
+        self.started_at = time.time()
+        self.match_indexes = MatchIndexPool()
+        self._server: ThreadingHTTPServer | None = None
+
+    # --- warm state ---
+
+    def match_index_for(self, cfg: Dict[str, Any]) -> WarmMatchIndex:
+        """Warm index for cfg's provider/matching settings (created on first use)."""
+        return self.match_indexes.get(cfg)
+
+    def warm_up(self, cfg: Dict[str, Any]) -> float:
+        """Load tracks and library files into the default match index; returns seconds taken."""
+        start = time.perf_counter()
+        with get_db(cfg) as db:
+            self.match_index_for(cfg).ensure_fresh(db)
+        return time.perf_counter() - start
+
+    # --- command execution ---
+
+    def run_command(
+        self,
+        args: List[str],
+        emit: Callable[[str], None],
+        cwd: str | None = None,
+        env: Dict[str, str] | None = None,
+        emit_event: Callable[[Dict[str, Any]], None] | None = None,
+    ) -> int:
+        """Run a CLI command line in this process, passing each output line to emit.
+
+        emit_event, if given, receives each structured progress event for the
+        duration of the command; `--events json` in args then
+        refers to this channel rather than a file descriptor.
+
+        The caller must hold command_lock. Exceptions raised by emit (client gone)
+        propagate after the process state is restored.
+        """
+        sink = LineSink(emit)
+        saved_streams = (sys.stdout, sys.stderr, sys.stdin)
+        saved_cwd = os.getcwd()
+        saved_env = {key: value for key, value in os.environ.items() if key.startswith("PSM")}
+        try:
+            if env is not None:
+                _replace_psm_environ(env)
+            os.environ["PSM_SKIP_FIRST_RUN_CHECK"] = "1"  # Never prompt inside the daemon
+            if cwd:
+                os.chdir(cwd)
+            sys.stdout = sys.stderr = sink
+            sys.stdin = io.StringIO()  # Prompts abort instead of blocking on the daemon's terminal
+            if emit_event is not None:
+                events.enable(emit_event)
+            code = self._invoke(args)
+            sink.close_partial()
+            return code
+        finally:
+            events.disable()
+            sys.stdout, sys.stderr, sys.stdin = saved_streams
+            os.chdir(saved_cwd)
+            _replace_psm_environ(saved_env)
+            self.commands_run += 1
+
+    def _invoke(self, args: List[str]) -> int:
+        obj = copy.deepcopy(self.config) if self.config is not None else None
+        return invoke_cli(args, obj=obj, match_indexes=self.match_indexes)
+
+    # --- lifecycle ---
+
+    def start(self) -> None:
+        """Bind the server and publish the state file (serve_forever() runs the loop)."""
+        self._server = _DaemonHTTPServer((self.host, self.port), _RequestHandler, self)
+        self.port = self._server.server_address[1]
+        self._write_state_file()
+        logger.info(f"psm daemon listening on {self.host}:{self.port} (pid {os.getpid()})")
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._remove_state_file()
+
+    def stop(self) -> None:
+        """Stop serve_forever() (callable from any thread)."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "version": __version__,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "commands_run": self.commands_run,
+            "busy": self.command_lock.locked(),
+            "match_indexes": len(self.match_indexes),
+        }
+
+    def _write_state_file(self) -> None:
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        data = {"host": self.host, "port": self.port, "token": self.token, "pid": os.getpid(), "version": __version__}
+        fd = os.open(self.state_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)  # Token: owner only
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def _remove_state_file(self) -> None:
+        try:
+            if json.loads(self.state_file.read_text(encoding="utf-8")).get("pid") == os.getpid():
+                self.state_file.unlink()
+        except (OSError, ValueError):
+            pass
+
+
+def _replace_psm_environ(values: Dict[str, str]) -> None:
+    for key in [key for key in os.environ if key.startswith("PSM")]:
+        del os.environ[key]
+    os.environ.update({key: value for key, value in values.items() if key.startswith("PSM")})
+
+
+def install_log_handler() -> None:
+    """Route root logging through the current sys.stdout (the running command's output)."""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(_CurrentStdout())
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    root.addHandler(handler)
+
+
+class _DaemonHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, handler_class, daemon: PsmDaemon):
+        self.psm_daemon = daemon
+        super().__init__(address, handler_class)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: _DaemonHTTPServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("daemon: " + format % args)
+
+    def _authorized(self) -> bool:
+        expected = f"Bearer {self.server.psm_daemon.token}"
+        if hmac.compare_digest(self.headers.get("Authorization", ""), expected):
+            return True
+        self._send_json(401, {"error": "unauthorized"})
+        return False
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if not self._authorized():
+            return
+        if self.path == "/status":
+            self._send_json(200, self.server.psm_daemon.status())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if not self._authorized():
+            return
+        if self.path == "/shutdown":
+            self._send_json(200, {"stopping": True})
+            threading.Thread(target=self.server.psm_daemon.stop, daemon=True).start()
+        elif self.path == "/run":
+            self._run()
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def _run(self) -> None:
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            request = json.loads(self.rfile.read(length).decode("utf-8"))
+            if not isinstance(request, dict):
+                raise ValueError("body must be a JSON object")
+            args = request["args"]
+            if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+                raise ValueError("args must be a list of strings")
+        except (KeyError, ValueError) as e:
+            self._send_json(400, {"error": f"bad request: {e}"})
+            return
+        if runs_locally(args):
+            self._send_json(400, {"error": f"run locally: {', '.join(sorted(LOCAL_ONLY_COMMANDS))} and --watch"})
+            return
+
+        daemon = self.server.psm_daemon
+        if not daemon.command_lock.acquire(blocking=False):
+            self._send_json(409, {"error": "busy"})
+            return
+
+        write_lock = threading.Lock()
+
+        def send(message: str) -> None:
+            with write_lock:
+                self.wfile.write((message + "\n").encode("utf-8"))
+                self.wfile.flush()
+
+        def emit(line: str) -> None:
+            send(json.dumps({"event": "log", "line": line}))
+
+        def emit_event(event: Dict[str, Any]) -> None:
+            send(json.dumps({"event": "progress", "data": event}))
+
+        wants_events = bool(request.get("events")) or "--events" in args
+
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            logger.debug(f"daemon: running {args}")
+            code = daemon.run_command(
+                args,
+                emit,
+                cwd=request.get("cwd"),
+                env=request.get("env"),
+                emit_event=emit_event if wants_events else None,
+            )
+        except (BrokenPipeError, ConnectionError):
+            logger.info(f"daemon: client disconnected, cancelled {args}")
+            return
+        finally:
+            # Release before the exit event so the client's next command is not refused as busy
+            daemon.command_lock.release()
+        self.wfile.write((json.dumps({"event": "exit", "code": code}) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+__all__ = ["PsmDaemon", "install_log_handler"]
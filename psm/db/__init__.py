@@ -1,6 +1,6 @@
 from .interface import DatabaseInterface
 from .sqlite_impl import Database
-from .models import TrackRow, LibraryFileRow, MatchRow, PlaylistRow
+from .models import TrackRow, LibraryFileRow, MatchRow, PlaylistRow, ChangeSet
 
 __all__ = [
     "DatabaseInterface",
@@ -9,4 +9,5 @@ __all__ = [
     "LibraryFileRow",
     "MatchRow",
     "PlaylistRow",
+    "ChangeSet",
 ]
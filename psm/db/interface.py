@@ -11,10 +11,10 @@ incrementally when new read/write paths are exercised. Keep write
 operations explicit (no generic execute) to preserve test clarity.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Protocol
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Protocol
 
 # Import domain models for typed returns
-from .models import TrackRow, LibraryFileRow, PlaylistRow
+from .models import TrackRow, LibraryFileRow, PlaylistRow, ChangeSet
 
 
 class SupportsRowMapping(Protocol):  # pragma: no cover - structural helper
@@ -265,6 +265,41 @@ class DatabaseInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_playlists_with_local_paths(
+        self, playlist_ids: Optional[List[str]] = None, provider: str | None = None
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Stream every playlist with its tracks and best-match local paths (bulk export source).
+
+        Args:
+            playlist_ids: Optional filter to specific playlist IDs
+            provider: Provider name filter (required)
+
+        Yields:
+            (playlist, tracks) pairs, one per playlist (order unspecified); playlist has id, name,
+            owner_id, owner_name, tracks are shaped like get_playlist_tracks_with_local_paths() rows
+        """
+        ...
+
+    @abstractmethod
+    def map_paths_to_track_ids(
+        self, paths: Sequence[str], playlist_id: str | None = None, provider: str | None = None
+    ) -> Dict[str, str]:
+        """Resolve local file paths to the tracks matched to them (reverse of the export mapping).
+
+        When several tracks match one file, tracks whose best match is that file win, then
+        tracks in playlist_id (if given), then the highest score.
+
+        Args:
+            paths: Library file paths (duplicates allowed)
+            playlist_id: Playlist the paths came from, used to break ties between tracks
+            provider: Provider name filter (required)
+
+        Returns:
+            Dict mapping each resolvable path to a track ID (unresolvable paths are absent)
+        """
+        ...
+
     @abstractmethod
     def get_liked_tracks_with_local_paths(self, provider: str | None = None) -> List[Dict[str, Any]]:
         """Get liked tracks with matched local file paths (best match only per track), newest first.
@@ -448,6 +483,29 @@ class DatabaseInterface(ABC):
     @abstractmethod
     def get_meta(self, key: str) -> Optional[str]: ...
 
+    # --- Change journal ---
+    @abstractmethod
+    def get_change_cursor(self) -> int:
+        """Return the sequence number of the latest change_log entry (0 if none)."""
+        ...
+
+    @abstractmethod
+    def read_changes(self, after_seq: int, exclude_own: bool = False) -> ChangeSet:
+        """Collect entities changed after a cursor.
+
+        Used by watch mode and the GUI to process exactly the rows written by
+        other commands/processes instead of polling file mtimes.
+
+        Args:
+            after_seq: Cursor returned by get_change_cursor() or a previous read
+            exclude_own: Skip entries written through this connection, leaving only changes
+                committed concurrently by other connections/processes
+
+        Returns:
+            ChangeSet with affected IDs and the new cursor
+        """
+        ...
+
     # --- Connection / lifecycle ---
     @abstractmethod
     def commit(self): ...
@@ -5,8 +5,8 @@ improving IDE support, type checking, and making the data contracts explicit.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, asdict, field
+from typing import Optional, Dict, Any, Set
 
 
 @dataclass
@@ -205,9 +205,40 @@ class PlaylistRow:
         )
 
 
+@dataclass
+class ChangeSet:
+    """Entities changed after a change_log cursor (see DatabaseInterface.read_changes).
+
+    IDs are de-duplicated; an entity appears once no matter how often it changed.
+    """
+
+    cursor: int = 0  # Highest change_log sequence number covered; pass it to the next read
+    tracks: Set[str] = field(default_factory=set)  # Track IDs inserted, updated or deleted
+    files: Set[int] = field(default_factory=set)  # library_files IDs inserted, updated or deleted
+    playlists: Set[str] = field(default_factory=set)  # Playlists whose metadata or track list changed
+    liked: Set[str] = field(default_factory=set)  # Track IDs liked or unliked
+    matches: Set[str] = field(default_factory=set)  # Track IDs whose matches changed
+    truncated: bool = False  # Entries after the cursor were pruned; consumer must refresh everything
+
+    @property
+    def empty(self) -> bool:
+        return not (self.truncated or self.tracks or self.files or self.playlists or self.liked or self.matches)
+
+    def update(self, other: "ChangeSet") -> None:
+        """Merge another change set into this one; the cursor becomes the later of the two."""
+        self.cursor = max(self.cursor, other.cursor)
+        self.tracks |= other.tracks
+        self.files |= other.files
+        self.playlists |= other.playlists
+        self.liked |= other.liked
+        self.matches |= other.matches
+        self.truncated = self.truncated or other.truncated
+
+
 __all__ = [
     "TrackRow",
     "LibraryFileRow",
     "MatchRow",
     "PlaylistRow",
+    "ChangeSet",
 ]
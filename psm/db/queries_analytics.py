@@ -100,7 +100,7 @@ def get_playlist_coverage(conn: sqlite3.Connection, provider: str) -> List[Dict[
             COUNT(DISTINCT CASE WHEN m.track_id IS NOT NULL THEN pt.track_id END) as matched
         FROM playlists p
         LEFT JOIN playlist_tracks pt ON p.id = pt.playlist_id AND p.provider = pt.provider
-        LEFT JOIN matches m ON pt.track_id = m.track_id AND pt.provider = m.provider
+        LEFT JOIN best_match m ON pt.track_id = m.track_id AND pt.provider = m.provider
         WHERE p.provider = ?
         GROUP BY p.id, p.name, p.owner_id, p.owner_name
         ORDER BY p.owner_name, p.name
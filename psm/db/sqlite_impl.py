@@ -1,15 +1,56 @@
 from __future__ import annotations
 import sqlite3
 import logging
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Sequence, Any, Dict, Tuple, Optional, List
+from typing import Iterable, Iterator, Sequence, Any, Dict, Tuple, Optional, List
 from .interface import DatabaseInterface
-from .models import TrackRow, LibraryFileRow, PlaylistRow
+from .models import TrackRow, LibraryFileRow, PlaylistRow, ChangeSet
 from . import queries_analytics
 from . import queries_unified
 
 logger = logging.getLogger(__name__)
 
+# change_log rows kept when a database is opened; readers further behind get ChangeSet.truncated
+CHANGE_LOG_RETAIN = 200_000
+
+# Values bound per IN (...) list; stays below SQLite's historical 999-variable limit
+IN_CHUNK_SIZE = 500
+
+# Best-match ranking: MANUAL overrides first, then highest score (file_id breaks ties deterministically)
+BEST_MATCH_ORDER = "(CASE WHEN confidence = 'MANUAL' THEN 1 ELSE 0 END) DESC, score DESC, file_id"
+
+
+def _refresh_best_match(row: str) -> str:
+    """Trigger statements recomputing best_match for the track of OLD/NEW row."""
+    return (
+        f"DELETE FROM best_match WHERE track_id = {row}.track_id AND provider = {row}.provider; "
+        "INSERT INTO best_match(track_id, provider, file_id, score, method, confidence) "
+        "SELECT track_id, provider, file_id, score, method, confidence FROM matches "
+        f"WHERE track_id = {row}.track_id AND provider = {row}.provider ORDER BY {BEST_MATCH_ORDER} LIMIT 1;"
+    )
+
+
+def _manual(table: str) -> str:
+    return f"(CASE WHEN {table}.confidence = 'MANUAL' THEN 1 ELSE 0 END)"
+
+
+# A newly inserted match only replaces the current best if it ranks higher (no re-ranking needed)
+_OFFER_BEST_MATCH = (
+    "INSERT INTO best_match(track_id, provider, file_id, score, method, confidence) "
+    "VALUES(NEW.track_id, NEW.provider, NEW.file_id, NEW.score, NEW.method, NEW.confidence) "
+    "ON CONFLICT(track_id, provider) DO UPDATE SET file_id = excluded.file_id, score = excluded.score, "
+    "method = excluded.method, confidence = excluded.confidence "
+    f"WHERE {_manual('excluded')} > {_manual('best_match')} OR ({_manual('excluded')} = {_manual('best_match')} "
+    "AND (excluded.score > best_match.score OR (excluded.score = best_match.score AND excluded.file_id < best_match.file_id)));"
+)
+
+
+# Track columns of iter_playlists_with_local_paths() rows
+_EXPORT_TRACK_KEYS = ("position", "track_id", "name", "artist", "album", "year", "duration_ms", "local_path")
+
+
 SCHEMA = [
     "PRAGMA journal_mode=WAL;",
     # Clean provider‑namespaced schema (v1). Playlists & playlist_tracks include provider in PK for cross-provider coexistence.
@@ -28,7 +69,7 @@ SCHEMA = [
     "CREATE INDEX IF NOT EXISTS idx_playlist_tracks_track ON playlist_tracks(track_id, provider);",
     "CREATE INDEX IF NOT EXISTS idx_matches_track ON matches(track_id, provider);",
     "CREATE INDEX IF NOT EXISTS idx_matches_file ON matches(file_id);",
-    # Covering index for best-match queries with window functions
+    # Ranks a track's matches for the best_match triggers
     "CREATE INDEX IF NOT EXISTS idx_matches_best_match ON matches(provider, track_id, score DESC);",
     "CREATE INDEX IF NOT EXISTS idx_liked_tracks_track ON liked_tracks(track_id, provider);",
     # Phase 8: Indexes for GUI sorting and filtering
@@ -38,6 +79,41 @@ SCHEMA = [
     "CREATE INDEX IF NOT EXISTS idx_tracks_year ON tracks(year);",
     # Metadata table
     "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);",
+    # Change journal: one row per changed entity, consumed by cursor (watch mode, GUI auto-refresh).
+    # UPDATE triggers only fire when a relevant column actually changed, so no-op upserts are not logged.
+    "CREATE TABLE IF NOT EXISTS change_log (seq INTEGER PRIMARY KEY AUTOINCREMENT, entity TEXT NOT NULL, entity_id TEXT NOT NULL);",
+    "CREATE TRIGGER IF NOT EXISTS trg_tracks_insert AFTER INSERT ON tracks BEGIN INSERT INTO change_log(entity, entity_id) VALUES('track', NEW.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_tracks_update AFTER UPDATE ON tracks WHEN OLD.name IS NOT NEW.name OR OLD.artist IS NOT NEW.artist OR OLD.album IS NOT NEW.album OR OLD.isrc IS NOT NEW.isrc OR OLD.duration_ms IS NOT NEW.duration_ms OR OLD.normalized IS NOT NEW.normalized OR OLD.year IS NOT NEW.year BEGIN INSERT INTO change_log(entity, entity_id) VALUES('track', NEW.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_tracks_delete AFTER DELETE ON tracks BEGIN INSERT INTO change_log(entity, entity_id) VALUES('track', OLD.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_library_files_insert AFTER INSERT ON library_files BEGIN INSERT INTO change_log(entity, entity_id) VALUES('file', NEW.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_library_files_update AFTER UPDATE ON library_files WHEN OLD.path IS NOT NEW.path OR OLD.size IS NOT NEW.size OR OLD.mtime IS NOT NEW.mtime OR OLD.title IS NOT NEW.title OR OLD.artist IS NOT NEW.artist OR OLD.album IS NOT NEW.album OR OLD.duration IS NOT NEW.duration OR OLD.normalized IS NOT NEW.normalized OR OLD.year IS NOT NEW.year BEGIN INSERT INTO change_log(entity, entity_id) VALUES('file', NEW.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_library_files_delete AFTER DELETE ON library_files BEGIN INSERT INTO change_log(entity, entity_id) VALUES('file', OLD.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_playlists_insert AFTER INSERT ON playlists BEGIN INSERT INTO change_log(entity, entity_id) VALUES('playlist', NEW.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_playlists_update AFTER UPDATE ON playlists WHEN OLD.name IS NOT NEW.name OR OLD.snapshot_id IS NOT NEW.snapshot_id OR OLD.owner_id IS NOT NEW.owner_id OR OLD.owner_name IS NOT NEW.owner_name BEGIN INSERT INTO change_log(entity, entity_id) VALUES('playlist', NEW.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_playlists_delete AFTER DELETE ON playlists BEGIN INSERT INTO change_log(entity, entity_id) VALUES('playlist', OLD.id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_playlist_tracks_insert AFTER INSERT ON playlist_tracks BEGIN INSERT INTO change_log(entity, entity_id) VALUES('playlist', NEW.playlist_id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_playlist_tracks_delete AFTER DELETE ON playlist_tracks BEGIN INSERT INTO change_log(entity, entity_id) VALUES('playlist', OLD.playlist_id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_liked_tracks_insert AFTER INSERT ON liked_tracks BEGIN INSERT INTO change_log(entity, entity_id) VALUES('liked', NEW.track_id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_liked_tracks_delete AFTER DELETE ON liked_tracks BEGIN INSERT INTO change_log(entity, entity_id) VALUES('liked', OLD.track_id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_matches_insert AFTER INSERT ON matches BEGIN INSERT INTO change_log(entity, entity_id) VALUES('match', NEW.track_id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_matches_update AFTER UPDATE ON matches WHEN OLD.file_id IS NOT NEW.file_id OR OLD.score IS NOT NEW.score OR OLD.confidence IS NOT NEW.confidence BEGIN INSERT INTO change_log(entity, entity_id) VALUES('match', NEW.track_id); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_matches_delete AFTER DELETE ON matches BEGIN INSERT INTO change_log(entity, entity_id) VALUES('match', OLD.track_id); END;",
+    # Materialized best match per track (see BEST_MATCH_ORDER), kept in sync by triggers so export,
+    # reports and the GUI join one indexed row per track instead of ranking all matches per query.
+    "CREATE TABLE IF NOT EXISTS best_match (track_id TEXT NOT NULL, provider TEXT NOT NULL, file_id INTEGER NOT NULL, score REAL NOT NULL, method TEXT, confidence TEXT, PRIMARY KEY(track_id, provider)) WITHOUT ROWID;",
+    "CREATE INDEX IF NOT EXISTS idx_best_match_file ON best_match(file_id);",
+    f"CREATE TRIGGER IF NOT EXISTS trg_best_match_insert AFTER INSERT ON matches BEGIN {_OFFER_BEST_MATCH} END;",
+    f"CREATE TRIGGER IF NOT EXISTS trg_best_match_update AFTER UPDATE ON matches WHEN OLD.track_id IS NOT NEW.track_id OR OLD.provider IS NOT NEW.provider OR OLD.file_id IS NOT NEW.file_id OR OLD.score IS NOT NEW.score OR OLD.method IS NOT NEW.method OR OLD.confidence IS NOT NEW.confidence BEGIN {_refresh_best_match('OLD')} {_refresh_best_match('NEW')} END;",
+    # Deleting a match other than the current best leaves best_match unchanged
+    f"CREATE TRIGGER IF NOT EXISTS trg_best_match_delete AFTER DELETE ON matches WHEN EXISTS (SELECT 1 FROM best_match WHERE track_id = OLD.track_id AND provider = OLD.provider AND file_id = OLD.file_id) BEGIN {_refresh_best_match('OLD')} END;",
+]
+
+# Per-connection record of the change_log rows this connection wrote. TEMP objects are private to the
+# connection, and rolled-back writes disappear from both tables, so read_changes(exclude_own=True)
+# returns exactly the changes committed by other connections and processes.
+OWN_CHANGES_SCHEMA = [
+    "CREATE TEMP TABLE IF NOT EXISTS own_changes (seq INTEGER PRIMARY KEY);",
+    "CREATE TEMP TRIGGER IF NOT EXISTS trg_own_changes AFTER INSERT ON main.change_log BEGIN INSERT INTO own_changes(seq) VALUES(NEW.seq); END;",
 ]
 
 
@@ -50,10 +126,6 @@ class Database(DatabaseInterface):
         self.conn.row_factory = sqlite3.Row
         self._closed = False
 
-        # Check SQLite version for window function support (required >= 3.25.0)
-        self._sqlite_version = tuple(int(x) for x in sqlite3.sqlite_version.split("."))
-        self._supports_window_functions = self._sqlite_version >= (3, 25, 0)
-
         self._init_schema()
 
     def __enter__(self) -> "Database":  # pragma: no cover
@@ -75,14 +147,22 @@ class Database(DatabaseInterface):
         except Exception:
             pass
         if legacy:
-            for tbl in ["matches", "playlist_tracks", "playlists", "tracks", "liked_tracks", "library_files"]:
+            for tbl in [
+                "best_match",
+                "matches",
+                "playlist_tracks",
+                "playlists",
+                "tracks",
+                "liked_tracks",
+                "library_files",
+            ]:
                 try:
                     self.conn.execute(f"DROP TABLE IF EXISTS {tbl}")
                 except Exception:
                     pass
             self.conn.commit()
         cur = self.conn.cursor()
-        for stmt in SCHEMA:
+        for stmt in SCHEMA + OWN_CHANGES_SCHEMA:
             cur.execute(stmt)
         self._ensure_column("tracks", "artist_id", "TEXT")
         self._ensure_column("tracks", "album_id", "TEXT")
@@ -90,6 +170,9 @@ class Database(DatabaseInterface):
 
         # Migrate existing matches to populate confidence from method string
         self._migrate_confidence_column()
+        if self.get_meta("best_match_built") != "1":
+            self.rebuild_best_match()
+        self.prune_change_log()
 
         cur.execute("INSERT OR REPLACE INTO meta(key,value) VALUES('schema_version','1')")
         self.conn.commit()
@@ -139,6 +222,29 @@ class Database(DatabaseInterface):
         except Exception as e:
             logger.warning(f"Failed to migrate confidence column: {e}")
 
+    def rebuild_best_match(self) -> int:
+        """Recompute the best_match table from matches (triggers keep it current afterwards).
+
+        Runs once when the table is introduced; returns the number of tracks with a best match.
+        """
+        self.conn.execute("DELETE FROM best_match")
+        self.conn.execute(f"""
+            INSERT INTO best_match(track_id, provider, file_id, score, method, confidence)
+            SELECT m.track_id, m.provider, m.file_id, m.score, m.method, m.confidence
+            FROM matches m
+            WHERE m.rowid = (
+                SELECT rowid FROM matches
+                WHERE track_id = m.track_id AND provider = m.provider
+                ORDER BY {BEST_MATCH_ORDER}
+                LIMIT 1
+            )
+            """)
+        self.set_meta("best_match_built", "1")
+        self.conn.commit()
+        count = self.conn.execute("SELECT COUNT(*) FROM best_match").fetchone()[0]
+        logger.debug(f"Built best_match for {count} tracks")
+        return count
+
     def _execute_with_lock_handling(self, sql: str, params: Any = None):
         """Execute SQL with better diagnostics on database lock (but let SQLite retry)."""
         try:
@@ -274,6 +380,47 @@ class Database(DatabaseInterface):
             "INSERT INTO meta(key,value) VALUES(?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value", (key, value)
         )
 
+    def get_change_cursor(self) -> int:
+        # sqlite_sequence keeps the high-water mark even if every row was pruned
+        row = self.conn.execute("SELECT seq FROM sqlite_sequence WHERE name='change_log'").fetchone()
+        return int(row[0]) if row else 0
+
+    def read_changes(self, after_seq: int, exclude_own: bool = False) -> ChangeSet:
+        changes = ChangeSet(cursor=after_seq)
+        cursor = self.get_change_cursor()
+        if cursor <= after_seq:
+            return changes
+        first = self.conn.execute("SELECT MIN(seq) FROM change_log").fetchone()[0]
+        if first is None or first > after_seq + 1:
+            changes.truncated = True
+        buckets = {
+            "track": changes.tracks,
+            "playlist": changes.playlists,
+            "liked": changes.liked,
+            "match": changes.matches,
+        }
+        own = " AND seq NOT IN (SELECT seq FROM temp.own_changes)" if exclude_own else ""
+        rows = self.conn.execute(
+            f"SELECT DISTINCT entity, entity_id FROM change_log WHERE seq > ? AND seq <= ?{own}", (after_seq, cursor)
+        )
+        for entity, entity_id in rows:
+            if entity == "file":
+                changes.files.add(int(entity_id))
+            elif entity in buckets:
+                buckets[entity].add(entity_id)
+        changes.cursor = cursor
+        return changes
+
+    def prune_change_log(self, retain: int = CHANGE_LOG_RETAIN) -> int:
+        """Delete all but the newest `retain` change_log entries; returns rows removed."""
+        threshold = self.get_change_cursor() - retain
+        cur = self.conn.execute("DELETE FROM change_log WHERE seq <= ?", (threshold,))
+        if cur.rowcount:
+            self.conn.execute("DELETE FROM temp.own_changes WHERE seq <= ?", (threshold,))
+            self.conn.commit()
+            logger.debug(f"Pruned {cur.rowcount} change_log entries")
+        return cur.rowcount
+
     def get_meta(self, key: str) -> Optional[str]:
         cur = self.conn.execute("SELECT value FROM meta WHERE key=?", (key,))
         row = cur.fetchone()
@@ -527,6 +674,7 @@ class Database(DatabaseInterface):
 
     def delete_all_matches(self):
         """Delete all track-to-file matches (for full re-match scenarios)."""
+        self._execute_with_lock_handling("DELETE FROM best_match", [])  # Lets the per-row delete trigger skip
         self._execute_with_lock_handling("DELETE FROM matches", [])
 
     def count_distinct_library_albums(self) -> int:
@@ -630,7 +778,7 @@ class Database(DatabaseInterface):
             SELECT id, name, owner_id, owner_name
             FROM playlists
             WHERE id IN ({placeholders}) AND provider = ?
-            ORDER BY owner_name, name
+            ORDER BY owner_name, name, id
             """
             params = list(playlist_ids) + [provider]
             rows = self.conn.execute(sql, params).fetchall()
@@ -639,7 +787,7 @@ class Database(DatabaseInterface):
             SELECT id, name, owner_id, owner_name
             FROM playlists
             WHERE provider = ?
-            ORDER BY owner_name, name
+            ORDER BY owner_name, name, id
             """
             rows = self.conn.execute(sql, (provider,)).fetchall()
 
@@ -650,180 +798,151 @@ class Database(DatabaseInterface):
     ) -> List[Dict[str, Any]]:
         """Get playlist tracks with matched local file paths (best match only per track).
 
-        Uses window function to select only the highest-scoring match per track.
+        Joins the materialized best_match table (MANUAL first, then highest score).
         All joins are provider-aware to prevent cross-provider data leakage.
         """
         if provider is None:
             provider = "spotify"  # Default for backward compat
 
-        if self._supports_window_functions:
-            # Use window function to rank matches: prefer MANUAL confidence, then highest score (M1)
-            # Then filter to only the best match (rn=1) in the outer query
-            sql = """
-            WITH ranked_matches AS (
-                SELECT
-                    m.track_id,
-                    m.file_id,
-                    m.score,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY m.track_id
-                        ORDER BY (CASE WHEN m.confidence = 'MANUAL' THEN 1 ELSE 0 END) DESC, m.score DESC
-                    ) AS rn
-                FROM matches m
-                WHERE m.provider = ?
-            )
-            SELECT
-                pt.position,
-                t.id as track_id,
-                t.name,
-                t.artist,
-                t.album,
-                t.year,
-                t.duration_ms,
-                lf.path AS local_path
-            FROM playlist_tracks pt
-            LEFT JOIN tracks t ON t.id = pt.track_id AND t.provider = pt.provider
-            LEFT JOIN ranked_matches rm ON rm.track_id = pt.track_id AND rm.rn = 1
-            LEFT JOIN library_files lf ON lf.id = rm.file_id
-            WHERE pt.playlist_id = ? AND pt.provider = ?
-            ORDER BY pt.position
+        sql = """
+        SELECT
+            pt.position,
+            t.id as track_id,
+            t.name,
+            t.artist,
+            t.album,
+            t.year,
+            t.duration_ms,
+            lf.path AS local_path
+        FROM playlist_tracks pt
+        LEFT JOIN tracks t ON t.id = pt.track_id AND t.provider = pt.provider
+        LEFT JOIN best_match bm ON bm.track_id = pt.track_id AND bm.provider = pt.provider
+        LEFT JOIN library_files lf ON lf.id = bm.file_id
+        WHERE pt.playlist_id = ? AND pt.provider = ?
+        ORDER BY pt.position
+        """
+        rows = self.conn.execute(sql, (playlist_id, provider)).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_playlists_with_local_paths(
+        self, playlist_ids: Optional[List[str]] = None, provider: str | None = None
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Stream all playlists with their tracks and best local paths from a single query.
+
+        Track rows arrive ordered by playlist ID and are grouped as they stream, so exporting
+        every playlist costs one pass over playlist_tracks instead of one query per playlist.
+        Playlists without tracks are yielded last, with an empty list.
+        """
+        if provider is None:
+            provider = "spotify"  # Default for backward compat
+
+        playlists = {pl["id"]: pl for pl in self.list_playlists(playlist_ids, provider)}
+        params: List[Any] = [provider]
+        id_filter = ""
+        if playlist_ids:
+            id_filter = f"AND pt.playlist_id IN ({','.join('?' * len(playlist_ids))})"
+            params.extend(playlist_ids)
+
+        sql = f"""
+        SELECT
+            pt.playlist_id,
+            pt.position,
+            t.id as track_id,
+            t.name,
+            t.artist,
+            t.album,
+            t.year,
+            t.duration_ms,
+            lf.path AS local_path
+        FROM playlist_tracks pt
+        LEFT JOIN tracks t ON t.id = pt.track_id AND t.provider = pt.provider
+        LEFT JOIN best_match bm ON bm.track_id = pt.track_id AND bm.provider = pt.provider
+        LEFT JOIN library_files lf ON lf.id = bm.file_id
+        WHERE pt.provider = ? {id_filter}
+        ORDER BY pt.playlist_id, pt.position
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # Plain tuples: cheaper than sqlite3.Row for a full-library stream
+        for playlist_id, rows in groupby(cursor.execute(sql, params), key=itemgetter(0)):
+            playlist = playlists.pop(playlist_id, None)
+            if playlist is not None:
+                yield playlist, [dict(zip(_EXPORT_TRACK_KEYS, row[1:])) for row in rows]
+        for playlist in playlists.values():
+            yield playlist, []
+
+    def map_paths_to_track_ids(
+        self, paths: Sequence[str], playlist_id: str | None = None, provider: str | None = None
+    ) -> Dict[str, str]:
+        """Resolve local file paths to their matched tracks with one set-based join per chunk of paths.
+
+        Candidates are ranked in SQL (tracks whose best_match is the file first, as that is the
+        file an export wrote for them, then highest score); only paths with several top-tier
+        candidates consult the playlist's track IDs, loaded once. CROSS JOIN pins library_files
+        (probed through its path index) as the outer loop; otherwise the planner may scan every
+        match of the provider per chunk.
+        """
+        if provider is None:
+            provider = "spotify"  # Default for backward compat
+
+        unique = list(dict.fromkeys(paths))
+        result: Dict[str, str] = {}
+        playlist_tracks: set[str] | None = None
+        for start in range(0, len(unique), IN_CHUNK_SIZE):
+            chunk = unique[start : start + IN_CHUNK_SIZE]
+            sql = f"""
+            SELECT lf.path, m.track_id, bm.file_id IS NOT NULL
+            FROM library_files lf
+            CROSS JOIN matches m ON m.file_id = lf.id AND m.provider = ?
+            LEFT JOIN best_match bm ON bm.track_id = m.track_id AND bm.provider = m.provider AND bm.file_id = m.file_id
+            WHERE lf.path IN ({",".join("?" * len(chunk))})
+            ORDER BY lf.path, bm.file_id IS NULL, m.score DESC, m.track_id
             """
-            rows = self.conn.execute(sql, (provider, playlist_id, provider)).fetchall()
-        else:
-            # Fallback for SQLite < 3.25: prefer MANUAL confidence, then highest score
-            sql = """
-            SELECT
-                pt.position,
-                t.id as track_id,
-                t.name,
-                t.artist,
-                t.album,
-                t.year,
-                t.duration_ms,
-                lf.path AS local_path
-            FROM playlist_tracks pt
-            LEFT JOIN tracks t ON t.id = pt.track_id AND t.provider = pt.provider
-            LEFT JOIN matches m ON m.track_id = pt.track_id
-                AND m.provider = ?
-                AND (
-                    m.confidence = 'MANUAL'
-                    OR NOT EXISTS (
-                        SELECT 1 FROM matches m_manual
-                        WHERE m_manual.track_id = m.track_id
-                            AND m_manual.provider = ?
-                            AND m_manual.confidence = 'MANUAL'
-                    )
-                )
-                AND m.score = (
-                    SELECT MAX(m2.score)
-                    FROM matches m2
-                    WHERE m2.track_id = m.track_id
-                        AND m2.provider = ?
-                        AND (
-                            m.confidence = 'MANUAL'
-                            OR NOT EXISTS (
-                                SELECT 1 FROM matches m_manual2
-                                WHERE m_manual2.track_id = m2.track_id
-                                    AND m_manual2.provider = ?
-                                    AND m_manual2.confidence = 'MANUAL'
+            rows = self.conn.execute(sql, (provider, *chunk)).fetchall()
+            for path, candidates in groupby(rows, key=itemgetter(0)):
+                _, track_id, is_best = next(candidates)
+                # Ties (several tracks share the top tier) go to a track of the playlist, if any
+                tied = [tid for _, tid, best in candidates if best == is_best]
+                if tied and playlist_id is not None:
+                    if playlist_tracks is None:
+                        playlist_tracks = {
+                            r[0]
+                            for r in self.conn.execute(
+                                "SELECT track_id FROM playlist_tracks WHERE playlist_id = ? AND provider = ?",
+                                (playlist_id, provider),
                             )
-                        )
-                )
-            LEFT JOIN library_files lf ON lf.id = m.file_id
-            WHERE pt.playlist_id = ? AND pt.provider = ?
-            ORDER BY pt.position
-            """
-            rows = self.conn.execute(sql, (provider, provider, provider, provider, playlist_id, provider)).fetchall()
-
-        return [dict(row) | {"position": row["position"]} for row in rows]
+                        }
+                    if track_id not in playlist_tracks:
+                        track_id = next((tid for tid in tied if tid in playlist_tracks), track_id)
+                result[path] = track_id
+        return result
 
     def get_liked_tracks_with_local_paths(self, provider: str | None = None) -> List[Dict[str, Any]]:
         """Get liked tracks with matched local file paths (best match only per track), newest first.
 
-        Uses window function to select only the highest-scoring match per track.
+        Joins the materialized best_match table (MANUAL first, then highest score).
         All joins are provider-aware to prevent cross-provider data leakage.
         Ordered by added_at DESC (newest first) to match Spotify's behavior.
         """
         if provider is None:
             provider = "spotify"  # Default for backward compat
 
-        if self._supports_window_functions:
-            # Use window function to rank matches: prefer MANUAL confidence, then highest score (M1)
-            # Then filter to only the best match (rn=1) in the outer query
-            sql = """
-            WITH ranked_matches AS (
-                SELECT
-                    m.track_id,
-                    m.file_id,
-                    m.score,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY m.track_id
-                        ORDER BY (CASE WHEN m.confidence = 'MANUAL' THEN 1 ELSE 0 END) DESC, m.score DESC
-                    ) AS rn
-                FROM matches m
-                WHERE m.provider = ?
-            )
-            SELECT
-                lt.added_at,
-                t.id as track_id,
-                t.name,
-                t.artist,
-                t.album,
-                t.duration_ms,
-                lf.path AS local_path
-            FROM liked_tracks lt
-            LEFT JOIN tracks t ON t.id = lt.track_id AND t.provider = lt.provider
-            LEFT JOIN ranked_matches rm ON rm.track_id = lt.track_id AND rm.rn = 1
-            LEFT JOIN library_files lf ON lf.id = rm.file_id
-            WHERE lt.provider = ?
-            ORDER BY lt.added_at DESC
-            """
-            rows = self.conn.execute(sql, (provider, provider)).fetchall()
-        else:
-            # Fallback for SQLite < 3.25: prefer MANUAL confidence, then highest score
-            sql = """
-            SELECT
-                lt.added_at,
-                t.id as track_id,
-                t.name,
-                t.artist,
-                t.album,
-                t.duration_ms,
-                lf.path AS local_path
-            FROM liked_tracks lt
-            LEFT JOIN tracks t ON t.id = lt.track_id AND t.provider = lt.provider
-            LEFT JOIN matches m ON m.track_id = lt.track_id
-                AND m.provider = ?
-                AND (
-                    m.confidence = 'MANUAL'
-                    OR NOT EXISTS (
-                        SELECT 1 FROM matches m_manual
-                        WHERE m_manual.track_id = m.track_id
-                            AND m_manual.provider = ?
-                            AND m_manual.confidence = 'MANUAL'
-                    )
-                )
-                AND m.score = (
-                    SELECT MAX(m2.score)
-                    FROM matches m2
-                    WHERE m2.track_id = m.track_id
-                        AND m2.provider = ?
-                        AND (
-                            m.confidence = 'MANUAL'
-                            OR NOT EXISTS (
-                                SELECT 1 FROM matches m_manual2
-                                WHERE m_manual2.track_id = m2.track_id
-                                    AND m_manual2.provider = ?
-                                    AND m_manual2.confidence = 'MANUAL'
-                            )
-                        )
-                )
-            LEFT JOIN library_files lf ON lf.id = m.file_id
-            WHERE lt.provider = ?
-            ORDER BY lt.added_at DESC
-            """
-            rows = self.conn.execute(sql, (provider, provider, provider, provider, provider)).fetchall()
-
+        sql = """
+        SELECT
+            lt.added_at,
+            t.id as track_id,
+            t.name,
+            t.artist,
+            t.album,
+            t.duration_ms,
+            lf.path AS local_path
+        FROM liked_tracks lt
+        LEFT JOIN tracks t ON t.id = lt.track_id AND t.provider = lt.provider
+        LEFT JOIN best_match bm ON bm.track_id = lt.track_id AND bm.provider = lt.provider
+        LEFT JOIN library_files lf ON lf.id = bm.file_id
+        WHERE lt.provider = ?
+        ORDER BY lt.added_at DESC
+        """
+        rows = self.conn.execute(sql, (provider,)).fetchall()
         return [dict(row) for row in rows]
 
     def get_track_by_id(self, track_id: str, provider: str | None = None) -> Optional[TrackRow]:
@@ -840,7 +959,7 @@ class Database(DatabaseInterface):
         return TrackRow.from_row(row) if row else None
 
     def get_match_for_track(self, track_id: str, provider: str | None = None) -> Optional[Dict[str, Any]]:
-        """Get match details for a track if it exists."""
+        """Get details of the track's best match (MANUAL first, then highest score) if it exists."""
         if provider is None:
             provider = "spotify"  # Default for backward compat
 
@@ -858,7 +977,7 @@ class Database(DatabaseInterface):
             f.normalized,
             f.year,
             f.bitrate_kbps
-        FROM matches m
+        FROM best_match m
         JOIN library_files f ON m.file_id = f.id
         WHERE m.track_id = ? AND m.provider = ?
         """
@@ -0,0 +1,167 @@
+"""Export manifest: what the exporter wrote, versioned by generation.
+
+The manifest lives in the export directory as ``.psm-manifest.json``. It maps
+every exported playlist id to its M3U file (relative to the export directory),
+content hash and track count. Each export that changes anything bumps the
+generation and stamps the changed entries with it. Removed playlists are kept
+as tombstones, and files psm no longer writes are kept as retired files, so
+consumers that last synced at generation N can ask for a delta (added,
+changed and removed playlists since N) instead of diffing the whole directory.
+"""
+
+from __future__ import annotations
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+import json
+import logging
+import os
+import secrets
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".psm-manifest.json"
+MANIFEST_VERSION = 1
+DELTA_NAME = "delta.json"  # Inside a delta bundle, next to the changed files
+
+
+@dataclass
+class ManifestEntry:
+    """One exported playlist (or, in ExportManifest.removed, a tombstone)."""
+
+    file: str  # POSIX path relative to the export directory
+    sha256: str
+    tracks: int
+    added: int  # Generation the playlist first appeared in
+    generation: int  # Generation of its last change (or of its removal, for tombstones)
+
+
+@dataclass
+class ExportManifest:
+    """Playlists currently exported, tombstones and retired files, with the current generation."""
+
+    generation: int = 0
+    playlists: Dict[str, ManifestEntry] = field(default_factory=dict)
+    removed: Dict[str, ManifestEntry] = field(default_factory=dict)
+    retired_files: Dict[str, int] = field(default_factory=dict)  # File -> generation it stopped being written
+
+    @classmethod
+    def load(cls, export_dir: Path) -> "ExportManifest":
+        """Read the manifest from export_dir; a missing or unreadable one yields an empty manifest (generation 0)."""
+        path = export_dir / MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')!r}")
+            return cls(
+                generation=int(data["generation"]),
+                playlists={pid: ManifestEntry(**e) for pid, e in data["playlists"].items()},
+                removed={pid: ManifestEntry(**e) for pid, e in data["removed"].items()},
+                retired_files={f: int(g) for f, g in data["retired_files"].items()},
+            )
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable export manifest {path}: {e}")
+            return cls()
+
+    def save(self, export_dir: Path) -> None:
+        """Write the manifest to export_dir atomically."""
+        export_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "generation": self.generation,
+            "playlists": {pid: asdict(e) for pid, e in sorted(self.playlists.items())},
+            "removed": {pid: asdict(e) for pid, e in sorted(self.removed.items())},
+            "retired_files": dict(sorted(self.retired_files.items())),
+        }
+        path = export_dir / MANIFEST_NAME
+        tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def update(self, exported: Dict[str, Tuple[str, str, int]], complete: bool) -> bool:
+        """Record an export run.
+
+        Args:
+            exported: Playlist id -> (relative file, sha256, track count) for every playlist written
+            complete: The run covered every playlist, so playlists missing from exported were removed
+                (False for scoped exports, which leave other entries alone)
+
+        Returns:
+            True if anything changed (the generation was bumped)
+        """
+        generation = self.generation + 1
+        changed = False
+        for pid, (file, sha256, tracks) in exported.items():
+            old = self.playlists.get(pid)
+            if old is not None and (old.file, old.sha256, old.tracks) == (file, sha256, tracks):
+                continue
+            changed = True
+            if old is not None and old.file != file:
+                self.retired_files[old.file] = generation  # Renamed playlist or moved owner folder
+            tombstone = self.removed.pop(pid, None)
+            added = old.added if old is not None else generation
+            if tombstone is not None:
+                added = generation  # Came back after being removed
+            self.playlists[pid] = ManifestEntry(file, sha256, tracks, added, generation)
+            self.retired_files.pop(file, None)
+        if complete:
+            for pid in [pid for pid in self.playlists if pid not in exported]:
+                changed = True
+                entry = self.playlists.pop(pid)
+                entry.generation = generation
+                self.removed[pid] = entry
+                self.retired_files[entry.file] = generation
+        if changed:
+            self.generation = generation
+        return changed
+
+    def obsolete_files(self, export_dir: Path, exported_files: Iterable[str]) -> List[Path]:
+        """Retired files that still exist and were not just exported (relative paths in exported_files)."""
+        exported = set(exported_files)
+        return [export_dir / f for f in sorted(self.retired_files) if f not in exported and (export_dir / f).is_file()]
+
+    def delta(self, since: int) -> Dict[str, Any]:
+        """Playlists added, changed and removed after generation since, plus the files that went away.
+
+        Raises:
+            ValueError: since is negative or newer than the current generation
+        """
+        if not 0 <= since <= self.generation:
+            raise ValueError(f"Generation {since} is outside 0..{self.generation}")
+        return {
+            "from_generation": since,
+            "generation": self.generation,
+            "added": {pid: asdict(e) for pid, e in sorted(self.playlists.items()) if e.added > since},
+            "changed": {pid: asdict(e) for pid, e in sorted(self.playlists.items()) if e.added <= since < e.generation},
+            "removed": {pid: asdict(e) for pid, e in sorted(self.removed.items()) if e.generation > since},
+            "removed_files": sorted(f for f, g in self.retired_files.items() if g > since),
+        }
+
+
+def write_delta_bundle(export_dir: Path, manifest: ExportManifest, since: int, bundle_path: Path) -> Dict[str, Any]:
+    """Write a zip with delta.json and the added and changed M3U files (at their relative paths).
+
+    Returns:
+        The delta written to delta.json
+    """
+    delta = manifest.delta(since)
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr(DELTA_NAME, json.dumps(delta, indent=1, ensure_ascii=False))
+        for entry in (*delta["added"].values(), *delta["changed"].values()):
+            bundle.write(export_dir / entry["file"], entry["file"])
+    logger.info(
+        f"Wrote delta bundle {bundle_path} (generation {since} -> {delta['generation']}: "
+        f"{len(delta['added'])} added, {len(delta['changed'])} changed, {len(delta['removed'])} removed)"
+    )
+    return delta
+
+
+__all__ = ["MANIFEST_NAME", "ManifestEntry", "ExportManifest", "write_delta_bundle"]
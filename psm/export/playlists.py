@@ -1,12 +1,65 @@
 from __future__ import annotations
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Dict, Any, Sequence
+from typing import Iterable, Dict, Any, List, Sequence
+import hashlib
 import logging
-from psm.utils.path_format import format_path_for_m3u
+import os
+import secrets
+import shutil
+from psm.utils.path_format import PathMapper
 
 logger = logging.getLogger(__name__)
 
 HEADER = "#EXTM3U"
+PLACEHOLDER_CONTENT = b"Missing track placeholder"
+
+
+@dataclass
+class WriteStats:
+    """Playlist files an export wrote vs left untouched because their content was unchanged."""
+
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    digests: Dict[str, str] = field(default_factory=dict)  # Path -> sha256 of its content (export manifest)
+
+
+def write_m3u(path: Path, lines: Sequence[str], stats: WriteStats | None = None) -> bool:
+    """Write playlist lines to path only if the content differs from the file on disk.
+
+    Unchanged files keep their mtime, so sync tools watching the export directory
+    don't re-transfer them. Changed files are written to a temporary file in the
+    same directory and moved into place with os.replace(), so readers never see
+    a half-written playlist.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    # Same bytes Path.write_text() would produce (platform newline translation)
+    data = "\n".join(lines).replace("\n", os.linesep).encode("utf-8")
+    try:
+        # Size check first: most changed playlists differ in length, so the read is rarely needed
+        unchanged = path.stat().st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        unchanged = False
+
+    if not unchanged:
+        # Hidden .tmp name so obsolete detection (*.m3u) never sees it; mode 0o666 lets the
+        # umask apply like a plain write would (mkstemp would create it 0600)
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    if stats is not None:
+        (stats.unchanged if unchanged else stats.written).append(str(path))
+        stats.digests[str(path)] = hashlib.sha256(data).hexdigest()
+    return not unchanged
 
 
 def sanitize_filename(name: str) -> str:
@@ -20,8 +73,8 @@ def export_strict(
     playlist: Dict[str, Any],
     tracks: Iterable[Dict[str, Any]],
     out_dir: Path,
-    path_format: str = "absolute",
-    library_roots: list[str] | None = None,
+    path_mapper: PathMapper | None = None,
+    stats: WriteStats | None = None,
 ):
     """Strict mode: only include resolved local file paths, omit missing tracks.
 
@@ -29,10 +82,11 @@ def export_strict(
         playlist: Playlist metadata dict
         tracks: Iterable of track dicts with 'local_path' field
         out_dir: Output directory for M3U file
-        path_format: "absolute" or "relative" paths in M3U
-        library_roots: Library root paths from config (for path reconstruction)
+        path_mapper: Formats track paths (absolute/relative, library roots); defaults to absolute
+        stats: Optional collector for written/unchanged files
     """
     out_dir.mkdir(parents=True, exist_ok=True)
+    path_mapper = path_mapper or PathMapper()
     playlist_id = playlist.get("id", "unknown")
     fname = f"{sanitize_filename(playlist.get('name', 'playlist'))}_{playlist_id[:8]}.m3u"
     path = out_dir / fname
@@ -46,15 +100,36 @@ def export_strict(
         local_path = t.get("local_path")
         if not local_path:
             continue
-        formatted_path = format_path_for_m3u(local_path, path, path_format, library_roots)
+        formatted_path = path_mapper.format(local_path, path)
         lines.append(formatted_path)
-    path.write_text("\n".join(lines), encoding="utf-8")
+    write_m3u(path, lines, stats)
 
     kept = sum(1 for t in tracks if t.get("local_path"))
     logger.debug(f"[exported] strict playlist='{playlist.get('name')}' kept={kept} file={path}")
     return path
 
 
+def _canonical_placeholder(out_dir: Path, placeholder_extension: str) -> Path:
+    """Return the shared placeholder file in out_dir that per-track placeholders link to, creating it if needed."""
+    canonical = out_dir / f".psm-placeholder{placeholder_extension}"
+    if not canonical.is_file():
+        # Write-then-replace: parallel exports into the same directory may race to create it
+        tmp_path = canonical.with_name(f"{canonical.name}.{secrets.token_hex(4)}.tmp")
+        tmp_path.write_bytes(PLACEHOLDER_CONTENT)
+        os.replace(tmp_path, canonical)
+    return canonical
+
+
+def _link_placeholder(canonical: Path, placeholder_path: Path) -> None:
+    """Hardlink placeholder_path to the shared placeholder; copy where hardlinks are unsupported (FAT/exFAT, some shares)."""
+    try:
+        os.link(canonical, placeholder_path)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copyfile(canonical, placeholder_path)
+
+
 def _extinf_line(track: Dict[str, Any], mark_missing: bool = False) -> str:
     # Duration in seconds (rounded) or -1 if unknown
     dur_ms = track.get("duration_ms")
@@ -76,8 +151,8 @@ def export_mirrored(
     playlist: Dict[str, Any],
     tracks: Sequence[Dict[str, Any]],
     out_dir: Path,
-    path_format: str = "absolute",
-    library_roots: list[str] | None = None,
+    path_mapper: PathMapper | None = None,
+    stats: WriteStats | None = None,
 ):
     """Mirrored mode: preserve full playlist order; include EXTINF lines for all tracks.
     Missing tracks use a placeholder path prefixed with '!' to indicate they're not available.
@@ -87,10 +162,11 @@ def export_mirrored(
         playlist: Playlist metadata dict
         tracks: Sequence of track dicts with 'local_path' field
         out_dir: Output directory for M3U file
-        path_format: "absolute" or "relative" paths in M3U
-        library_roots: Library root paths from config (for path reconstruction)
+        path_mapper: Formats track paths (absolute/relative, library roots); defaults to absolute
+        stats: Optional collector for written/unchanged files
     """
     out_dir.mkdir(parents=True, exist_ok=True)
+    path_mapper = path_mapper or PathMapper()
     playlist_id = playlist.get("id", "unknown")
     fname = f"{sanitize_filename(playlist.get('name', 'playlist'))}_{playlist_id[:8]}.m3u"
     path = out_dir / fname
@@ -113,7 +189,7 @@ def export_mirrored(
         lines.append(_extinf_line(t, mark_missing=is_missing))
         if t.get("local_path"):
             # Valid track - use actual path with formatting
-            formatted_path = format_path_for_m3u(t["local_path"], path, path_format, library_roots)
+            formatted_path = path_mapper.format(t["local_path"], path)
             lines.append(formatted_path)
         else:
             # Missing track - use placeholder with '!' prefix
@@ -121,7 +197,7 @@ def export_mirrored(
             name = (t.get("name") or "Unknown Track").strip()
             placeholder = f"!MISSING - {artist} - {name}"
             lines.append(placeholder)
-    path.write_text("\n".join(lines), encoding="utf-8")
+    write_m3u(path, lines, stats)
 
     missing = sum(1 for t in tracks if not t.get("local_path"))
     logger.debug(
@@ -135,30 +211,40 @@ def export_placeholders(
     tracks: Sequence[Dict[str, Any]],
     out_dir: Path,
     placeholder_extension: str = ".missing",
-    path_format: str = "absolute",
-    library_roots: list[str] | None = None,
+    path_mapper: PathMapper | None = None,
+    stats: WriteStats | None = None,
 ):
     """Placeholders mode: like mirrored, but create placeholder files for missing tracks.
 
     Placeholder files allow media players to show positional gaps. Each placeholder
-    is an empty (or tiny) file named using playlist position & track title.
+    is a tiny file named using playlist position & track title. Placeholders are
+    hardlinks to one shared file per directory (copies where hardlinks are not
+    supported), existing ones are reused across exports, and placeholders no longer
+    referenced (e.g. the track has since been matched) are removed.
 
     Args:
         playlist: Playlist metadata dict
         tracks: Sequence of track dicts with 'local_path' field
         out_dir: Output directory for M3U file
         placeholder_extension: Extension for placeholder files
-        path_format: "absolute" or "relative" paths in M3U
-        library_roots: Library root paths from config (for path reconstruction)
+        path_mapper: Formats track paths (absolute/relative, library roots); defaults to absolute
+        stats: Optional collector for written/unchanged files
     """
     out_dir.mkdir(parents=True, exist_ok=True)
+    path_mapper = path_mapper or PathMapper()
     playlist_id = playlist.get("id", "unknown")
     fname = f"{sanitize_filename(playlist.get('name', 'playlist'))}_{playlist_id[:8]}.m3u"
     path = out_dir / fname
     placeholders_dir = out_dir / (
         f"{sanitize_filename(playlist.get('name', 'playlist'))}_{playlist_id[:8]}_placeholders"
     )
-    placeholders_dir.mkdir(parents=True, exist_ok=True)
+    # One listing instead of an exists() check per missing track
+    try:
+        existing = {name for name in os.listdir(placeholders_dir) if name.endswith(placeholder_extension)}
+    except FileNotFoundError:
+        existing = set()
+    wanted = set()
+    canonical = None
     lines = [HEADER]
 
     # Add Spotify URL if playlist ID is available
@@ -180,19 +266,32 @@ def export_placeholders(
         used_names.add(unique_name)
         if not t.get("local_path"):
             placeholder_path = placeholders_dir / unique_name
-            if not placeholder_path.exists():
-                placeholder_path.write_text("Missing track placeholder", encoding="utf-8")
+            wanted.add(unique_name)
+            if unique_name not in existing:
+                if canonical is None:
+                    canonical = _canonical_placeholder(out_dir, placeholder_extension)
+                    placeholders_dir.mkdir(exist_ok=True)
+                _link_placeholder(canonical, placeholder_path)
             # For placeholder files, use relative path
             rel_path = placeholder_path.relative_to(out_dir)
             lines.append(_extinf_line(t) + " (PLACEHOLDER)")
             lines.append(str(rel_path))
         else:
             lines.append(_extinf_line(t))
-            formatted_path = format_path_for_m3u(t["local_path"], path, path_format, library_roots)
+            formatted_path = path_mapper.format(t["local_path"], path)
             lines.append(formatted_path)
-    path.write_text("\n".join(lines), encoding="utf-8")
+    write_m3u(path, lines, stats)
+
+    # Garbage-collect placeholders of tracks that are now matched (or moved/removed)
+    for name in existing - wanted:
+        (placeholders_dir / name).unlink(missing_ok=True)
+    if existing and not wanted:
+        try:
+            placeholders_dir.rmdir()
+        except OSError:
+            pass  # Not empty: keep files we did not create
 
-    placeholders = sum(1 for t in tracks if not t.get("local_path"))
+    placeholders = len(wanted)
     logger.debug(
         f"[exported] placeholders playlist='{playlist.get('name')}' total={len(tracks)} placeholders={placeholders} file={path}"
     )
@@ -204,4 +303,6 @@ __all__ = [
     "export_mirrored",
     "export_placeholders",
     "sanitize_filename",
+    "write_m3u",
+    "WriteStats",
 ]
@@ -122,10 +122,13 @@ class MainOrchestrator(QObject):
                 config = load_config()
                 db_path = Path(config["database"]["path"]).resolve()
 
+            # Change-journal cursor: advances only when rows actually change
+            self._change_cursor = self.facade.db.get_change_cursor()
+
             # Create controller - it will create DatabaseChangeDetector internally
             monitor = DbAutoRefreshController(
                 db_path=db_path,
-                get_write_epoch=lambda: self.facade.db.get_meta("last_write_epoch") or "0",
+                get_write_epoch=lambda: str(self.facade.db.get_change_cursor()),
                 on_change_detected=self._on_external_db_change,
             )
 
@@ -139,6 +142,14 @@ class MainOrchestrator(QObject):
         """Callback when external database change is detected."""
         watch_status = " [watch mode]" if self.watch_mode.is_active else ""
 
+        # Read exactly what changed since the last refresh from the change journal
+        try:
+            changes = self.facade.db.read_changes(self._change_cursor)
+            self._change_cursor = changes.cursor
+        except Exception as e:
+            logger.debug(f"Could not read change journal: {e}")
+            changes = None
+
         # Try to get write source for better logging
         try:
             write_source = self.facade.db.get_meta("last_write_source") or "unknown"
@@ -146,8 +157,12 @@ class MainOrchestrator(QObject):
         except Exception:
             self.window.append_log(f"🔄 Database changed externally, auto-refreshing...{watch_status}")
 
-        # Trigger fast refresh
-        self.data_refresh.refresh_tracks_only_async()
+        if changes is None or changes.truncated or changes.playlists or changes.liked:
+            # Playlist membership/metadata changed: playlists, albums and counts need reloading too
+            self.data_refresh.refresh_all_async()
+        else:
+            # Only tracks, files or matches changed: fast tracks-only refresh
+            self.data_refresh.refresh_tracks_only_async()
 
     def _show_welcome_message(self):
         """Show welcome message with getting started instructions."""
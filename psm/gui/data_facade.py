@@ -513,7 +513,7 @@ class DataFacade:
                 COUNT(DISTINCT CASE WHEN m.track_id IS NOT NULL THEN t.id END) as matched_count
             FROM tracks t
             LEFT JOIN playlist_tracks pt ON t.id = pt.track_id AND t.provider = pt.provider
-            LEFT JOIN matches m ON t.id = m.track_id AND t.provider = m.provider
+            LEFT JOIN best_match m ON t.id = m.track_id AND t.provider = m.provider
             WHERE t.provider = ?
               AND t.album IS NOT NULL
               AND t.artist IS NOT NULL
@@ -568,7 +568,7 @@ class DataFacade:
                 COUNT(DISTINCT CASE WHEN m.track_id IS NOT NULL THEN t.id END) as matched_count
             FROM tracks t
             LEFT JOIN playlist_tracks pt ON t.id = pt.track_id AND t.provider = pt.provider
-            LEFT JOIN matches m ON t.id = m.track_id AND t.provider = m.provider
+            LEFT JOIN best_match m ON t.id = m.track_id AND t.provider = m.provider
             WHERE t.provider = ?
               AND t.artist IS NOT NULL
             GROUP BY t.artist
@@ -1,7 +1,7 @@
 """Database change detection for GUI auto-refresh.
 
 This module provides automatic detection of external database changes
-using write-epoch signals and WAL-aware file monitoring.
+using the change_log cursor and WAL-aware file monitoring.
 """
 
 from __future__ import annotations
@@ -19,7 +19,8 @@ class DatabaseChangeDetector:
     """Monitors database for external changes and triggers refresh callbacks.
 
     Uses a two-tier detection strategy:
-    1. PRIMARY: Write-epoch meta key (only updated on real writes)
+    1. PRIMARY: Write epoch - the change_log cursor, which only advances when
+       rows actually change (see Database.get_change_cursor)
     2. FALLBACK: WAL-aware file mtime (when epoch unavailable)
 
     Includes defense mechanisms:
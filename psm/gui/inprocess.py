@@ -0,0 +1,168 @@
+"""In-process command execution for the GUI.
+
+Local pipeline commands (match, export, report, scan, ...) run directly in the
+GUI process on the runner's worker thread instead of in a `psm-cli`
+subprocess. That skips interpreter start, imports and, for matching, reloading
+every track and library file: a process-wide MatchIndexPool keeps the match
+index warm between actions (kept current through the change_log journal).
+
+Output of the worker thread is routed to the caller by ThreadRoutedStream
+(installed once as sys.stdout/stderr/stdin; other threads keep writing to the
+original streams; prompts read EOF and abort) and a thread-filtered logging handler. Progress arrives as
+structured events (psm.utils.events), and stop() cancels cooperatively through
+a CancelToken checked in the matching, scanning and export loops.
+
+Commands that talk to the provider (pull, build, login, playlist pull/push)
+and watch mode keep running out of process.
+"""
+
+from __future__ import annotations
+import io
+import logging
+import sys
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+from ..cli.embedded import LineSink, MatchIndexPool, invoke_cli
+from ..utils import events
+from ..utils.cancellation import CancelToken, cancel_scope
+
+# Top-level commands that only touch the database and local files
+IN_PROCESS_COMMANDS = frozenset(
+    {"analyze", "config", "diagnose", "export", "match", "remove-match", "report", "scan", "set-match", "sync-device"}
+)
+IN_PROCESS_PLAYLIST_COMMANDS = frozenset({"match", "export"})
+
+
+def runs_in_process(args: List[str]) -> bool:
+    """True if the GUI may run this command line in its own process."""
+    if not args or "--watch" in args or "--help" in args:
+        return False
+    if args[0] == "playlist":
+        return len(args) > 1 and args[1] in IN_PROCESS_PLAYLIST_COMMANDS
+    return args[0] in IN_PROCESS_COMMANDS
+
+
+class ThreadRoutedStream:
+    """Stand-in for sys.stdout/stderr/stdin that serves routed threads from their own stream.
+
+    Threads without a route use the original stream (which may be None in
+    windowed builds; writes are then dropped).
+    """
+
+    def __init__(self, fallback: Optional[TextIO]):
+        self._fallback = fallback
+        self._routes: Dict[int, Any] = {}
+
+    @contextmanager
+    def route(self, stream: Any) -> Iterator[None]:
+        """Serve the calling thread from stream for the duration of the block."""
+        ident = threading.get_ident()
+        self._routes[ident] = stream
+        try:
+            yield
+        finally:
+            self._routes.pop(ident, None)
+
+    def _target(self) -> Any:
+        return self._routes.get(threading.get_ident(), self._fallback)
+
+    def write(self, text: str) -> int:
+        target = self._target()
+        return target.write(text) if target is not None else len(text)
+
+    def flush(self) -> None:
+        target = self._target()
+        if target is not None:
+            target.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+class _ThreadLogHandler(logging.Handler):
+    """Forwards log records emitted on one thread to a line callback."""
+
+    def __init__(self, ident: int, emit_line: Callable[[str], None]):
+        super().__init__(logging.INFO)
+        self._ident = ident
+        self._emit_line = emit_line
+        self.setFormatter(logging.Formatter("%(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.thread != self._ident:
+            return
+        try:
+            for line in self.format(record).splitlines():
+                self._emit_line(line)
+        except Exception:
+            self.handleError(record)
+
+
+_routing_lock = threading.Lock()
+_streams: Dict[str, ThreadRoutedStream] = {}
+_match_indexes = MatchIndexPool()
+
+
+def _routed(name: str) -> ThreadRoutedStream:
+    """Install (once) and return the routed stand-in for sys.<name>."""
+    with _routing_lock:
+        stream = _streams.get(name)
+        if stream is None or getattr(sys, name) is not stream:
+            stream = _streams[name] = ThreadRoutedStream(getattr(sys, name))
+            setattr(sys, name, stream)
+        return stream
+
+
+class InProcessCommand:
+    """One command line executed in the GUI process (call run() on a worker thread)."""
+
+    def __init__(
+        self,
+        args: List[str],
+        on_line: Callable[[str], None],
+        on_event: Callable[[Dict[str, Any]], None] | None = None,
+        config: Dict[str, Any] | None = None,
+    ):
+        """Initialize command.
+
+        Args:
+            args: CLI arguments (e.g. ['match', '--full'])
+            on_line: Receives each output line (stdout, stderr and INFO+ log records)
+            on_event: Receives structured progress events
+            config: Fixed configuration (tests); None loads .env/environment per run
+        """
+        self.args = list(args)
+        self.on_line = on_line
+        self.on_event = on_event
+        self.config = config
+        self.token = CancelToken()
+
+    def run(self) -> int:
+        """Run the command; raises OperationCancelled if cancel() was called."""
+        sink = LineSink(self.on_line)
+        handler = _ThreadLogHandler(threading.get_ident(), self.on_line)
+        root = logging.getLogger()
+        root.addHandler(handler)
+        if self.on_event is not None:
+            events.enable(self.on_event)
+        try:
+            with ExitStack() as stack:
+                stack.enter_context(cancel_scope(self.token))
+                stack.enter_context(_routed("stdout").route(sink))
+                stack.enter_context(_routed("stderr").route(sink))
+                stack.enter_context(_routed("stdin").route(io.StringIO()))  # Prompts abort instead of blocking
+                return invoke_cli(self.args, obj=self.config, match_indexes=_match_indexes)
+        finally:
+            if self.on_event is not None:
+                events.disable()
+            root.removeHandler(handler)
+            sink.close_partial()
+
+    def cancel(self) -> None:
+        """Request cancellation at the next checkpoint (callable from any thread)."""
+        self.token.cancel()
+
+
+__all__ = ["IN_PROCESS_COMMANDS", "InProcessCommand", "ThreadRoutedStream", "runs_in_process"]
@@ -9,10 +9,13 @@ Supports standardized progress formats from psm.utils.progress:
 - Status: "→ Status message"
 
 Also supports legacy formats for backward compatibility.
+
+Runs started with `--events json` report progress as structured events
+instead; progress_from_event() maps those without any text parsing.
 """
 
 import re
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 # Regex patterns for standardized progress formats
 PATTERNS = {
@@ -172,3 +175,37 @@ def is_completion_marker(line: str) -> bool:
         or PATTERNS["completion_matched"].search(line)
         or PATTERNS["completion_created"].search(line)
     )
+
+
+def progress_from_event(event: Dict[str, Any]) -> Optional[Tuple[int, int, str]]:
+    """Map a structured progress event (psm.utils.events) to a progress update.
+
+    Args:
+        event: Decoded event object
+
+    Returns:
+        Tuple of (current, total, message) with the same conventions as
+        parse_progress(), or None for events that carry no progress
+    """
+    kind = event.get("type")
+    if kind == "progress":
+        current = int(event.get("current", 0))
+        total = int(event.get("total") or 0)
+        item = event.get("item", "items")
+        if not total:
+            return (current, 0, f"{item}: {current}")
+        message = f"{item}: {current}/{total}"
+        eta = event.get("eta")
+        if eta is not None and current < total:
+            message += f" (~{eta:.0f}s left)"
+        return (current, total, message)
+    if kind == "stage_start":
+        step, total_steps = event.get("step"), event.get("total_steps")
+        if step and total_steps:
+            return (int(step), int(total_steps), event["stage"])
+        return (0, 0, f"→ {event['stage']}")
+    if kind == "stage_end":
+        return (100, 100, f"✓ {event['stage']}")
+    if kind == "status":
+        return (0, 0, event["message"])
+    return None
@@ -1,19 +1,33 @@
 """CLI subprocess runner for executing long-running operations.
 
 Spawns CLI commands as subprocesses and streams logs/progress back to GUI.
+Local pipeline commands (match, export, report, scan, ...) run in-process on
+the runner thread instead (see inprocess.py); otherwise, when a `psm serve`
+daemon is running, commands are sent to it, which skips the per-command
+interpreter start, imports and catalog loading.
+
+Progress comes from structured events (`psm --events json`) read from a
+dedicated pipe (or the daemon's event stream); log lines are only
+regex-parsed for progress when no event channel could be set up.
 """
 
 from __future__ import annotations
+import json
 import os
 import subprocess
 import sys
 import logging
 import platform
+import threading
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Any, Dict, Optional, Callable, List, Tuple
 from PySide6.QtCore import QObject, QThread, Signal
 
-from .progress_parser import parse_progress
+from .inprocess import InProcessCommand, runs_in_process
+from .progress_parser import parse_progress, progress_from_event
+from ..daemon import DaemonClient, find_daemon, runs_locally
+from ..utils.cancellation import OperationCancelled
+from ..utils.events import EVENTS_FD_ENV
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +73,25 @@ def _get_cli_command() -> tuple[list[str], str | None]:
         return ([sys.executable, "-m", "psm.cli"], None)
 
 
+def _open_event_pipe() -> Tuple[int, int, str, Dict[str, Any]]:
+    """Create the pipe a CLI subprocess writes its progress events to.
+
+    Returns:
+        Tuple of (read_fd, write_fd, PSM_EVENTS_FD value for the child,
+        extra Popen keyword arguments that let the child inherit write_fd)
+    """
+    read_fd, write_fd = os.pipe()
+    if platform.system() == "Windows":
+        import msvcrt
+
+        handle = msvcrt.get_osfhandle(write_fd)
+        os.set_handle_inheritable(handle, True)
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.lpAttributeList = {"handle_list": [handle]}
+        return read_fd, write_fd, str(handle), {"startupinfo": startupinfo, "close_fds": True}
+    return read_fd, write_fd, str(write_fd), {"pass_fds": (write_fd,)}
+
+
 class CliRunner(QThread):
     """Background thread for running CLI commands via subprocess."""
 
@@ -78,11 +111,113 @@ class CliRunner(QThread):
         super().__init__(parent)
         self.command_args = command_args
         self.process: Optional[subprocess.Popen] = None
+        self.daemon_client: Optional[DaemonClient] = None
+        self.in_process: Optional[InProcessCommand] = None
         self._stop_requested = False
+        self._parse_lines = True  # Regex fallback until an event channel is attached
+
+    def _emit_line(self, line: str):
+        """Forward one output line to the log (and, without events, progress) signals."""
+        line = line.rstrip()
+        if line:
+            self.log_line.emit(line)
+
+            if self._parse_lines:
+                progress = parse_progress(line)
+                if progress:
+                    current, total, message = progress
+                    self.progress_update.emit(current, total, message)
+
+    def _emit_event(self, event: Dict[str, Any]):
+        """Forward one structured progress event to the progress signal."""
+        progress = progress_from_event(event)
+        if progress:
+            self.progress_update.emit(*progress)
+
+    def _read_events(self, read_fd: int):
+        """Pump JSON-lines events from the subprocess pipe (runs in its own thread)."""
+        with open(read_fd, encoding="utf-8", errors="replace") as stream:
+            for raw in stream:
+                try:
+                    event = json.loads(raw)
+                except ValueError:
+                    continue
+                if not self._stop_requested:
+                    self._emit_event(event)
+
+    def _run_in_process(self) -> bool:
+        """Run a local command directly in the GUI process (on this thread).
+
+        Returns:
+            True if the command ran in-process (finished was emitted), False to
+            use the daemon or a subprocess (remote/interactive command, or disabled
+            via PSM_NO_INPROCESS)
+        """
+        if os.environ.get("PSM_NO_INPROCESS") or not runs_in_process(self.command_args):
+            return False
+
+        logger.info(f"Running command in-process: {' '.join(self.command_args)}")
+        self.in_process = InProcessCommand(self.command_args, on_line=self._emit_line, on_event=self._emit_event)
+        self._parse_lines = False
+        if self._stop_requested:
+            self.in_process.cancel()
+        try:
+            exit_code = self.in_process.run()
+        except OperationCancelled:
+            logger.info("Command cancelled by user")
+            self.finished.emit(-1)
+            return True
+
+        if self._stop_requested:
+            logger.info("Command cancelled by user")
+            self.finished.emit(-1)
+        else:
+            logger.info(f"Command completed with exit code {exit_code}")
+            self.finished.emit(exit_code)
+        return True
+
+    def _run_via_daemon(self) -> bool:
+        """Run the command in a `psm serve` daemon if one is up.
+
+        Returns:
+            True if the daemon handled the command (finished was emitted), False to
+            fall back to a subprocess (no daemon, daemon busy, or local-only command)
+        """
+        if os.environ.get("PSM_NO_DAEMON") or runs_locally(self.command_args):
+            return False
+        info = find_daemon()
+        if info is None:
+            return False
+
+        logger.info(f"Running command via psm daemon (pid {info.pid}): {' '.join(self.command_args)}")
+        self.daemon_client = DaemonClient(info)
+        self._parse_lines = False
+        try:
+            exit_code = self.daemon_client.run(self.command_args, on_line=self._emit_line, on_event=self._emit_event)
+        except ConnectionError as e:
+            if self._stop_requested:
+                logger.info("Command cancelled by user")
+                self.finished.emit(-1)
+            else:
+                logger.error(f"Lost connection to psm daemon: {e}")
+                self.error.emit(f"Lost connection to psm daemon: {e}")
+                self.finished.emit(-1)
+            return True
+
+        if exit_code is None:
+            logger.info("psm daemon busy; running command in a subprocess")
+            self._parse_lines = True
+            return False
+        logger.info(f"Command completed with exit code {exit_code}")
+        self.finished.emit(exit_code)
+        return True
 
     def run(self):
         """Execute the CLI command and stream output."""
         try:
+            if self._run_in_process() or self._run_via_daemon():
+                return
+
             # Get CLI command based on frozen/source mode
             cli_prefix, error_msg = _get_cli_command()
 
@@ -93,16 +228,27 @@ class CliRunner(QThread):
                 self.finished.emit(1)
                 return
 
-            # Build full command: [cli_prefix...] + command_args
-            cmd = cli_prefix + self.command_args
-
-            logger.info(f"Running command: {' '.join(cmd)}")
-
             # Set environment to force UTF-8 encoding for subprocess
             env = os.environ.copy()
             env["PYTHONIOENCODING"] = "utf-8"  # Force UTF-8 encoding for Python subprocess
             env["PSM_SKIP_FIRST_RUN_CHECK"] = "1"  # Skip first-run .env check when running from GUI
 
+            # Structured progress events on a dedicated pipe (falls back to parsing log lines)
+            event_args: List[str] = []
+            event_popen_kwargs: Dict[str, Any] = {}
+            read_fd = write_fd = None
+            try:
+                read_fd, write_fd, env[EVENTS_FD_ENV], event_popen_kwargs = _open_event_pipe()
+                event_args = ["--events", "json"]
+                self._parse_lines = False
+            except (OSError, AttributeError) as e:
+                logger.warning(f"Progress event pipe unavailable, parsing log output instead: {e}")
+
+            # Build full command: [cli_prefix...] + [--events json] + command_args
+            cmd = cli_prefix + event_args + self.command_args
+
+            logger.info(f"Running command: {' '.join(cmd)}")
+
             # Platform-specific subprocess options
             creation_flags = 0
             if platform.system() == "Windows" and getattr(sys, "frozen", False):
@@ -111,37 +257,43 @@ class CliRunner(QThread):
                 creation_flags = subprocess.CREATE_NO_WINDOW
 
             # Start subprocess with line-buffered output and UTF-8 encoding
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Merge stderr into stdout
-                text=True,
-                bufsize=1,  # Line buffered
-                universal_newlines=True,
-                encoding="utf-8",  # Force UTF-8 to handle Unicode characters
-                errors="replace",  # Replace unencodable characters instead of crashing
-                env=env,  # Pass modified environment
-                creationflags=creation_flags,  # Suppress console on Windows frozen
-            )
+            try:
+                self.process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,  # Merge stderr into stdout
+                    text=True,
+                    bufsize=1,  # Line buffered
+                    universal_newlines=True,
+                    encoding="utf-8",  # Force UTF-8 to handle Unicode characters
+                    errors="replace",  # Replace unencodable characters instead of crashing
+                    env=env,  # Pass modified environment
+                    creationflags=creation_flags,  # Suppress console on Windows frozen
+                    **event_popen_kwargs,
+                )
+            except BaseException:
+                if read_fd is not None:
+                    os.close(read_fd)  # No child and no reader: don't leak the pipe
+                    os.close(write_fd)
+                raise
+
+            event_reader = None
+            if read_fd is not None:
+                os.close(write_fd)  # Child holds the only write end: EOF when it exits
+                event_reader = threading.Thread(target=self._read_events, args=(read_fd,), daemon=True)
+                event_reader.start()
 
             # Stream output line by line
             for line in self.process.stdout:
                 if self._stop_requested:
                     break
 
-                line = line.rstrip()
-                if line:
-                    # Emit log line
-                    self.log_line.emit(line)
-
-                    # Parse for progress
-                    progress = parse_progress(line)
-                    if progress:
-                        current, total, message = progress
-                        self.progress_update.emit(current, total, message)
+                self._emit_line(line)
 
             # Wait for process completion
             exit_code = self.process.wait()
+            if event_reader is not None:
+                event_reader.join(timeout=5)
 
             if self._stop_requested:
                 logger.info("Command cancelled by user")
@@ -158,6 +310,12 @@ class CliRunner(QThread):
     def stop(self):
         """Request to stop the running command."""
         self._stop_requested = True
+        if self.in_process is not None:
+            # Raises OperationCancelled at the command's next cancellation checkpoint
+            self.in_process.cancel()
+        if self.daemon_client is not None:
+            # Closing the connection cancels the command at its next output line
+            self.daemon_client.close()
         if self.process and self.process.poll() is None:
             logger.info("Terminating subprocess...")
             self.process.terminate()
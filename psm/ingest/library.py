@@ -1,12 +1,19 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, List, Sequence, Tuple
+from dataclasses import dataclass, field
 import mutagen
 from ..utils.fs import iter_music_files, normalize_library_path
-from ..utils.hashing import partial_hash
+from .prefetch import PrefetchScanner, ScanCandidate
+from .tag_cache import TagCache, open_tag_cache
+from .tag_reader import read_fast_tags
+from ..utils.hashing import partial_hash, resolve_algorithm, same_content, split_hash
 from ..utils.normalization import normalize_title_artist
+from ..utils import events
+from ..utils.cancellation import check_cancelled
 from ..utils.logging_helpers import log_progress, format_summary
+from ..utils.latency import PhaseTimings
+import os
 import time
 import logging
 import click
@@ -16,6 +23,16 @@ import re
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RootScanStats:
+    """Per-root counters from a concurrent multi-root scan."""
+
+    path: str
+    files_seen: int = 0
+    processed: int = 0
+    duration_seconds: float = 0.0
+
+
 @dataclass
 class ScanResult:
     """Results from a library scan operation."""
@@ -27,6 +44,9 @@ class ScanResult:
     deleted: int = 0
     errors: int = 0
     duration_seconds: float = 0.0
+    phase_timings: PhaseTimings | None = None  # Per-phase I/O latency (network mode only)
+    root_stats: Dict[str, RootScanStats] = field(default_factory=dict)  # Concurrent scans only
+    tag_cache_hits: int = 0  # Files whose metadata came from the sidecar tag cache
 
 
 TAG_CANDIDATES = [
@@ -43,13 +63,13 @@ def extract_tags(audio) -> Dict[str, Any]:
     if not audio:
         return tags
     if getattr(audio, "tags", None):
-        for field, keys in TAG_CANDIDATES:
+        for tag_name, keys in TAG_CANDIDATES:
             for k in keys:
                 if k in audio.tags:
                     val = audio.tags.get(k)
                     if isinstance(val, list):
                         val = val[0]
-                    tags[field] = str(val)
+                    tags[tag_name] = str(val)
                     break
     return tags
 
@@ -121,6 +141,7 @@ def scan_specific_files(db, cfg: Dict[str, Any], file_paths: List[Path]) -> Scan
     result = ScanResult()
     start = time.time()
     since_commit = 0
+    tag_cache = open_tag_cache(cfg, getattr(db, "path", None))
 
     logger.info(f"Scanning {len(file_paths)} specific files...")
 
@@ -143,11 +164,13 @@ def scan_specific_files(db, cfg: Dict[str, Any], file_paths: List[Path]) -> Scan
         result.files_seen += 1
 
         try:
-            _process_single_file(db, cfg, p, result, use_year)
+            _process_single_file(db, cfg, p, result, use_year, tag_cache)
             since_commit += 1
 
             if commit_interval and since_commit >= commit_interval:
                 db.commit()
+                if tag_cache is not None:
+                    tag_cache.flush()
                 since_commit = 0
 
         except Exception as e:
@@ -155,10 +178,118 @@ def scan_specific_files(db, cfg: Dict[str, Any], file_paths: List[Path]) -> Scan
             logger.debug(f"{click.style('[error]', fg='red')} {p}: {e}")
 
     db.commit()
+    if tag_cache is not None:
+        result.tag_cache_hits = tag_cache.hits
+        tag_cache.close()
     result.duration_seconds = time.time() - start
     return result
 
 
+@dataclass
+class MoveResult:
+    """Results from applying filesystem moves to library_files."""
+
+    moved: int = 0  # Rows whose path was updated in place
+    replaced: int = 0  # Rows deleted because a move overwrote their file
+    moved_file_ids: List[int] = field(default_factory=list)
+    unresolved: List[Path] = field(default_factory=list)  # Destinations that need a regular scan
+
+
+def _prefix_range(directory: str) -> Tuple[str, str]:
+    """Bounds such that lo <= path < hi selects every path under directory (index range scan)."""
+    prefix = directory.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+# Keep IN (...) lists below SQLite's default host-parameter limit
+_LOOKUP_CHUNK = 500
+
+
+def lookup_file_ids(db, paths: Sequence[Path | str]) -> Dict[str, int]:
+    """Map library paths to file IDs with batched IN queries.
+
+    Args:
+        db: Database instance
+        paths: File paths (normalized before lookup)
+
+    Returns:
+        Dict of normalized path -> file ID for paths present in library_files
+    """
+    normalized = list(dict.fromkeys(normalize_library_path(p) for p in paths))
+    ids: Dict[str, int] = {}
+    for i in range(0, len(normalized), _LOOKUP_CHUNK):
+        chunk = normalized[i : i + _LOOKUP_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        for row in db.conn.execute(f"SELECT id, path FROM library_files WHERE path IN ({placeholders})", chunk):
+            ids[row["path"]] = row["id"]
+    return ids
+
+
+def file_ids_under(db, directories: Sequence[Path | str]) -> List[int]:
+    """Return IDs of all library files below the given directories."""
+    ids: List[int] = []
+    for directory in directories:
+        lo, hi = _prefix_range(normalize_library_path(directory))
+        ids.extend(
+            row["id"] for row in db.conn.execute("SELECT id FROM library_files WHERE path >= ? AND path < ?", (lo, hi))
+        )
+    return ids
+
+
+def apply_library_moves(db, moves: Sequence[Tuple[Path | str, Path | str, bool]]) -> MoveResult:
+    """Apply file/directory moves as in-place path updates.
+
+    A rename keeps the row id, tags and matches, so no re-parse or re-match is
+    needed. Moves are applied in order. A file move whose source is not in the
+    library (e.g. a download renamed from ``.part``) is reported in
+    ``unresolved`` so the caller can scan the destination instead.
+
+    Args:
+        db: Database instance
+        moves: (src, dest, is_directory) tuples in event order
+
+    Returns:
+        MoveResult with counts, moved file IDs and unresolved destinations
+    """
+    result = MoveResult()
+    moved_ids: Dict[int, None] = {}
+    for src, dest, is_directory in moves:
+        src_str = normalize_library_path(src)
+        dest_str = normalize_library_path(dest)
+        if src_str == dest_str:
+            continue
+        if is_directory:
+            prefix, upper = _prefix_range(src_str)
+            # Range scan on the unique path index: every path starting with prefix
+            rows = db.conn.execute(
+                "SELECT id, path FROM library_files WHERE path >= ? AND path < ?", (prefix, upper)
+            ).fetchall()
+            updates = [(dest_str.rstrip(os.sep) + row["path"][len(prefix) - 1 :], row["id"]) for row in rows]
+        else:
+            row = db.conn.execute("SELECT id FROM library_files WHERE path=?", (src_str,)).fetchone()
+            if row is None:
+                if not db.conn.execute("SELECT 1 FROM library_files WHERE path=?", (dest_str,)).fetchone():
+                    result.unresolved.append(Path(dest))
+                continue
+            updates = [(dest_str, row["id"])]
+
+        for new_path, file_id in updates:
+            # A move onto an existing library file replaces it
+            existing = db.conn.execute("SELECT id FROM library_files WHERE path=?", (new_path,)).fetchone()
+            if existing and existing["id"] != file_id:
+                db.conn.execute("DELETE FROM matches WHERE file_id=?", (existing["id"],))
+                db.conn.execute("DELETE FROM library_files WHERE id=?", (existing["id"],))
+                moved_ids.pop(existing["id"], None)
+                result.replaced += 1
+            db.conn.execute("UPDATE library_files SET path=? WHERE id=?", (new_path, file_id))
+            moved_ids[file_id] = None
+            result.moved += 1
+            logger.debug(f"{click.style('[moved]', fg='blue')} {new_path}")
+    db.commit()
+    result.moved_file_ids = list(moved_ids)
+    return result
+
+
 def scan_library_incremental(
     db, cfg: Dict[str, Any], changed_since: float | None = None, specific_paths: List[Path] | None = None
 ) -> ScanResult:
@@ -179,15 +310,19 @@ def scan_library_incremental(
 
     lib_cfg = cfg["library"]
 
-    # Override paths if specific paths provided
+    # Override paths if specific paths provided; only files below them can be detected as deleted
+    delete_scope = None
     if specific_paths:
         lib_cfg = {**lib_cfg, "paths": [str(p) for p in specific_paths]}
+        delete_scope = [normalize_library_path(p) for p in specific_paths]
 
     # Perform full scan with filtering
-    return _scan_library_internal(db, cfg, lib_cfg, changed_since=changed_since)
+    return _scan_library_internal(db, cfg, lib_cfg, changed_since=changed_since, delete_scope=delete_scope)
 
 
-def _process_single_file(db, cfg: Dict[str, Any], p: Path, result: ScanResult, use_year: bool) -> None:
+def _process_single_file(
+    db, cfg: Dict[str, Any], p: Path, result: ScanResult, use_year: bool, tag_cache: TagCache | None = None
+) -> None:
     """Process a single file and update the database.
 
     Helper function used by both full and incremental scans.
@@ -203,11 +338,33 @@ def _process_single_file(db, cfg: Dict[str, Any], p: Path, result: ScanResult, u
         logger.debug(f"{click.style('[io-error]', fg='red')} {p}")
         return
 
-    try:
-        audio = mutagen.File(p)
-    except Exception:
-        audio = None
+    metadata = _cached_metadata(tag_cache, path_str, st, use_year)
+    if metadata is None:
+        metadata = read_file_metadata(cfg, p, use_year)
+        if tag_cache is not None:
+            tag_cache.put(path_str, st, *metadata)
+    record, parse_error = metadata
+    if parse_error:
         result.errors += 1
+    _store_file_record(db, p, path_str, st, record, result)
+
+
+def read_file_metadata(cfg: Dict[str, Any], p: Path, use_year: bool) -> Tuple[Dict[str, Any], bool]:
+    """Read tags and stream info for one file.
+
+    Performs no database access, so concurrent scans call it from worker threads.
+
+    Returns:
+        Tuple of (library_files column values excluding path/size/mtime, parse_error flag)
+    """
+    parse_error = False
+    audio = read_fast_tags(p) if cfg["library"].get("fast_tags", True) else None
+    if audio is None:
+        try:
+            audio = mutagen.File(p)
+        except Exception:
+            audio = None
+            parse_error = True
 
     tags = extract_tags(audio)
     title = tags.get("title") or p.stem
@@ -235,29 +392,49 @@ def _process_single_file(db, cfg: Dict[str, Any], p: Path, result: ScanResult, u
             channels = getattr(audio.info, "channels", 2)
             bitrate_kbps = int((sample_rate * bits_per_sample * channels) / 1000)
 
-    ph = partial_hash(p)
-    nt, na, combo = normalize_title_artist(title, artist)
-    if use_year and year is not None:
-        combo = f"{combo} {year}"
-
+    fields = {
+        "title": title,
+        "album": album,
+        "artist": artist,
+        "duration": duration,
+        "year": year,
+        "bitrate_kbps": bitrate_kbps,
+    }
+    return _build_record(fields, use_year), parse_error
+
+
+def _build_record(fields: Dict[str, Any], use_year: bool) -> Dict[str, Any]:
+    """Add derived columns (normalized key, partial hash placeholder) to extracted tag fields."""
+    nt, na, combo = normalize_title_artist(fields["title"], fields["artist"])
+    if use_year and fields["year"] is not None:
+        combo = f"{combo} {fields['year']}"
+    return {
+        # Computed lazily by ensure_partial_hashes() when rename/duplicate detection needs it
+        "partial_hash": None,
+        **fields,
+        "normalized": combo,
+    }
+
+
+def _cached_metadata(
+    tag_cache: TagCache | None, path_str: str, st, use_year: bool
+) -> Tuple[Dict[str, Any], bool] | None:
+    """Return (record, parse_error) from the sidecar tag cache, or None on a miss."""
+    if tag_cache is None:
+        return None
+    cached = tag_cache.get(path_str, st)
+    if cached is None:
+        return None
+    fields, parse_error = cached
+    return _build_record(fields, use_year), parse_error
+
+
+def _store_file_record(db, p: Path, path_str: str, st, record: Dict[str, Any], result: ScanResult) -> None:
+    """Upsert a parsed file record and update scan counters."""
     # Check if exists
     existing = db.conn.execute("SELECT id FROM library_files WHERE path=?", (path_str,)).fetchone()
 
-    db.add_library_file(
-        {
-            "path": path_str,
-            "size": st.st_size,
-            "mtime": st.st_mtime,
-            "partial_hash": ph,
-            "title": title,
-            "album": album,
-            "artist": artist,
-            "duration": duration,
-            "normalized": combo,
-            "year": year,
-            "bitrate_kbps": bitrate_kbps,
-        }
-    )
+    db.add_library_file({"path": path_str, "size": st.st_size, "mtime": st.st_mtime, **record})
 
     if existing:
         result.updated += 1
@@ -268,17 +445,120 @@ def _process_single_file(db, cfg: Dict[str, Any], p: Path, result: ScanResult, u
         action = "new"
         color = "green"
 
+    year = record["year"]
     logger.debug(
-        f"{click.style(f'[{action}]', fg=color)} {p} | title='{title}' artist='{artist}' album='{album}' year={year if year is not None else '-'}"
+        f"{click.style(f'[{action}]', fg=color)} {p} | title='{record['title']}' artist='{record['artist']}' album='{record['album']}' year={year if year is not None else '-'}"
     )
 
 
+def ensure_partial_hashes(
+    db, file_ids: List[int], algorithm: str | None = None, timings: PhaseTimings | None = None
+) -> Dict[int, str]:
+    """Return partial hashes for the given files, computing missing ones on demand.
+
+    Scans no longer hash every file; callers that need content identity
+    (rename/move or duplicate detection) request hashes here instead. Hashes
+    are persisted so each file is read at most once until it changes.
+
+    Args:
+        db: Database instance
+        file_ids: Library file IDs to hash
+        algorithm: Hash algorithm name (None/"auto" picks the fastest available)
+        timings: Optional PhaseTimings to record per-file hash latency under "hash"
+
+    Returns:
+        Mapping of file ID to stored hash value (files that cannot be read are omitted)
+    """
+    if not file_ids:
+        return {}
+
+    algorithm = resolve_algorithm(algorithm)
+    hashes: Dict[int, str] = {}
+    since_commit = 0
+    for start in range(0, len(file_ids), 500):
+        chunk = list(file_ids[start : start + 500])
+        placeholders = ",".join("?" * len(chunk))
+        rows = db.conn.execute(
+            f"SELECT id, path, partial_hash FROM library_files WHERE id IN ({placeholders})", chunk
+        ).fetchall()
+        for row in rows:
+            if row["partial_hash"]:
+                hashes[row["id"]] = row["partial_hash"]
+                continue
+            hash_start = time.perf_counter()
+            try:
+                value = partial_hash(Path(row["path"]), algorithm=algorithm)
+            except OSError:
+                logger.debug(f"{click.style('[io-error]', fg='red')} {row['path']} (hash)")
+                continue
+            finally:
+                if timings is not None:
+                    timings.record("hash", time.perf_counter() - hash_start)
+            db.conn.execute("UPDATE library_files SET partial_hash=? WHERE id=?", (value, row["id"]))
+            hashes[row["id"]] = value
+            since_commit += 1
+    if since_commit:
+        db.commit()
+    return hashes
+
+
+def find_duplicate_files(db, algorithm: str | None = None, timings: PhaseTimings | None = None) -> List[List[str]]:
+    """Find library files with identical content.
+
+    Only files that share their size with another file are hashed (through
+    ensure_partial_hashes, so hashes are reused and persisted). Stored hashes
+    made with another algorithm (e.g. legacy SHA-1 values) are verified by
+    re-hashing the candidate with that algorithm.
+
+    Args:
+        db: Database instance
+        algorithm: Hash algorithm for files without a stored hash (None/"auto" picks the fastest available)
+        timings: Optional PhaseTimings to record per-file hash latency under "hash"
+
+    Returns:
+        Groups of two or more paths with the same content, each sorted, largest files first
+    """
+    rows = db.conn.execute(
+        "SELECT id, path, size FROM library_files WHERE size IN "
+        "(SELECT size FROM library_files WHERE size > 0 GROUP BY size HAVING COUNT(*) > 1) "
+        "ORDER BY size DESC, path"
+    ).fetchall()
+    hashes = ensure_partial_hashes(db, [row["id"] for row in rows], algorithm, timings)
+
+    by_size: Dict[int, List[Any]] = {}
+    for row in rows:
+        if row["id"] in hashes:
+            by_size.setdefault(row["size"], []).append(row)
+
+    groups: List[List[str]] = []
+    for candidates in by_size.values():
+        clusters: List[Tuple[str, List[str]]] = []  # (representative hash, paths)
+        for row in candidates:
+            value = hashes[row["id"]]
+            for reference, paths in clusters:
+                if value == reference or (
+                    split_hash(value)[0] != split_hash(reference)[0] and same_content(Path(row["path"]), reference)
+                ):
+                    paths.append(row["path"])
+                    break
+            else:
+                clusters.append((value, [row["path"]]))
+        groups.extend(sorted(paths) for _, paths in clusters if len(paths) > 1)
+    return groups
+
+
 def _scan_library_internal(
-    db, cfg: Dict[str, Any], lib_cfg: Dict[str, Any], changed_since: float | None = None
+    db,
+    cfg: Dict[str, Any],
+    lib_cfg: Dict[str, Any],
+    changed_since: float | None = None,
+    delete_scope: Sequence[str] | None = None,
 ) -> ScanResult:
     """Internal scan implementation with optional time-based filtering.
 
     This is refactored from the original scan_library to support incremental mode.
+    When delete_scope is given (normalized directories), only files below those
+    directories are removed if not seen; otherwise every unseen file is removed.
     """
     paths = lib_cfg["paths"]
     extensions = lib_cfg["extensions"]
@@ -287,6 +567,8 @@ def _scan_library_internal(
     skip_unchanged = lib_cfg.get("skip_unchanged", True)
     fast_scan = lib_cfg.get("fast_scan", True)
     commit_interval = int(lib_cfg.get("commit_interval", 100) or 0)
+    network_mode = lib_cfg.get("network_mode", False)
+    parallel_roots = lib_cfg.get("parallel_roots", True)
     use_year = cfg.get("matching", {}).get("use_year")
 
     result = ScanResult()
@@ -296,6 +578,7 @@ def _scan_library_internal(
     progress_interval = 100
     last_progress_log = 0
     last_dir_logged = None
+    tag_cache = open_tag_cache(cfg, getattr(db, "path", None))
 
     # Batch load existing file metadata
     existing_files = {}
@@ -324,120 +607,166 @@ def _scan_library_internal(
             existing_files = {row["path"]: (row["size"], row["mtime"], row["partial_hash"]) for row in rows}
         logger.debug(f"Loaded {len(existing_files)} existing files for skip-unchanged checks")
 
-    try:
-        for p in iter_music_files(paths, extensions, ignore_patterns, follow_symlinks):
-            result.files_seen += 1
-
-            # Log directory change
-            current_dir = str(p.parent)
-            if current_dir != last_dir_logged:
-                logger.debug(f"{click.style('[scanning]', fg='cyan')} {current_dir}")
-                last_dir_logged = current_dir
-
-            path_str = str(p.resolve())
-            seen_paths.add(path_str)
-
-            try:
-                st = p.stat()
-            except OSError:
-                result.errors += 1
-                logger.debug(f"{click.style('[io-error]', fg='red')} {p}")
-                continue
+    def report_progress() -> None:
+        nonlocal last_progress_log
+        check_cancelled()
+        if result.files_seen - last_progress_log >= progress_interval:
+            elapsed = time.time() - start
+            log_progress(
+                processed=result.files_seen,
+                total=None,
+                new=result.inserted,
+                updated=result.updated,
+                skipped=result.skipped,
+                elapsed_seconds=elapsed,
+                item_name="files",
+            )
+            last_progress_log = result.files_seen
+
+    def log_directory(p: Path) -> None:
+        nonlocal last_dir_logged
+        current_dir = str(p.parent)
+        if current_dir != last_dir_logged:
+            logger.debug(f"{click.style('[scanning]', fg='cyan')} {current_dir}")
+            last_dir_logged = current_dir
+
+    def needs_processing(p: Path, path_str: str, st) -> bool:
+        """Apply time-based and skip-unchanged filters; False means the file was skipped."""
+        # Check if file exists in DB
+        file_in_db = path_str in existing_files
+
+        # Time-based filtering: ONLY skip files that are ALREADY in DB and not modified
+        if changed_since is not None and file_in_db:
+            # File exists in DB, check if it was modified since cutoff
+            if st.st_mtime < changed_since:
+                # Not modified since cutoff - skip it
+                result.skipped += 1
+                logger.debug(f"{click.style('[skip-old]', fg='yellow')} {p} (not modified since cutoff)")
+                return False
+
+        # Skip unchanged fast path (only for files already in DB)
+        if skip_unchanged and file_in_db:
+            existing_data = existing_files[path_str]
+
+            if isinstance(existing_data, dict):
+                size_db, mtime_db = existing_data["size"], existing_data["mtime"]
+                if size_db == st.st_size and abs(mtime_db - st.st_mtime) < 1.0:
+                    result.skipped += 1
+                    logger.debug(f"{click.style('[skip]', fg='yellow')} {p} unchanged (fast mode - no parsing)")
+                    return False
+            else:
+                size_db, mtime_db, hash_db = existing_data
+                if size_db == st.st_size and abs(mtime_db - st.st_mtime) < 1.0:
+                    result.skipped += 1
+                    logger.debug(f"{click.style('[skip]', fg='yellow')} {p} unchanged")
+                    return False
+        return True
+
+    def after_write() -> None:
+        nonlocal since_commit
+        since_commit += 1
+        if commit_interval and since_commit >= commit_interval:
+            db.commit()
+            if tag_cache is not None:
+                tag_cache.flush()
+            logger.debug(f"Interim commit after {since_commit} processed")
+            since_commit = 0
+
+    def on_stat(cand: ScanCandidate) -> bool:
+        result.files_seen += 1
+        result.root_stats[cand.root].files_seen += 1
+        log_directory(cand.path)
+        seen_paths.add(cand.path_str)
+        if cand.stat is None:
+            result.errors += 1
+            logger.debug(f"{click.style('[io-error]', fg='red')} {cand.path}")
+            return False
+        if not needs_processing(cand.path, cand.path_str, cand.stat):
+            report_progress()
+            return False
+        metadata = _cached_metadata(tag_cache, cand.path_str, cand.stat, use_year)
+        if metadata is None:
+            return True  # Queue a tag read on the worker pool
+        store(cand, metadata)
+        return False
+
+    def on_read(cand: ScanCandidate, metadata: Tuple[Dict[str, Any], bool]) -> None:
+        if tag_cache is not None:
+            tag_cache.put(cand.path_str, cand.stat, *metadata)
+        store(cand, metadata)
+
+    def store(cand: ScanCandidate, metadata: Tuple[Dict[str, Any], bool]) -> None:
+        record, parse_error = metadata
+        if parse_error:
+            result.errors += 1
+        _store_file_record(db, cand.path, cand.path_str, cand.stat, record, result)
+        result.root_stats[cand.root].processed += 1
+        after_write()
+        report_progress()
 
-            # Check if file exists in DB
-            file_in_db = path_str in existing_files
+    def on_root_done(root: str, seconds: float) -> None:
+        result.root_stats[root].duration_seconds = seconds
+        logger.debug(f"{click.style('[root-done]', fg='cyan')} {root} in {seconds:.2f}s")
 
-            # Time-based filtering: ONLY skip files that are ALREADY in DB and not modified
-            if changed_since is not None and file_in_db:
-                # File exists in DB, check if it was modified since cutoff
-                if st.st_mtime < changed_since:
-                    # Not modified since cutoff - skip it
-                    result.skipped += 1
-                    logger.debug(f"{click.style('[skip-old]', fg='yellow')} {p} (not modified since cutoff)")
-
-                    if result.files_seen - last_progress_log >= progress_interval:
-                        elapsed = time.time() - start
-                        log_progress(
-                            processed=result.files_seen,
-                            total=None,
-                            new=result.inserted,
-                            updated=result.updated,
-                            skipped=result.skipped,
-                            elapsed_seconds=elapsed,
-                            item_name="files",
-                        )
-                        last_progress_log = result.files_seen
+    walk_complete = False
+    try:
+        if network_mode or (parallel_roots and len(paths) > 1):
+            # Concurrent pipeline: high-latency filesystems keep many stat/read operations
+            # in flight, and each root is walked by its own lane so disks/shares overlap
+            timings = PhaseTimings()
+            if network_mode:
+                result.phase_timings = timings
+            result.root_stats = {root: RootScanStats(path=root) for root in paths}
+            scanner = PrefetchScanner(
+                paths,
+                extensions,
+                ignore_patterns,
+                follow_symlinks,
+                read_metadata=lambda p: read_file_metadata(cfg, p, use_year),
+                min_concurrency=int(lib_cfg.get("min_concurrency", 4)),
+                max_concurrency=int(lib_cfg.get("max_concurrency", 32)),
+                timings=timings,
+            )
+            scanner.run(on_stat, on_read, on_root_done)
+        else:
+            for p in iter_music_files(paths, extensions, ignore_patterns, follow_symlinks):
+                result.files_seen += 1
+                log_directory(p)
+
+                path_str = str(p.resolve())
+                seen_paths.add(path_str)
+
+                try:
+                    st = p.stat()
+                except OSError:
+                    result.errors += 1
+                    logger.debug(f"{click.style('[io-error]', fg='red')} {p}")
                     continue
 
-            # Skip unchanged fast path (only for files already in DB)
-            if skip_unchanged and file_in_db:
-                existing_data = existing_files[path_str]
-
-                if isinstance(existing_data, dict):
-                    size_db, mtime_db = existing_data["size"], existing_data["mtime"]
-                    if size_db == st.st_size and abs(mtime_db - st.st_mtime) < 1.0:
-                        result.skipped += 1
-                        logger.debug(f"{click.style('[skip]', fg='yellow')} {p} unchanged (fast mode - no parsing)")
-
-                        if result.files_seen - last_progress_log >= progress_interval:
-                            elapsed = time.time() - start
-                            log_progress(
-                                processed=result.files_seen,
-                                total=None,
-                                new=result.inserted,
-                                updated=result.updated,
-                                skipped=result.skipped,
-                                elapsed_seconds=elapsed,
-                                item_name="files",
-                            )
-                            last_progress_log = result.files_seen
-                        continue
-                else:
-                    size_db, mtime_db, hash_db = existing_data
-                    if size_db == st.st_size and abs(mtime_db - st.st_mtime) < 1.0:
-                        result.skipped += 1
-                        logger.debug(f"{click.style('[skip]', fg='yellow')} {p} unchanged")
-
-                        if result.files_seen - last_progress_log >= progress_interval:
-                            elapsed = time.time() - start
-                            log_progress(
-                                processed=result.files_seen,
-                                total=None,
-                                new=result.inserted,
-                                updated=result.updated,
-                                skipped=result.skipped,
-                                elapsed_seconds=elapsed,
-                                item_name="files",
-                            )
-                            last_progress_log = result.files_seen
-                        continue
-
-            _process_single_file(db, cfg, p, result, use_year)
-            since_commit += 1
+                if needs_processing(p, path_str, st):
+                    _process_single_file(db, cfg, p, result, use_year, tag_cache)
+                    after_write()
 
-            if commit_interval and since_commit >= commit_interval:
-                db.commit()
-                logger.debug(f"Interim commit after {since_commit} processed")
-                since_commit = 0
-
-            if result.files_seen - last_progress_log >= progress_interval:
-                elapsed = time.time() - start
-                log_progress(
-                    processed=result.files_seen,
-                    total=None,
-                    new=result.inserted,
-                    updated=result.updated,
-                    skipped=result.skipped,
-                    elapsed_seconds=elapsed,
-                    item_name="files",
-                )
-                last_progress_log = result.files_seen
+                report_progress()
+        walk_complete = True
 
     except KeyboardInterrupt:
         print(f"{click.style('[interrupt]', fg='magenta')} Caught keyboard interrupt; finalizing partial work...")
     finally:
-        # Cleanup: remove deleted files
-        rows = db.conn.execute("SELECT id, path FROM library_files").fetchall()
+        # Cleanup: remove deleted files (only after a complete walk: unseen != deleted otherwise)
+        if not walk_complete:
+            rows = []
+            logger.info("Scan interrupted; skipping removal of files not seen")
+        elif delete_scope is None:
+            rows = db.conn.execute("SELECT id, path FROM library_files").fetchall()
+        else:
+            rows = []
+            for directory in delete_scope:
+                rows.extend(
+                    db.conn.execute(
+                        "SELECT id, path FROM library_files WHERE path >= ? AND path < ?", _prefix_range(directory)
+                    ).fetchall()
+                )
         db_paths = {row["path"]: row["id"] for row in rows}
 
         deleted_paths = set(db_paths.keys()) - seen_paths
@@ -450,11 +779,35 @@ def _scan_library_internal(
             logger.debug(f"{click.style('[deleted]', fg='red')} {path} (no longer exists)")
 
         db.commit()
+        if tag_cache is not None:
+            result.tag_cache_hits = tag_cache.hits
+            evicted = tag_cache.evict_stale()
+            if evicted:
+                logger.debug(f"Evicted {evicted} stale tag cache entries")
+            tag_cache.close()
         result.duration_seconds = time.time() - start
 
     return result
 
 
+def log_scan_timings(result: ScanResult) -> None:
+    """Log tag cache reuse, per-root durations and per-phase I/O latency of a scan."""
+    if result.tag_cache_hits:
+        logger.info(f"Tag cache: reused metadata for {result.tag_cache_hits} files without parsing")
+    if len(result.root_stats) > 1:
+        logger.info("Per-root timing:")
+        for stats in result.root_stats.values():
+            logger.info(
+                f"  • {stats.path}: {stats.files_seen} files ({stats.processed} parsed) in {stats.duration_seconds:.1f}s"
+            )
+    if result.phase_timings is not None:
+        lines = result.phase_timings.summary_lines()
+        if lines:
+            logger.info("I/O latency by phase:")
+            for line in lines:
+                logger.info(f"  {line}")
+
+
 def scan_library(db, cfg):
     """Scan local music library and index track metadata.
 
@@ -464,6 +817,7 @@ def scan_library(db, cfg):
     lib_cfg = cfg["library"]
 
     click.echo(click.style("=== Scanning local library ===", fg="cyan", bold=True))
+    events.stage_start("Scanning library")
 
     # Log directories being scanned
     paths = lib_cfg["paths"]
@@ -488,8 +842,24 @@ def scan_library(db, cfg):
         item_name="Library",
     )
     logger.info(summary)
+    log_scan_timings(result)
     if result.errors:
         logger.debug(f"Errors: {result.errors}")
-
-
-__all__ = ["scan_library", "scan_library_incremental", "scan_specific_files", "parse_time_string", "ScanResult"]
+    events.stage_end("Scanning library", result.duration_seconds)
+
+
+__all__ = [
+    "scan_library",
+    "scan_library_incremental",
+    "scan_specific_files",
+    "apply_library_moves",
+    "lookup_file_ids",
+    "file_ids_under",
+    "MoveResult",
+    "ensure_partial_hashes",
+    "find_duplicate_files",
+    "log_scan_timings",
+    "parse_time_string",
+    "ScanResult",
+    "RootScanStats",
+]
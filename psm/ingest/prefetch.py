@@ -0,0 +1,289 @@
+"""Concurrent prefetching scan pipeline for high-latency filesystems.
+
+On network shares (SMB/NFS) every stat/open/read is a round trip, so a serial
+scan spends most of its time waiting. ``PrefetchScanner`` keeps many of those
+operations in flight at once:
+
+- directory listings use ``os.scandir`` (one batched round trip per directory,
+  file-type info comes with the listing) and run concurrently
+- stat and tag-read calls for individual files run on the same worker pool
+- the number of outstanding operations is adapted to observed throughput by
+  ``AdaptiveLimiter``
+- each library root is walked in its own lane, so roots on different disks or
+  shares are scanned at the same time under one global concurrency cap
+
+All callbacks (skip decisions and database writes) run on the calling thread,
+so the SQLite connection is never shared with workers.
+"""
+
+from __future__ import annotations
+import fnmatch
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Sequence, Tuple
+
+from ..utils.fs import normalize_library_path
+from ..utils.latency import PhaseTimings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScanCandidate:
+    """A music file discovered by the walker."""
+
+    path: Path
+    path_str: str  # Normalized path as stored in library_files
+    root: str  # Library root (as configured) the file was found under
+    entry: os.DirEntry | None = None
+    stat: os.stat_result | None = None
+
+
+class AdaptiveLimiter:
+    """Concurrency limit tuned by hill climbing on completed-operation throughput.
+
+    Each window of completions compares throughput with the previous window:
+    if it improved the limit keeps moving in the same direction, if it dropped
+    the direction reverses. The limit only grows while the pipeline actually
+    saturated it, so a walker that cannot produce enough work does not inflate
+    it. With high per-operation latency, throughput keeps improving as more
+    operations overlap, so the limit climbs until the share stops scaling.
+
+    Not thread-safe: acquire/release are called from the scheduling thread only.
+    """
+
+    def __init__(self, min_limit: int = 4, max_limit: int = 64, window: int = 64):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = self.min_limit
+        self.window = window
+        self.in_flight = 0
+        self._direction = 1
+        self._last_throughput: float | None = None
+        self._window_done = 0
+        self._window_start = time.perf_counter()
+        self._saturated = False
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= self.limit:
+            self._saturated = True
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._window_done += 1
+        if self._window_done >= self.window:
+            self._adjust()
+
+    def _adjust(self) -> None:
+        now = time.perf_counter()
+        elapsed = max(now - self._window_start, 1e-9)
+        throughput = self._window_done / elapsed
+        if self._last_throughput is not None and throughput < self._last_throughput * 0.95:
+            self._direction = -self._direction
+        if self._direction > 0 and not self._saturated:
+            self._direction = 0  # Work-starved; hold until saturated again
+        elif self._direction == 0 and self._saturated:
+            self._direction = 1
+        step = max(1, self.limit // 4)
+        self.limit = min(self.max_limit, max(self.min_limit, self.limit + self._direction * step))
+        self._last_throughput = throughput
+        self._window_done = 0
+        self._window_start = now
+        self._saturated = False
+
+
+class _RootLane:
+    """Per-root work queues, limiter and worker pool."""
+
+    def __init__(self, root: str, min_concurrency: int, max_concurrency: int):
+        self.root = root
+        self.dirs: Deque[Tuple[str, str, str]] = deque([(str(root), normalize_library_path(root), root)])
+        self.to_stat: Deque[ScanCandidate] = deque()
+        self.to_read: Deque[ScanCandidate] = deque()
+        self.limiter = AdaptiveLimiter(min_concurrency, max_concurrency)
+        self.pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="psm-scan")
+        self.outstanding = 1  # Queued or running items (starts with the root listing)
+        self.started = time.perf_counter()
+
+    def has_work(self) -> bool:
+        return bool(self.to_read or self.to_stat or self.dirs)
+
+
+class PrefetchScanner:
+    """Walk library roots and prefetch stat/tag data with bounded concurrency.
+
+    Each root gets its own lane (walker queue, adaptive limiter and worker
+    pool), so roots on different disks or shares progress independently;
+    ``max_concurrency`` caps in-flight operations across all lanes.
+    """
+
+    def __init__(
+        self,
+        roots: Sequence[str],
+        extensions: Sequence[str],
+        ignore_patterns: Sequence[str],
+        follow_symlinks: bool,
+        read_metadata: Callable[[Path], Any],
+        min_concurrency: int = 4,
+        max_concurrency: int = 32,
+        timings: PhaseTimings | None = None,
+    ):
+        self.roots = list(roots)
+        self.extensions = {e.lower() for e in extensions}
+        self.ignore_patterns = list(ignore_patterns)
+        self.follow_symlinks = follow_symlinks
+        self.read_metadata = read_metadata
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.timings = timings or PhaseTimings()
+        self.root_durations: Dict[str, float] = {}
+
+    # --- worker tasks (run on pool threads) ---
+
+    def _list_dir(
+        self, dir_path: str, dir_norm: str, root: str
+    ) -> Tuple[str, List[Tuple[str, str]], List[ScanCandidate]]:
+        start = time.perf_counter()
+        subdirs: List[Tuple[str, str]] = []
+        files: List[ScanCandidate] = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if not self.follow_symlinks and entry.is_symlink():
+                            continue
+                        if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                            subdirs.append((entry.path, os.path.join(dir_norm, entry.name)))
+                        elif entry.is_file(follow_symlinks=self.follow_symlinks):
+                            name = entry.name
+                            if os.path.splitext(name)[1].lower() not in self.extensions:
+                                continue
+                            if any(fnmatch.fnmatch(name, pat) for pat in self.ignore_patterns):
+                                continue
+                            files.append(
+                                ScanCandidate(
+                                    path=Path(entry.path),
+                                    path_str=os.path.join(dir_norm, name),
+                                    root=root,
+                                    entry=entry,
+                                )
+                            )
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"[listdir-error] {dir_path}: {e}")
+        self.timings.record("listdir", time.perf_counter() - start)
+        return root, subdirs, files
+
+    def _stat(self, cand: ScanCandidate) -> ScanCandidate:
+        start = time.perf_counter()
+        try:
+            # DirEntry.stat() is free on Windows (cached from the listing)
+            cand.stat = cand.entry.stat() if cand.entry is not None else cand.path.stat()
+            if self.follow_symlinks:
+                cand.path_str = normalize_library_path(cand.path)
+        except OSError:
+            cand.stat = None
+        cand.entry = None  # Release directory handle data early
+        self.timings.record("stat", time.perf_counter() - start)
+        return cand
+
+    def _read(self, cand: ScanCandidate) -> Tuple[ScanCandidate, Any]:
+        start = time.perf_counter()
+        try:
+            return cand, self.read_metadata(cand.path)
+        finally:
+            self.timings.record("tags", time.perf_counter() - start)
+
+    # --- scheduling (calling thread) ---
+
+    def run(
+        self,
+        on_stat: Callable[[ScanCandidate], bool],
+        on_read: Callable[[ScanCandidate, Any], None],
+        on_root_done: Callable[[str, float], None] | None = None,
+    ) -> None:
+        """Scan all roots, invoking callbacks on the calling thread.
+
+        Args:
+            on_stat: Called with each stat'ed candidate (stat is None on error);
+                return True to have its metadata read
+            on_read: Called with the candidate and read_metadata() result
+            on_root_done: Optional callback with (root, seconds) when all work
+                for a root completed
+        """
+        lanes: Dict[str, _RootLane] = {}
+        for root in self.roots:
+            if root in lanes or not Path(root).exists():
+                continue
+            lanes[root] = _RootLane(root, self.min_concurrency, self.max_concurrency)
+        order = list(lanes.values())
+
+        def finish(lane: _RootLane) -> None:
+            lane.outstanding -= 1
+            if lane.outstanding == 0:
+                elapsed = time.perf_counter() - lane.started
+                self.root_durations[lane.root] = elapsed
+                lane.pool.shutdown(wait=False)
+                if on_root_done:
+                    on_root_done(lane.root, elapsed)
+
+        pending: Dict[Future, Tuple[str, _RootLane]] = {}
+        turn = 0
+        try:
+            while pending or any(lane.has_work() for lane in order):
+                # Round-robin across roots so one large root cannot starve the others
+                progressed = True
+                while progressed and len(pending) < self.max_concurrency:
+                    progressed = False
+                    for k in range(len(order)):
+                        lane = order[(turn + k) % len(order)]
+                        if len(pending) >= self.max_concurrency:
+                            break
+                        if not lane.has_work() or not lane.limiter.try_acquire():
+                            continue
+                        # Prefer finishing files over discovering more, to bound queue growth
+                        if lane.to_read:
+                            pending[lane.pool.submit(self._read, lane.to_read.popleft())] = ("read", lane)
+                        elif lane.to_stat:
+                            pending[lane.pool.submit(self._stat, lane.to_stat.popleft())] = ("stat", lane)
+                        else:
+                            pending[lane.pool.submit(self._list_dir, *lane.dirs.popleft())] = ("listdir", lane)
+                        progressed = True
+                    turn += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    kind, lane = pending.pop(fut)
+                    lane.limiter.release()
+                    if kind == "listdir":
+                        _, subdirs, files = fut.result()
+                        for sub_path, sub_norm in subdirs:
+                            lane.dirs.append((sub_path, sub_norm, lane.root))
+                        lane.to_stat.extend(files)
+                        lane.outstanding += len(subdirs) + len(files)
+                        finish(lane)
+                    elif kind == "stat":
+                        cand = fut.result()
+                        if on_stat(cand):
+                            lane.to_read.append(cand)
+                        else:
+                            finish(lane)
+                    else:
+                        cand, metadata = fut.result()
+                        on_read(cand, metadata)
+                        finish(lane)
+        finally:
+            for lane in order:
+                lane.pool.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["PrefetchScanner", "AdaptiveLimiter", "ScanCandidate"]
@@ -0,0 +1,174 @@
+"""Persistent sidecar cache of extracted tag metadata.
+
+Tag parsing is the expensive part of a scan. The library database is often
+deleted or rebuilt (schema resets, ``scan --deep``, switching providers) while
+the audio files themselves have not changed, so extracted metadata is kept in a
+separate small SQLite file next to the database.
+
+Entries are keyed by file identity (``device:inode``, or the normalized path
+where the filesystem reports no inode numbers) and validated against size and
+``mtime_ns``: a changed file simply misses and its entry is overwritten, and a
+moved/renamed file still hits. Entries for deleted files are evicted once they
+have not been seen for ``max_age_days``. In refresh mode (``scan --refresh-tags``)
+cached entries are ignored but still overwritten with the fresh results.
+
+The cache is only an optimization: if its file is locked by another process
+beyond a short busy timeout, lookups miss and queued writes are dropped rather
+than failing the scan. It is only accessed from the scanning thread.
+"""
+
+from __future__ import annotations
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction semantics change so stale metadata is not reused
+CACHE_VERSION = 1
+
+# Cached record fields (normalized/partial_hash are derived, not cached)
+_FIELDS = ("title", "artist", "album", "year", "duration", "bitrate_kbps")
+
+# Refresh last_seen at most this often, so cache hits rarely cause writes
+_TOUCH_INTERVAL = 24 * 3600
+
+# Seconds to wait for another process's lock on the cache file before giving up
+_BUSY_TIMEOUT = 2.0
+
+
+class TagCache:
+    """Key-value store of (file identity, size, mtime_ns) -> extracted metadata."""
+
+    def __init__(self, path: Path | str, max_age_days: float = 90, refresh: bool = False):
+        self.path = Path(path)
+        self.max_age_days = max_age_days
+        self.refresh = refresh  # Ignore cached entries; fresh results still overwrite them
+        self.hits = 0
+        self.misses = 0
+        self._now = time.time()
+        self._pending_puts: List[Tuple[str, int, int, str, float]] = []
+        self._pending_touches: List[Tuple[float, str]] = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=_BUSY_TIMEOUT)
+        self.conn.execute("PRAGMA synchronous=OFF")  # Losing a cache write only costs a re-parse
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS tags")
+            self.conn.execute(f"PRAGMA user_version={CACHE_VERSION}")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS tags("
+            "ident TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "data TEXT NOT NULL, last_seen REAL NOT NULL) WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def identity(path_str: str, st: os.stat_result) -> str:
+        """Stable file identity: device/inode when available, else the path."""
+        if st.st_ino:
+            return f"{st.st_dev}:{st.st_ino}"
+        return path_str
+
+    def get(self, path_str: str, st: os.stat_result) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """Return (record fields, parse_error) if cached for this exact file version."""
+        if self.refresh:
+            self.misses += 1
+            return None
+        ident = self.identity(path_str, st)
+        try:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns, data, last_seen FROM tags WHERE ident=?", (ident,)
+            ).fetchone()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Tag cache lookup failed ({self.path}): {e}")
+            row = None
+        if row is None or row[0] != st.st_size or row[1] != st.st_mtime_ns:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self._now - row[3] > _TOUCH_INTERVAL:
+            self._pending_touches.append((self._now, ident))
+        values = json.loads(row[2])
+        return dict(zip(_FIELDS, values[: len(_FIELDS)])), bool(values[len(_FIELDS)])
+
+    def put(self, path_str: str, st: os.stat_result, record: Dict[str, Any], parse_error: bool) -> None:
+        """Queue metadata for a file version (written on flush)."""
+        data = json.dumps([record.get(f) for f in _FIELDS] + [int(parse_error)], separators=(",", ":"))
+        self._pending_puts.append((self.identity(path_str, st), st.st_size, st.st_mtime_ns, data, self._now))
+
+    def flush(self) -> None:
+        """Write queued entries and last-seen refreshes (dropped if the cache file stays locked)."""
+        try:
+            if self._pending_puts:
+                self.conn.executemany("INSERT OR REPLACE INTO tags VALUES (?,?,?,?,?)", self._pending_puts)
+            if self._pending_touches:
+                self.conn.executemany("UPDATE tags SET last_seen=? WHERE ident=?", self._pending_touches)
+            self.conn.commit()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Tag cache write skipped ({self.path}): {e}")
+            self.conn.rollback()
+        finally:
+            self._pending_puts.clear()
+            self._pending_touches.clear()
+
+    def evict_stale(self) -> int:
+        """Delete entries not seen within max_age_days; returns the number removed."""
+        cutoff = self._now - self.max_age_days * 86400
+        try:
+            cur = self.conn.execute("DELETE FROM tags WHERE last_seen < ?", (cutoff,))
+            self.conn.commit()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Tag cache eviction skipped ({self.path}): {e}")
+            self.conn.rollback()
+            return 0
+        return cur.rowcount
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0]
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
+
+
+def tag_cache_path(cfg: Dict[str, Any], db_path: Path | str | None = None) -> Optional[Path]:
+    """Sidecar location: library.tag_cache_path, or tag_cache.db next to the database file."""
+    configured = cfg["library"].get("tag_cache_path")
+    if configured:
+        return Path(configured)
+    if db_path is None or str(db_path) == ":memory:":
+        return None
+    return Path(db_path).with_name("tag_cache.db")
+
+
+def open_tag_cache(cfg: Dict[str, Any], db_path: Path | str | None = None) -> Optional[TagCache]:
+    """Open the configured tag cache, or None if disabled or unusable.
+
+    Args:
+        cfg: Configuration dict
+        db_path: Path of the library database (default cache location is next to it)
+    """
+    lib_cfg = cfg["library"]
+    if not lib_cfg.get("tag_cache", True):
+        return None
+    path = tag_cache_path(cfg, db_path)
+    if path is None:
+        return None
+    try:
+        return TagCache(
+            path,
+            max_age_days=float(lib_cfg.get("tag_cache_max_age_days", 90)),
+            refresh=bool(lib_cfg.get("tag_cache_refresh", False)),
+        )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Tag cache unavailable ({path}): {e}")
+        return None
+
+
+__all__ = ["TagCache", "open_tag_cache", "tag_cache_path", "CACHE_VERSION"]
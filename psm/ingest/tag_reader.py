@@ -0,0 +1,303 @@
+"""Lightweight header-only tag reader for MP3 (ID3v2) and FLAC.
+
+The scanner only needs title/artist/album/year plus duration and bitrate.
+``mutagen.File()`` probes every registered format and parses far more than
+that, so for the two dominant formats we read just the metadata region and
+decode the handful of fields we use.
+
+``read_fast_tags()`` returns an object shaped like a mutagen file (``.tags``
+mapping and ``.info`` with ``length``/``bitrate``) so ``extract_tags()`` and
+the scanner treat both paths identically. It returns None whenever the file
+is anything other than a plain, well-formed case it understands; callers then
+fall back to mutagen, which remains the source of truth for edge cases
+(unsynchronised or compressed frames, ID3v2.2, FLAC with leading ID3, ...).
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+import struct
+
+# ID3v2 frame IDs -> tag keys understood by extract_tags()
+_ID3_FRAMES = {
+    b"TIT2": "title",
+    b"TPE1": "artist",
+    b"TALB": "album",
+    b"TDRC": "date",  # v2.4 recording time
+    b"TYER": "year",  # v2.3 year
+    b"TSRC": "isrc",
+}
+
+# Vorbis comment keys (case-insensitive) -> tag keys
+_VORBIS_KEYS = {"title": "title", "artist": "artist", "album": "album", "date": "date", "isrc": "isrc"}
+
+# Bytes read after the ID3 tag to locate the first MPEG frame and its Xing/VBRI header
+_MPEG_PROBE_BYTES = 4096
+
+# MPEG audio header tables (Layer III is by far the most common; I/II handled for completeness)
+_MPEG_BITRATES = {
+    # (version_is_mpeg1, layer) -> kbps table indexed by bitrate index
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (False, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MPEG_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],  # MPEG1
+    2: [22050, 24000, 16000],  # MPEG2
+    0: [11025, 12000, 8000],  # MPEG2.5
+}
+
+
+@dataclass
+class FastStreamInfo:
+    """Subset of mutagen's stream info used by the scanner."""
+
+    length: float = 0.0
+    bitrate: int = 0  # bits per second
+    sample_rate: int = 0
+    channels: int = 0
+    bits_per_sample: int = 0
+
+
+@dataclass
+class FastAudio:
+    """Minimal stand-in for a mutagen FileType (``.tags`` + ``.info``)."""
+
+    tags: Dict[str, str] = field(default_factory=dict)
+    info: FastStreamInfo = field(default_factory=FastStreamInfo)
+
+
+def read_fast_tags(path: Path) -> Optional[FastAudio]:
+    """Read tags and stream info for MP3/FLAC without mutagen.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        FastAudio on success, None if the caller should fall back to mutagen
+    """
+    suffix = path.suffix.lower()
+    try:
+        with open(path, "rb") as fh:
+            if suffix == ".mp3":
+                return _read_mp3(fh)
+            if suffix == ".flac":
+                return _read_flac(fh)
+    except (OSError, struct.error, IndexError, ValueError):
+        return None
+    return None
+
+
+# --- ID3v2 / MPEG -----------------------------------------------------------
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _decode_text_frame(payload: bytes) -> str:
+    """Decode an ID3 text frame (encoding byte + text), returning the first value."""
+    if not payload:
+        return ""
+    encoding, body = payload[0], payload[1:]
+    if encoding == 0:
+        text = body.decode("latin-1")
+    elif encoding == 1:
+        text = body.decode("utf-16")
+    elif encoding == 2:
+        text = body.decode("utf-16-be")
+    elif encoding == 3:
+        text = body.decode("utf-8")
+    else:
+        raise ValueError(f"unknown ID3 text encoding {encoding}")
+    return text.split("\x00", 1)[0].strip()
+
+
+def _parse_id3_frames(buf: bytes, end: int, major: int) -> Optional[Dict[str, str]]:
+    tags: Dict[str, str] = {}
+    pos = 0
+    while pos + 10 <= end:
+        frame_id = buf[pos : pos + 4]
+        if frame_id[0] == 0:  # padding
+            break
+        size_bytes = buf[pos + 4 : pos + 8]
+        size = _syncsafe(size_bytes) if major == 4 else struct.unpack(">I", size_bytes)[0]
+        format_flags = buf[pos + 9]
+        start = pos + 10
+        pos = start + size
+        if pos > end:
+            return None  # truncated tag
+        key = _ID3_FRAMES.get(frame_id)
+        if key is None or key in tags:
+            continue
+        # Compressed/encrypted/unsynchronised frames are left to mutagen
+        if (major == 4 and format_flags & 0x0F) or (major == 3 and format_flags & 0xE0):
+            return None
+        value = _decode_text_frame(buf[start:pos])
+        if value:
+            tags[key] = value
+    if "date" not in tags and "year" in tags:
+        tags["date"] = tags["year"]
+    tags.pop("year", None)
+    return tags
+
+
+def _parse_mpeg_header(header: int):
+    """Return (mpeg1, layer, bitrate_kbps, sample_rate, channels, frame_samples) or None."""
+    if (header >> 21) & 0x7FF != 0x7FF:
+        return None
+    version_bits = (header >> 19) & 0x3
+    layer_bits = (header >> 17) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0x3
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version_bits == 3
+    layer = 4 - layer_bits
+    bitrate = _MPEG_BITRATES[(mpeg1, layer)][bitrate_index]
+    sample_rate = _MPEG_SAMPLE_RATES[version_bits][rate_index]
+    channels = 1 if (header >> 6) & 0x3 == 3 else 2
+    if layer == 1:
+        frame_samples = 384
+    elif layer == 2 or mpeg1:
+        frame_samples = 1152
+    else:
+        frame_samples = 576
+    return mpeg1, layer, bitrate, sample_rate, channels, frame_samples
+
+
+def _read_mp3(fh) -> Optional[FastAudio]:
+    header = fh.read(10)
+    if len(header) < 10 or header[:3] != b"ID3":
+        return None
+    major, flags = header[3], header[5]
+    if major not in (3, 4) or flags & 0x80:  # unsupported version or whole-tag unsync
+        return None
+    tag_size = _syncsafe(header[6:10])
+    audio_start = 10 + tag_size + (10 if flags & 0x10 else 0)
+
+    # One read covers the frame area plus enough audio to find the first MPEG frame
+    buf = fh.read(tag_size + _MPEG_PROBE_BYTES)
+    file_size = fh.seek(0, 2)
+
+    frames_start = 0
+    if flags & 0x40:  # extended header
+        ext_size = _syncsafe(buf[0:4]) if major == 4 else struct.unpack(">I", buf[0:4])[0] + 4
+        frames_start = ext_size
+    tags = _parse_id3_frames(buf[frames_start:], tag_size - frames_start, major)
+    if tags is None:
+        return None
+
+    info = _read_mpeg_info(buf[audio_start - 10 :], file_size - audio_start)
+    if info is None:
+        return None
+    return FastAudio(tags=tags, info=info)
+
+
+def _read_mpeg_info(audio: bytes, audio_bytes: int) -> Optional[FastStreamInfo]:
+    """Derive duration/bitrate from the first MPEG frame (Xing/VBRI aware)."""
+    pos = audio.find(b"\xff")
+    while 0 <= pos <= len(audio) - 4:
+        parsed = _parse_mpeg_header(struct.unpack(">I", audio[pos : pos + 4])[0])
+        if parsed:
+            break
+        pos = audio.find(b"\xff", pos + 1)
+    else:
+        return None
+    mpeg1, layer, bitrate_kbps, sample_rate, channels, frame_samples = parsed
+    audio_bytes -= pos
+
+    frame_count = None
+    stream_bytes = None
+    if layer == 3:
+        side_info = (32 if channels == 2 else 17) if mpeg1 else (17 if channels == 2 else 9)
+        xing_at = pos + 4 + side_info
+        tag = audio[xing_at : xing_at + 4]
+        if tag in (b"Xing", b"Info"):
+            xing_flags = struct.unpack(">I", audio[xing_at + 4 : xing_at + 8])[0]
+            offset = xing_at + 8
+            if xing_flags & 0x1:
+                frame_count = struct.unpack(">I", audio[offset : offset + 4])[0]
+                offset += 4
+            if xing_flags & 0x2:
+                stream_bytes = struct.unpack(">I", audio[offset : offset + 4])[0]
+        elif audio[pos + 36 : pos + 40] == b"VBRI":
+            vbri = pos + 36
+            stream_bytes = struct.unpack(">I", audio[vbri + 10 : vbri + 14])[0]
+            frame_count = struct.unpack(">I", audio[vbri + 14 : vbri + 18])[0]
+
+    if frame_count:
+        length = frame_count * frame_samples / sample_rate
+        total_bytes = stream_bytes or audio_bytes
+        bitrate = int(total_bytes * 8 / length) if length > 0 else bitrate_kbps * 1000
+    else:
+        # CBR: duration from stream size and header bitrate
+        bitrate = bitrate_kbps * 1000
+        length = audio_bytes * 8 / bitrate
+    return FastStreamInfo(length=length, bitrate=bitrate, sample_rate=sample_rate, channels=channels)
+
+
+# --- FLAC ---------------------------------------------------------------------
+
+
+def _read_flac(fh) -> Optional[FastAudio]:
+    if fh.read(4) != b"fLaC":
+        return None  # includes FLAC files with a leading ID3 tag
+    info: Optional[FastStreamInfo] = None
+    total_samples = 0
+    tags: Dict[str, str] = {}
+    offset = 4
+    while True:
+        block_header = fh.read(4)
+        if len(block_header) < 4:
+            return None
+        is_last = block_header[0] & 0x80
+        block_type = block_header[0] & 0x7F
+        length = int.from_bytes(block_header[1:4], "big")
+        offset += 4 + length
+        if block_type == 0:  # STREAMINFO
+            data = fh.read(length)
+            packed = int.from_bytes(data[10:18], "big")
+            sample_rate = packed >> 44
+            channels = ((packed >> 41) & 0x7) + 1
+            bits_per_sample = ((packed >> 36) & 0x1F) + 1
+            total_samples = packed & 0xFFFFFFFFF
+            info = FastStreamInfo(sample_rate=sample_rate, channels=channels, bits_per_sample=bits_per_sample)
+        elif block_type == 4:  # VORBIS_COMMENT
+            tags = _parse_vorbis_comment(fh.read(length))
+        else:
+            fh.seek(length, 1)  # skip pictures, padding, seek tables
+        if is_last:
+            break
+    if info is None or not info.sample_rate:
+        return None
+    file_size = fh.seek(0, 2)
+    if total_samples:
+        info.length = total_samples / info.sample_rate
+        info.bitrate = int((file_size - offset) * 8 / info.length)
+    return FastAudio(tags=tags, info=info)
+
+
+def _parse_vorbis_comment(data: bytes) -> Dict[str, str]:
+    tags: Dict[str, str] = {}
+    vendor_len = struct.unpack_from("<I", data, 0)[0]
+    pos = 4 + vendor_len
+    count = struct.unpack_from("<I", data, pos)[0]
+    pos += 4
+    for _ in range(count):
+        entry_len = struct.unpack_from("<I", data, pos)[0]
+        pos += 4
+        entry = data[pos : pos + entry_len].decode("utf-8", errors="replace")
+        pos += entry_len
+        key, sep, value = entry.partition("=")
+        mapped = _VORBIS_KEYS.get(key.lower())
+        if sep and mapped and mapped not in tags and value.strip():
+            tags[mapped] = value.strip()
+    return tags
+
+
+__all__ = ["read_fast_tags", "FastAudio", "FastStreamInfo"]
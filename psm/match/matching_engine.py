@@ -14,6 +14,7 @@ from .scoring import ScoringConfig, evaluate_pair, MatchConfidence
 from .candidate_selector import CandidateSelector
 from ..db import Database
 from ..config_types import MatchingConfig
+from ..utils.cancellation import check_cancelled
 from ..utils.logging_helpers import log_progress
 
 logger = logging.getLogger(__name__)
@@ -63,24 +64,34 @@ class MatchingEngine:
         self.progress_enabled = progress_enabled
         self.progress_interval = progress_interval
 
-    def match_all(self) -> int:
+    def match_all(
+        self, all_tracks: List[Dict[str, Any]] | None = None, all_files: List[Dict[str, Any]] | None = None
+    ) -> int:
         """Match all tracks against all library files.
 
         This performs a full matching run, evaluating all tracks in the database
         against all library files. Progress is logged periodically and results
         are committed to the database.
 
+        Args:
+            all_tracks: Pre-loaded track list (optional, will query if None)
+            all_files: Pre-loaded file list (optional, will query if None)
+
         Returns:
             Number of matches created
         """
         start = time.time()
 
         # Fetch all tracks and files using repository methods
-        track_rows = self.db.get_all_tracks(provider=self.provider)
-        tracks = [row.to_dict() for row in track_rows]
+        if all_tracks is None:
+            track_rows = self.db.get_all_tracks(provider=self.provider)
+            all_tracks = [row.to_dict() for row in track_rows]
+        tracks = all_tracks
 
-        file_rows = self.db.get_all_library_files()
-        files = [self._normalize_file_dict(row.to_dict()) for row in file_rows]
+        if all_files is None:
+            file_rows = self.db.get_all_library_files()
+            all_files = [self._normalize_file_dict(row.to_dict()) for row in file_rows]
+        files = all_files
 
         if not tracks or not files:
             logger.debug("No tracks or files to match")
@@ -93,6 +104,7 @@ class MatchingEngine:
 
         # Match each track to best file
         for track in tracks:
+            check_cancelled()
             processed += 1
 
             # Select candidates using two-stage filtering
@@ -260,6 +272,7 @@ class MatchingEngine:
 
         # For each changed track, find best file from library
         for track in tracks_to_match:
+            check_cancelled()
             processed += 1
             # Build candidate subset using CandidateSelector
             candidates = self.selector.duration_prefilter(track, all_files, dur_tolerance=self.dur_tolerance)
@@ -381,6 +394,7 @@ class MatchingEngine:
 
         # For each track, find best file from our changed file list
         for track in all_tracks:
+            check_cancelled()
             processed += 1
             # Build candidate subset using CandidateSelector
             candidates = self.selector.duration_prefilter(track, files_to_match, dur_tolerance=self.dur_tolerance)
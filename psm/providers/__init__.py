@@ -9,6 +9,10 @@ from .base import (
     Album,
     Track,
     Playlist,
+    RemoveTracks,
+    InsertTracks,
+    MoveRange,
+    PlaylistEdit,
     ProviderCapabilities,
     AuthProvider,
     Provider,
@@ -29,6 +33,10 @@ __all__ = [
     "Album",
     "Track",
     "Playlist",
+    "RemoveTracks",
+    "InsertTracks",
+    "MoveRange",
+    "PlaylistEdit",
     "ProviderCapabilities",
     "AuthProvider",
     "Provider",
@@ -9,6 +9,7 @@ can implement the same interface and register themselves in the registry.
 
 Key abstractions:
 - Domain models: Artist, Album, Track, Playlist
+- Playlist edits: RemoveTracks, InsertTracks, MoveRange (incremental push)
 - AuthProvider: OAuth/authentication interface
 - ProviderClient: API client interface
 - Provider: Complete provider factory
@@ -17,7 +18,7 @@ Key abstractions:
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Sequence, Protocol, Dict, Any
+from typing import Sequence, Protocol, Dict, Any, Tuple, Union
 
 # ---------------- Domain Models (minimal for current needs) -----------------
 
@@ -58,6 +59,37 @@ class Playlist:
     provider: str = "spotify"
 
 
+# ---------------- Playlist edit operations (incremental push) -----------------
+# Positions refer to the remote playlist as it is right before the operation.
+
+
+@dataclass(frozen=True)
+class RemoveTracks:
+    """Remove every occurrence of these tracks."""
+
+    track_ids: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class InsertTracks:
+    """Insert tracks (in order) before position."""
+
+    position: int
+    track_ids: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class MoveRange:
+    """Move range_length tracks starting at range_start to before insert_before."""
+
+    range_start: int
+    range_length: int
+    insert_before: int
+
+
+PlaylistEdit = Union[RemoveTracks, InsertTracks, MoveRange]
+
+
 # ---------------- Capability descriptor -----------------
 
 
@@ -253,6 +285,10 @@ __all__ = [
     "Album",
     "Track",
     "Playlist",
+    "RemoveTracks",
+    "InsertTracks",
+    "MoveRange",
+    "PlaylistEdit",
     "ProviderCapabilities",
     "ProviderLinkGenerator",
     "AuthProvider",
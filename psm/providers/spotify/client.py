@@ -14,6 +14,8 @@ import time
 import logging
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
+from ..base import InsertTracks, PlaylistEdit, RemoveTracks
+
 logger = logging.getLogger(__name__)
 API_BASE = "https://api.spotify.com/v1"
 
@@ -25,13 +27,15 @@ class SpotifyAPIClient:
     Also supports write operations (playlist updates) for push functionality.
     """
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, api_base: str = API_BASE):
         """Initialize client with access token.
 
         Args:
             token: Valid Spotify OAuth access token
+            api_base: Web API base URL (overridable for a local mock server)
         """
         self.token = token
+        self.api_base = api_base
 
     def _headers(self) -> Dict[str, str]:
         """Build authorization headers for API requests."""
@@ -65,7 +69,7 @@ class SpotifyAPIClient:
             if path == "/me":
                 return {"id": "user-stub"}
             return {}
-        r = requests.get(API_BASE + path, headers=self._headers(), params=params, timeout=30)
+        r = requests.get(self.api_base + path, headers=self._headers(), params=params, timeout=30)
         if r.status_code == 429:
             # Spotify returns Retry-After header
             ra = int(r.headers.get("Retry-After", "1"))
@@ -84,7 +88,7 @@ class SpotifyAPIClient:
         Returns:
             JSON response as dict (may be empty)
         """
-        r = requests.put(API_BASE + path, headers=self._headers(), json=json, timeout=30)
+        r = requests.put(self.api_base + path, headers=self._headers(), json=json, timeout=30)
         if r.status_code == 429:
             ra = int(r.headers.get("Retry-After", "1"))
             time.sleep(ra)
@@ -107,7 +111,30 @@ class SpotifyAPIClient:
         Returns:
             JSON response as dict (may be empty)
         """
-        r = requests.post(API_BASE + path, headers=self._headers(), json=json, timeout=30)
+        r = requests.post(self.api_base + path, headers=self._headers(), json=json, timeout=30)
+        if r.status_code == 429:
+            ra = int(r.headers.get("Retry-After", "1"))
+            time.sleep(ra)
+            raise Exception("rate limit retry")
+        r.raise_for_status()
+        if r.text:
+            try:
+                return r.json()
+            except Exception:
+                return {}
+        return {}
+
+    def _delete(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover
+        """Execute DELETE request (with body) with rate limit handling.
+
+        Args:
+            path: API endpoint path
+            json: Request body as dict
+
+        Returns:
+            JSON response as dict (may be empty)
+        """
+        r = requests.delete(self.api_base + path, headers=self._headers(), json=json, timeout=30)
         if r.status_code == 429:
             ra = int(r.headers.get("Retry-After", "1"))
             time.sleep(ra)
@@ -225,6 +252,45 @@ class SpotifyAPIClient:
             uris = [f"spotify:track:{tid}" for tid in batch]
             self._post(f"/playlists/{playlist_id}/tracks", json={"uris": uris})
 
+    def apply_playlist_edits(
+        self, playlist_id: str, ops: Sequence[PlaylistEdit], snapshot_id: str | None = None
+    ) -> str | None:
+        """Apply incremental edits (one API call each), chaining snapshot IDs.
+
+        Each response's snapshot_id is sent with the next remove/reorder, so
+        Spotify resolves positions against the version the edit was planned for.
+
+        Args:
+            playlist_id: Spotify playlist ID
+            ops: Edit operations from psm.push.diff.plan_playlist_edits()
+            snapshot_id: Snapshot the edits were planned against
+
+        Returns:
+            Snapshot ID after the last edit
+        """
+        path = f"/playlists/{playlist_id}/tracks"
+        for op in ops:
+            if isinstance(op, RemoveTracks):
+                body: Dict[str, Any] = {"tracks": [{"uri": f"spotify:track:{tid}"} for tid in op.track_ids]}
+                if snapshot_id:
+                    body["snapshot_id"] = snapshot_id
+                response = self._delete(path, json=body)
+            elif isinstance(op, InsertTracks):
+                uris = [f"spotify:track:{tid}" for tid in op.track_ids]
+                response = self._post(path, json={"uris": uris, "position": op.position})
+            else:
+                body = {
+                    "range_start": op.range_start,
+                    "range_length": op.range_length,
+                    "insert_before": op.insert_before,
+                }
+                if snapshot_id:
+                    body["snapshot_id"] = snapshot_id
+                response = self._put(path, json=body)
+            snapshot_id = response.get("snapshot_id", snapshot_id)
+            logger.debug(f"Applied {op} to playlist {playlist_id} (snapshot {snapshot_id})")
+        return snapshot_id
+
     def liked_tracks(self) -> Iterator[Dict[str, Any]]:
         """Fetch all liked (saved) tracks for the current user.
 
@@ -13,6 +13,7 @@ import click
 from typing import TYPE_CHECKING
 
 from ...utils.normalization import normalize_title_artist
+from ...utils import events
 from ...utils.logging_helpers import format_summary
 
 # Provider identifier for database operations
@@ -59,6 +60,7 @@ def ingest_playlists(db, client: "SpotifyAPIClient", use_year: bool = False, for
         set: Set of track IDs that were added or updated
     """
     click.echo(click.style("=== Pulling playlists from Spotify ===", fg="cyan", bold=True))
+    events.stage_start("Pulling playlists")
     if force_refresh:
         click.echo(click.style("🔄 Force refresh mode: Re-processing all tracks to populate new fields", fg="blue"))
     t0 = time.time()
@@ -80,6 +82,15 @@ def ingest_playlists(db, client: "SpotifyAPIClient", use_year: bool = False, for
         logger.error(f"Could not fetch current user profile: {e}")
 
     for pl in client.current_user_playlists():
+        events.progress(
+            new_playlists + updated_playlists + unchanged_playlists,
+            None,
+            "playlists",
+            elapsed_seconds=time.time() - t0,
+            new=new_playlists,
+            updated=updated_playlists,
+            skipped=unchanged_playlists,
+        )
         pid = pl["id"]
         name = pl.get("name")
         snapshot_id = pl.get("snapshot_id")
@@ -201,6 +212,7 @@ def ingest_playlists(db, client: "SpotifyAPIClient", use_year: bool = False, for
         item_name="Playlists",
     )
     logger.info(summary)
+    events.stage_end("Pulling playlists", t1 - t0)
 
     return changed_track_ids
 
@@ -220,6 +232,7 @@ def ingest_liked(db, client: "SpotifyAPIClient", use_year: bool = False):
         set: Set of track IDs that were added or updated
     """
     click.echo(click.style("=== Pulling liked tracks ===", fg="cyan", bold=True))
+    events.stage_start("Pulling liked tracks")
     last_added_at = db.get_meta("liked_last_added_at")
     newest_seen = last_added_at
     t0 = time.time()
@@ -337,6 +350,7 @@ def ingest_liked(db, client: "SpotifyAPIClient", use_year: bool = False):
     if newest_seen and newest_seen != last_added_at:
         db.set_meta("liked_last_added_at", newest_seen)
     db.commit()
+    events.stage_end("Pulling liked tracks", t1 - t0)
 
     return changed_track_ids
 
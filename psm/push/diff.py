@@ -0,0 +1,172 @@
+"""Minimal edit script between a remote playlist and the desired track order.
+
+A full replace costs one call per 100 tracks (plus a clear above 100), so a
+one-track reorder in a 3,000-track playlist takes 31 calls. Instead we plan:
+
+  * RemoveTracks for tracks that occur more often remotely than desired
+    (the remove endpoints drop every occurrence; kept duplicates are re-inserted)
+  * MoveRange for tracks outside the longest increasing subsequence of the
+    remaining tracks' desired positions (patience sorting); those are the
+    anchors that never move, everything else is moved next to its desired
+    predecessor, with adjacent runs moved as one range
+  * InsertTracks for tracks missing remotely, batched per endpoint limit
+
+Operations are simulated as they are planned, so every position is valid for
+the playlist state the operation will be applied to.
+"""
+
+from __future__ import annotations
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Hashable, List, Sequence, Set, Tuple
+
+from ..providers.base import InsertTracks, MoveRange, PlaylistEdit, RemoveTracks
+
+MAX_BATCH = 100  # Spotify: tracks per add/remove/replace request
+
+
+@dataclass
+class EditPlan:
+    """Edit operations turning the remote playlist into the desired order (one API call each)."""
+
+    ops: List[PlaylistEdit] = field(default_factory=list)
+
+    @property
+    def api_calls(self) -> int:
+        return len(self.ops)
+
+
+class _OverBudget(Exception):
+    pass
+
+
+def replace_call_count(track_count: int, batch_size: int = MAX_BATCH) -> int:
+    """API calls a full replace needs: one PUT, or a clearing PUT plus one POST per batch."""
+    if track_count <= batch_size:
+        return 1
+    return 1 + -(-track_count // batch_size)
+
+
+def _tag(track_ids: Sequence[str]) -> List[Tuple[str, int]]:
+    """Make duplicates distinct: (track_id, n) for the n-th occurrence."""
+    seen: Counter = Counter()
+    tagged = []
+    for tid in track_ids:
+        tagged.append((tid, seen[tid]))
+        seen[tid] += 1
+    return tagged
+
+
+def _longest_increasing(values: Sequence[int]) -> Set[int]:
+    """Indices into values of one longest strictly increasing subsequence (patience sorting, O(n log n))."""
+    tails: List[int] = []  # values[tail_idx[k]] is the smallest tail of an increasing run of length k+1
+    tail_idx: List[int] = []
+    prev = [-1] * len(values)
+    for i, v in enumerate(values):
+        k = bisect_left(tails, v)
+        if k:
+            prev[i] = tail_idx[k - 1]
+        if k == len(tails):
+            tails.append(v)
+            tail_idx.append(i)
+        else:
+            tails[k] = v
+            tail_idx[k] = i
+    keep = set()
+    i = tail_idx[-1] if tail_idx else -1
+    while i >= 0:
+        keep.add(i)
+        i = prev[i]
+    return keep
+
+
+def plan_playlist_edits(
+    current: Sequence[str], desired: Sequence[str], batch_size: int = MAX_BATCH, max_calls: int | None = None
+) -> EditPlan | None:
+    """Plan removes, range moves and inserts that turn current into desired.
+
+    Args:
+        current: Remote track IDs in order
+        desired: Desired track IDs in order
+        batch_size: Most tracks one remove/insert call accepts
+        max_calls: Give up once the plan needs more calls than this
+
+    Returns:
+        EditPlan (empty if the orders already match), or None if over max_calls
+    """
+    plan = EditPlan()
+
+    def add(op: PlaylistEdit) -> None:
+        plan.ops.append(op)
+        if max_calls is not None and len(plan.ops) > max_calls:
+            raise _OverBudget
+
+    try:
+        current_counts, desired_counts = Counter(current), Counter(desired)
+        removed = [tid for tid in dict.fromkeys(current) if current_counts[tid] > desired_counts[tid]]
+        for start in range(0, len(removed), batch_size):
+            add(RemoveTracks(tuple(removed[start : start + batch_size])))
+        removed_set = set(removed)
+
+        state: List[Hashable] = _tag([tid for tid in current if tid not in removed_set])
+        target = _tag(desired)
+        target_index = {t: i for i, t in enumerate(target)}
+        anchors = {state[i] for i in _longest_increasing([target_index[t] for t in state])}
+        present = set(state)
+
+        # Walk the desired order: anchors stay, every other track is placed right after its
+        # desired predecessor, so the processed tracks and the anchors are always in desired order
+        i = 0
+        while i < len(target):
+            if target[i] in anchors:
+                i += 1
+                continue
+            insert_at = state.index(target[i - 1]) + 1 if i else 0
+            j = i + 1
+            if target[i] in present:
+                start = state.index(target[i])
+                # Extend the range while the next desired tracks follow it remotely too
+                while (
+                    j < len(target)
+                    and target[j] not in anchors
+                    and start + j - i < len(state)
+                    and state[start + j - i] == target[j]
+                ):
+                    j += 1
+                length = j - i
+                if start != insert_at:
+                    add(MoveRange(start, length, insert_at))
+                    block = state[start : start + length]
+                    del state[start : start + length]
+                    dest = insert_at - length if insert_at > start else insert_at
+                    state[dest:dest] = block
+            else:
+                while j < len(target) and j - i < batch_size and target[j] not in present:
+                    j += 1
+                add(InsertTracks(insert_at, tuple(tid for tid, _ in target[i:j])))
+                state[insert_at:insert_at] = target[i:j]
+            i = j
+    except _OverBudget:
+        return None
+    return plan
+
+
+def apply_edits(track_ids: Sequence[str], ops: Sequence[PlaylistEdit]) -> List[str]:
+    """Apply edit operations to a track list the way the provider would (previews, tests)."""
+    result = list(track_ids)
+    for op in ops:
+        if isinstance(op, RemoveTracks):
+            drop = set(op.track_ids)
+            result = [tid for tid in result if tid not in drop]
+        elif isinstance(op, InsertTracks):
+            result[op.position : op.position] = op.track_ids
+        else:
+            block = result[op.range_start : op.range_start + op.range_length]
+            del result[op.range_start : op.range_start + op.range_length]
+            dest = op.insert_before - op.range_length if op.insert_before > op.range_start else op.insert_before
+            result[dest:dest] = block
+    return result
+
+
+__all__ = ["EditPlan", "plan_playlist_edits", "replace_call_count", "apply_edits", "MAX_BATCH"]
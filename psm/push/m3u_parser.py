@@ -13,8 +13,24 @@ directory. Resolution failures (e.g. path does not exist) are still returned as
 the joined path string – existence is not required because we only map them to
 tracks via the matches table using their stored absolute path when available.
 """
+import os
 from pathlib import Path
-from typing import List
+from typing import Dict, List
+
+
+def _resolve(p: Path, resolved_dirs: Dict[Path, Path]) -> Path:
+    """Path.resolve() with the parent directory resolved once per directory.
+
+    Playlist lines share a handful of album folders; only the file itself is
+    checked for being a symlink (one lstat) instead of every path component.
+    """
+    if p.name in ("", ".."):
+        return p.resolve()
+    parent = resolved_dirs.get(p.parent)
+    if parent is None:
+        parent = resolved_dirs[p.parent] = p.parent.resolve()
+    candidate = parent / p.name
+    return candidate.resolve() if os.path.islink(candidate) else candidate
 
 
 def parse_m3u_paths(path: Path) -> List[str]:
@@ -29,6 +45,7 @@ def parse_m3u_paths(path: Path) -> List[str]:
     lines = []
     text = path.read_text(encoding="utf-8", errors="ignore")
     parent = path.parent
+    resolved_dirs: Dict[Path, Path] = {}
     for raw in text.splitlines():
         line = raw.strip()
         if not line:
@@ -39,11 +56,11 @@ def parse_m3u_paths(path: Path) -> List[str]:
         p = Path(line)
         if not p.is_absolute():
             # Resolve relative paths against playlist directory
-            p = (parent / p).resolve()
+            p = _resolve(parent / p, resolved_dirs)
         else:
             # Normalize absolute path (remove .., symlinks if any)
             try:
-                p = p.resolve()
+                p = _resolve(p, resolved_dirs)
             except Exception:
                 # If resolution fails, fall back to original
                 pass
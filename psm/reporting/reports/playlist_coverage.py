@@ -40,7 +40,7 @@ def write_playlist_coverage_report(db: Database, out_dir: Path, provider: str =
             0 as is_liked_songs
         FROM playlists p
         JOIN playlist_tracks pt ON p.id = pt.playlist_id
-        LEFT JOIN matches m ON pt.track_id = m.track_id
+        LEFT JOIN best_match m ON pt.track_id = m.track_id AND pt.provider = m.provider
         GROUP BY p.id, p.name, p.owner_name
 
         UNION ALL
@@ -55,7 +55,7 @@ def write_playlist_coverage_report(db: Database, out_dir: Path, provider: str =
             ROUND(CAST(COUNT(DISTINCT m.track_id) AS FLOAT) / COUNT(DISTINCT lt.track_id) * 100, 2) as coverage_percent,
             1 as is_liked_songs
         FROM liked_tracks lt
-        LEFT JOIN matches m ON lt.track_id = m.track_id
+        LEFT JOIN best_match m ON lt.track_id = m.track_id AND lt.provider = m.provider
         HAVING total_tracks > 0
 
         ORDER BY coverage_percent ASC, total_tracks DESC
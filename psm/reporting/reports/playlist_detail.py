@@ -57,7 +57,7 @@ def write_playlist_detail_report(
             CASE WHEN m.file_id IS NOT NULL THEN 1 ELSE 0 END as is_matched
         FROM playlist_tracks pt
         JOIN tracks t ON pt.track_id = t.id AND pt.provider = t.provider
-        LEFT JOIN matches m ON t.id = m.track_id AND t.provider = m.provider
+        LEFT JOIN best_match m ON t.id = m.track_id AND t.provider = m.provider
         LEFT JOIN library_files l ON m.file_id = l.id
         WHERE pt.playlist_id = ? AND pt.provider = ?
         ORDER BY pt.position
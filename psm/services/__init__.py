@@ -14,21 +14,36 @@ This allows CLI commands to focus on:
 - Output formatting
 """
 
-from .pull_service import pull_data
-from .match_service import run_matching
-from .export_service import export_playlists
-from .playlist_service import (
-    pull_single_playlist,
-    match_single_playlist,
-    export_single_playlist,
-    build_single_playlist,
-)
-from .analysis_service import (
-    analyze_library_quality,
-    print_quality_report,
-    QualityReport,
-    QualityIssue,
-)
+from __future__ import annotations
+import importlib
+from typing import Any, Dict
+
+# Public name -> defining module. Resolved on first access (PEP 562) so that
+# importing one service (e.g. match_service) does not also import the provider
+# client stack (requests, cryptography) pulled in by pull_service.
+_EXPORTS: Dict[str, str] = {
+    "pull_data": "pull_service",
+    "run_matching": "match_service",
+    "export_playlists": "export_service",
+    "pull_single_playlist": "playlist_service",
+    "match_single_playlist": "playlist_service",
+    "export_single_playlist": "playlist_service",
+    "build_single_playlist": "playlist_service",
+    "analyze_library_quality": "analysis_service",
+    "print_quality_report": "analysis_service",
+    "QualityReport": "analysis_service",
+    "QualityIssue": "analysis_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "pull_data",
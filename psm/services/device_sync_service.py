@@ -0,0 +1,407 @@
+"""Device sync service: copy the audio files of selected playlists to a device.
+
+Builds on the export data source: playlists (and Liked Songs) are read with
+their best local paths, every referenced file is copied into
+``<target>/Music`` and M3U files pointing at those copies are written to
+``<target>/Playlists``. Copies are incremental (size and mtime), run on a
+worker pool under an optional bandwidth cap.
+
+A manifest on the device (``.psm-device.json``) records which files psm
+copied and which playlists it wrote. Only those are ever removed: a copied
+file once no synced playlist references it, a playlist M3U once its playlist
+is no longer synced. Music and playlists that were already on the device are
+never touched.
+"""
+
+from __future__ import annotations
+import contextvars
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Deque, Dict, List, Set, Tuple
+
+from ..db import DatabaseInterface
+from ..export.playlists import WriteStats, export_strict, sanitize_filename
+from ..utils import events
+from ..utils.cancellation import check_cancelled
+from ..utils.path_format import PathMapper
+
+logger = logging.getLogger(__name__)
+
+MUSIC_DIR = "Music"
+PLAYLISTS_DIR = "Playlists"
+DEVICE_MANIFEST_NAME = ".psm-device.json"
+DEVICE_MANIFEST_VERSION = 1
+COPY_CHUNK = 1 << 20
+MTIME_TOLERANCE = 2.0  # FAT/exFAT (SD cards, most players) store mtimes with 2-second resolution
+
+# Outcomes of syncing one file
+COPIED = "copied"
+UNCHANGED = "unchanged"
+MISSING = "missing"  # Source gone and no earlier copy on the device
+
+
+class DeviceSyncResult:
+    """Results from a device sync."""
+
+    def __init__(self):
+        self.playlist_count = 0
+        self.files_copied = 0
+        self.files_unchanged = 0  # Size and mtime already matched on the device
+        self.files_missing = 0  # Referenced by a playlist but not readable at the source
+        self.bytes_copied = 0
+        self.copy_seconds = 0.0
+        self.playlist_files: List[str] = []
+        self.orphans_removed: List[str] = []  # Files psm wrote earlier that no synced playlist references now
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Copy throughput in MB/s over the copy phase (0 when nothing was copied)."""
+        if not self.bytes_copied or self.copy_seconds <= 0:
+            return 0.0
+        return self.bytes_copied / self.copy_seconds / 1_000_000
+
+
+@dataclass
+class DeviceManifest:
+    """What psm wrote to a device: copied files, playlist M3Us and what each synced playlist references.
+
+    Paths are POSIX paths relative to the device directory.
+    """
+
+    files: Set[str] = field(default_factory=set)  # Files psm copied that are still on the device
+    m3us: Set[str] = field(default_factory=set)  # Playlist files psm wrote that are still on the device
+    playlists: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # Id -> {"m3u": path, "files": [paths]}
+    _stored: Dict[str, Any] | None = field(default=None, repr=False, compare=False)  # Content on the device
+
+    @classmethod
+    def load(cls, target: Path) -> "DeviceManifest":
+        """Read the manifest from target; a missing or unreadable one yields an empty manifest."""
+        path = target / DEVICE_MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != DEVICE_MANIFEST_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')!r}")
+            return cls(set(data["files"]), set(data["m3us"]), dict(data["playlists"]), _stored=data)
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable device manifest {path}: {e}")
+            return cls()
+
+    def save(self, target: Path) -> None:
+        """Write the manifest to target atomically (skipped when nothing changed, as on a repeat sync)."""
+        data = {
+            "version": DEVICE_MANIFEST_VERSION,
+            "files": sorted(self.files),
+            "m3us": sorted(self.m3us),
+            "playlists": dict(sorted(self.playlists.items())),
+        }
+        if data == self._stored:
+            return
+        target.mkdir(parents=True, exist_ok=True)
+        path = target / DEVICE_MANIFEST_NAME
+        tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._stored = data
+
+    def orphans(self) -> Tuple[Set[str], Set[str]]:
+        """(files, M3Us) psm wrote that no synced playlist references any more."""
+        referenced = {f for entry in self.playlists.values() for f in entry["files"]}
+        current_m3us = {entry["m3u"] for entry in self.playlists.values()}
+        return self.files - referenced, self.m3us - current_m3us
+
+
+class BandwidthLimiter:
+    """Token bucket shared by all copy workers, capping their combined throughput."""
+
+    def __init__(self, bytes_per_second: float):
+        self.rate = bytes_per_second
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def consume(self, nbytes: int) -> None:
+        """Block until nbytes may be sent without exceeding the rate."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next_slot, now)
+            self._next_slot = start + nbytes / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+
+class DeviceLayout:
+    """Maps library file paths to their location below the device's Music directory.
+
+    Files keep their path below the library root they belong to, prefixed with
+    the root's folder name (so several roots cannot collide); path components
+    are sanitized for FAT/exFAT. Two files that would still land on the same
+    device path (names that differ only in case or in characters sanitizing
+    replaces) are told apart with a " (2)", " (3)", ... suffix, in the order
+    they are first mapped.
+    """
+
+    def __init__(self, library_roots: List[str] | None = None):
+        roots: List[Tuple[Path, str]] = []
+        for root in library_roots or []:
+            name = sanitize_filename(Path(root).name) or "library"
+            # Database paths are resolved; match against both the configured and the resolved form
+            roots.append((Path(root), name))
+            roots.append((Path(root).resolve(), name))
+        roots.sort(key=lambda entry: len(str(entry[0])), reverse=True)
+        self._roots = roots
+        self._cache: Dict[str, PurePosixPath] = {}
+        self._taken: Set[str] = set()  # Case-folded device paths already assigned (FAT/exFAT ignore case)
+
+    def relative(self, local_path: str) -> PurePosixPath:
+        """Path of local_path relative to the device's Music directory."""
+        rel = self._cache.get(local_path)
+        if rel is None:
+            rel = self._cache[local_path] = self._unique(self._map(Path(local_path)))
+        return rel
+
+    def _unique(self, rel: PurePosixPath) -> PurePosixPath:
+        candidate, n = rel, 1
+        while str(candidate).casefold() in self._taken:
+            n += 1
+            candidate = rel.with_name(f"{rel.stem} ({n}){rel.suffix}")
+        self._taken.add(str(candidate).casefold())
+        return candidate
+
+    def _map(self, path: Path) -> PurePosixPath:
+        for root, name in self._roots:
+            try:
+                parts = path.relative_to(root).parts
+            except ValueError:
+                continue
+            return PurePosixPath(name, *(sanitize_filename(part) or "_" for part in parts))
+        # Outside every configured root: keep the full path below "other"
+        return PurePosixPath("other", *(sanitize_filename(part) or "_" for part in path.parts[1:]))
+
+
+class _DevicePathMapper(PathMapper):
+    """Formats M3U entries as paths relative to <target>/Playlists (forward slashes, as players expect)."""
+
+    def __init__(self, layout: DeviceLayout):
+        super().__init__()
+        self._layout = layout
+
+    def format(self, file_path: str | Path, playlist_path: Path) -> str:
+        return f"../{MUSIC_DIR}/{self._layout.relative(str(file_path))}"
+
+
+def _sync_file(src: str, dst: Path, limiter: BandwidthLimiter | None) -> Tuple[str, int]:
+    """Copy src to dst unless an identical copy (size and mtime) is already there.
+
+    The copy goes to a temporary file that is moved into place, so an unplugged
+    device never keeps a truncated track under its final name.
+
+    Returns:
+        (outcome, bytes copied)
+    """
+    try:
+        src_stat = os.stat(src)
+    except OSError:
+        return (UNCHANGED if dst.is_file() else MISSING), 0
+    try:
+        dst_stat = dst.stat()
+        if dst_stat.st_size == src_stat.st_size and abs(dst_stat.st_mtime - src_stat.st_mtime) <= MTIME_TOLERANCE:
+            return UNCHANGED, 0
+    except OSError:
+        pass
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst.with_name(f".{dst.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(src, "rb") as fsrc, open(tmp_path, "wb") as fdst:
+            while chunk := fsrc.read(COPY_CHUNK):
+                check_cancelled()
+                if limiter is not None:
+                    limiter.consume(len(chunk))
+                fdst.write(chunk)
+        os.utime(tmp_path, (src_stat.st_atime, src_stat.st_mtime))
+        os.replace(tmp_path, dst)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return COPIED, src_stat.st_size
+
+
+def _collect_playlists(
+    db: DatabaseInterface, playlist_ids: List[str] | None, liked_songs: bool, provider: str
+) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Selected playlists with their tracks (best local paths), Liked Songs last."""
+    selected = []
+    if playlist_ids != []:
+        selected = list(db.iter_playlists_with_local_paths(playlist_ids, provider))
+    if liked_songs:
+        tracks = [dict(row) | {"position": i} for i, row in enumerate(db.get_liked_tracks_with_local_paths(provider))]
+        if tracks:
+            selected.append(({"id": "_liked_songs_virtual", "name": "Liked Songs"}, tracks))
+    return selected
+
+
+def _remove_device_files(target: Path, rel_paths: Set[str]) -> Tuple[List[str], Set[str]]:
+    """Delete device files and the directories they leave empty.
+
+    Returns:
+        (paths deleted, relative paths no longer on the device, including ones already gone)
+    """
+    removed: List[str] = []
+    gone: Set[str] = set()
+    for rel in sorted(rel_paths):
+        path = target / rel
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            gone.add(rel)
+            continue
+        except OSError as e:
+            logger.warning(f"Failed to remove {path}: {e}")
+            continue
+        removed.append(str(path))
+        gone.add(rel)
+        parent = path.parent
+        while parent.parent != target and parent != target:  # Keep Music/ and Playlists/ themselves
+            try:
+                parent.rmdir()  # Only succeeds if empty
+            except OSError:
+                break
+            parent = parent.parent
+    return removed, gone
+
+
+def sync_device(
+    db: DatabaseInterface,
+    target: Path,
+    library_paths: List[str] | None = None,
+    playlist_ids: List[str] | None = None,
+    liked_songs: bool = True,
+    workers: int = 4,
+    max_bandwidth: float | None = None,
+    delete_orphans: bool = True,
+) -> DeviceSyncResult:
+    """Copy the selected playlists' matched files to target and write M3Us relative to them.
+
+    Args:
+        db: Database instance
+        target: Device directory (mount point of a player or SD card, or any local directory)
+        library_paths: Library root paths from config (determine the layout below <target>/Music)
+        playlist_ids: Playlists to sync (None = all, [] = none). A subset leaves the other
+            playlists synced earlier in place
+        liked_songs: Also sync the Liked Songs virtual playlist
+        workers: Parallel copy workers
+        max_bandwidth: Cap on combined copy throughput in bytes/s (None = unlimited)
+        delete_orphans: Remove files and M3Us psm wrote earlier that no synced playlist
+            references any more (files psm did not write are never removed)
+
+    Returns:
+        DeviceSyncResult with file counts, bytes copied and throughput
+    """
+    result = DeviceSyncResult()
+    playlists_dir = target / PLAYLISTS_DIR
+    layout = DeviceLayout(library_paths)
+    provider = "spotify"  # TODO: Make configurable when adding multi-provider support
+    manifest = DeviceManifest.load(target)
+
+    selected = _collect_playlists(db, playlist_ids, liked_songs, provider)
+    # Local path -> device path relative to target (mapped in sorted order, so collision suffixes are stable)
+    local_paths = sorted({t["local_path"] for _, tracks in selected for t in tracks if t.get("local_path")})
+    sources = {local_path: f"{MUSIC_DIR}/{layout.relative(local_path)}" for local_path in local_paths}
+    logger.info(f"Syncing {len(selected)} playlist(s) referencing {len(sources)} file(s) to {target}")
+
+    # Copy on the worker pool; results are collected in submission order on this thread
+    limiter = BandwidthLimiter(max_bandwidth) if max_bandwidth else None
+    missing: set[str] = set()
+    pending: Deque[Tuple[str, Future]] = deque()
+    done = 0
+    workers = max(1, workers)
+    start = time.perf_counter()
+
+    def collect(src: str, future: Future) -> None:
+        nonlocal done
+        outcome, nbytes = future.result()
+        if outcome == COPIED:
+            result.files_copied += 1
+            result.bytes_copied += nbytes
+            manifest.files.add(sources[src])
+        elif outcome == UNCHANGED:
+            result.files_unchanged += 1  # Stays owned only if psm copied it earlier
+        else:
+            result.files_missing += 1
+            missing.add(src)
+            manifest.files.discard(sources[src])
+            logger.warning(f"Source file not found, skipped: {src}")
+        done += 1
+        events.progress(done, len(sources), "files")
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="psm-device") as pool:
+            for src, rel in sources.items():
+                check_cancelled()
+                # Workers run in a copy of this context so they see the cancel token
+                task = contextvars.copy_context().run
+                pending.append((src, pool.submit(task, _sync_file, src, target / rel, limiter)))
+                while pending and (pending[0][1].done() or len(pending) > 4 * workers):
+                    collect(*pending.popleft())
+            while pending:
+                collect(*pending.popleft())
+    except BaseException:
+        manifest.save(target)  # Remember the copies made so far, so a later sync can clean them up
+        raise
+    result.copy_seconds = time.perf_counter() - start
+
+    # Playlists reference only files that made it onto the device
+    path_mapper = _DevicePathMapper(layout)
+    stats = WriteStats()
+    synced: Dict[str, Dict[str, Any]] = {}
+    for playlist, tracks in selected:
+        check_cancelled()
+        available = [t if t.get("local_path") not in missing else t | {"local_path": None} for t in tracks]
+        path = export_strict(
+            {"name": playlist["name"], "id": playlist["id"]}, available, playlists_dir, path_mapper, stats
+        )
+        result.playlist_files.append(str(path))
+        m3u = path.relative_to(target).as_posix()
+        manifest.m3us.add(m3u)
+        files = sorted({sources[t["local_path"]] for t in available if t.get("local_path")})
+        synced[playlist["id"]] = {"m3u": m3u, "files": files}
+    result.playlist_count = len(selected)
+
+    # A full sync replaces the set of synced playlists; a --playlist subset only updates its own entries
+    if playlist_ids is None:
+        manifest.playlists = synced
+    else:
+        manifest.playlists.update(synced)
+
+    if delete_orphans:
+        orphan_files, orphan_m3us = manifest.orphans()
+        removed, gone = _remove_device_files(target, orphan_files | orphan_m3us)
+        manifest.files -= gone
+        manifest.m3us -= gone
+        result.orphans_removed = removed
+        if removed:
+            logger.info(f"Removed {len(removed)} orphaned file(s) from {target}")
+    manifest.save(target)
+
+    logger.info(
+        f"✓ Synced {result.playlist_count} playlists to {target}: {result.files_copied} copied "
+        f"({result.bytes_copied / 1_000_000:.1f} MB at {result.throughput_mb_s:.1f} MB/s), "
+        f"{result.files_unchanged} unchanged, {result.files_missing} missing"
+    )
+    return result
+
+
+__all__ = ["DeviceSyncResult", "DeviceManifest", "DeviceLayout", "BandwidthLimiter", "sync_device"]
@@ -6,11 +6,17 @@ and dispatching to the appropriate export mode.
 
 from __future__ import annotations
 import logging
-from typing import Dict, Any, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Any, List, Tuple
 from pathlib import Path
 
-from ..export.playlists import export_strict, export_mirrored, export_placeholders, sanitize_filename
+from ..export.manifest import ExportManifest
+from ..export.playlists import export_strict, export_mirrored, export_placeholders, sanitize_filename, WriteStats
 from ..db import DatabaseInterface
+from ..utils.path_format import PathMapper
+from ..utils import events
+from ..utils.cancellation import check_cancelled
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,8 @@ class ExportResult:
         self.exported_files: List[str] = []
         self.obsolete_files: List[str] = []  # Files that exist but aren't in current playlists
         self.cleaned_files: List[str] = []  # Files that were deleted during cleanup
+        self.write_stats = WriteStats()  # Files rewritten vs left untouched (content unchanged)
+        self.manifest_generation: int | None = None  # Export manifest generation after this run (None = no manifest)
 
 
 def _find_existing_m3u_files(export_dir: Path) -> List[Path]:
@@ -81,6 +89,69 @@ def _clean_export_directory(export_dir: Path) -> List[str]:
     return deleted
 
 
+def _export_one(
+    mode: str,
+    playlist_meta: Dict[str, Any],
+    tracks: List[Dict[str, Any]],
+    target_dir: Path,
+    placeholder_ext: str,
+    path_mapper: PathMapper,
+    stats: WriteStats,
+) -> Path:
+    """Render and write one playlist in the given export mode; returns the M3U path."""
+    if mode == "mirrored":
+        return export_mirrored(playlist_meta, tracks, target_dir, path_mapper, stats)
+    if mode == "placeholders":
+        return export_placeholders(playlist_meta, tracks, target_dir, placeholder_ext, path_mapper, stats)
+    return export_strict(playlist_meta, tracks, target_dir, path_mapper, stats)
+
+
+def _run_inline(fn: Callable[..., Any], *args: Any) -> Future:
+    """Run fn on the calling thread, returning its outcome as a completed Future (serial export)."""
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+def _collect_export(future: Future, stats: WriteStats, result: ExportResult, total_playlists: int) -> None:
+    """Record a finished playlist export in result (called in submission order)."""
+    result.exported_files.append(str(future.result()))
+    result.write_stats.written.extend(stats.written)
+    result.write_stats.unchanged.extend(stats.unchanged)
+    result.write_stats.digests.update(stats.digests)
+    events.progress(len(result.exported_files), total_playlists, "playlists")
+
+
+def _update_manifest(
+    manifest: ExportManifest,
+    export_dir: Path,
+    exported_playlists: List[Tuple[str, int]],
+    result: ExportResult,
+    complete: bool,
+) -> Dict[str, Tuple[str, str, int]]:
+    """Record this run's files in the manifest.
+
+    Args:
+        manifest: Manifest loaded before the export
+        export_dir: Base export directory (manifest paths are relative to it)
+        exported_playlists: (playlist id, track count) in the order of result.exported_files
+        result: Result holding the exported files and their digests
+        complete: Every playlist was exported (missing ones become tombstones)
+
+    Returns:
+        Playlist id -> (relative file, sha256, track count) as recorded
+    """
+    exported = {}
+    for (playlist_id, track_count), file in zip(exported_playlists, result.exported_files):
+        relative = Path(file).relative_to(export_dir).as_posix()
+        exported[playlist_id] = (relative, result.write_stats.digests[file], track_count)
+    manifest.update(exported, complete)
+    return exported
+
+
 def _resolve_export_dir(
     base_dir: Path, organize_by_owner: bool, owner_id: str | None, owner_name: str | None, current_user_id: str | None
 ) -> Path:
@@ -116,10 +187,14 @@ def export_playlists(
     current_user_id: str | None = None,
     library_paths: list[str] | None = None,
     playlist_ids: List[str] | None = None,
+    liked_songs: bool | None = None,
 ) -> ExportResult:
     """Export playlists to M3U files.
 
     Automatically includes Liked Songs as a virtual playlist unless disabled in config.
+    A scoped export (playlist_ids given, possibly empty) writes only those playlists,
+    plus Liked Songs if liked_songs is True; it never cleans the export directory or
+    reports other playlists as obsolete.
 
     Args:
         db: Database instance
@@ -128,6 +203,8 @@ def export_playlists(
         current_user_id: Current user ID (for owner organization)
         library_paths: Library root paths from config (for path reconstruction)
         playlist_ids: Optional list of specific playlist IDs to export (None = export all)
+        liked_songs: Export the Liked Songs virtual playlist (subject to include_liked_songs);
+            None = only in full exports
 
     Returns:
         ExportResult with count and file list
@@ -143,9 +220,22 @@ def export_playlists(
     use_library_roots = export_config.get("use_library_roots", True)
     clean_before_export = export_config.get("clean_before_export", False)
     detect_obsolete = export_config.get("detect_obsolete", True)
+    workers = max(1, int(export_config.get("workers", 4)))
+    keep_manifest = export_config.get("manifest", True)
+    scoped = playlist_ids is not None
+    if liked_songs is None:
+        liked_songs = not scoped
+    if scoped:
+        # Other playlists are left as they are: cleaning or flagging them as obsolete would be wrong
+        clean_before_export = False
+        detect_obsolete = False
+
+    if mode not in ("strict", "mirrored", "placeholders"):
+        logger.warning(f"Unknown export mode '{mode}', defaulting to strict")
+        mode = "strict"
 
-    # Prepare library roots for path reconstruction (if enabled)
-    library_roots_param = library_paths if (use_library_roots and library_paths) else None
+    # Resolve library roots once for path reconstruction (if enabled) and reuse for every track
+    path_mapper = PathMapper(path_format, library_paths if (use_library_roots and library_paths) else None)
 
     # Clean export directory before export (if configured)
     if clean_before_export:
@@ -154,8 +244,11 @@ def export_playlists(
         if result.cleaned_files:
             logger.info(f"Deleted {len(result.cleaned_files)} existing .m3u files")
 
-    # Capture existing files for obsolete detection (before export, after optional clean)
-    existing_files_before = [] if clean_before_export else _find_existing_m3u_files(export_dir)
+    # A manifest from an earlier run turns obsolete detection into a set operation on it;
+    # without one, capture existing files for obsolete detection (before export, after optional clean)
+    manifest = ExportManifest.load(export_dir) if keep_manifest else None
+    scan_for_obsolete = detect_obsolete and not clean_before_export and not (manifest and manifest.generation)
+    existing_files_before = _find_existing_m3u_files(export_dir) if scan_for_obsolete else []
 
     # Get current user ID from metadata if not provided
     if organize_by_owner and current_user_id is None:
@@ -163,7 +256,7 @@ def export_playlists(
 
     # Enumerate playlists using repository method (provider-aware, sorted)
     provider = "spotify"  # TODO: Make configurable when adding multi-provider support
-    playlists = db.list_playlists(playlist_ids, provider)
+    playlists = db.list_playlists(playlist_ids, provider) if playlist_ids != [] else []
 
     total_playlists = len(playlists)
 
@@ -176,7 +269,7 @@ def export_playlists(
         playlists_by_owner[owner].append(pl)
 
     # Log export summary by owner (INFO mode)
-    if not logger.isEnabledFor(logging.DEBUG):
+    if playlists and not logger.isEnabledFor(logging.DEBUG):
         if playlist_ids:
             logger.info(f"Exporting {total_playlists} affected playlist(s) from {len(playlists_by_owner)} owner(s):")
         else:
@@ -185,68 +278,92 @@ def export_playlists(
             count = len(playlists_by_owner[owner])
             logger.info(f"  • {owner}: {count} playlist(s)")
 
-    for idx, pl in enumerate(playlists, 1):
-        pl_id = pl["id"]
-        owner_id = pl["owner_id"] if "owner_id" in pl.keys() else None
-        owner_name = pl["owner_name"] if "owner_name" in pl.keys() else None
-
-        # Determine target directory
-        target_dir = _resolve_export_dir(export_dir, organize_by_owner, owner_id, owner_name, current_user_id)
-
-        # Fetch tracks with local paths using repository method (provider-aware, best match only)
-        track_rows = db.get_playlist_tracks_with_local_paths(pl_id, provider)
-        tracks = [dict(r) | {"position": r["position"]} for r in track_rows]
-        playlist_meta = {"name": pl["name"], "id": pl_id}
-
-        # Log progress (only in DEBUG mode - INFO mode shows per-owner summary above)
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"[{idx}/{total_playlists}] Exporting: {pl['name']}")
-
-        # Dispatch to export function based on mode and capture actual path
-        if mode == "strict":
-            actual_path = export_strict(playlist_meta, tracks, target_dir, path_format, library_roots_param)
-        elif mode == "mirrored":
-            actual_path = export_mirrored(playlist_meta, tracks, target_dir, path_format, library_roots_param)
-        elif mode == "placeholders":
-            actual_path = export_placeholders(
-                playlist_meta, tracks, target_dir, placeholder_ext, path_format, library_roots_param
+    # One query streams every playlist's tracks (grouped per playlist) on this thread, so the
+    # SQLite connection is never shared; rendering and writing run on the worker pool. Results
+    # are collected in submission order (deterministic exported_files) and at most 2x workers
+    # playlists are in flight, so the stream is never fully held in memory.
+    playlist_groups = db.iter_playlists_with_local_paths(playlist_ids, provider) if playlists else iter(())
+    pending: Deque[tuple[Future, WriteStats]] = deque()
+    exported_playlists: List[Tuple[str, int]] = []  # (id, track count) in submission order, for the manifest
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="psm-export") as pool:
+        submit = pool.submit if workers > 1 else _run_inline
+        for idx, (pl, tracks) in enumerate(playlist_groups, 1):
+            check_cancelled()
+            pl_id = pl["id"]
+
+            # Determine target directory
+            target_dir = _resolve_export_dir(
+                export_dir, organize_by_owner, pl.get("owner_id"), pl.get("owner_name"), current_user_id
             )
-        else:
-            logger.warning(f"Unknown export mode '{mode}', defaulting to strict")
-            actual_path = export_strict(playlist_meta, tracks, target_dir, path_format, library_roots_param)
+            playlist_meta = {"name": pl["name"], "id": pl_id}
+
+            # Log progress (only in DEBUG mode - INFO mode shows per-owner summary above)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{idx}/{total_playlists}] Exporting: {pl['name']}")
+
+            stats = WriteStats()
+            future = submit(_export_one, mode, playlist_meta, tracks, target_dir, placeholder_ext, path_mapper, stats)
+            pending.append((future, stats))
+            exported_playlists.append((pl_id, len(tracks)))
+            while pending and (pending[0][0].done() or len(pending) > 2 * workers):
+                _collect_export(*pending.popleft(), result, total_playlists)
 
-        result.exported_files.append(str(actual_path))
+        while pending:
+            _collect_export(*pending.popleft(), result, total_playlists)
 
     result.playlist_count = len(playlists)
 
     # Export Liked Songs as virtual playlist (unless disabled in config)
-    # Skip Liked Songs during incremental/scoped exports (playlist_ids provided)
-    # to avoid unnecessary full exports - caller should trigger full export if Liked Songs affected
+    # Scoped exports (playlist_ids provided) include it only when asked to (liked_songs=True)
     provider = "spotify"  # TODO: Make configurable when adding multi-provider support
-    if include_liked_songs and playlist_ids is None:
+    if include_liked_songs and liked_songs:
         liked_count = db.count_liked_tracks(provider=provider)
         if liked_count > 0:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Exporting Liked Songs as virtual playlist ({liked_count} tracks)")
-            _export_liked_tracks(
+            liked_tracks = _export_liked_tracks(
                 db,
                 export_dir,
                 mode,
                 placeholder_ext,
                 organize_by_owner,
                 current_user_id,
-                path_format,
-                library_roots_param,
+                path_mapper,
                 result,
             )
+            exported_playlists.append(("_liked_songs_virtual", liked_tracks))
+
+    if manifest is not None:
+        previous_generation = manifest.generation
+        exported = _update_manifest(manifest, export_dir, exported_playlists, result, complete=not scoped)
 
     # Detect obsolete files (if configured and not cleaned)
-    if detect_obsolete and not clean_before_export and existing_files_before:
-        result.obsolete_files = [str(f) for f in _detect_obsolete_files(existing_files_before, result.exported_files)]
+    if detect_obsolete and not clean_before_export:
+        if existing_files_before:
+            obsolete = _detect_obsolete_files(existing_files_before, result.exported_files)
+            if manifest is not None:
+                # First run with a manifest: remember stale files so later runs still report them
+                for f in obsolete:
+                    manifest.retired_files.setdefault(f.relative_to(export_dir).as_posix(), manifest.generation)
+        elif manifest is not None:
+            obsolete = manifest.obsolete_files(export_dir, (file for file, _, _ in exported.values()))
+        else:
+            obsolete = []
+        result.obsolete_files = [str(f) for f in obsolete]
         if result.obsolete_files:
             logger.info(f"Found {len(result.obsolete_files)} obsolete playlist(s) in export directory")
 
-    logger.info(f"✓ Exported " f"{result.playlist_count} playlists " f"to {export_dir}")
+    if manifest is not None:
+        if manifest.generation != previous_generation or existing_files_before:
+            manifest.save(export_dir)
+            logger.debug(f"Export manifest now at generation {manifest.generation}")
+        result.manifest_generation = manifest.generation
+
+    stats = result.write_stats
+    logger.info(
+        f"✓ Exported {result.playlist_count} playlists to {export_dir} "
+        f"({len(stats.written)} written, {len(stats.unchanged)} unchanged)"
+    )
     return result
 
 
@@ -257,10 +374,9 @@ def _export_liked_tracks(
     placeholder_ext: str,
     organize_by_owner: bool,
     current_user_id: str | None,
-    path_format: str,
-    library_roots: list[str] | None,
+    path_mapper: PathMapper,
     result: ExportResult,
-) -> None:
+) -> int:
     """Export liked tracks as a virtual 'Liked Songs' playlist.
 
     Args:
@@ -270,9 +386,11 @@ def _export_liked_tracks(
         placeholder_ext: Extension for placeholder files
         organize_by_owner: Whether to organize by owner
         current_user_id: Current user ID (for owner organization)
-        path_format: Path format for M3U files
-        library_roots: Library root paths from config (for path reconstruction)
+        path_mapper: Formats track paths for M3U files
         result: Result object to update with export info
+
+    Returns:
+        Number of liked tracks in the playlist
     """
     # Determine target directory
     if organize_by_owner:
@@ -297,19 +415,9 @@ def _export_liked_tracks(
 
     playlist_meta = {"name": "Liked Songs", "id": "_liked_songs_virtual"}
 
-    # Dispatch to appropriate export mode and get the actual file path
-    if mode == "strict":
-        actual_path = export_strict(playlist_meta, tracks, target_dir, path_format, library_roots)
-    elif mode == "mirrored":
-        actual_path = export_mirrored(playlist_meta, tracks, target_dir, path_format, library_roots)
-    elif mode == "placeholders":
-        actual_path = export_placeholders(
-            playlist_meta, tracks, target_dir, placeholder_ext, path_format, library_roots
-        )
-    else:
-        logger.warning(f"Unknown export mode '{mode}', defaulting to strict")
-        actual_path = export_strict(playlist_meta, tracks, target_dir, path_format, library_roots)
+    actual_path = _export_one(mode, playlist_meta, tracks, target_dir, placeholder_ext, path_mapper, result.write_stats)
 
     # Update result
     result.playlist_count += 1
     result.exported_files.append(str(actual_path))
+    return len(tracks)
@@ -30,6 +30,182 @@ class MatchResult:
         self.duration_seconds = 0.0
 
 
+class WarmMatchIndex:
+    """Resident track and library-file lists for repeated incremental matching.
+
+    Watch mode matches a handful of changed files (or pulled tracks) at a time.
+    Loading every track/file from SQLite and converting rows to dicts for each
+    event dominates that latency, so this index keeps the converted lists in
+    memory between events and patches them as files and tracks change.
+
+    The index holds no database connection; each call takes the Database of the
+    current event. It reloads itself when the data it mirrors was changed by
+    another process (library_last_modified meta or track count changed).
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        matching_dict = config.get("matching", {})
+        self.matching_config = MatchingConfig(
+            duration_tolerance=matching_dict.get("duration_tolerance", 2.0),
+            max_candidates_per_track=int(matching_dict.get("max_candidates_per_track", 500)),
+            fuzzy_threshold=matching_dict.get("fuzzy_threshold", 0.85),
+        )
+        self.provider = config.get("provider", "spotify")
+        self.tracks: Dict[str, Dict[str, Any]] | None = None
+        self.files: Dict[int, Dict[str, Any]] | None = None
+        self._file_ids_by_path: Dict[str, int] = {}
+        self._track_list: List[Dict[str, Any]] | None = None
+        self._file_list: List[Dict[str, Any]] | None = None
+        self._library_stamp: str | None = None
+        self._cursor: int | None = None  # change_log position the resident data reflects
+        self.loads = 0  # Full reloads (for diagnostics/tests)
+
+    # --- loading / freshness ---
+
+    def load_tracks(self, db: Database) -> None:
+        self.tracks = {row.id: row.to_dict() for row in db.get_all_tracks(provider=self.provider)}
+        self._track_list = None
+        self.loads += 1
+
+    def load_files(self, db: Database) -> None:
+        self.files = {}
+        self._file_ids_by_path = {}
+        for row in db.get_all_library_files():
+            self._put_file(MatchingEngine._normalize_file_dict(row.to_dict()))
+        self._file_list = None
+        self._library_stamp = db.get_meta("library_last_modified")
+        self.loads += 1
+
+    def invalidate(self) -> None:
+        """Drop resident data; the next match call reloads everything."""
+        self.tracks = None
+        self.files = None
+        self._cursor = None
+
+    def ensure_fresh(self, db: Database) -> None:
+        """Load on first use; reload or patch parts changed outside this process.
+
+        Bulk changes (track count or library_last_modified changed) reload a side;
+        anything else recorded in the change journal since the last call (e.g. a
+        pull that only renamed tracks) is patched in by ID.
+        """
+        changes = db.read_changes(self._cursor) if self._cursor is not None else None
+        self._cursor = changes.cursor if changes is not None else db.get_change_cursor()
+        if changes is not None and changes.truncated:
+            self.tracks = None
+            self.files = None
+
+        tracks_loaded = files_loaded = False
+        if self.tracks is None:
+            self.load_tracks(db)
+            tracks_loaded = True
+        else:
+            count = db.conn.execute("SELECT COUNT(*) FROM tracks WHERE provider=?", (self.provider,)).fetchone()[0]
+            if count != len(self.tracks):
+                logger.debug(f"[match-index] track count changed ({len(self.tracks)} -> {count}); reloading")
+                self.load_tracks(db)
+                tracks_loaded = True
+        if self.files is None or db.get_meta("library_last_modified") != self._library_stamp:
+            self.load_files(db)
+            files_loaded = True
+
+        if changes is not None:
+            if changes.tracks and not tracks_loaded:
+                self.refresh_tracks(db, list(changes.tracks))
+            if changes.files and not files_loaded:
+                self.refresh_files(db, list(changes.files))
+
+    def track_list(self, db: Database) -> List[Dict[str, Any]]:
+        """Resident tracks as the list MatchingEngine expects (loaded/patched first)."""
+        self.ensure_fresh(db)
+        return self._resident_tracks()
+
+    def file_list(self, db: Database) -> List[Dict[str, Any]]:
+        """Resident library files as the list MatchingEngine expects (loaded/patched first)."""
+        self.ensure_fresh(db)
+        return self._resident_files()
+
+    def _resident_tracks(self) -> List[Dict[str, Any]]:
+        if self._track_list is None:
+            self._track_list = list(self.tracks.values())
+        return self._track_list
+
+    def _resident_files(self) -> List[Dict[str, Any]]:
+        if self._file_list is None:
+            self._file_list = list(self.files.values())
+        return self._file_list
+
+    # --- incremental patching ---
+
+    def _put_file(self, file_dict: Dict[str, Any]) -> None:
+        previous = self._file_ids_by_path.get(file_dict["path"])
+        if previous is not None and previous != file_dict["id"]:
+            self.files.pop(previous, None)  # Path now belongs to another row (file replaced)
+        old = self.files.get(file_dict["id"])
+        if old is not None and old["path"] != file_dict["path"]:
+            self._file_ids_by_path.pop(old["path"], None)  # Moved
+        self.files[file_dict["id"]] = file_dict
+        self._file_ids_by_path[file_dict["path"]] = file_dict["id"]
+
+    def _drop_file(self, file_id: int) -> None:
+        old = self.files.pop(file_id, None)
+        if old is not None and self._file_ids_by_path.get(old["path"]) == file_id:
+            del self._file_ids_by_path[old["path"]]
+
+    def refresh_files(self, db: Database, file_ids: List[int]) -> None:
+        """Re-read specific library files (new, updated or moved); missing IDs are dropped."""
+        if self.files is None:
+            return
+        found = set()
+        for row in db.get_library_files_by_ids(list(file_ids)):
+            self._put_file(MatchingEngine._normalize_file_dict(row.to_dict()))
+            found.add(row.id)
+        for file_id in set(file_ids) - found:
+            self._drop_file(file_id)
+        self._file_list = None
+
+    def drop_paths(self, paths: List[str]) -> None:
+        """Forget files at the given normalized paths (deleted from the library)."""
+        if self.files is None:
+            return
+        for path in paths:
+            file_id = self._file_ids_by_path.get(path)
+            if file_id is not None:
+                self._drop_file(file_id)
+        self._file_list = None
+
+    def refresh_tracks(self, db: Database, track_ids: List[str]) -> None:
+        """Re-read specific tracks; IDs no longer in the database are dropped."""
+        if self.tracks is None:
+            return
+        found = set()
+        for row in db.get_tracks_by_ids(list(track_ids), provider=self.provider):
+            self.tracks[row.id] = row.to_dict()
+            found.add(row.id)
+        for track_id in set(track_ids) - found:
+            self.tracks.pop(track_id, None)
+        self._track_list = None
+
+    # --- matching ---
+
+    def _engine(self, db: Database) -> MatchingEngine:
+        return MatchingEngine(db, self.matching_config, provider=self.provider)
+
+    def match_files(self, db: Database, file_ids: List[int] | None) -> tuple[int, List[str]]:
+        """Same as match_changed_files(), using the resident track list."""
+        self.ensure_fresh(db)
+        if file_ids:
+            self.refresh_files(db, file_ids)
+        return self._engine(db).match_files(file_ids=file_ids, all_tracks=self._resident_tracks())
+
+    def match_tracks(self, db: Database, track_ids: List[str] | None) -> int:
+        """Same as match_changed_tracks(), using the resident library file list."""
+        self.ensure_fresh(db)
+        if track_ids:
+            self.refresh_tracks(db, track_ids)
+        return self._engine(db).match_tracks(track_ids=track_ids, all_files=self._resident_files())
+
+
 def run_matching(
     db: Database,
     config: Dict[str, Any],
@@ -37,6 +213,7 @@ def run_matching(
     top_unmatched_tracks: int = 20,
     top_unmatched_albums: int = 10,
     force_full: bool = False,
+    index: WarmMatchIndex | None = None,
 ) -> MatchResult:
     """Run matching engine and generate diagnostics.
 
@@ -47,6 +224,7 @@ def run_matching(
         top_unmatched_tracks: Number of top unmatched tracks to show (INFO mode)
         top_unmatched_albums: Number of top unmatched albums to show (INFO mode)
         force_full: If True, re-match all tracks; if False (default), skip already-matched tracks
+        index: Optional warm index (psm serve daemon); avoids reloading tracks and files
 
     Returns:
         MatchResult with statistics and unmatched diagnostics
@@ -78,11 +256,15 @@ def run_matching(
         logger.info("Forcing full re-match (deleting existing matches)...")
         db.delete_all_matches()
         db.commit()
-        matched_count = engine.match_all()
+        if index is not None:
+            matched_count = engine.match_all(all_tracks=index.track_list(db), all_files=index.file_list(db))
+        else:
+            matched_count = engine.match_all()
     else:
         # Smart incremental: only match tracks that don't have matches yet
         logger.info("Smart matching (skipping already-matched tracks)...")
-        matched_count = engine.match_tracks(track_ids=None)  # None = match all unmatched
+        all_files = index.file_list(db) if index is not None else None
+        matched_count = engine.match_tracks(track_ids=None, all_files=all_files)  # None = match all unmatched
 
     # Gather statistics
     result.library_files = db.count_library_files()
@@ -241,7 +423,9 @@ def _show_unmatched_diagnostics(db: Database, top_tracks: int = 20, top_albums:
                 logger.info(f"  ... and {len(sorted_albums) - display_album_count} more albums")
 
 
-def match_changed_tracks(db: Database, config: Dict[str, Any], track_ids: List[str] | None = None) -> int:
+def match_changed_tracks(
+    db: Database, config: Dict[str, Any], track_ids: List[str] | None = None, index: WarmMatchIndex | None = None
+) -> int:
     """Incrementally match all files against only changed/new tracks.
 
     This is the inverse of match_changed_files: instead of matching a few changed
@@ -253,10 +437,14 @@ def match_changed_tracks(db: Database, config: Dict[str, Any], track_ids: List[s
         db: Database instance
         config: Full configuration dict
         track_ids: List of specific track IDs to match (if None, matches all unmatched tracks)
+        index: Optional warm index (watch mode); avoids reloading all library files
 
     Returns:
         Number of new matches created
     """
+    if index is not None:
+        return index.match_tracks(db, track_ids)
+
     # Convert dict config to typed MatchingConfig
     matching_dict = config.get("matching", {})
     matching_config = MatchingConfig(
@@ -272,7 +460,7 @@ def match_changed_tracks(db: Database, config: Dict[str, Any], track_ids: List[s
 
 
 def match_changed_files(
-    db: Database, config: Dict[str, Any], file_ids: List[int] | None = None
+    db: Database, config: Dict[str, Any], file_ids: List[int] | None = None, index: WarmMatchIndex | None = None
 ) -> tuple[int, List[str]]:
     """Incrementally match only changed/new files against all tracks.
 
@@ -284,10 +472,14 @@ def match_changed_files(
         db: Database instance
         config: Full configuration dict
         file_ids: List of specific file IDs to match (if None, matches all unmatched files)
+        index: Optional warm index (watch mode); avoids reloading all tracks
 
     Returns:
         Tuple of (match_count, list of matched track IDs)
     """
+    if index is not None:
+        return index.match_files(db, file_ids)
+
     # Convert dict config to typed MatchingConfig
     matching_dict = config.get("matching", {})
     matching_config = MatchingConfig(
@@ -19,6 +19,7 @@ from ..db import DatabaseInterface
 from ..utils.normalization import normalize_title_artist
 from ..match.matching_engine import MatchingEngine
 from ..export.playlists import export_strict, export_mirrored, export_placeholders
+from ..utils.path_format import PathMapper
 from .export_service import _resolve_export_dir
 
 logger = logging.getLogger(__name__)
@@ -248,8 +249,8 @@ def export_single_playlist(
     path_format = export_config.get("path_format", "absolute")
     use_library_roots = export_config.get("use_library_roots", True)
 
-    # Prepare library roots for path reconstruction (if enabled)
-    library_roots_param = library_paths if (use_library_roots and library_paths) else None
+    # Resolve library roots once for path reconstruction (if enabled)
+    path_mapper = PathMapper(path_format, library_paths if (use_library_roots and library_paths) else None)
 
     # Get current user ID from metadata if not provided
     if organize_by_owner and current_user_id is None:
@@ -265,16 +266,14 @@ def export_single_playlist(
 
     # Dispatch to export function based on mode (with path format and library roots)
     if mode == "strict":
-        actual_path = export_strict(playlist_meta, tracks, target_dir, path_format, library_roots_param)
+        actual_path = export_strict(playlist_meta, tracks, target_dir, path_mapper)
     elif mode == "mirrored":
-        actual_path = export_mirrored(playlist_meta, tracks, target_dir, path_format, library_roots_param)
+        actual_path = export_mirrored(playlist_meta, tracks, target_dir, path_mapper)
     elif mode == "placeholders":
-        actual_path = export_placeholders(
-            playlist_meta, tracks, target_dir, placeholder_ext, path_format, library_roots_param
-        )
+        actual_path = export_placeholders(playlist_meta, tracks, target_dir, placeholder_ext, path_mapper)
     else:
         logger.warning(f"Unknown export mode '{mode}', defaulting to strict")
-        actual_path = export_strict(playlist_meta, tracks, target_dir, path_format, library_roots_param)
+        actual_path = export_strict(playlist_meta, tracks, target_dir, path_mapper)
 
     result.exported_file = str(actual_path)
     result.tracks_processed = len(tracks)
@@ -14,8 +14,10 @@ Safety constraints (MVP):
   * Full replace semantics (remote order becomes desired order)
 
 Remote operations are implemented for Spotify only (provider abstraction kept
-minimal). If desired track count exceeds 100 (Spotify replace limit), we clear
-then batch-add in chunks of 100.
+minimal). When the client supports incremental edits, a minimal edit script
+(removes, range moves, inserts; see psm.push.diff) is applied if it needs fewer
+API calls than a full replace. A full replace clears then batch-adds in chunks
+of 100 when the desired track count exceeds 100 (Spotify replace limit).
 """
 from dataclasses import dataclass
 from pathlib import Path
@@ -23,10 +25,13 @@ from typing import List, Sequence, Dict, Any, Tuple
 import logging
 
 from ..db import DatabaseInterface
+from ..push.diff import EditPlan, plan_playlist_edits, replace_call_count
 from ..push.m3u_parser import parse_m3u_paths
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_ATTEMPTS = 3  # Listings tried before giving up on one consistent with a snapshot ID
+
 
 @dataclass
 class PushPreview:
@@ -40,33 +45,30 @@ class PushPreview:
     unmatched_file_paths: int
     changed: bool
     applied: bool = False
+    api_calls: int = 0  # Remote write calls the push needs (incremental edits or full replace)
+    incremental: bool = False  # Applied as a minimal edit script rather than a full replace
 
 
-def _map_paths_to_track_ids(db: DatabaseInterface, paths: Sequence[str]) -> Tuple[List[str], int]:
+def _map_paths_to_track_ids(
+    db: DatabaseInterface, paths: Sequence[str], playlist_id: str | None = None
+) -> Tuple[List[str], int]:
     """Map local file system paths back to playlist track IDs via matches.
 
+    All paths are resolved in bulk (one set-based join per chunk of paths); a file
+    matched to several tracks maps to the track whose best match it is, preferring
+    tracks of playlist_id.
+
     Returns list of track IDs (duplicates preserved to reflect ordering) and
     count of file paths that could not be resolved.
     """
-    track_ids: List[str] = []
-    unresolved = 0
-    # Prepare statement once for efficiency
-    cur = db.conn.cursor()
-    for p in paths:
-        row = cur.execute(
-            "SELECT m.track_id FROM library_files lf JOIN matches m ON m.file_id = lf.id WHERE lf.path = ?",
-            (p,),
-        ).fetchone()
-        if row and row[0]:
-            track_ids.append(row[0])
-        else:
-            unresolved += 1
-    return track_ids, unresolved
+    resolved = db.map_paths_to_track_ids(paths, playlist_id, provider="spotify")
+    track_ids = [resolved[p] for p in paths if p in resolved]
+    return track_ids, len(paths) - len(track_ids)
 
 
 def _desired_track_ids_from_file(db: DatabaseInterface, playlist_id: str, m3u_path: Path) -> Tuple[List[str], int]:
     paths = parse_m3u_paths(m3u_path)
-    return _map_paths_to_track_ids(db, paths)
+    return _map_paths_to_track_ids(db, paths, playlist_id)
 
 
 def _desired_track_ids_from_db(db: DatabaseInterface, playlist_id: str) -> List[str]:
@@ -86,14 +88,55 @@ def _diff(current: Sequence[str], desired: Sequence[str]) -> Tuple[int, int, int
     return positional_changes, added, removed, changed
 
 
-def _remote_playlist_items(client, playlist_id: str) -> List[str]:  # pragma: no cover (thin wrapper)
-    items = client.playlist_items(playlist_id, verbose=False)
+def _remote_playlist_items(client, playlist_id: str) -> Tuple[List[str], int]:  # pragma: no cover (thin wrapper)
+    """Remote track IDs in order, and the number of items without one (local files, unavailable tracks)."""
+    items = client.playlist_items(playlist_id)
     ids: List[str] = []
     for it in items:
         track = it.get("track") if isinstance(it, dict) else None
         if track and track.get("id"):
             ids.append(track["id"])
-    return ids
+    return ids, len(items) - len(ids)
+
+
+def _remote_snapshot_id(client, playlist_id: str) -> str | None:
+    try:
+        return (client.get_playlist(playlist_id) or {}).get("snapshot_id")
+    except Exception as e:  # pragma: no cover (network variability)
+        logger.debug(f"Could not fetch playlist snapshot: {e}")
+        return None
+
+
+def _remote_playlist_state(client, playlist_id: str, snapshot_before: str | None) -> Tuple[List[str], int, str | None]:
+    """Remote track IDs and untracked count, with the snapshot ID the listing belongs to.
+
+    The item listing carries no snapshot ID, so the snapshot is read again after
+    it; if it moved (someone edited the playlist mid-listing) the pages may mix
+    versions and the listing is repeated. The snapshot is None if it never
+    settled or cannot be read, which rules out position-based edits.
+    """
+    for _ in range(SNAPSHOT_ATTEMPTS):
+        ids, untracked = _remote_playlist_items(client, playlist_id)
+        snapshot_after = _remote_snapshot_id(client, playlist_id)
+        if snapshot_after is not None and snapshot_after == snapshot_before:
+            return ids, untracked, snapshot_after
+        snapshot_before = snapshot_after
+    logger.info(f"Playlist {playlist_id} kept changing while it was read; using a full replace")
+    return ids, untracked, None
+
+
+def _plan_edits(
+    client, current: Sequence[str], desired: Sequence[str], untracked: int, snapshot_id: str | None
+) -> EditPlan | None:
+    """Minimal edit script if the client supports it and it beats a full replace, else None.
+
+    Items without a track ID occupy remote positions the plan cannot see, so
+    their presence forces a full replace; so does a listing without a settled
+    snapshot ID, since the planned positions would not be tied to a version.
+    """
+    if untracked or snapshot_id is None or not hasattr(client, "apply_playlist_edits"):
+        return None
+    return plan_playlist_edits(current, desired, max_calls=replace_call_count(len(desired)) - 1)
 
 
 def _fetch_playlist_meta(client, db: DatabaseInterface, playlist_id: str) -> Dict[str, Any]:
@@ -105,6 +148,7 @@ def _fetch_playlist_meta(client, db: DatabaseInterface, playlist_id: str) -> Dic
     try:
         detail = client.get_playlist(playlist_id)
         if detail:
+            meta["remote_snapshot_id"] = detail.get("snapshot_id")
             meta.setdefault("name", detail.get("name"))
             owner = detail.get("owner") or {}
             meta.setdefault("owner_id", owner.get("id"))
@@ -156,8 +200,9 @@ def push_playlist(
         desired = _desired_track_ids_from_db(db, playlist_id)
         unresolved = 0
 
-    current_remote = _remote_playlist_items(client, playlist_id)
+    current_remote, untracked, snapshot_id = _remote_playlist_state(client, playlist_id, meta.get("remote_snapshot_id"))
     positional_changes, added, removed, changed = _diff(current_remote, desired)
+    plan = _plan_edits(client, current_remote, desired, untracked, snapshot_id) if changed else None
 
     preview = PushPreview(
         playlist_id=playlist_id,
@@ -170,11 +215,13 @@ def push_playlist(
         unmatched_file_paths=unresolved,
         changed=changed,
         applied=False,
+        api_calls=(plan.api_calls if plan is not None else replace_call_count(len(desired))) if changed else 0,
+        incremental=plan is not None,
     )
 
     # Always log a summary (even if not verbose) for visibility
     logger.info(
-        f"preview playlist={playlist_id} name='{preview.playlist_name}' current={preview.current_count} new={preview.new_count} positional={positional_changes} added={added} removed={removed} unresolved_paths={unresolved} changed={changed}"
+        f"preview playlist={playlist_id} name='{preview.playlist_name}' current={preview.current_count} new={preview.new_count} positional={positional_changes} added={added} removed={removed} unresolved_paths={unresolved} changed={changed} api_calls={preview.api_calls} incremental={preview.incremental}"
     )
     if changed:
         # Optionally log first few differences for diagnostics
@@ -188,8 +235,12 @@ def push_playlist(
                 caps = getattr(client, "capabilities")
                 if not getattr(caps, "replace_playlist", False):
                     raise RuntimeError("Provider does not advertise replace_playlist capability")
-            _apply_remote_replace(client, playlist_id, desired)
-            logger.info(f"applied replace playlist={playlist_id} new_count={len(desired)}")
+            if plan is not None:
+                client.apply_playlist_edits(playlist_id, plan.ops, snapshot_id)
+                logger.info(f"applied {plan.api_calls} edit(s) playlist={playlist_id} new_count={len(desired)}")
+            else:
+                _apply_remote_replace(client, playlist_id, desired)
+                logger.info(f"applied replace playlist={playlist_id} new_count={len(desired)}")
             preview.applied = True
     return preview
 
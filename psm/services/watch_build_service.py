@@ -6,15 +6,22 @@ incremental rebuilds.
 """
 
 from __future__ import annotations
+import threading
 import time
 import logging
 import click
 from pathlib import Path
 from typing import Dict, Any, Callable, List
 
-from ..db import Database
-from ..ingest.library import scan_specific_files
-from ..services.match_service import match_changed_files, run_matching
+from ..db import ChangeSet, Database
+from ..ingest.library import (
+    apply_library_moves,
+    file_ids_under,
+    lookup_file_ids,
+    scan_library_incremental,
+    scan_specific_files,
+)
+from ..services.match_service import WarmMatchIndex, match_changed_files, match_changed_tracks, run_matching
 from ..services.export_service import export_playlists
 from ..reporting.generator import write_match_reports, write_index_page
 from ..services.watch_service import LibraryWatcher
@@ -43,258 +50,396 @@ class WatchBuildConfig:
         self.debounce_seconds = debounce_seconds
         self.db_check_interval = db_check_interval
         self.db_path = Path(config["database"]["path"])
+        # Tracks and library files kept in memory between events (loaded on first match)
+        self.match_index = WarmMatchIndex(config)
 
 
-def _handle_library_changes(changed_file_paths: list, watch_config: WatchBuildConfig) -> float:
+def _handle_library_changes(
+    changed_file_paths: list, watch_config: WatchBuildConfig, after_seq: int | None = None
+) -> ChangeSet | None:
     """Handle library file changes with incremental scan and match.
 
+    Args:
+        changed_file_paths: Paths reported by the watcher
+        watch_config: Watch build configuration
+        after_seq: Journal cursor the watch loop has handled (None = the cursor when the handler starts)
+
     Returns:
-        Updated database mtime after all operations complete
+        Changes committed by other processes while the handler ran, with the cursor after
+        all operations complete (None if the rebuild failed)
     """
     logger.info("")
     logger.info(f"▶ Library changed ({len(changed_file_paths)} files)")
 
     try:
         with watch_config.get_db(watch_config.config) as db:
+            if after_seq is None:
+                after_seq = db.get_change_cursor()
             # 1. Scan changed files
             progress.step(1, 4, "Scanning changed files")
             scan_result = scan_specific_files(db, watch_config.config, changed_file_paths)
 
-            # Track which file IDs were affected
-            file_ids_to_match = []
-
-            # Get file IDs for paths that were scanned (use normalized paths to match DB storage)
-            for path in changed_file_paths:
-                # Normalize path to match database storage format
-                if not isinstance(path, Path):
-                    path = Path(path)
-                normalized_path = normalize_library_path(path)
-
-                file_row = db.conn.execute("SELECT id FROM library_files WHERE path = ?", (normalized_path,)).fetchone()
-                if file_row:
-                    file_ids_to_match.append(file_row["id"])
+            # Get file IDs for paths that were scanned (one batched lookup on normalized paths)
+            present = lookup_file_ids(db, changed_file_paths)
+            file_ids_to_match = list(present.values())
+            deleted_paths = {normalize_library_path(p) for p in changed_file_paths} - present.keys()
+            watch_config.match_index.drop_paths(list(deleted_paths))
 
             progress.status(
                 f"✓ {scan_result.inserted} new, {scan_result.updated} updated, {scan_result.deleted} deleted"
             )
 
-            # 2. Incrementally match only changed files
-            matched_track_ids = []
-            if file_ids_to_match:
-                progress.step(2, 4, f"Matching {len(file_ids_to_match)} changed file(s)")
-                new_matches, matched_track_ids = match_changed_files(
-                    db, watch_config.config, file_ids=file_ids_to_match
-                )
-                progress.status(f"✓ {new_matches} new match(es)")
-            else:
-                progress.step(2, 4, "No files to match (all deleted)")
-
-            # 3. Determine affected playlists and export
-            affected_playlist_ids = []
-            has_liked_tracks = False
-            if matched_track_ids:
-                provider = watch_config.config.get("provider", "spotify")
-                affected_playlist_ids = db.get_playlists_containing_tracks(matched_track_ids, provider=provider)
-                logger.debug(
-                    f"Affected playlists: {len(affected_playlist_ids)} - {affected_playlist_ids[:5] if len(affected_playlist_ids) > 5 else affected_playlist_ids}"
-                )
-
-                # Check if any matched tracks are in Liked Songs
-                liked_track_ids = db.get_liked_track_ids(matched_track_ids, provider=provider)
-                has_liked_tracks = len(liked_track_ids) > 0
-                if has_liked_tracks:
-                    logger.debug(f"Matched tracks in Liked Songs: {len(liked_track_ids)}")
-
-            if not watch_config.skip_export:
-                if affected_playlist_ids or has_liked_tracks:
-                    if affected_playlist_ids:
-                        progress.step(
-                            3,
-                            4,
-                            f"Exporting {len(affected_playlist_ids)} affected playlist(s){' + Liked Songs' if has_liked_tracks else ''}",
-                        )
-                        _export_playlists(db, watch_config.config, playlist_ids=affected_playlist_ids)
-                    else:
-                        # Only Liked Songs affected (no playlists)
-                        progress.step(3, 4, "Exporting Liked Songs")
-                        _export_playlists(db, watch_config.config)  # Full export to include Liked Songs
-                elif matched_track_ids:
-                    progress.step(3, 4, "Export skipped (no affected playlists or liked tracks)")
-                    logger.info("No playlists or liked songs contain the matched tracks; skipping export")
-                else:
-                    progress.step(3, 4, "Export skipped (no matches)")
-            else:
-                progress.step(3, 4, "Export skipped (disabled)")
-
-            # 4. Regenerate reports (incrementally for affected playlists, or full if only Liked Songs)
-            if not watch_config.skip_report:
-                if affected_playlist_ids or has_liked_tracks:
-                    if affected_playlist_ids:
-                        progress.step(4, 4, "Updating reports (incremental)")
-                        _generate_reports(db, watch_config.config, affected_playlist_ids=affected_playlist_ids)
-                    else:
-                        # Only Liked Songs affected - need full report to update Liked Songs section
-                        progress.step(4, 4, "Updating reports (Liked Songs)")
-                        _generate_reports(db, watch_config.config)  # Full report generation
-                elif matched_track_ids:
-                    progress.step(4, 4, "Reports skipped (no affected playlists or liked tracks)")
-                    logger.info("No playlists or liked songs contain the matched tracks; skipping report update")
-                else:
-                    progress.step(4, 4, "Reports skipped (no matches)")
-            else:
-                progress.step(4, 4, "Reports skipped (disabled)")
+            # 2-4. Match changed files, then export and report affected playlists
+            _match_and_refresh(db, watch_config, file_ids_to_match)
 
             # Set write signal for GUI auto-refresh
             import time
 
             db.set_meta("last_write_epoch", str(time.time()))
             db.set_meta("last_write_source", "watch:library")
+            foreign = db.read_changes(after_seq, exclude_own=True)
 
         progress.complete("Incremental rebuild")
     except Exception as e:
         progress.error(f"Rebuild failed: {e}")
         logger.exception("Watch mode error details:")
+        foreign = None
 
     click.echo("")
     progress.status("Watching for changes...")
 
-    # Return updated DB mtime to prevent false-positive database change detection
-    return watch_config.db_path.stat().st_mtime if watch_config.db_path.exists() else 0.0
+    return foreign
 
 
-def _handle_database_changes(watch_config: WatchBuildConfig) -> float:
-    """Handle database changes (e.g., after external 'pull' command).
+def _handle_library_storm(
+    directories: list, watch_config: WatchBuildConfig, after_seq: int | None = None
+) -> ChangeSet | None:
+    """Handle an event storm with a directory-scoped incremental scan.
 
-    Performs incremental matching if we can determine which tracks changed,
-    otherwise falls back to full re-match.
+    Used instead of per-file processing when a batch is very large (restored
+    backup, new drive under a library root). Only files whose size/mtime changed
+    during the scan, or that are new, are re-matched.
 
     Returns:
-        Updated database mtime after all operations complete
+        Changes committed by other processes while the handler ran, with the cursor after
+        all operations complete (None if the rebuild failed)
     """
-    click.echo("")
-    progress.status("▶ Database changed (tracks/playlists updated)")
+    logger.info("")
+    logger.info(f"▶ Library changed (event storm, rescanning {len(directories)} directories)")
 
     try:
         with watch_config.get_db(watch_config.config) as db:
-            # Check if we have metadata about which tracks changed
-            changed_track_ids_str = db.get_meta("last_pull_changed_tracks")
+            if after_seq is None:
+                after_seq = db.get_change_cursor()
+            # 1. Scan the affected subtrees (concurrent per-directory pipeline)
+            progress.step(
+                1, 4, f"Scanning {len(directories)} changed director{'y' if len(directories) == 1 else 'ies'}"
+            )
+            before = _file_versions_under(db, directories)
+            scan_result = scan_library_incremental(db, watch_config.config, specific_paths=directories)
+            after = _file_versions_under(db, directories)
+            file_ids_to_match = [file_id for file_id, version in after.items() if before.get(file_id) != version]
+            watch_config.match_index.refresh_files(db, list(before.keys() - after.keys()))  # Drops deleted files
+            progress.status(
+                f"✓ {scan_result.inserted} new, {scan_result.updated} updated, {scan_result.deleted} deleted"
+            )
 
-            if changed_track_ids_str:
-                # Parse comma-separated track IDs
-                changed_track_ids = [tid.strip() for tid in changed_track_ids_str.split(",") if tid.strip()]
+            # 2-4. Match changed files, then export and report affected playlists
+            _match_and_refresh(db, watch_config, file_ids_to_match)
 
-                if changed_track_ids:
-                    from .match_service import match_changed_tracks
+            db.set_meta("last_write_epoch", str(time.time()))
+            db.set_meta("last_write_source", "watch:library")
+            foreign = db.read_changes(after_seq, exclude_own=True)
 
-                    progress.step(1, 3, f"Incrementally matching {len(changed_track_ids)} changed track(s)")
-                    new_matches = match_changed_tracks(db, watch_config.config, track_ids=changed_track_ids)
-                    progress.status(f"✓ {new_matches} new match(es)")
+        progress.complete("Incremental rebuild")
+    except Exception as e:
+        progress.error(f"Rebuild failed: {e}")
+        logger.exception("Watch mode error details:")
+        foreign = None
 
-                    # Clear the metadata after processing
-                    db.set_meta("last_pull_changed_tracks", None)
-                    db.commit()
+    click.echo("")
+    progress.status("Watching for changes...")
+    return foreign
+
+
+def _file_versions_under(db: Database, directories: List[Path]) -> Dict[int, tuple]:
+    """Map file ID -> (size, mtime) for all library files below the directories."""
+    ids = file_ids_under(db, directories)
+    versions: Dict[int, tuple] = {}
+    for i in range(0, len(ids), 500):
+        chunk = ids[i : i + 500]
+        placeholders = ",".join("?" * len(chunk))
+        for row in db.conn.execute(f"SELECT id, size, mtime FROM library_files WHERE id IN ({placeholders})", chunk):
+            versions[row["id"]] = (row["size"], row["mtime"])
+    return versions
+
+
+def _match_and_refresh(db: Database, watch_config: WatchBuildConfig, file_ids_to_match: List[int]) -> None:
+    """Steps 2-4 of a library rebuild: match changed files, then export and report."""
+    # 2. Incrementally match only changed files
+    matched_track_ids = []
+    if file_ids_to_match:
+        progress.step(2, 4, f"Matching {len(file_ids_to_match)} changed file(s)")
+        new_matches, matched_track_ids = match_changed_files(
+            db, watch_config.config, file_ids=file_ids_to_match, index=watch_config.match_index
+        )
+        progress.status(f"✓ {new_matches} new match(es)")
+    else:
+        progress.step(2, 4, "No files to match (all deleted)")
+
+    # 3-4. Export and report playlists containing the matched tracks
+    _export_and_report_for_tracks(db, watch_config, matched_track_ids, first_step=3, total_steps=4)
+
+
+def _export_and_report_for_tracks(
+    db: Database,
+    watch_config: WatchBuildConfig,
+    matched_track_ids: List[str],
+    first_step: int,
+    total_steps: int,
+    extra_playlist_ids: List[str] | None = None,
+    liked_changed: bool = False,
+) -> None:
+    """Re-export and re-report the playlists (and Liked Songs) containing the given tracks.
+
+    extra_playlist_ids are exported too (e.g. playlists whose track list changed),
+    and liked_changed forces a Liked Songs export. Uses progress steps first_step
+    (export) and first_step + 1 (reports).
+    """
+    # Determine affected playlists and export
+    affected_playlist_ids = []
+    has_liked_tracks = liked_changed
+    if matched_track_ids:
+        provider = watch_config.config.get("provider", "spotify")
+        affected_playlist_ids = db.get_playlists_containing_tracks(matched_track_ids, provider=provider)
+        logger.debug(
+            f"Affected playlists: {len(affected_playlist_ids)} - {affected_playlist_ids[:5] if len(affected_playlist_ids) > 5 else affected_playlist_ids}"
+        )
 
-                    # Store matched track IDs for incremental report generation
-                    matched_track_ids = changed_track_ids if new_matches > 0 else []
-                else:
-                    progress.step(1, 3, "No track changes detected, skipping match")
-                    matched_track_ids = []
+        # Check if any matched tracks are in Liked Songs
+        liked_track_ids = db.get_liked_track_ids(matched_track_ids, provider=provider)
+        has_liked_tracks = has_liked_tracks or len(liked_track_ids) > 0
+        if liked_track_ids:
+            logger.debug(f"Matched tracks in Liked Songs: {len(liked_track_ids)}")
+
+    if extra_playlist_ids:
+        # Drop IDs of deleted playlists; they have nothing left to export
+        placeholders = ",".join("?" * len(extra_playlist_ids))
+        known = {
+            row["id"]
+            for row in db.conn.execute(f"SELECT id FROM playlists WHERE id IN ({placeholders})", extra_playlist_ids)
+        }
+        seen = set(affected_playlist_ids)
+        affected_playlist_ids += [pid for pid in extra_playlist_ids if pid in known and pid not in seen]
+
+    if not watch_config.skip_export:
+        if affected_playlist_ids or has_liked_tracks:
+            if affected_playlist_ids:
+                progress.step(
+                    first_step,
+                    total_steps,
+                    f"Exporting {len(affected_playlist_ids)} affected playlist(s){' + Liked Songs' if has_liked_tracks else ''}",
+                )
+            else:
+                # Only Liked Songs affected (no playlists)
+                progress.step(first_step, total_steps, "Exporting Liked Songs")
+            _export_playlists(db, watch_config.config, playlist_ids=affected_playlist_ids, liked_songs=has_liked_tracks)
+        elif matched_track_ids:
+            progress.step(first_step, total_steps, "Export skipped (no affected playlists or liked tracks)")
+            logger.info("No playlists or liked songs contain the matched tracks; skipping export")
+        else:
+            progress.step(first_step, total_steps, "Export skipped (no matches)")
+    else:
+        progress.step(first_step, total_steps, "Export skipped (disabled)")
+
+    # Regenerate reports (incrementally for affected playlists, or full if only Liked Songs)
+    if not watch_config.skip_report:
+        if affected_playlist_ids or has_liked_tracks:
+            if affected_playlist_ids:
+                progress.step(first_step + 1, total_steps, "Updating reports (incremental)")
+                _generate_reports(db, watch_config.config, affected_playlist_ids=affected_playlist_ids)
             else:
-                # Fallback: Full re-match since we don't know what changed
-                progress.step(1, 3, "Re-matching all tracks (no change tracking available)")
+                # Only Liked Songs affected: no playlist detail pages, but the overview
+                # reports (liked column, counts) and index must be refreshed
+                progress.step(first_step + 1, total_steps, "Updating reports (Liked Songs)")
+                _generate_reports(db, watch_config.config, affected_playlist_ids=[], liked_changed=True)
+        elif matched_track_ids:
+            progress.step(first_step + 1, total_steps, "Reports skipped (no affected playlists or liked tracks)")
+            logger.info("No playlists or liked songs contain the matched tracks; skipping report update")
+        else:
+            progress.step(first_step + 1, total_steps, "Reports skipped (no matches)")
+    else:
+        progress.step(first_step + 1, total_steps, "Reports skipped (disabled)")
+
+
+def _handle_library_moves(
+    moves: list, watch_config: WatchBuildConfig, after_seq: int | None = None
+) -> ChangeSet | None:
+    """Handle renamed/moved library files by updating their stored paths.
+
+    Moved files keep their tags and matches, so there is no scan or match step;
+    only playlists containing the moved files' tracks are re-exported. Moves
+    whose source was never indexed are handled like new files.
+
+    Returns:
+        Changes committed by other processes while the handler ran, with the cursor after
+        all operations complete (None if the update failed)
+    """
+    logger.info("")
+    logger.info(f"▶ Library files moved ({len(moves)} move(s))")
+
+    unresolved: List[Path] = []
+    try:
+        with watch_config.get_db(watch_config.config) as db:
+            if after_seq is None:
+                after_seq = db.get_change_cursor()
+            progress.step(1, 3, "Updating moved paths")
+            result = apply_library_moves(db, [(m.src, m.dest, m.is_directory) for m in moves])
+            unresolved = result.unresolved
+            watch_config.match_index.refresh_files(db, result.moved_file_ids)
+            progress.status(f"✓ {result.moved} moved, {result.replaced} replaced")
+
+            moved_track_ids: List[str] = []
+            if result.moved_file_ids:
+                placeholders = ",".join("?" * len(result.moved_file_ids))
+                rows = db.conn.execute(
+                    f"SELECT DISTINCT track_id FROM matches WHERE file_id IN ({placeholders})",
+                    result.moved_file_ids,
+                ).fetchall()
+                moved_track_ids = [row["track_id"] for row in rows]
+
+            _export_and_report_for_tracks(db, watch_config, moved_track_ids, first_step=2, total_steps=3)
+
+            db.set_meta("last_write_epoch", str(time.time()))
+            db.set_meta("last_write_source", "watch:library")
+            foreign = db.read_changes(after_seq, exclude_own=True)
+
+        progress.complete("Move update")
+    except Exception as e:
+        progress.error(f"Move update failed: {e}")
+        logger.exception("Watch mode error details:")
+        return None
+
+    if unresolved:
+        later = _handle_library_changes(unresolved, watch_config, after_seq=foreign.cursor)
+        if later is None:
+            return None
+        foreign.update(later)
+        return foreign
+
+    click.echo("")
+    progress.status("Watching for changes...")
+    return foreign
+
+
+def _handle_database_changes(watch_config: WatchBuildConfig, changes: ChangeSet) -> ChangeSet | None:
+    """Handle database changes (e.g., after external 'pull' command).
+
+    Re-matches only the tracks and library files recorded in the change journal,
+    then re-exports playlists whose tracks, matches or contents changed. Falls
+    back to a full re-match when the journal was pruned past our cursor.
+
+    Returns:
+        Changes committed by other processes after changes.cursor while the handler ran,
+        with the cursor after all operations complete (None if the sync failed)
+    """
+    click.echo("")
+    progress.status("▶ Database changed (tracks/playlists updated)")
+
+    try:
+        with watch_config.get_db(watch_config.config) as db:
+            if changes.truncated:
+                # Journal no longer covers our cursor: we don't know what changed
+                progress.step(1, 3, "Re-matching all tracks (change journal truncated)")
+                watch_config.match_index.invalidate()
                 result = run_matching(
                     db, config=watch_config.config, verbose=False, top_unmatched_tracks=0, top_unmatched_albums=0
                 )
                 progress.status(f"✓ Matched {result.matched} tracks")
-                matched_track_ids = []  # Full rebuild, so regenerate all reports
-
-            # Determine affected playlists
-            affected_playlist_ids = []
-            has_liked_tracks = False
-            if matched_track_ids:
-                provider = watch_config.config.get("provider", "spotify")
-                affected_playlist_ids = db.get_playlists_containing_tracks(matched_track_ids, provider=provider)
-                logger.debug(
-                    f"Affected playlists: {len(affected_playlist_ids)} - {affected_playlist_ids[:5] if len(affected_playlist_ids) > 5 else affected_playlist_ids}"
-                )
 
-                # Check if any matched tracks are in Liked Songs
-                liked_track_ids = db.get_liked_track_ids(matched_track_ids, provider=provider)
-                has_liked_tracks = len(liked_track_ids) > 0
-                if has_liked_tracks:
-                    logger.debug(f"Matched tracks in Liked Songs: {len(liked_track_ids)}")
-
-            # Export
-            if not watch_config.skip_export:
-                if affected_playlist_ids or has_liked_tracks:
-                    if affected_playlist_ids:
-                        progress.step(
-                            2,
-                            3,
-                            f"Exporting {len(affected_playlist_ids)} affected playlist(s){' + Liked Songs' if has_liked_tracks else ''}",
-                        )
-                        _export_playlists(db, watch_config.config, playlist_ids=affected_playlist_ids)
-                    else:
-                        # Only Liked Songs affected (no playlists)
-                        progress.step(2, 3, "Exporting Liked Songs")
-                        _export_playlists(db, watch_config.config)  # Full export to include Liked Songs
-                elif matched_track_ids:
-                    # Full rebuild case
+                if not watch_config.skip_export:
                     progress.step(2, 3, "Exporting all playlists")
                     _export_playlists(db, watch_config.config)
                 else:
-                    progress.step(2, 3, "Export skipped (no changes)")
-            else:
-                progress.step(2, 3, "Export skipped (disabled)")
-
-            # Reports (incremental if we know which tracks changed)
-            if not watch_config.skip_report:
-                if affected_playlist_ids or has_liked_tracks:
-                    if affected_playlist_ids:
-                        progress.step(3, 3, "Updating reports (incremental)")
-                        _generate_reports(db, watch_config.config, affected_playlist_ids=affected_playlist_ids)
-                    else:
-                        # Only Liked Songs affected - need full report to update Liked Songs section
-                        progress.step(3, 3, "Updating reports (Liked Songs)")
-                        _generate_reports(db, watch_config.config)  # Full report generation
-                elif matched_track_ids:
-                    # Full rebuild case
+                    progress.step(2, 3, "Export skipped (disabled)")
+                if not watch_config.skip_report:
                     progress.step(3, 3, "Regenerating all reports")
                     _generate_reports(db, watch_config.config)
                 else:
-                    progress.step(3, 3, "Reports skipped (no changes)")
+                    progress.step(3, 3, "Reports skipped (disabled)")
             else:
-                progress.step(3, 3, "Reports skipped (disabled)")
+                affected_track_ids = set(changes.matches) | set(changes.tracks)
+                file_ids = sorted(changes.files)
+                if file_ids:
+                    # Files changed by another process (e.g. 'scan'); deleted ones are skipped by the query
+                    placeholders = ",".join("?" * len(file_ids))
+                    existing = [
+                        row["id"]
+                        for row in db.conn.execute(
+                            f"SELECT id FROM library_files WHERE id IN ({placeholders})", file_ids
+                        )
+                    ]
+                    watch_config.match_index.refresh_files(db, file_ids)
+                else:
+                    existing = []
+
+                if changes.tracks or existing:
+                    progress.step(
+                        1, 3, f"Incrementally matching {len(changes.tracks)} track(s), {len(existing)} file(s)"
+                    )
+                    new_matches = 0
+                    if changes.tracks:
+                        new_matches += match_changed_tracks(
+                            db, watch_config.config, track_ids=sorted(changes.tracks), index=watch_config.match_index
+                        )
+                    if existing:
+                        file_matches, matched_track_ids = match_changed_files(
+                            db, watch_config.config, file_ids=existing, index=watch_config.match_index
+                        )
+                        new_matches += file_matches
+                        affected_track_ids.update(matched_track_ids)
+                    progress.status(f"✓ {new_matches} new match(es)")
+                else:
+                    progress.step(1, 3, "No track or file changes, skipping match")
+
+                _export_and_report_for_tracks(
+                    db,
+                    watch_config,
+                    sorted(affected_track_ids),
+                    first_step=2,
+                    total_steps=3,
+                    extra_playlist_ids=sorted(changes.playlists),
+                    liked_changed=bool(changes.liked),
+                )
 
             # Set write signal for GUI auto-refresh
-            import time
-
             db.set_meta("last_write_epoch", str(time.time()))
             db.set_meta("last_write_source", "watch:database")
+            foreign = db.read_changes(changes.cursor, exclude_own=True)
 
         progress.complete("Database sync")
     except Exception as e:
         progress.error(f"Database sync failed: {e}")
         logger.exception("Database sync error details:")
-        # Return current mtime even on error to prevent infinite re-trigger loops
-        return watch_config.db_path.stat().st_mtime if watch_config.db_path.exists() else 0.0
+        return None
 
     click.echo("")
     progress.status("Watching for changes...")
-
-    # Return updated DB mtime to prevent false-positive database change detection
-    return watch_config.db_path.stat().st_mtime if watch_config.db_path.exists() else 0.0
+    return foreign
 
 
-def _export_playlists(db: Database, config: Dict[str, Any], playlist_ids: List[str] | None = None) -> None:
+def _export_playlists(
+    db: Database, config: Dict[str, Any], playlist_ids: List[str] | None = None, liked_songs: bool = False
+) -> None:
     """Export playlists helper.
 
     Args:
         db: Database instance
         config: Full configuration dict
         playlist_ids: Optional list of specific playlist IDs to export (None = export all)
+        liked_songs: Also export Liked Songs in a scoped export (playlist_ids given)
     """
-    if playlist_ids is not None and len(playlist_ids) == 0:
+    if playlist_ids is not None and len(playlist_ids) == 0 and not liked_songs:
         # Empty list means no playlists to export
         logger.info("Export skipped: no playlists affected")
         click.echo(click.style("  ✓ Export skipped (no affected playlists)", fg="yellow"))
@@ -308,15 +453,24 @@ def _export_playlists(db: Database, config: Dict[str, Any], playlist_ids: List[s
         organize_by_owner=organize_by_owner,
         current_user_id=current_user_id,
         playlist_ids=playlist_ids,
+        liked_songs=liked_songs if playlist_ids is not None else None,
     )
 
-    if playlist_ids:
-        click.echo(click.style(f"  ✓ Exported {result.playlist_count} affected playlist(s)", fg="green"))
+    counts = f"{len(result.write_stats.written)} written, {len(result.write_stats.unchanged)} unchanged"
+    if playlist_ids is not None and not playlist_ids:
+        click.echo(click.style(f"  ✓ Exported Liked Songs ({counts})", fg="green"))
+    elif playlist_ids:
+        click.echo(click.style(f"  ✓ Exported {result.playlist_count} affected playlist(s) ({counts})", fg="green"))
     else:
-        click.echo(click.style(f"  ✓ Exported {result.playlist_count} playlists", fg="green"))
+        click.echo(click.style(f"  ✓ Exported {result.playlist_count} playlists ({counts})", fg="green"))
 
 
-def _generate_reports(db: Database, config: Dict[str, Any], affected_playlist_ids: List[str] | None = None) -> None:
+def _generate_reports(
+    db: Database,
+    config: Dict[str, Any],
+    affected_playlist_ids: List[str] | None = None,
+    liked_changed: bool = False,
+) -> None:
     """Generate reports helper.
 
     Args:
@@ -325,8 +479,10 @@ def _generate_reports(db: Database, config: Dict[str, Any], affected_playlist_id
         affected_playlist_ids: Optional list of playlist IDs that changed.
             If provided, only regenerates detail pages for these playlists.
             If None, regenerates all reports.
+        liked_changed: Liked Songs changed; refresh the overview pages even when
+            affected_playlist_ids is empty
     """
-    if affected_playlist_ids is not None and len(affected_playlist_ids) == 0:
+    if affected_playlist_ids is not None and len(affected_playlist_ids) == 0 and not liked_changed:
         # Empty list means no playlists to update
         logger.info("Report update skipped: no playlists affected")
         click.echo(click.style("  ✓ Reports skipped (no affected playlists)", fg="yellow"))
@@ -340,6 +496,8 @@ def _generate_reports(db: Database, config: Dict[str, Any], affected_playlist_id
         click.echo(
             click.style(f"  ✓ Reports updated ({len(affected_playlist_ids)} playlist details) in {out_dir}", fg="green")
         )
+    elif affected_playlist_ids is not None:
+        click.echo(click.style(f"  ✓ Reports updated (overview pages) in {out_dir}", fg="green"))
     else:
         click.echo(click.style(f"  ✓ Reports updated in {out_dir}", fg="green"))
 
@@ -353,55 +511,81 @@ def run_watch_build(watch_config: WatchBuildConfig) -> None:
     logger.info("")
     logger.info("Monitoring library files AND database for changes.")
     logger.info("• Library changes → incremental scan + match")
-    logger.info("• Database changes (e.g. after 'pull') → incremental track match")
+    logger.info("• Library renames/moves → path update (no re-scan or re-match)")
+    logger.info("• Event storms (thousands of files) → directory-scoped incremental scan")
+    logger.info("• Database changes (e.g. after 'pull') → incremental match of journaled tracks/files")
     logger.info(f"Debounce time: {watch_config.debounce_seconds}s")
     logger.info("Press Ctrl+C to stop.")
     logger.info("")
     logger.info("Watching for changes...")
 
-    # Track database modification time
-    last_db_mtime = watch_config.db_path.stat().st_mtime if watch_config.db_path.exists() else 0
+    # Position in the change journal; everything up to here has been handled except `pending`
+    with watch_config.get_db(watch_config.config) as db:
+        cursor = db.get_change_cursor()
+    # Changes other processes committed while a handler ran (below the cursor, not yet handled)
+    pending = ChangeSet(cursor=cursor)
+    # Serializes handlers (watcher thread) with journal polling (this thread)
+    handler_lock = threading.Lock()
+
+    def settle(foreign: ChangeSet | None) -> None:
+        """Move the cursor past a handler's own writes, keeping concurrent foreign changes pending.
+
+        A failed handler leaves the cursor alone, so whatever it did commit is picked up
+        by the journal poller like any other write.
+        """
+        nonlocal cursor
+        if foreign is not None:
+            pending.update(foreign)
+            cursor = max(cursor, foreign.cursor)
 
     watcher = None
     try:
-        # Create library file change handler
+        # Library handlers run on the watcher thread; the lock keeps journal polling from
+        # picking up their writes mid-operation.
         def library_change_handler(changed_file_paths: list):
-            nonlocal last_db_mtime  # Allow updating parent scope variable
-            # Update mtime BEFORE operations to prevent race condition with DB monitoring loop
-            # The monitoring loop runs every 2s and might detect changes mid-operation
-            last_db_mtime = time.time() + 3600  # Temporarily set to future to prevent false triggers
-            updated_mtime = _handle_library_changes(changed_file_paths, watch_config)
-            last_db_mtime = updated_mtime  # Update to actual final mtime
+            with handler_lock:
+                settle(_handle_library_changes(changed_file_paths, watch_config, after_seq=cursor))
+
+        def library_move_handler(moves: list):
+            with handler_lock:
+                settle(_handle_library_moves(moves, watch_config, after_seq=cursor))
+
+        def library_storm_handler(directories: list):
+            with handler_lock:
+                settle(_handle_library_storm(directories, watch_config, after_seq=cursor))
 
         # Create and start library file watcher
         watcher = LibraryWatcher(
             config=watch_config.config,
             on_change_callback=library_change_handler,
             debounce_seconds=watch_config.debounce_seconds,
+            on_move_callback=library_move_handler,
+            on_storm_callback=library_storm_handler,
         )
 
         watcher.start()
 
-        # Monitor loop: check for both library changes and database changes
+        # Monitor loop: poll the change journal for writes by other processes
         last_check = time.time()
 
         while True:
             time.sleep(1)
 
-            # Periodically check if database was modified (e.g., by 'pull' command)
             current_time = time.time()
             if current_time - last_check >= watch_config.db_check_interval:
                 last_check = current_time
 
-                if watch_config.db_path.exists():
-                    current_db_mtime = watch_config.db_path.stat().st_mtime
-
-                    if current_db_mtime > last_db_mtime:
-                        # Database changed! Someone ran 'pull' or modified tracks
-                        # Update mtime BEFORE operations to prevent race condition
-                        last_db_mtime = time.time() + 3600  # Temporarily set to future
-                        updated_mtime = _handle_database_changes(watch_config)
-                        last_db_mtime = updated_mtime  # Update to actual final mtime
+                with handler_lock:
+                    with watch_config.get_db(watch_config.config) as db:
+                        changes = db.read_changes(cursor)
+                    changes.update(pending)
+                    if changes.empty:
+                        continue
+                    pending = ChangeSet(cursor=changes.cursor)
+                    cursor = changes.cursor
+                    # Someone ran 'pull' (or another writer changed tracks/playlists)
+                    # On failure, skip the batch rather than re-triggering on it forever
+                    settle(_handle_database_changes(watch_config, changes))
 
     except KeyboardInterrupt:
         logger.info("")
@@ -7,15 +7,24 @@ are modified simultaneously.
 
 from __future__ import annotations
 import logging
+import time
 from pathlib import Path
-from threading import Timer, Lock
-from typing import Callable, List, Set, Dict, Any
+from threading import Condition, Thread
+from typing import Callable, List, Dict, Any, NamedTuple, Sequence
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
 logger = logging.getLogger(__name__)
 
 
+class PathMove(NamedTuple):
+    """A file or directory rename/move reported by the filesystem."""
+
+    src: Path
+    dest: Path
+    is_directory: bool
+
+
 class DebouncedLibraryWatcher(FileSystemEventHandler):
     """Filesystem event handler with debouncing for library changes.
 
@@ -23,11 +32,37 @@ class DebouncedLibraryWatcher(FileSystemEventHandler):
     only after a quiet period (debounce_seconds) has elapsed.
 
     This prevents event storms when many files are modified simultaneously
-    (e.g., copying an entire album folder).
+    (e.g., copying an entire album folder). A single long-lived worker thread
+    coalesces events (repeat events for a path collapse into one entry) and
+    also flushes once the oldest pending event is max_batch_seconds old, so a
+    sustained copy is processed in chunks instead of waiting for it to finish.
+    The pending queue is bounded by max_pending; events beyond it are dropped
+    and counted (run a scan to reconcile).
+
+    When on_move_callback is given, renames/moves (including directory moves)
+    are kept as src/dest pairs and delivered before the changed paths of the
+    same batch, so they can be applied as path updates instead of delete+add.
+
+    When on_storm_callback is given, event storms (a restored backup, a drive
+    mounted under a library root) are handled per directory: a batch with more
+    than storm_threshold paths is collapsed to its common directories and passed
+    to on_storm_callback instead of on_change_callback. Queue overflow then
+    records the parent directory of each excess event instead of dropping it,
+    and a directory move that cannot be applied as a move (no move callback, or
+    a destination matching an ignore pattern) rescans its source, so the files
+    that left the library are deleted.
     """
 
     def __init__(
-        self, config: Dict[str, Any], on_change_callback: Callable[[List[Path]], None], debounce_seconds: float = 2.0
+        self,
+        config: Dict[str, Any],
+        on_change_callback: Callable[[List[Path]], None],
+        debounce_seconds: float = 2.0,
+        max_batch_seconds: float | None = None,
+        max_pending: int | None = None,
+        on_move_callback: Callable[[List[PathMove]], None] | None = None,
+        on_storm_callback: Callable[[List[Path]], None] | None = None,
+        storm_threshold: int | None = None,
     ):
         """Initialize the debounced watcher.
 
@@ -35,20 +70,63 @@ class DebouncedLibraryWatcher(FileSystemEventHandler):
             config: Configuration dict containing library settings
             on_change_callback: Function to call with list of changed file paths
             debounce_seconds: Seconds to wait after last event before processing
+            max_batch_seconds: Maximum age of the oldest pending event before a batch is
+                processed even without a quiet period (default library.watch_max_batch_seconds)
+            max_pending: Maximum distinct pending paths (default library.watch_max_pending)
+            on_move_callback: Optional function called with moves (in event order) before
+                the batch's changed paths; without it a move is treated as delete + create
+            on_storm_callback: Optional function called with directories to rescan when a
+                batch exceeds storm_threshold paths or the queue overflowed
+            storm_threshold: Batch size that triggers the directory fallback
+                (default library.watch_storm_threshold)
         """
         self.config = config
         self.on_change = on_change_callback
+        self.on_move = on_move_callback
+        self.on_storm = on_storm_callback
         self.debounce_seconds = debounce_seconds
-        self.timer: Timer | None = None
-        self.pending_paths: Set[Path] = set()
-        self.lock = Lock()
 
         # Get configuration
         lib_cfg = config.get("library", {})
         self.extensions = tuple(lib_cfg.get("extensions", [".mp3", ".flac", ".m4a"]))
         self.ignore_patterns = lib_cfg.get("ignore_patterns", [])
-
-        logger.debug(f"Initialized watcher with debounce={debounce_seconds}s, extensions={self.extensions}")
+        if max_batch_seconds is None:
+            max_batch_seconds = float(lib_cfg.get("watch_max_batch_seconds", 30.0))
+        if max_pending is None:
+            max_pending = int(lib_cfg.get("watch_max_pending", 10000))
+        if storm_threshold is None:
+            storm_threshold = int(lib_cfg.get("watch_storm_threshold", 2000))
+        self.max_batch_seconds = max(max_batch_seconds, debounce_seconds)
+        self.max_pending = max_pending
+        self.storm_threshold = storm_threshold
+        self.library_roots = [Path(p) for p in lib_cfg.get("paths", [])]
+
+        # Pending paths in arrival order (dict used as an ordered set)
+        self.pending_paths: Dict[Path, None] = {}
+        self.pending_moves: List[PathMove] = []
+        # Directories to rescan as a whole: parents of events that did not fit in the queue
+        # and sources of directory moves that cannot be applied as moves (storm mode only)
+        self.overflow_dirs: Dict[Path, None] = {}
+        self.lock = Condition()
+        self._first_event_at = 0.0
+        self._last_event_at = 0.0
+        self._worker: Thread | None = None
+        self._stopping = False
+        self._flush_requested = False
+
+        # Counters
+        self.events_received = 0
+        self.events_coalesced = 0
+        self.events_dropped = 0
+        self.events_overflowed = 0
+        self.batches_processed = 0
+        self.storm_batches = 0
+        self.max_queue_depth = 0
+
+        logger.debug(
+            f"Initialized watcher with debounce={debounce_seconds}s, max_batch={self.max_batch_seconds}s, "
+            f"max_pending={max_pending}, extensions={self.extensions}"
+        )
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle any filesystem event.
@@ -56,38 +134,202 @@ class DebouncedLibraryWatcher(FileSystemEventHandler):
         Filters events and adds relevant files to the pending queue.
         Resets the debounce timer on each event.
         """
+        if event.event_type == "moved":
+            self._on_moved(event)
+            return
+
         # Ignore directory events
         if event.is_directory:
             return
 
         path = Path(event.src_path)
+        if not self._is_relevant(path, event.event_type):
+            return
+
+        # Log event only in DEBUG mode to avoid spam
+        logger.debug(f"[watch] {event.event_type}: {path}")
+
+        self._enqueue(path)
 
+    def _on_moved(self, event: FileSystemEvent) -> None:
+        """Handle a rename/move: keep src/dest pairs, or fall back to delete + create."""
+        src, dest = Path(event.src_path), Path(event.dest_path)
+        if event.is_directory:
+            dest_ignored = self._matches_ignore_pattern(dest)
+            if self.on_move is not None and not dest_ignored:
+                logger.debug(f"[watch] moved directory: {src} -> {dest}")
+                self._enqueue_move(PathMove(src, dest, True))
+                return
+            # Not applicable as a move: the source subtree is gone (rescanning it deletes
+            # its files), and a destination that is not ignored has to be scanned
+            logger.debug(f"[watch] moved directory: {src} -> {dest} (rescanning)")
+            self._enqueue_directory(src)
+            if not dest_ignored:
+                self._enqueue_directory(dest)
+            return
+
+        src_ok = self._is_relevant(src, "moved")
+        dest_ok = self._is_relevant(dest, "moved")
+        if src_ok and dest_ok and self.on_move is not None:
+            logger.debug(f"[watch] moved: {src} -> {dest}")
+            self._enqueue_move(PathMove(src, dest, False))
+            return
+        # e.g. a download renamed from .part, or a file renamed to a non-music name
+        if src_ok:
+            self._enqueue(src)
+        if dest_ok:
+            self._enqueue(dest)
+
+    def _is_relevant(self, path: Path, event_type: str) -> bool:
+        """Check extension, temp-file and ignore-pattern filters for a file path."""
         # Filter by extension
         if not path.suffix.lower() in self.extensions:
-            logger.debug(f"[watch] Ignoring {event.event_type}: {path} (wrong extension)")
-            return
+            logger.debug(f"[watch] Ignoring {event_type}: {path} (wrong extension)")
+            return False
 
         # Filter temporary files
         if self._is_temp_file(path):
-            logger.debug(f"[watch] Ignoring {event.event_type}: {path} (temp file)")
-            return
+            logger.debug(f"[watch] Ignoring {event_type}: {path} (temp file)")
+            return False
 
         # Filter by ignore patterns
         if self._matches_ignore_pattern(path):
-            logger.debug(f"[watch] Ignoring {event.event_type}: {path} (matches ignore pattern)")
-            return
+            logger.debug(f"[watch] Ignoring {event_type}: {path} (matches ignore pattern)")
+            return False
+        return True
 
-        # Log event only in DEBUG mode to avoid spam
-        logger.debug(f"[watch] {event.event_type}: {path}")
+    def _enqueue_move(self, move: PathMove) -> None:
+        """Queue a move, re-targeting pending changes under its source."""
+        now = time.monotonic()
+        with self.lock:
+            self.events_received += 1
+            if not move.is_directory and self._covered_by_directory_move(move):
+                # Per-file event emitted for a child of an already queued directory move
+                self.events_coalesced += 1
+                return
+            if len(self.pending_paths) + len(self.pending_moves) >= self.max_pending:
+                if self.on_storm is not None:
+                    # Rescan both sides: the source rows are deleted, the destination is indexed
+                    self.events_overflowed += 1
+                    if move.is_directory:
+                        self.overflow_dirs.update({move.src: None, move.dest: None})
+                    else:
+                        self.overflow_dirs.update({move.src.parent: None, move.dest.parent: None})
+                else:
+                    self.events_dropped += 1
+                self._flush_requested = True
+                self.lock.notify()
+                return
+            if not self.pending_paths and not self.pending_moves:
+                self._first_event_at = now
+            # Pending changes for the old location now refer to the new one
+            retargeted: Dict[Path, None] = {}
+            for path in self.pending_paths:
+                retargeted[_retarget(path, move) or path] = None
+            self.pending_paths = retargeted
+            self.pending_moves.append(move)
+            self.max_queue_depth = max(self.max_queue_depth, len(self.pending_paths) + len(self.pending_moves))
+            self._last_event_at = now
+            self._ensure_worker()
+            self.lock.notify()
+
+    def _covered_by_directory_move(self, move: PathMove) -> bool:
+        for queued in reversed(self.pending_moves):
+            if queued.is_directory and _retarget(move.src, queued) == move.dest:
+                return True
+        return False
+
+    def _enqueue_directory(self, path: Path) -> None:
+        """Queue a directory for a rescan as a whole (needs the storm callback)."""
+        now = time.monotonic()
+        with self.lock:
+            self.events_received += 1
+            if self.on_storm is None:
+                self.events_dropped += 1
+                return
+            if not self._has_pending():
+                self._first_event_at = now
+            self.overflow_dirs[path] = None
+            self._last_event_at = now
+            self._ensure_worker()
+            self.lock.notify()
+
+    def _enqueue(self, path: Path) -> None:
+        """Add a path to the pending batch and wake the worker."""
+        now = time.monotonic()
+        with self.lock:
+            self.events_received += 1
+            if path in self.pending_paths:
+                self.events_coalesced += 1
+            elif len(self.pending_paths) + len(self.pending_moves) >= self.max_pending:
+                if self.on_storm is not None:
+                    # Remember the directory; it is rescanned with the rest of the storm
+                    self.events_overflowed += 1
+                    self.overflow_dirs[path.parent] = None
+                else:
+                    self.events_dropped += 1
+                # Queue is full: process what we have now instead of waiting for quiet
+                self._flush_requested = True
+                self.lock.notify()
+                return
+            else:
+                if not self.pending_paths and not self.pending_moves:
+                    self._first_event_at = now
+                self.pending_paths[path] = None
+                self.max_queue_depth = max(self.max_queue_depth, len(self.pending_paths) + len(self.pending_moves))
+            self._last_event_at = now
+            self._ensure_worker()
+            self.lock.notify()
+
+    def _ensure_worker(self) -> None:
+        """Start the coalescing worker on first use (caller holds the lock)."""
+        if self._worker is None or not self._worker.is_alive():
+            self._stopping = False
+            self._worker = Thread(target=self._run, name="psm-watch-debounce", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: wait for a quiet period or the batch latency limit, then process."""
+        while True:
+            with self.lock:
+                while not self._has_pending() and not self._stopping:
+                    self.lock.wait()
+                while self._has_pending() and not (self._stopping or self._flush_requested):
+                    deadline = min(
+                        self._last_event_at + self.debounce_seconds,
+                        self._first_event_at + self.max_batch_seconds,
+                    )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.lock.wait(remaining)
+                self._flush_requested = False
+                if not self._has_pending() and self._stopping:
+                    return
+            self._process_changes()
 
+    def _has_pending(self) -> bool:
+        return bool(self.pending_paths or self.pending_moves or self.overflow_dirs)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of distinct paths and moves waiting to be processed."""
         with self.lock:
-            self.pending_paths.add(path)
+            return len(self.pending_paths) + len(self.pending_moves)
 
-            # Reset debounce timer
-            if self.timer:
-                self.timer.cancel()
-            self.timer = Timer(self.debounce_seconds, self._process_changes)
-            self.timer.start()
+    def stats(self) -> Dict[str, int]:
+        """Event and queue counters for diagnostics."""
+        with self.lock:
+            return {
+                "queue_depth": len(self.pending_paths) + len(self.pending_moves),
+                "max_queue_depth": self.max_queue_depth,
+                "events_received": self.events_received,
+                "events_coalesced": self.events_coalesced,
+                "events_dropped": self.events_dropped,
+                "events_overflowed": self.events_overflowed,
+                "batches_processed": self.batches_processed,
+                "storm_batches": self.storm_batches,
+            }
 
     def _is_temp_file(self, path: Path) -> bool:
         """Check if file is a temporary file that should be ignored."""
@@ -105,14 +347,48 @@ class DebouncedLibraryWatcher(FileSystemEventHandler):
     def _process_changes(self) -> None:
         """Process accumulated changes after debounce period."""
         with self.lock:
-            if not self.pending_paths:
+            if not self._has_pending():
                 return
 
             paths_to_process = list(self.pending_paths)
-            self.pending_paths.clear()
+            moves_to_process = self.pending_moves
+            overflow_dirs = list(self.overflow_dirs)
+            self.pending_paths = {}
+            self.pending_moves = []
+            self.overflow_dirs = {}
+            self.batches_processed += 1
+            dropped = self.events_dropped
+            storm = self.on_storm is not None and (bool(overflow_dirs) or len(paths_to_process) > self.storm_threshold)
+            if storm:
+                self.storm_batches += 1
+
+        if moves_to_process:
+            logger.info(f"[watch] Applying {len(moves_to_process)} move(s)/rename(s)...")
+            try:
+                self.on_move(moves_to_process)
+            except Exception as e:
+                logger.error(f"[watch] Error applying moves: {e}", exc_info=True)
+        if storm:
+            directories = collapse_to_directories(paths_to_process, overflow_dirs, roots=self.library_roots)
+            logger.info(
+                f"[watch] Event storm: {len(paths_to_process) + len(overflow_dirs)} change(s), "
+                f"rescanning {len(directories)} director{'y' if len(directories) == 1 else 'ies'}..."
+            )
+            try:
+                self.on_storm(directories)
+            except Exception as e:
+                logger.error(f"[watch] Error processing event storm: {e}", exc_info=True)
+            return
+        if not paths_to_process:
+            return
 
         # Log summary with file count
         logger.info(f"[watch] Processing {len(paths_to_process)} changed file(s) after debounce...")
+        if dropped:
+            logger.warning(
+                f"[watch] {dropped} event(s) dropped so far (queue limit {self.max_pending}); "
+                "run 'psm scan' to pick up missed changes"
+            )
 
         # In DEBUG mode, show individual files
         if logger.isEnabledFor(logging.DEBUG):
@@ -126,13 +402,68 @@ class DebouncedLibraryWatcher(FileSystemEventHandler):
 
     def flush(self) -> None:
         """Immediately process any pending changes without waiting for debounce."""
-        with self.lock:
-            if self.timer:
-                self.timer.cancel()
-                self.timer = None
+        self._process_changes()
 
-        if self.pending_paths:
-            self._process_changes()
+    def stop(self) -> None:
+        """Process pending changes and stop the worker thread."""
+        with self.lock:
+            self._stopping = True
+            self.lock.notify()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout=30.0)
+        self.flush()
+
+
+def collapse_to_directories(
+    paths: Sequence[Path], directories: Sequence[Path] = (), roots: Sequence[Path] = (), max_directories: int = 64
+) -> List[Path]:
+    """Reduce changed files (and directories) to a small set of non-nested directories.
+
+    Each file contributes its parent directory; nested directories are dropped in
+    favour of their ancestors. While more than max_directories remain, the deepest
+    ones are replaced by their parents, but never climbing above a library root.
+
+    Args:
+        paths: Changed file paths
+        directories: Additional directories that must be covered
+        roots: Library roots (collapsing stops at these)
+        max_directories: Target upper bound on the number of directories
+
+    Returns:
+        Sorted list of directories covering every input
+    """
+    root_set = set(roots)
+    dirs = {p.parent for p in paths}
+    dirs.update(directories)
+
+    def outermost(candidates) -> set:
+        kept: set = set()
+        for d in sorted(candidates, key=lambda d: len(d.parts)):
+            if not any(parent in kept for parent in d.parents):
+                kept.add(d)
+        return kept
+
+    dirs = outermost(dirs)
+    while len(dirs) > max_directories:
+        climbable = [d for d in dirs if d not in root_set and d.parent != d]
+        if not climbable:
+            break
+        deepest = max(len(d.parts) for d in climbable)
+        dirs = outermost({d.parent if d in climbable and len(d.parts) == deepest else d for d in dirs})
+    return sorted(dirs)
+
+
+def _retarget(path: Path, move: PathMove) -> Path | None:
+    """Return path's new location under move, or None if the move does not affect it."""
+    if path == move.src:
+        return move.dest
+    if move.is_directory:
+        try:
+            return move.dest / path.relative_to(move.src)
+        except ValueError:
+            return None
+    return None
 
 
 class LibraryWatcher:
@@ -143,7 +474,12 @@ class LibraryWatcher:
     """
 
     def __init__(
-        self, config: Dict[str, Any], on_change_callback: Callable[[List[Path]], None], debounce_seconds: float = 2.0
+        self,
+        config: Dict[str, Any],
+        on_change_callback: Callable[[List[Path]], None],
+        debounce_seconds: float = 2.0,
+        on_move_callback: Callable[[List[PathMove]], None] | None = None,
+        on_storm_callback: Callable[[List[Path]], None] | None = None,
     ):
         """Initialize the library watcher.
 
@@ -151,10 +487,14 @@ class LibraryWatcher:
             config: Configuration dict containing library settings
             on_change_callback: Function to call when files change
             debounce_seconds: Debounce period in seconds
+            on_move_callback: Optional function to apply renames/moves as path updates
+            on_storm_callback: Optional function to rescan directories after an event storm
         """
         self.config = config
         self.debounce_seconds = debounce_seconds
         self.on_change = on_change_callback
+        self.on_move = on_move_callback
+        self.on_storm = on_storm_callback
         self.observer: Observer | None = None
         self.handler: DebouncedLibraryWatcher | None = None
         self._running = False
@@ -175,7 +515,13 @@ class LibraryWatcher:
         if isinstance(paths, str):
             paths = [paths]
 
-        self.handler = DebouncedLibraryWatcher(self.config, self.on_change, self.debounce_seconds)
+        self.handler = DebouncedLibraryWatcher(
+            self.config,
+            self.on_change,
+            self.debounce_seconds,
+            on_move_callback=self.on_move,
+            on_storm_callback=self.on_storm,
+        )
 
         self.observer = Observer()
 
@@ -199,14 +545,21 @@ class LibraryWatcher:
 
         logger.info("Stopping watch mode...")
 
-        # Flush any pending changes
-        if self.handler:
-            self.handler.flush()
-
         if self.observer:
             self.observer.stop()
             self.observer.join(timeout=5.0)
 
+        # Flush any pending changes and stop the debounce worker
+        if self.handler:
+            self.handler.stop()
+            stats = self.handler.stats()
+            logger.debug(
+                f"[watch] events={stats['events_received']} coalesced={stats['events_coalesced']} "
+                f"dropped={stats['events_dropped']} overflowed={stats['events_overflowed']} "
+                f"batches={stats['batches_processed']} storms={stats['storm_batches']} "
+                f"max_queue_depth={stats['max_queue_depth']}"
+            )
+
         self._running = False
         logger.info("Watch mode stopped")
 
@@ -224,4 +577,4 @@ class LibraryWatcher:
         self.stop()
 
 
-__all__ = ["LibraryWatcher", "DebouncedLibraryWatcher"]
+__all__ = ["LibraryWatcher", "DebouncedLibraryWatcher", "PathMove", "collapse_to_directories"]
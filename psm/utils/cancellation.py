@@ -0,0 +1,63 @@
+"""Cooperative cancellation for long-running operations.
+
+A host that runs operations on a worker thread (the GUI's in-process runner)
+creates a CancelToken and runs the operation inside cancel_scope(token).
+Hot loops call check_cancelled(), which raises OperationCancelled once the
+token is cancelled from another thread. Outside a scope check_cancelled() is
+a no-op, so CLI runs are unaffected.
+
+The active token is held in a context variable, i.e. per thread: worker
+threads spawned by an operation do not inherit it, and their loops simply
+finish their current item.
+"""
+
+from __future__ import annotations
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class OperationCancelled(Exception):
+    """Raised at a cancellation checkpoint after the operation's token was cancelled."""
+
+
+class CancelToken:
+    """Thread-safe cancellation flag shared between a controller and a worker."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise OperationCancelled()
+
+
+_current: ContextVar[Optional[CancelToken]] = ContextVar("psm_cancel_token", default=None)
+
+
+@contextmanager
+def cancel_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """Make token the active token for check_cancelled() in this thread."""
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
+
+
+def check_cancelled() -> None:
+    """Raise OperationCancelled if the active token (if any) was cancelled."""
+    token = _current.get()
+    if token is not None and token.cancelled:
+        raise OperationCancelled()
+
+
+__all__ = ["CancelToken", "OperationCancelled", "cancel_scope", "check_cancelled"]
@@ -0,0 +1,235 @@
+"""Structured progress events for machine consumers (`psm --events json`).
+
+Human output (progress lines, log records) is unchanged. When events are
+enabled, every progress call additionally writes one JSON object per line to a
+dedicated channel, so the GUI can follow a run without parsing log text.
+
+Channel: the file descriptor named by PSM_EVENTS_FD (on Windows an inherited
+OS handle), or stderr when unset. Hosts that run commands in-process (the
+`psm serve` daemon, the GUI) install their own callback via enable() instead.
+
+Event schema (every event carries ``v`` (schema version), ``type`` and ``ts``):
+- stage_start: stage, step, total_steps (step fields omitted outside step sequences)
+- stage_end:   stage, elapsed (seconds, optional)
+- progress:    item, current, total (null if unknown), rate (items/s), eta (seconds),
+               new, updated, skipped (optional counts)
+- status / warning / error: message
+
+Progress events are throttled (default: at most one per 0.1s); the most recent
+suppressed update is flushed before the next non-progress event, and final
+updates (current == total) are never dropped.
+"""
+
+from __future__ import annotations
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TextIO
+
+EVENTS_FD_ENV = "PSM_EVENTS_FD"
+SCHEMA_VERSION = 1
+DEFAULT_MIN_INTERVAL = 0.1
+
+
+class EventEmitter:
+    """Builds events and hands them to a callback, throttling progress updates."""
+
+    def __init__(
+        self,
+        write: Callable[[Dict[str, Any]], None],
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        close: Callable[[], None] | None = None,
+    ):
+        """Initialize emitter.
+
+        Args:
+            write: Called with each event (a JSON-serializable dict)
+            min_interval: Minimum seconds between two progress events
+            clock: Monotonic time source (injectable for tests)
+            close: Called once by close() (e.g. to close the channel)
+        """
+        self._write = write
+        self._close = close
+        self._min_interval = min_interval
+        self._clock = clock
+        self._lock = threading.RLock()  # write() may disable() on a broken channel
+        self._last_progress = float("-inf")
+        self._pending: Optional[Dict[str, Any]] = None
+        self.emitted = 0
+        self.coalesced = 0
+
+    def emit(self, event_type: str, **fields: Any) -> None:
+        """Write an event immediately (after any pending progress update)."""
+        with self._lock:
+            self._flush_pending()
+            self._send(self._event(event_type, fields))
+
+    def progress(self, **fields: Any) -> None:
+        """Write a progress event, or hold it back if the last one was too recent."""
+        event = self._event("progress", fields)
+        final = fields.get("total") is not None and fields.get("current", 0) >= fields["total"]
+        with self._lock:
+            now = self._clock()
+            if final or now - self._last_progress >= self._min_interval:
+                self._pending = None
+                self._last_progress = now
+                self._send(event)
+            else:
+                if self._pending is not None:
+                    self.coalesced += 1
+                self._pending = event
+
+    def flush(self) -> None:
+        """Write the pending (throttled) progress update, if any."""
+        with self._lock:
+            self._flush_pending()
+
+    def close(self) -> None:
+        """Flush the pending update and release the channel."""
+        self.flush()
+        close, self._close = self._close, None
+        if close is not None:
+            close()
+
+    def _flush_pending(self) -> None:
+        if self._pending is not None:
+            event, self._pending = self._pending, None
+            self._last_progress = self._clock()
+            self._send(event)
+
+    @staticmethod
+    def _event(event_type: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        event = {"v": SCHEMA_VERSION, "type": event_type, "ts": round(time.time(), 3)}
+        event.update((key, value) for key, value in fields.items() if value is not None)
+        return event
+
+    def _send(self, event: Dict[str, Any]) -> None:
+        self._write(event)
+        self.emitted += 1
+
+
+_emitter: Optional[EventEmitter] = None
+
+
+def enable(
+    write: Callable[[Dict[str, Any]], None],
+    min_interval: float = DEFAULT_MIN_INTERVAL,
+    close: Callable[[], None] | None = None,
+) -> EventEmitter:
+    """Route events to write (replaces any current emitter)."""
+    global _emitter
+    _emitter = EventEmitter(write, min_interval=min_interval, close=close)
+    return _emitter
+
+
+def disable() -> None:
+    """Flush, close the channel and stop emitting events."""
+    global _emitter
+    emitter, _emitter = _emitter, None
+    if emitter is not None:
+        try:
+            emitter.close()
+        except OSError:
+            pass
+
+
+def is_enabled() -> bool:
+    return _emitter is not None
+
+
+def open_channel() -> TextIO:
+    """Open the event channel named by PSM_EVENTS_FD (stderr when unset)."""
+    value = os.environ.get(EVENTS_FD_ENV)
+    if not value:
+        return sys.stderr
+    fd = int(value)
+    if sys.platform == "win32":
+        import msvcrt
+
+        fd = msvcrt.open_osfhandle(fd, os.O_WRONLY)
+    return os.fdopen(fd, "w", encoding="utf-8", buffering=1)
+
+
+def enable_json_output() -> EventEmitter:
+    """Enable events on the process channel (see open_channel())."""
+    stream = open_channel()
+
+    def write(event: Dict[str, Any]) -> None:
+        try:
+            stream.write(json.dumps(event, ensure_ascii=False) + "\n")
+            stream.flush()
+        except (OSError, ValueError):
+            disable()  # Reader went away; keep the command running
+
+    return enable(write, close=None if stream is sys.stderr else stream.close)
+
+
+def emit(event_type: str, **fields: Any) -> None:
+    """Emit an event if events are enabled (no-op otherwise)."""
+    if _emitter is not None:
+        _emitter.emit(event_type, **fields)
+
+
+def stage_start(stage: str, step: int | None = None, total_steps: int | None = None) -> None:
+    emit("stage_start", stage=stage, step=step, total_steps=total_steps)
+
+
+def stage_end(stage: str, elapsed: float | None = None) -> None:
+    emit("stage_end", stage=stage, elapsed=round(elapsed, 3) if elapsed is not None else None)
+
+
+def progress(
+    current: int,
+    total: int | None,
+    item: str = "items",
+    elapsed_seconds: float | None = None,
+    new: int | None = None,
+    updated: int | None = None,
+    skipped: int | None = None,
+) -> None:
+    """Emit a (throttled) progress event; rate and ETA are derived from elapsed_seconds."""
+    if _emitter is None:
+        return
+    rate = eta = None
+    if elapsed_seconds and elapsed_seconds > 0 and current > 0:
+        rate = current / elapsed_seconds
+        if total:
+            eta = round(max(total - current, 0) / rate, 1)
+        rate = round(rate, 1)
+    _emitter.progress(
+        item=item, current=current, total=total or None, rate=rate, eta=eta, new=new, updated=updated, skipped=skipped
+    )
+
+
+def status(message: str) -> None:
+    emit("status", message=message)
+
+
+def warning(message: str) -> None:
+    emit("warning", message=message)
+
+
+def error(message: str) -> None:
+    emit("error", message=message)
+
+
+__all__ = [
+    "EVENTS_FD_ENV",
+    "SCHEMA_VERSION",
+    "EventEmitter",
+    "disable",
+    "emit",
+    "enable",
+    "enable_json_output",
+    "error",
+    "is_enabled",
+    "open_channel",
+    "progress",
+    "stage_end",
+    "stage_start",
+    "status",
+    "warning",
+]
@@ -1,10 +1,70 @@
+"""Partial content hashing for rename/move and duplicate detection.
+
+Only the head and tail of a file (plus its size) are hashed, which is enough to
+recognise the same audio file under a different path without reading it fully.
+
+Stored hash values carry their algorithm as a prefix (``"blake2b:<hex>"``).
+Legacy values without a prefix are plain SHA-1 digests over the same input
+layout, so they remain comparable by re-hashing with ``"sha1"``.
+"""
+
 from __future__ import annotations
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Callable, Dict, Tuple
 import hashlib
+import mmap
+
+try:  # Optional accelerator
+    import xxhash  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on environment
+    xxhash = None
 
 CHUNK = 64 * 1024
 
+LEGACY_ALGORITHM = "sha1"
+DEFAULT_ALGORITHM = "blake2b"
+
+
+def _blake2b():
+    return hashlib.blake2b(digest_size=16)
+
+
+_HASHERS: Dict[str, Callable[[], object]] = {
+    "sha1": hashlib.sha1,
+    "blake2b": _blake2b,
+}
+if xxhash is not None:  # pragma: no cover - depends on environment
+    _HASHERS["xxh64"] = xxhash.xxh64
+    _HASHERS["xxh3"] = xxhash.xxh3_64
+
+
+def available_algorithms() -> Tuple[str, ...]:
+    """Return hash algorithm names usable in this environment."""
+    return tuple(_HASHERS)
+
+
+def resolve_algorithm(name: str | None) -> str:
+    """Map a configured algorithm name to an available one.
+
+    ``"auto"`` (or None) picks xxh3 when xxhash is installed, else BLAKE2b.
+    Unknown names fall back to the default rather than failing a scan.
+    """
+    if not name or name == "auto":
+        return "xxh3" if "xxh3" in _HASHERS else DEFAULT_ALGORITHM
+    name = name.lower()
+    return name if name in _HASHERS else DEFAULT_ALGORITHM
+
+
+def split_hash(value: str) -> Tuple[str, str]:
+    """Split a stored hash value into (algorithm, hex digest).
+
+    Values without an algorithm prefix are legacy SHA-1 digests.
+    """
+    algorithm, sep, digest = value.partition(":")
+    if not sep:
+        return LEGACY_ALGORITHM, value
+    return algorithm, digest
+
 
 def _read_head_tail(fh: BinaryIO, size: int, head_bytes: int, tail_bytes: int) -> bytes:
     if size <= head_bytes + tail_bytes:
@@ -16,18 +76,66 @@ def _read_head_tail(fh: BinaryIO, size: int, head_bytes: int, tail_bytes: int) -
     return head + tail
 
 
-def partial_hash(path: Path, head_bytes: int = 64 * 1024, tail_bytes: int = 64 * 1024) -> str:
+def _update_from_file(h, fh: BinaryIO, size: int, head_bytes: int, tail_bytes: int) -> None:
+    """Feed head/tail bytes into hasher, using mmap slices to avoid copies."""
+    if size == 0:
+        return
+    try:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Some filesystems (and special files) cannot be mapped
+        fh.seek(0)
+        h.update(_read_head_tail(fh, size, head_bytes, tail_bytes))
+        return
+    with mm, memoryview(mm) as view:
+        if size <= head_bytes + tail_bytes:
+            h.update(view)
+        else:
+            h.update(view[:head_bytes])
+            h.update(view[size - tail_bytes :])
+
+
+def partial_hash(
+    path: Path, head_bytes: int = 64 * 1024, tail_bytes: int = 64 * 1024, algorithm: str = LEGACY_ALGORITHM
+) -> str:
     """Hash beginning and end of file plus size to detect renames/moves.
-    Returns hex digest sha1(size||head||tail).
+
+    With the legacy ``"sha1"`` algorithm this returns a bare hex digest of
+    sha1(size||head||tail), identical to values stored by older versions.
+    Other algorithms return ``"<algorithm>:<hex>"``.
     """
-    st = path.stat()
-    size = st.st_size
+    if algorithm not in _HASHERS:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
     with path.open("rb") as fh:
-        data = _read_head_tail(fh, size, head_bytes, tail_bytes)
-    h = hashlib.sha1()
-    h.update(str(size).encode())
-    h.update(data)
-    return h.hexdigest()
+        size = fh.seek(0, 2)
+        fh.seek(0)
+        h = _HASHERS[algorithm]()
+        h.update(str(size).encode())
+        _update_from_file(h, fh, size, head_bytes, tail_bytes)
+    digest = h.hexdigest()
+    return digest if algorithm == LEGACY_ALGORITHM else f"{algorithm}:{digest}"
+
+
+def same_content(path: Path, stored: str) -> bool:
+    """Check whether a file matches a stored hash, re-hashing with its algorithm.
+
+    Returns False when the stored algorithm is unavailable here (e.g. an
+    xxhash value on a machine without xxhash) or the file cannot be read.
+    """
+    algorithm, _ = split_hash(stored)
+    if algorithm not in _HASHERS:
+        return False
+    try:
+        return partial_hash(path, algorithm=algorithm) == stored
+    except OSError:
+        return False
 
 
-__all__ = ["partial_hash"]
+__all__ = [
+    "partial_hash",
+    "split_hash",
+    "same_content",
+    "resolve_algorithm",
+    "available_algorithms",
+    "DEFAULT_ALGORITHM",
+]
@@ -0,0 +1,95 @@
+"""Thread-safe latency histograms for per-phase I/O timing.
+
+Used by the concurrent scan pipeline to report where time goes on
+high-latency filesystems (directory listing vs stat vs tag read vs hashing).
+Buckets are powers of two in microseconds, so memory stays constant no matter
+how many samples are recorded and percentiles are accurate to within 2x.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+_BUCKETS = 32  # 2^31 µs ≈ 36 minutes, plenty for a single I/O call
+
+
+class LatencyHistogram:
+    """Log2-bucketed latency histogram."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = int(seconds * 1_000_000)
+        bucket = min(micros.bit_length(), _BUCKETS - 1)
+        with self._lock:
+            self._counts[bucket] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile (upper bucket bound) in seconds."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(1, int(self.count * pct / 100.0 + 0.5))
+            seen = 0
+            for bucket, n in enumerate(self._counts):
+                seen += n
+                if seen >= target:
+                    return min((1 << bucket) / 1_000_000, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class PhaseTimings:
+    """Collection of named latency histograms (one per pipeline phase)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, phase: str) -> LatencyHistogram:
+        with self._lock:
+            hist = self.phases.get(phase)
+            if hist is None:
+                hist = self.phases[phase] = LatencyHistogram()
+            return hist
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.histogram(phase).record(seconds)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def summary_lines(self) -> List[str]:
+        """Human-readable one-line summary per phase (ms)."""
+        lines = []
+        for phase, hist in self.phases.items():
+            if not hist.count:
+                continue
+            lines.append(
+                f"{phase:<8} n={hist.count:<7} mean={hist.mean * 1000:7.2f}ms "
+                f"p50={hist.percentile(50) * 1000:7.2f}ms p90={hist.percentile(90) * 1000:7.2f}ms "
+                f"p99={hist.percentile(99) * 1000:7.2f}ms max={hist.max * 1000:7.2f}ms"
+            )
+        return lines
+
+
+__all__ = ["LatencyHistogram", "PhaseTimings"]
@@ -3,6 +3,8 @@
 import logging
 import click
 
+from . import events
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +28,16 @@ def log_progress(
         elapsed_seconds: Time elapsed since start
         item_name: Name of items being processed (e.g., "files", "tracks")
     """
+    events.progress(
+        processed,
+        total,
+        item_name,
+        elapsed_seconds=elapsed_seconds,
+        new=new or None,
+        updated=updated or None,
+        skipped=skipped or None,
+    )
+
     parts = [f"{click.style(f'{processed}', fg='cyan')} {item_name} processed"]
 
     if total:
@@ -10,11 +10,89 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class PathMapper:
+    r"""Formats library file paths for M3U playlists; build once per export.
+
+    Configured library roots are resolved once (resolve() is a filesystem call,
+    and may turn Z:\ into \\server\share) and kept sorted longest first, so the
+    most specific root wins. Results are cached per file path and, for relative
+    output, per playlist directory, since the same tracks recur across playlists.
+
+    Args:
+        path_format: "absolute" or "relative"
+        library_roots: List of library root paths from config (for path reconstruction)
+    """
+
+    def __init__(self, path_format: str = "absolute", library_roots: list[str] | None = None):
+        self.path_format = path_format
+        # (resolved root lowercased with backslashes, length of resolved root, root as configured)
+        roots = []
+        for root in library_roots or []:
+            resolved = str(Path(root).resolve())
+            roots.append((resolved.lower().replace("/", "\\"), len(resolved), Path(root)))
+        roots.sort(key=lambda entry: len(entry[0]), reverse=True)
+        self._roots = roots
+        self._absolute: dict[str, str] = {}
+        self._relative: dict[Path, dict[str, str]] = {}
+
+    def format(self, file_path: str | Path, playlist_path: Path) -> str:
+        """Format a file path (as stored in the database) for the playlist at playlist_path."""
+        absolute = self._absolute.get(str(file_path))
+        if absolute is None:
+            absolute = self._absolute[str(file_path)] = self._reconstruct(str(file_path))
+        if self.path_format != "relative":
+            return absolute
+
+        directory = playlist_path.parent
+        cache = self._relative.get(directory)
+        if cache is None:
+            cache = self._relative[directory] = {}
+        formatted = cache.get(absolute)
+        if formatted is None:
+            try:
+                # Make path relative to playlist location
+                formatted = str(Path(absolute).relative_to(directory))
+            except ValueError:
+                # Files not on same root - fall back to absolute
+                logger.warning(
+                    f"Cannot create relative path from {absolute} to {directory}, using absolute path instead"
+                )
+                formatted = absolute
+            cache[absolute] = formatted
+        return formatted
+
+    def _reconstruct(self, file_path: str) -> str:
+        r"""Rewrite file_path under the configured root it belongs to.
+
+        This solves the network path problem: if a user scans Z:\Artists but the
+        database stores \\server\share\Artists (due to path resolution), we want to
+        export Z:\Artists to match the user's configuration.
+
+        Example:
+            Database has: \\diskstation\music\Artists\Song.mp3
+            Config has: Z:\Artists
+            Result: Z:\Artists\Song.mp3
+        """
+        file_path_str = file_path.lower().replace("/", "\\")
+        for root_key, root_len, root in self._roots:
+            if file_path_str.startswith(root_key):
+                # Found a match! Reconstruct using the ORIGINAL root from config
+                relative_part = file_path[root_len:].lstrip("\\/")
+                reconstructed = str(root / relative_part)
+                if logger.isEnabledFor(logging.DEBUG):  # Hot path: skip building the message otherwise
+                    logger.debug(f"Reconstructed path: {file_path} -> {reconstructed} (using root: {root})")
+                return reconstructed
+        return str(Path(file_path))
+
+
 def format_path_for_m3u(
     file_path: str | Path, playlist_path: Path, path_format: str = "absolute", library_roots: list[str] | None = None
 ) -> str:
     r"""Format a file path for inclusion in an M3U playlist.
 
+    Convenience wrapper for a single path; exports should build one PathMapper
+    and reuse it for every track.
+
     Args:
         file_path: Path to the audio file (as stored in database)
         playlist_path: Path to the M3U playlist file being created
@@ -29,68 +107,7 @@ def format_path_for_m3u(
         using the configured library root that matches. This ensures the exported path
         uses the same format as the user's configuration (e.g., Z:\ instead of \\server\share).
     """
-    if not isinstance(file_path, Path):
-        file_path = Path(file_path)
-
-    # Try to reconstruct path using library roots (preserves user's configured format)
-    if library_roots:
-        reconstructed = _reconstruct_from_library_root(file_path, library_roots)
-        if reconstructed:
-            file_path = reconstructed
-
-    # Handle relative paths
-    if path_format == "relative":
-        try:
-            # Make path relative to playlist location
-            rel_path = file_path.relative_to(playlist_path.parent)
-            return str(rel_path)
-        except ValueError:
-            # Files not on same root - fall back to absolute
-            logger.warning(
-                f"Cannot create relative path from {file_path} to {playlist_path.parent}, "
-                "using absolute path instead"
-            )
-            # Fall through to absolute handling
-
-    # Return absolute path
-    return str(file_path)
-
-
-def _reconstruct_from_library_root(file_path: Path, library_roots: list[str]) -> Path | None:
-    r"""Reconstruct file path using configured library roots.
-
-    This function solves the network path problem: if a user scans Z:\Artists but the
-    database stores \\server\share\Artists (due to path resolution), we want to export
-    Z:\Artists to match the user's configuration.
-
-    Args:
-        file_path: Absolute file path from database
-        library_roots: List of library root paths from config
-
-    Returns:
-        Reconstructed path using library root, or None if no match found
-
-    Example:
-        Database has: \\diskstation\music\Artists\Song.mp3
-        Config has: Z:\Artists
-        Result: Z:\Artists\Song.mp3
-    """
-    file_path_str = str(file_path).lower().replace("/", "\\")
-
-    for root in library_roots:
-        root_path = Path(root).resolve()  # Resolve to absolute (may convert Z:\ to \\server\share)
-        root_str = str(root_path).lower().replace("/", "\\")
-
-        # Check if file path starts with this resolved root
-        if file_path_str.startswith(root_str):
-            # Found a match! Reconstruct using the ORIGINAL root from config
-            relative_part = str(file_path)[len(str(root_path)) :].lstrip("\\/")
-            reconstructed = Path(root) / relative_part
-            logger.debug(f"Reconstructed path: {file_path} -> {reconstructed} (using root: {root})")
-            return reconstructed
-
-    # No matching library root found
-    return None
+    return PathMapper(path_format, library_roots).format(file_path, playlist_path)
 
 
-__all__ = ["format_path_for_m3u"]
+__all__ = ["PathMapper", "format_path_for_m3u"]
@@ -10,11 +10,16 @@ Format Standards:
 - Status: "→ Status message"
 - Warning: "⚠ Warning message"
 - Error: "✗ Error message"
+
+With `psm --events json` each call also emits the matching structured event
+(see psm.utils.events).
 """
 
 import time
 from typing import Optional
 
+from . import events
+
 
 class ProgressLogger:
     """Standardized progress logger for CLI operations.
@@ -48,6 +53,7 @@ class ProgressLogger:
         self._start_time = time.time()
         self._current_operation = operation
         print(f"→ {operation}...")
+        events.stage_start(operation)
 
     def step(self, current: int, total: int, name: str):
         """Log a step in a multi-step operation.
@@ -62,6 +68,7 @@ class ProgressLogger:
             [2/5] Matching tracks
         """
         print(f"[{current}/{total}] {name}")
+        events.stage_start(name, step=current, total_steps=total)
 
     def items(self, current: int, total: int, item_type: str = "items"):
         """Log progress through a collection of items.
@@ -81,6 +88,7 @@ class ProgressLogger:
         else:
             # Indeterminate progress (total unknown)
             print(f"Progress: {current} {item_type} processed")
+        events.progress(current, total, item_type)
 
     def status(self, message: str):
         """Log a status message.
@@ -93,6 +101,7 @@ class ProgressLogger:
             → Found 42 playlists
         """
         print(f"→ {message}")
+        events.status(message)
 
     def complete(self, operation: Optional[str] = None, elapsed: Optional[float] = None):
         """Log completion of an operation.
@@ -114,6 +123,7 @@ class ProgressLogger:
             print(f"✓ {op} completed in {elapsed:.1f}s")
         else:
             print(f"✓ {op} completed")
+        events.stage_end(op, elapsed)
 
         # Reset state
         self._start_time = None
@@ -130,6 +140,7 @@ class ProgressLogger:
             ⚠ 3 playlists skipped
         """
         print(f"⚠ {message}")
+        events.warning(message)
 
     def error(self, message: str):
         """Log an error message.
@@ -142,6 +153,7 @@ class ProgressLogger:
             ✗ Failed to connect to Spotify
         """
         print(f"✗ {message}")
+        events.error(message)
 
 
 # Global singleton instance for convenience
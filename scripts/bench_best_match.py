@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark best-match lookups: per-query window ranking vs the best_match table.
+
+Builds a database with a synthetic catalog, library and several candidate
+matches per track, then times the export and GUI queries against the
+materialized best_match table and against the previous form, which ranked
+every row of `matches` with ROW_NUMBER() on each call. Also reports what the
+best_match triggers add to writing matches.
+
+Usage:
+    python scripts/bench_best_match.py
+    python scripts/bench_best_match.py --tracks 20000 --playlists 50 --runs 3
+"""
+
+import argparse
+import logging
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from psm.db import Database  # noqa: E402
+
+# Previous form of the export query: rank all matches per call, keep rn = 1
+WINDOW_PLAYLIST_SQL = """
+WITH ranked_matches AS (
+    SELECT m.track_id, m.file_id, m.score,
+        ROW_NUMBER() OVER (
+            PARTITION BY m.track_id
+            ORDER BY (CASE WHEN m.confidence = 'MANUAL' THEN 1 ELSE 0 END) DESC, m.score DESC
+        ) AS rn
+    FROM matches m
+    WHERE m.provider = ?
+)
+SELECT pt.position, t.id as track_id, t.name, t.artist, t.album, t.year, t.duration_ms, lf.path AS local_path
+FROM playlist_tracks pt
+LEFT JOIN tracks t ON t.id = pt.track_id AND t.provider = pt.provider
+LEFT JOIN ranked_matches rm ON rm.track_id = pt.track_id AND rm.rn = 1
+LEFT JOIN library_files lf ON lf.id = rm.file_id
+WHERE pt.playlist_id = ? AND pt.provider = ?
+ORDER BY pt.position
+"""
+
+# Best-match part of the GUI track list, before and after
+WINDOW_UNIFIED_SQL = """
+SELECT t.id, t.name, lf.path
+FROM tracks t
+LEFT JOIN (
+    SELECT track_id, provider, file_id FROM (
+        SELECT track_id, provider, file_id,
+            ROW_NUMBER() OVER (
+                PARTITION BY track_id, provider
+                ORDER BY (CASE WHEN confidence = 'MANUAL' THEN 1 ELSE 0 END) DESC, score DESC
+            ) as rn
+        FROM matches
+    ) ranked WHERE rn = 1
+) m ON t.id = m.track_id AND t.provider = m.provider
+LEFT JOIN library_files lf ON m.file_id = lf.id
+WHERE t.provider = ?
+ORDER BY t.artist, t.album, t.name
+"""
+
+TABLE_UNIFIED_SQL = """
+SELECT t.id, t.name, lf.path
+FROM tracks t
+LEFT JOIN best_match m ON t.id = m.track_id AND t.provider = m.provider
+LEFT JOIN library_files lf ON m.file_id = lf.id
+WHERE t.provider = ?
+ORDER BY t.artist, t.album, t.name
+"""
+
+
+def populate(conn: sqlite3.Connection, tracks: int, playlists: int, playlist_size: int) -> None:
+    conn.executemany(
+        "INSERT INTO tracks(id, provider, name, artist, album, normalized) VALUES(?, 'spotify', ?, ?, ?, ?)",
+        ((f"t{i}", f"Song {i}", f"Artist {i % 500}", f"Album {i % 2000}", f"song {i}") for i in range(tracks)),
+    )
+    conn.executemany(
+        "INSERT INTO library_files(id, path, title, artist, album, normalized, size, mtime) VALUES(?, ?, ?, ?, ?, ?, 1, 1.0)",
+        (
+            (i, f"/music/{i}.mp3", f"Song {i}", f"Artist {i % 500}", f"Album {i % 2000}", f"song {i}")
+            for i in range(tracks)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO playlists(id, provider, name) VALUES(?, 'spotify', ?)",
+        ((f"p{p}", f"P{p}") for p in range(playlists)),
+    )
+    conn.executemany(
+        "INSERT INTO playlist_tracks(playlist_id, provider, position, track_id) VALUES(?, 'spotify', ?, ?)",
+        (
+            (f"p{p}", pos, f"t{(p * 7919 + pos * 31) % tracks}")
+            for p in range(playlists)
+            for pos in range(playlist_size)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO liked_tracks(track_id, provider, added_at) VALUES(?, 'spotify', ?)",
+        ((f"t{i}", f"2024-01-{i % 28 + 1:02d}") for i in range(0, tracks, 10)),
+    )
+    conn.commit()
+
+
+def match_rows(tracks: int):
+    """Three candidates per matched track (90% of tracks), every 50th one a MANUAL override."""
+    for i in range(tracks):
+        if i % 10 == 9:
+            continue
+        for k in range(3):
+            confidence = "MANUAL" if (i % 50 == 0 and k == 2) else "HIGH"
+            yield (f"t{i}", (i + k * 7) % tracks, 0.9 - k * 0.05, f"score:{confidence}", confidence)
+
+
+def write_matches(conn: sqlite3.Connection, tracks: int) -> float:
+    start = time.perf_counter()
+    conn.executemany(
+        "INSERT INTO matches(track_id, provider, file_id, score, method, confidence) VALUES(?, 'spotify', ?, ?, ?, ?)",
+        match_rows(tracks),
+    )
+    conn.commit()
+    return time.perf_counter() - start
+
+
+def timed(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=50000, help="Catalog and library size (default 50000)")
+    parser.add_argument("--playlists", type=int, default=20, help="Playlists to export (default 20)")
+    parser.add_argument("--playlist-size", type=int, default=100, help="Tracks per playlist (default 100)")
+    parser.add_argument("--runs", type=int, default=1, help="Runs per measurement (default 1)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Match write cost without the best_match triggers (same schema otherwise)
+        with Database(Path(tmp) / "plain.db") as db:
+            for trigger in ("trg_best_match_insert", "trg_best_match_update", "trg_best_match_delete"):
+                db.conn.execute(f"DROP TRIGGER {trigger}")
+            populate(db.conn, args.tracks, 0, 0)
+            plain_write = write_matches(db.conn, args.tracks)
+
+        db = Database(Path(tmp) / "psm.db")
+        populate(db.conn, args.tracks, args.playlists, args.playlist_size)
+        trigger_write = write_matches(db.conn, args.tracks)
+        matches = db.count_matches()
+        playlist_ids = [f"p{p}" for p in range(args.playlists)]
+
+        def export_window():
+            for pid in playlist_ids:
+                db.conn.execute(WINDOW_PLAYLIST_SQL, ("spotify", pid, "spotify")).fetchall()
+
+        def export_table():
+            for pid in playlist_ids:
+                db.get_playlist_tracks_with_local_paths(pid, provider="spotify")
+
+        results = [
+            ("export all playlists", timed(export_window, args.runs), timed(export_table, args.runs)),
+            (
+                "GUI unified track list",
+                timed(lambda: db.conn.execute(WINDOW_UNIFIED_SQL, ("spotify",)).fetchall(), args.runs),
+                timed(lambda: db.conn.execute(TABLE_UNIFIED_SQL, ("spotify",)).fetchall(), args.runs),
+            ),
+        ]
+        rebuild = timed(db.rebuild_best_match, 1)
+        db.close()
+
+    print(f"Catalog: {args.tracks} tracks, {matches} matches, {args.playlists} playlists x {args.playlist_size}")
+    print(f"  {'query':<24} {'window (ms)':>12} {'best_match (ms)':>16} {'speedup':>8}")
+    for name, before, after in results:
+        print(f"  {name:<24} {before * 1000:12.1f} {after * 1000:16.1f} {before / after:7.1f}x")
+    print(f"  writing {matches} matches: {plain_write:.2f}s without triggers, {trigger_write:.2f}s with")
+    print(f"  one-time rebuild (existing databases): {rebuild:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark CLI startup: wall time and import time of common commands.
+
+Runs `python -X importtime -m psm.cli <cmd>` for each command and reports the
+median wall time, the cumulative import time of psm.cli (the package and the
+subcommand module it resolves), the total import time of the process and the
+slowest top-level imports. Commands that need no data (--help, config) run
+against an empty temporary database.
+
+Usage:
+    python scripts/bench_cli_startup.py
+    python scripts/bench_cli_startup.py --runs 10 --top 15
+    python scripts/bench_cli_startup.py --command "scan --help"
+"""
+
+import argparse
+import os
+import re
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+COMMANDS = ("--help", "config --section database", "match --help", "scan --help", "export --help", "report --help")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> Tuple[int, Dict[str, int]]:
+    """Return (total microseconds, cumulative microseconds of each top-level import)."""
+    total = 0
+    top_level: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if indent == 1:  # One space after '|' marks a top-level import
+            total += cumulative
+            top_level[name] = top_level.get(name, 0) + cumulative
+    return total, top_level
+
+
+def run_command(args: List[str], env: dict) -> Tuple[float, int, Dict[str, int]]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "psm.cli", *args],
+        env=env,
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    total, top_level = parse_importtime(result.stderr)
+    return wall, total, top_level
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command (default 5)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest top-level imports to list per command (default 8)")
+    parser.add_argument("--command", action="append", help="Command line to time (repeatable; default: common set)")
+    args = parser.parse_args()
+    commands = args.command or list(COMMANDS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, PSM_SKIP_FIRST_RUN_CHECK="1", PSM__DATABASE__PATH=str(Path(tmp) / "psm.db"))
+        env.pop("PSM_USE_DAEMON", None)
+
+        rows = []
+        for command in commands:
+            samples = [run_command(shlex.split(command), env) for _ in range(args.runs)]
+            wall = statistics.median(s[0] for s in samples)
+            total = statistics.median(s[1] for s in samples)
+            top_level = samples[-1][2]
+            rows.append((command, wall, total, top_level))
+
+    print(f"CLI startup, median of {args.runs} runs (import times from -X importtime)")
+    print(f"  {'command':<28}{'wall':>9}{'imports':>10}{'psm.cli':>10}")
+    for command, wall, total, top_level in rows:
+        cli_us = top_level.get("psm.cli", 0) + top_level.get("psm.cli.__main__", 0)
+        print(f"  {command:<28}{wall * 1000:>7.0f}ms{total / 1000:>8.0f}ms{cli_us / 1000:>8.0f}ms")
+
+    for command, _, _, top_level in rows if args.top else ():
+        print(f"\nSlowest top-level imports: psm {command}")
+        for name, micros in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+            print(f"  {micros / 1000:>8.1f}ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
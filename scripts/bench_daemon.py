@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark command latency: cold CLI process vs `psm serve` daemon.
+
+Builds a database with a synthetic catalog and library, starts `psm serve` on
+it, then times each command three ways:
+  cold    - `python -m psm.cli <cmd>` (fresh process, imports, catalog load)
+  client  - `python -m psm.daemon <cmd>` (thin client process -> daemon)
+  call    - DaemonClient.run() from an already running process (the GUI path)
+
+Usage:
+    python scripts/bench_daemon.py
+    python scripts/bench_daemon.py --tracks 50000 --runs 5
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from psm.daemon import DaemonClient, find_daemon  # noqa: E402
+from psm.db import Database  # noqa: E402
+
+COMMANDS = (["config", "--section", "database"], ["match", "--track-id", "t0"])
+
+
+def populate(db: Database, tracks: int) -> None:
+    for i in range(tracks):
+        track = {
+            "id": f"t{i}",
+            "name": f"Song {i}",
+            "artist": f"Artist {i % 500}",
+            "album": f"Album {i % 2000}",
+            "year": 1960 + i % 60,
+            "duration_ms": 120_000 + (i * 7919) % 300_000,
+            "normalized": f"song {i} artist {i % 500}",
+        }
+        db.upsert_track(track, provider="spotify")
+        db.add_library_file(
+            {
+                "path": f"/music/{i}.mp3",
+                "title": track["name"],
+                "artist": track["artist"],
+                "album": track["album"],
+                "duration": track["duration_ms"] / 1000,
+                "normalized": track["normalized"],
+                "size": 1,
+                "mtime": 1.0,
+            }
+        )
+    db.commit()
+
+
+def time_process(cmd: list, env: dict, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=env, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def time_call(client: DaemonClient, args: list, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        client.run(args, on_line=lambda line: None)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=20000, help="Tracks (and library files) (default 20000)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per command and mode (default 3)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "db" / "psm.db"
+        with Database(db_path) as db:
+            populate(db, args.tracks)
+
+        env = dict(os.environ, PSM__DATABASE__PATH=str(db_path), PSM_SKIP_FIRST_RUN_CHECK="1")
+        env["PSM__REPORTS__DIRECTORY"] = str(Path(tmp) / "reports")
+        os.environ.update({k: v for k, v in env.items() if k.startswith("PSM")})
+        config = {"database": {"path": str(db_path)}}
+
+        server = subprocess.Popen(
+            [sys.executable, "-m", "psm.cli", "serve"],
+            env=env,
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            info = None
+            deadline = time.time() + 60
+            while info is None and time.time() < deadline:
+                time.sleep(0.2)
+                info = find_daemon(config)
+            if info is None:
+                print("daemon did not start")
+                return 1
+            client = DaemonClient(info)
+
+            print(f"Catalog: {args.tracks} tracks / files, median of {args.runs} runs")
+            print(f"  {'command':<28}{'cold CLI':>10}{'client':>10}{'call':>10}")
+            for command in COMMANDS:
+                cold = time_process([sys.executable, "-m", "psm.cli", *command], env, args.runs)
+                thin = time_process([sys.executable, "-m", "psm.daemon", *command], env, args.runs)
+                call = time_call(client, command, args.runs)
+                print(f"  {' '.join(command):<28}{cold * 1000:>8.0f}ms{thin * 1000:>8.0f}ms{call * 1000:>8.0f}ms")
+            client.shutdown()
+            server.wait(timeout=10)
+        finally:
+            if server.poll() is None:
+                server.kill()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Benchmark playlist export on a synthetic library.
+
+Builds a database with many playlists, a catalog and matched library files,
+then times the export data source (one query per playlist vs the single
+streamed query) and full `export_playlists()` runs into a temporary
+directory: the first one writes every file, repeats find them unchanged.
+With --latency-ms, each playlist file access is delayed to emulate a
+network export target, and serial export is compared with --workers.
+
+Usage:
+    python scripts/bench_export.py
+    python scripts/bench_export.py --playlists 1200 --playlist-size 50 --mode placeholders
+    python scripts/bench_export.py --latency-ms 5 --workers 8
+"""
+
+import argparse
+import logging
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from psm.db import Database  # noqa: E402
+from psm.export import playlists  # noqa: E402
+from psm.services.export_service import export_playlists  # noqa: E402
+
+
+def populate(conn: sqlite3.Connection, tracks: int, playlists: int, playlist_size: int) -> None:
+    conn.executemany(
+        "INSERT INTO tracks(id, provider, name, artist, album, duration_ms, normalized) VALUES(?, 'spotify', ?, ?, ?, ?, ?)",
+        (
+            (f"t{i}", f"Song {i}", f"Artist {i % 500}", f"Album {i % 2000}", 180_000 + i % 60_000, f"song {i}")
+            for i in range(tracks)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO library_files(id, path, title, artist, size, mtime) VALUES(?, ?, ?, ?, 1, 1.0)",
+        ((i, f"/music/Artist {i % 500}/{i}.mp3", f"Song {i}", f"Artist {i % 500}") for i in range(tracks)),
+    )
+    conn.executemany(
+        "INSERT INTO matches(track_id, provider, file_id, score, method, confidence) VALUES(?, 'spotify', ?, 0.9, 'score:HIGH', 'HIGH')",
+        ((f"t{i}", i) for i in range(tracks) if i % 5),  # 80% of tracks matched
+    )
+    conn.executemany(
+        "INSERT INTO playlists(id, provider, name, owner_id, owner_name) VALUES(?, 'spotify', ?, ?, ?)",
+        ((f"p{p}", f"Playlist {p}", f"u{p % 20}", f"Owner {p % 20}") for p in range(playlists)),
+    )
+    conn.executemany(
+        "INSERT INTO playlist_tracks(playlist_id, provider, position, track_id) VALUES(?, 'spotify', ?, ?)",
+        (
+            (f"p{p}", pos, f"t{(p * 7919 + pos * 31) % tracks}")
+            for p in range(playlists)
+            for pos in range(playlist_size)
+        ),
+    )
+    conn.commit()
+
+
+def inject_latency(seconds: float) -> None:
+    real_write = playlists.write_m3u
+
+    def slow_write(path, lines, stats=None):
+        time.sleep(seconds)  # One round trip to compare with / replace the file on the share
+        return real_write(path, lines, stats)
+
+    playlists.write_m3u = slow_write
+
+
+def timed(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=50000, help="Catalog and library size (default 50000)")
+    parser.add_argument("--playlists", type=int, default=1200, help="Playlists (default 1200)")
+    parser.add_argument("--playlist-size", type=int, default=50, help="Tracks per playlist (default 50)")
+    parser.add_argument("--mode", default="strict", choices=["strict", "mirrored", "placeholders"], help="Export mode")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per measurement (default 3)")
+    parser.add_argument("--workers", type=int, default=4, help="export.workers for the parallel run (default 4)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Injected delay per playlist file (default 0)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    if args.latency_ms:
+        inject_latency(args.latency_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "psm.db")
+        populate(db.conn, args.tracks, args.playlists, args.playlist_size)
+
+        def per_playlist():
+            for pl in db.list_playlists(provider="spotify"):
+                db.get_playlist_tracks_with_local_paths(pl["id"], provider="spotify")
+
+        def streamed():
+            for _ in db.iter_playlists_with_local_paths(provider="spotify"):
+                pass
+
+        library_paths = ["/mnt/nas/music", "/music"]  # Exercise library-root path reconstruction
+
+        def export(workers: int):
+            export_config = {
+                "directory": str(Path(tmp) / f"export-{workers}"),
+                "mode": args.mode,
+                "include_liked_songs": False,
+                "detect_obsolete": False,
+                "workers": workers,
+            }
+            return lambda: export_playlists(db, export_config, organize_by_owner=True, library_paths=library_paths)
+
+        query_before = timed(per_playlist, args.runs)
+        query_after = timed(streamed, args.runs)
+        exports = {}
+        for workers in sorted({1, args.workers}):
+            first = timed(export(workers), 1)
+            exports[workers] = (first, timed(export(workers), args.runs))
+        db.close()
+
+    print(f"Library: {args.tracks} tracks, {args.playlists} playlists x {args.playlist_size} ({args.mode})")
+    if args.latency_ms:
+        print(f"  {args.latency_ms} ms injected latency per playlist file")
+    print(f"  data source, one query per playlist: {query_before * 1000:8.1f} ms")
+    print(f"  data source, single streamed query:  {query_after * 1000:8.1f} ms")
+    for workers, (first, repeat) in exports.items():
+        print(f"  export_playlists(), {workers} worker(s), all written:   {first * 1000:8.1f} ms")
+        print(f"  export_playlists(), {workers} worker(s), all unchanged: {repeat * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
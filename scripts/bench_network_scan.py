@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark serial, parallel-roots and network-mode (concurrent prefetch) library scans.
+
+Creates a synthetic library split across one or more roots and injects a
+fixed delay into every directory listing and tag read to mimic the
+per-operation round trips of an SMB/NFS share, then scans it with each mode
+into fresh databases.
+
+Usage:
+    python scripts/bench_network_scan.py
+    python scripts/bench_network_scan.py --files 2000 --latency-ms 5 --max-concurrency 64
+    python scripts/bench_network_scan.py --roots 3
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from psm.config import load_config  # noqa: E402
+from psm.db import Database  # noqa: E402
+from psm.ingest import library  # noqa: E402
+
+
+def build_corpus(root: Path, files: int, per_dir: int) -> None:
+    for i in range(files):
+        album = root / f"artist{i // (per_dir * 5)}" / f"album{i // per_dir}"
+        album.mkdir(parents=True, exist_ok=True)
+        (album / f"{i:05d} - Track {i}.mp3").write_bytes(b"\x00" * 2048)
+
+
+def inject_latency(seconds: float) -> None:
+    real_scandir = os.scandir
+    real_read = library.read_file_metadata
+
+    def slow_scandir(path="."):
+        time.sleep(seconds)
+        return real_scandir(path)
+
+    def slow_read(cfg, p, use_year):
+        time.sleep(seconds)
+        return real_read(cfg, p, use_year)
+
+    os.scandir = slow_scandir
+    library.read_file_metadata = slow_read
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500, help="Number of files (default 500)")
+    parser.add_argument("--per-dir", type=int, default=12, help="Files per album directory (default 12)")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Injected delay per listing/read (default 2)")
+    parser.add_argument("--roots", type=int, default=1, help="Number of library roots (default 1)")
+    parser.add_argument("--min-concurrency", type=int, default=4)
+    parser.add_argument("--max-concurrency", type=int, default=32)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # Keep scan progress lines out of the report
+
+    with tempfile.TemporaryDirectory() as tmp:
+        roots = [Path(tmp) / f"music{i}" for i in range(args.roots)]
+        for root in roots:
+            build_corpus(root, args.files // args.roots, args.per_dir)
+        inject_latency(args.latency_ms / 1000)
+
+        cfg = load_config()
+        cfg["library"].update(
+            paths=[str(root) for root in roots],
+            min_concurrency=args.min_concurrency,
+            max_concurrency=args.max_concurrency,
+        )
+        print(
+            f"Corpus: {args.files} files in {args.roots} root(s), "
+            f"{args.latency_ms} ms injected latency per listing/read"
+        )
+        modes = ["serial", "roots", "network"] if args.roots > 1 else ["serial", "network"]
+        for mode in modes:
+            cfg["library"]["network_mode"] = mode == "network"
+            cfg["library"]["parallel_roots"] = mode != "serial"
+            with Database(Path(tmp) / f"{mode}.db") as db:
+                result = library._scan_library_internal(db, cfg, cfg["library"])
+            rate = result.files_seen / result.duration_seconds
+            print(f"{mode:<8}{result.duration_seconds:>8.2f}s{rate:>10.0f} files/s")
+            for stats in result.root_stats.values():
+                print(f"    {Path(stats.path).name}: {stats.files_seen} files in {stats.duration_seconds:.2f}s")
+            if result.phase_timings is not None:
+                for line in result.phase_timings.summary_lines():
+                    print(f"    {line}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
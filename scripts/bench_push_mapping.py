@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark mapping an exported M3U back to track IDs for `psm playlist push`.
+
+Builds a database with N matched tracks (a share of the files matched to
+several tracks), writes an N-line M3U and times parsing it and resolving its
+paths to track IDs.
+
+Usage:
+    python scripts/bench_push_mapping.py
+    python scripts/bench_push_mapping.py --lines 50000 --runs 3
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from psm.db import Database  # noqa: E402
+from psm.push.m3u_parser import parse_m3u_paths  # noqa: E402
+from psm.services.push_service import _map_paths_to_track_ids  # noqa: E402
+
+
+def populate(db: Database, music: Path, lines: int) -> list[str]:
+    paths = [str(music / f"Artist {i % 100}" / f"{i:06d}.mp3") for i in range(lines)]
+    db.conn.executemany(
+        "INSERT INTO tracks(id, provider, name, artist, normalized) VALUES(?, 'spotify', ?, 'A', ?)",
+        ((f"t{i}", str(i), str(i)) for i in range(lines)),
+    )
+    db.conn.executemany(
+        "INSERT INTO library_files(id, path, title, size, mtime) VALUES(?, ?, ?, 1, 1.0)",
+        ((i + 1, path, str(i)) for i, path in enumerate(paths)),
+    )
+    db.conn.executemany(
+        "INSERT INTO matches(track_id, provider, file_id, score, method, confidence) VALUES(?, 'spotify', ?, 0.9, 'score:HIGH', 'HIGH')",
+        ((f"t{i}", i + 1) for i in range(lines)),
+    )
+    # Every tenth file is also a weaker match for a neighbouring track (alternate release)
+    db.conn.executemany(
+        "INSERT INTO matches(track_id, provider, file_id, score, method, confidence) VALUES(?, 'spotify', ?, 0.5, 'score:LOW', 'LOW')",
+        ((f"t{i + 1}", i + 1) for i in range(0, lines - 1, 10)),
+    )
+    db.conn.executemany(
+        "INSERT INTO playlist_tracks(playlist_id, provider, position, track_id) VALUES('pl', 'spotify', ?, ?)",
+        ((i, f"t{i}") for i in range(lines)),
+    )
+    db.commit()
+    return paths
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=10_000, help="M3U lines / matched tracks (default 10000)")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs, best reported (default 5)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        music = Path(tmp).resolve() / "music"
+        with Database(Path(tmp) / "psm.db") as db:
+            paths = populate(db, music, args.lines)
+            m3u = Path(tmp) / "pl.m3u"
+            m3u.write_text("#EXTM3U\n" + "\n".join(paths) + "\n", encoding="utf-8")
+
+            parse_s, map_s = [], []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                parsed = parse_m3u_paths(m3u)
+                parse_s.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                track_ids, unresolved = _map_paths_to_track_ids(db, parsed, "pl")
+                map_s.append(time.perf_counter() - start)
+            assert unresolved == 0 and len(track_ids) == args.lines
+
+    print(f"M3U with {args.lines} lines (best of {args.runs})")
+    print(f"  parse: {min(parse_s) * 1000:.0f} ms")
+    print(f"  map paths to tracks: {min(map_s) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark a library rebuild (fresh database) with and without the tag cache.
+
+Generates tagged MP3/FLAC files, scans them into a new database to warm the
+sidecar tag cache, then deletes the database and rescans with the tag cache
+disabled (every file parsed, with mutagen and with the fast reader) and enabled.
+
+Usage:
+    python scripts/bench_tag_cache.py
+    python scripts/bench_tag_cache.py --files 2000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_tag_reader import write_flac, write_mp3  # noqa: E402
+from psm.config import load_config  # noqa: E402
+from psm.db import Database  # noqa: E402
+from psm.ingest.library import _scan_library_internal  # noqa: E402
+
+
+def rebuild(cfg, db_path: Path):
+    if db_path.exists():
+        db_path.unlink()
+    start = time.perf_counter()
+    with Database(db_path) as db:
+        result = _scan_library_internal(db, cfg, cfg["library"])
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000, help="Files per format (default 1000)")
+    parser.add_argument("--art-kb", type=int, default=64, help="Embedded cover art size in KB (default 64)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    art = b"\xff" * (args.art_kb * 1024)
+    with tempfile.TemporaryDirectory() as tmp:
+        music = Path(tmp) / "music"
+        music.mkdir()
+        for i in range(args.files):
+            write_mp3(music / f"{i:05d}.mp3", i, art)
+            write_flac(music / f"{i:05d}.flac", i, art)
+
+        cfg = load_config()
+        cfg["library"].update(paths=[str(music)], extensions=[".mp3", ".flac"])
+        db_path = Path(tmp) / "db" / "psm.db"
+        rebuild(cfg, db_path)  # warm the cache
+
+        print(f"Corpus: {args.files * 2} files ({args.art_kb} KB cover art each)")
+        modes = (
+            ("mutagen, no cache", False, False),
+            ("fast tags, no cache", True, False),
+            ("tag cache", True, True),
+        )
+        for label, fast_tags, cache in modes:
+            cfg["library"].update(fast_tags=fast_tags, tag_cache=cache)
+            elapsed, result = rebuild(cfg, db_path)
+            print(f"{label:<22}{elapsed:>8.2f}s  ({result.tag_cache_hits} cache hits)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
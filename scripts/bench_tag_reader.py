@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark the header-only tag reader against mutagen.
+
+Generates a synthetic corpus of tagged MP3 (ID3v2.3 + Xing, with embedded
+cover art) and FLAC (STREAMINFO + VORBIS_COMMENT + PICTURE) files, then times
+per-file metadata extraction with both readers.
+
+Usage:
+    python scripts/bench_tag_reader.py
+    python scripts/bench_tag_reader.py --files 2000 --art-kb 200
+"""
+
+import argparse
+import statistics
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mutagen  # noqa: E402
+
+from psm.ingest.library import extract_tags  # noqa: E402
+from psm.ingest.tag_reader import read_fast_tags  # noqa: E402
+
+MPEG_FRAME_HEADER = b"\xff\xfb\x90\x00"  # MPEG1 Layer III, 128 kbps, 44.1 kHz, stereo
+MPEG_FRAME_LEN = 417
+
+
+def _syncsafe(n: int) -> bytes:
+    return bytes([(n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F])
+
+
+def _id3_frame(frame_id: bytes, payload: bytes) -> bytes:
+    return frame_id + struct.pack(">I", len(payload)) + b"\x00\x00" + payload
+
+
+def write_mp3(path: Path, idx: int, art: bytes, frames: int = 300) -> None:
+    body = b"".join(
+        [
+            _id3_frame(b"TIT2", b"\x03" + f"Song {idx}".encode()),
+            _id3_frame(b"TPE1", b"\x03" + f"Artist {idx % 50}".encode()),
+            _id3_frame(b"TALB", b"\x03" + f"Album {idx % 200}".encode()),
+            _id3_frame(b"TYER", b"\x032015"),
+            _id3_frame(b"APIC", b"\x00image/jpeg\x00\x03\x00" + art),
+        ]
+    )
+    tag = b"ID3\x03\x00\x00" + _syncsafe(len(body)) + body
+    xing = MPEG_FRAME_HEADER + b"\x00" * 32 + b"Xing" + struct.pack(">III", 3, frames, frames * MPEG_FRAME_LEN)
+    audio = xing + b"\x00" * (MPEG_FRAME_LEN - len(xing))
+    audio += (MPEG_FRAME_HEADER + b"\x00" * (MPEG_FRAME_LEN - 4)) * frames
+    path.write_bytes(tag + audio)
+
+
+def write_flac(path: Path, idx: int, art: bytes) -> None:
+    packed = (44100 << 44) | (1 << 41) | (15 << 36) | (44100 * 180)
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\x00" * 6 + packed.to_bytes(8, "big") + b"\x00" * 16
+    comments = [f"TITLE=Song {idx}".encode(), f"ARTIST=Artist {idx % 50}".encode(), b"ALBUM=Album", b"DATE=2015"]
+    vc = struct.pack("<I", 3) + b"psm" + struct.pack("<I", len(comments))
+    vc += b"".join(struct.pack("<I", len(c)) + c for c in comments)
+    mime = b"image/jpeg"
+    picture = struct.pack(">II", 3, len(mime)) + mime + struct.pack(">IIIIII", 0, 1, 1, 24, 0, len(art)) + art
+    blocks = b"\x00" + len(streaminfo).to_bytes(3, "big") + streaminfo
+    blocks += b"\x06" + len(picture).to_bytes(3, "big") + picture
+    blocks += b"\x84" + len(vc).to_bytes(3, "big") + vc
+    path.write_bytes(b"fLaC" + blocks + b"\x00" * 100_000)
+
+
+def _time_reader(files, reader) -> list:
+    samples = []
+    for p in files:
+        t0 = time.perf_counter()
+        audio = reader(p)
+        extract_tags(audio)
+        _ = audio.info.length if audio else None
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500, help="Files per format (default 500)")
+    parser.add_argument("--art-kb", type=int, default=64, help="Embedded cover art size in KB (default 64)")
+    parser.add_argument("--rounds", type=int, default=3, help="Timing rounds; best round is reported")
+    args = parser.parse_args()
+
+    art = b"\xff" * (args.art_kb * 1024)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        corpus = {"mp3": [], "flac": []}
+        for i in range(args.files):
+            mp3 = root / f"{i:05d}.mp3"
+            write_mp3(mp3, i, art)
+            corpus["mp3"].append(mp3)
+            flac = root / f"{i:05d}.flac"
+            write_flac(flac, i, art)
+            corpus["flac"].append(flac)
+
+        print(f"Corpus: {args.files} MP3 + {args.files} FLAC, {args.art_kb} KB cover art each")
+        print(f"{'format':<8}{'reader':<10}{'median µs':>12}{'p95 µs':>12}{'files/s':>12}")
+        for fmt, files in corpus.items():
+            for name, reader in (("mutagen", mutagen.File), ("fast", read_fast_tags)):
+                best = None
+                for _ in range(args.rounds):
+                    samples = _time_reader(files, reader)
+                    if best is None or sum(samples) < sum(best):
+                        best = samples
+                median = statistics.median(best) * 1e6
+                p95 = sorted(best)[int(len(best) * 0.95) - 1] * 1e6
+                rate = len(best) / sum(best)
+                print(f"{fmt:<8}{name:<10}{median:>12.1f}{p95:>12.1f}{rate:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
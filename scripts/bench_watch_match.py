@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark watch-mode matching latency with and without the warm match index.
+
+Builds a database with a synthetic catalog and library, then repeatedly adds
+one new file and matches it, as watch mode does for a single file drop: once
+through the cold path (all tracks reloaded from SQLite per event) and once
+through a WarmMatchIndex kept alive across events.
+
+Usage:
+    python scripts/bench_watch_match.py
+    python scripts/bench_watch_match.py --tracks 50000 --events 20
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from psm.config import load_config  # noqa: E402
+from psm.db import Database  # noqa: E402
+from psm.services.match_service import WarmMatchIndex, match_changed_files  # noqa: E402
+
+
+def populate(db: Database, tracks: int) -> None:
+    for i in range(tracks):
+        db.upsert_track(
+            {
+                "id": f"t{i}",
+                "name": f"Song {i}",
+                "artist": f"Artist {i % 500}",
+                "album": f"Album {i % 2000}",
+                "year": 1960 + i % 60,
+                "duration_ms": 120_000 + (i * 7919) % 300_000,
+                "normalized": f"song {i} artist {i % 500}",
+            },
+            provider="spotify",
+        )
+    db.commit()
+
+
+def add_file(db: Database, n: int) -> int:
+    path = f"/music/new/{n}.mp3"
+    db.add_library_file(
+        {
+            "path": path,
+            "title": f"Song {n}",
+            "artist": f"Artist {n % 500}",
+            "album": f"Album {n % 2000}",
+            "duration": (120_000 + (n * 7919) % 300_000) / 1000,
+            "normalized": f"song {n} artist {n % 500}",
+            "size": 1,
+            "mtime": 1.0,
+        }
+    )
+    db.commit()
+    return db.conn.execute("SELECT id FROM library_files WHERE path=?", (path,)).fetchone()["id"]
+
+
+def run(cfg, db_path: Path, events: int, offset: int, index: WarmMatchIndex | None) -> list:
+    latencies = []
+    for n in range(offset, offset + events):
+        with Database(db_path) as db:  # watch mode opens the database per event
+            file_id = add_file(db, n)
+            start = time.perf_counter()
+            match_changed_files(db, cfg, file_ids=[file_id], index=index)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=20000, help="Catalog size (default 20000)")
+    parser.add_argument("--events", type=int, default=10, help="Single-file events per mode (default 10)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    cfg = load_config()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "psm.db"
+        with Database(db_path) as db:
+            populate(db, args.tracks)
+
+        cold = run(cfg, db_path, args.events, 0, None)
+        index = WarmMatchIndex(cfg)
+        with Database(db_path) as db:
+            start = time.perf_counter()
+            index.ensure_fresh(db)
+            load = time.perf_counter() - start
+        warm = run(cfg, db_path, args.events, args.events, index)
+
+    print(f"Catalog: {args.tracks} tracks, {args.events} single-file events per mode")
+    print(f"  cold (reload per event): median {statistics.median(cold) * 1000:8.1f} ms")
+    print(f"  warm index:              median {statistics.median(warm) * 1000:8.1f} ms (one-time load {load:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
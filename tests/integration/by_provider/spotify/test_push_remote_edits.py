@@ -0,0 +1,180 @@
+"""Push against a local mock of the Spotify Web API: minimal edits, snapshot chaining, call counts."""
+
+from __future__ import annotations
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from psm.db import Database
+from psm.providers.spotify import SpotifyAPIClient
+from psm.services.push_service import push_playlist
+
+
+class MockSpotify(ThreadingHTTPServer):
+    """In-memory playlist with Spotify's track endpoints; stale snapshot IDs are rejected."""
+
+    def __init__(self, track_ids: list[str]):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.tracks = list(track_ids)
+        self.version = 0
+        self.writes: list[str] = []
+        self.edit_during_listing: list[str] = []  # Inserted at the top right after the first page is served
+
+    @property
+    def snapshot(self) -> str:
+        return f"snap-{self.version}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: MockSpotify
+
+    def log_message(self, format, *args):  # Keep test output quiet
+        pass
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> dict:
+        return json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+    def _write(self, kind: str, body: dict) -> bool:
+        if body.get("snapshot_id", self.server.snapshot) != self.server.snapshot:
+            self._reply(400, {"error": {"status": 400, "message": "stale snapshot_id"}})
+            return False
+        self.server.writes.append(kind)
+        return True
+
+    def _done(self) -> None:
+        self.server.version += 1
+        self._reply(200, {"snapshot_id": self.server.snapshot})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/v1/playlists/pl1":
+            owner = {"id": "me", "display_name": "Me"}
+            return self._reply(200, {"id": "pl1", "name": "Big", "snapshot_id": self.server.snapshot, "owner": owner})
+        query = parse_qs(url.query)
+        offset, limit = int(query["offset"][0]), int(query["limit"][0])
+        page = self.server.tracks[offset : offset + limit]
+        self._reply(200, {"items": [{"track": {"id": tid}} for tid in page]})
+        if self.server.edit_during_listing:  # Another client edits the playlist mid-listing
+            self.server.tracks[:0] = self.server.edit_during_listing
+            self.server.edit_during_listing = []
+            self.server.version += 1
+
+    def do_PUT(self):
+        body = self._body()
+        tracks = self.server.tracks
+        if "uris" in body:
+            if self._write("replace", {}):
+                tracks[:] = [uri.rsplit(":", 1)[1] for uri in body["uris"]]
+                self._done()
+        elif self._write("reorder", body):
+            start, length, before = body["range_start"], body.get("range_length", 1), body["insert_before"]
+            block = tracks[start : start + length]
+            del tracks[start : start + length]
+            dest = before - length if before > start else before
+            tracks[dest:dest] = block
+            self._done()
+
+    def do_POST(self):
+        body = self._body()
+        if self._write("add", {}):
+            position = body.get("position", len(self.server.tracks))
+            self.server.tracks[position:position] = [uri.rsplit(":", 1)[1] for uri in body["uris"]]
+            self._done()
+
+    def do_DELETE(self):
+        body = self._body()
+        if self._write("remove", body):
+            drop = {t["uri"].rsplit(":", 1)[1] for t in body["tracks"]}
+            self.server.tracks[:] = [tid for tid in self.server.tracks if tid not in drop]
+            self._done()
+
+
+@pytest.fixture
+def mock_spotify(monkeypatch):
+    monkeypatch.delenv("PSM__TEST__MODE", raising=False)  # Talk to the mock server, not the client's stubs
+    servers = []
+
+    def start(track_ids):
+        server = MockSpotify(track_ids)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        client = SpotifyAPIClient("token", api_base=f"http://127.0.0.1:{server.server_address[1]}/v1")
+        return server, client
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _db_with_playlist(tmp_path: Path, track_ids: list[str]) -> Database:
+    db = Database(tmp_path / "test.db")
+    db.set_meta("current_user_id", "me")
+    db.upsert_playlist("pl1", "Big", snapshot_id="s1", owner_id="me", owner_name="Me", provider="spotify")
+    db.replace_playlist_tracks("pl1", [(i, tid, None) for i, tid in enumerate(track_ids)], provider="spotify")
+    db.commit()
+    return db
+
+
+def test_single_reorder_costs_one_call(tmp_path: Path, mock_spotify):
+    remote = [f"t{i}" for i in range(3000)]
+    desired = remote[:]
+    desired.insert(2000, desired.pop(5))
+    server, client = mock_spotify(remote)
+    with _db_with_playlist(tmp_path, desired) as db:
+        preview = push_playlist(db=db, playlist_id="pl1", client=client, apply=True)
+
+    assert (preview.applied, preview.incremental, preview.api_calls) == (True, True, 1)
+    assert server.writes == ["reorder"]
+    assert server.tracks == desired
+
+
+def test_mixed_edits_chain_snapshots(tmp_path: Path, mock_spotify):
+    remote = [f"t{i}" for i in range(400)] + ["dup", "dup"]
+    desired = ["new0"] + remote[:50] + remote[300:310] + remote[50:300] + ["dup"] + [f"new{i}" for i in range(1, 120)]
+    server, client = mock_spotify(remote)
+    with _db_with_playlist(tmp_path, desired) as db:
+        preview = push_playlist(db=db, playlist_id="pl1", client=client, apply=True)
+
+    assert preview.incremental and preview.api_calls == len(server.writes) < 6
+    assert server.writes[0] == "remove"  # Every later write carried the chained snapshot_id
+    assert server.tracks == desired
+
+
+def test_falls_back_to_full_replace_when_cheaper(tmp_path: Path, mock_spotify):
+    remote = [f"t{i}" for i in range(250)]
+    desired = remote[::-1]
+    server, client = mock_spotify(remote)
+    with _db_with_playlist(tmp_path, desired) as db:
+        preview = push_playlist(db=db, playlist_id="pl1", client=client, apply=True)
+
+    assert (preview.incremental, preview.api_calls) == (False, 4)
+    assert server.writes == ["replace", "add", "add", "add"]
+    assert server.tracks == desired
+
+
+def test_edit_during_listing_is_planned_against_a_consistent_snapshot(tmp_path: Path, mock_spotify):
+    remote = [f"t{i}" for i in range(300)]
+    desired = remote[:]
+    desired.insert(250, desired.pop(5))
+    server, client = mock_spotify(remote)
+    server.edit_during_listing = ["intruder"]
+    with _db_with_playlist(tmp_path, desired) as db:
+        preview = push_playlist(db=db, playlist_id="pl1", client=client, apply=True)
+
+    # The mixed-version listing is discarded; the plan covers the intruder too
+    assert (preview.applied, preview.incremental, preview.current_count) == (True, True, 301)
+    assert server.writes == ["remove", "reorder"]
+    assert server.tracks == desired
@@ -0,0 +1,73 @@
+"""best_match table: maintained by triggers as matches change, rebuilt for existing databases."""
+
+from pathlib import Path
+
+from psm.db import Database
+
+
+def _add_files(db: Database, count: int) -> None:
+    for i in range(1, count + 1):
+        db.add_library_file(
+            {"path": f"/music/{i}.mp3", "title": f"Song {i}", "normalized": f"song {i}", "size": 1, "mtime": 1.0}
+        )
+
+
+def _best(db: Database, track_id: str = "t1"):
+    row = db.conn.execute(
+        "SELECT file_id, score, confidence FROM best_match WHERE track_id = ? AND provider = 'spotify'", (track_id,)
+    ).fetchone()
+    return tuple(row) if row else None
+
+
+def test_best_match_follows_match_changes(tmp_path: Path):
+    with Database(tmp_path / "db.sqlite") as db:
+        _add_files(db, 3)
+        db.add_match("t1", 1, 0.80, "score:MEDIUM", provider="spotify", confidence="MEDIUM")
+        assert _best(db) == (1, 0.80, "MEDIUM")
+
+        db.add_match("t1", 2, 0.95, "score:HIGH", provider="spotify", confidence="HIGH")
+        assert _best(db) == (2, 0.95, "HIGH")
+
+        # MANUAL overrides win regardless of score
+        db.add_match("t1", 3, 0.50, "manual", provider="spotify", confidence="MANUAL")
+        assert _best(db) == (3, 0.50, "MANUAL")
+
+        db.conn.execute("DELETE FROM matches WHERE file_id = 3")
+        assert _best(db) == (2, 0.95, "HIGH")
+
+        db.add_match("t1", 1, 0.99, "score:CERTAIN", provider="spotify", confidence="CERTAIN")  # upsert
+        assert _best(db) == (1, 0.99, "CERTAIN")
+
+        db.delete_matches_by_track_ids(["t1"])
+        assert _best(db) is None
+
+
+def test_export_queries_use_best_match(tmp_path: Path):
+    with Database(tmp_path / "db.sqlite") as db:
+        _add_files(db, 2)
+        db.upsert_track({"id": "t1", "name": "Song", "artist": "A", "normalized": "song a"}, provider="spotify")
+        db.upsert_playlist("p1", "Playlist", "snap", provider="spotify")
+        db.replace_playlist_tracks("p1", [(0, "t1", None)], provider="spotify")
+        db.add_match("t1", 1, 0.95, "score:HIGH", provider="spotify", confidence="HIGH")
+        db.add_match("t1", 2, 0.70, "manual", provider="spotify", confidence="MANUAL")
+        db.commit()
+
+        rows = db.get_playlist_tracks_with_local_paths("p1", provider="spotify")
+        assert [row["local_path"] for row in rows] == ["/music/2.mp3"]
+        assert db.get_match_for_track("t1", provider="spotify")["path"] == "/music/2.mp3"
+
+
+def test_existing_database_is_backfilled(tmp_path: Path):
+    db_path = tmp_path / "db.sqlite"
+    with Database(db_path) as db:
+        _add_files(db, 2)
+        db.add_match("t1", 1, 0.90, "score:HIGH", provider="spotify", confidence="HIGH")
+        db.add_match("t2", 2, 0.80, "score:MEDIUM", provider="spotify", confidence="MEDIUM")
+        # Simulate a database written before best_match existed
+        db.conn.execute("DELETE FROM best_match")
+        db.conn.execute("DELETE FROM meta WHERE key = 'best_match_built'")
+        db.commit()
+
+    with Database(db_path) as db:
+        assert _best(db, "t1") == (1, 0.90, "HIGH")
+        assert _best(db, "t2") == (2, 0.80, "MEDIUM")
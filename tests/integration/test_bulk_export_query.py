@@ -0,0 +1,43 @@
+"""Bulk export source: one streamed query yields every playlist with its tracks."""
+
+from pathlib import Path
+
+from psm.db import Database
+
+
+def _populate(db: Database) -> None:
+    for i in range(1, 5):
+        db.upsert_track({"id": f"t{i}", "name": f"Song {i}", "artist": "A", "normalized": f"song {i}"}, "spotify")
+        db.add_library_file({"path": f"/music/{i}.mp3", "title": f"Song {i}", "size": 1, "mtime": 1.0})
+    db.add_match("t1", 1, 0.9, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.add_match("t3", 3, 0.9, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.upsert_playlist("pb", "Beta", "s", owner_id="u1", owner_name="Alice", provider="spotify")
+    db.upsert_playlist("pa", "Alpha", "s", owner_id="u1", owner_name="Alice", provider="spotify")
+    db.upsert_playlist("pc", "Gamma", "s", owner_id="u2", owner_name="Bob", provider="spotify")
+    db.upsert_playlist("pe", "Empty", "s", owner_id="u2", owner_name="Bob", provider="spotify")
+    db.replace_playlist_tracks("pa", [(0, "t3", None), (1, "t1", None), (2, "t2", None)], provider="spotify")
+    db.replace_playlist_tracks("pb", [(0, "t4", None)], provider="spotify")
+    db.replace_playlist_tracks("pc", [(0, "t1", None), (1, "t1", None)], provider="spotify")
+    db.commit()
+
+
+def test_stream_matches_per_playlist_queries(tmp_path: Path):
+    with Database(tmp_path / "db.sqlite") as db:
+        _populate(db)
+        streamed = list(db.iter_playlists_with_local_paths(provider="spotify"))
+
+        assert sorted(pl["id"] for pl, _ in streamed) == ["pa", "pb", "pc", "pe"]
+        assert {pl["id"]: pl for pl, _ in streamed} == {pl["id"]: pl for pl in db.list_playlists(provider="spotify")}
+        for pl, tracks in streamed:
+            assert tracks == db.get_playlist_tracks_with_local_paths(pl["id"], provider="spotify")
+
+        by_id = {pl["id"]: tracks for pl, tracks in streamed}
+        assert by_id["pe"] == []
+        assert [t["local_path"] for t in by_id["pa"]] == ["/music/3.mp3", "/music/1.mp3", None]
+
+
+def test_stream_filters_playlist_ids(tmp_path: Path):
+    with Database(tmp_path / "db.sqlite") as db:
+        _populate(db)
+        streamed = list(db.iter_playlists_with_local_paths(["pc", "pe"], provider="spotify"))
+        assert [(pl["id"], len(tracks)) for pl, tracks in streamed] == [("pc", 2), ("pe", 0)]
@@ -0,0 +1,197 @@
+"""Change journal: triggers record changed entities, consumers read them by cursor."""
+
+from __future__ import annotations
+from pathlib import Path
+from unittest.mock import patch
+
+from psm.db import Database
+from psm.services.watch_build_service import WatchBuildConfig, _handle_database_changes
+
+
+def _track(track_id, name="Song", artist="Artist"):
+    return {
+        "id": track_id,
+        "name": name,
+        "artist": artist,
+        "album": "Album",
+        "year": 2000,
+        "duration_ms": 200000,
+        "normalized": f"{name.lower()} {artist.lower()}",
+    }
+
+
+def _file(path, title="Song"):
+    return {
+        "path": path,
+        "size": 100,
+        "mtime": 1.0,
+        "title": title,
+        "artist": "Artist",
+        "album": "Album",
+        "duration": 200.0,
+        "normalized": f"{title.lower()} artist",
+    }
+
+
+def test_writes_are_journaled_by_entity(tmp_path: Path):
+    with Database(tmp_path / "psm.db") as db:
+        start = db.get_change_cursor()
+        db.upsert_track(_track("t1"), provider="spotify")
+        db.upsert_playlist("p1", "Mix", "snap1", provider="spotify")
+        db.replace_playlist_tracks("p1", [(0, "t1", None)], provider="spotify")
+        db.upsert_liked("t1", "2024-01-01T00:00:00Z", provider="spotify")
+        db.add_library_file(_file("/music/a.mp3"))
+        file_id = db.conn.execute("SELECT id FROM library_files").fetchone()["id"]
+        db.add_match("t1", file_id, 0.9, "score", provider="spotify")
+        db.commit()
+
+        changes = db.read_changes(start)
+        assert changes.cursor == db.get_change_cursor() > start
+        assert changes.tracks == {"t1"}
+        assert changes.playlists == {"p1"}
+        assert changes.liked == {"t1"}
+        assert changes.files == {file_id}
+        assert changes.matches == {"t1"}
+        assert not changes.truncated
+
+        # Nothing new after the returned cursor
+        assert db.read_changes(changes.cursor).empty
+
+
+def test_noop_upsert_is_not_journaled(tmp_path: Path):
+    with Database(tmp_path / "psm.db") as db:
+        db.upsert_track(_track("t1"), provider="spotify")
+        db.commit()
+        cursor = db.get_change_cursor()
+
+        db.upsert_track(_track("t1"), provider="spotify")  # Same data, e.g. a re-pull
+        db.commit()
+        assert db.get_change_cursor() == cursor
+
+        db.upsert_track(_track("t1", name="Renamed"), provider="spotify")
+        db.commit()
+        assert db.read_changes(cursor).tracks == {"t1"}
+
+
+def test_deletes_are_journaled(tmp_path: Path):
+    with Database(tmp_path / "psm.db") as db:
+        db.add_library_file(_file("/music/a.mp3"))
+        db.commit()
+        file_id = db.conn.execute("SELECT id FROM library_files").fetchone()["id"]
+        cursor = db.get_change_cursor()
+
+        db.conn.execute("DELETE FROM library_files WHERE id=?", (file_id,))
+        db.commit()
+        assert db.read_changes(cursor).files == {file_id}
+
+
+def test_pruned_journal_reports_truncation(tmp_path: Path):
+    with Database(tmp_path / "psm.db") as db:
+        for i in range(5):
+            db.upsert_track(_track(f"t{i}", name=f"Song {i}"), provider="spotify")
+        db.commit()
+
+        assert db.prune_change_log(retain=2) == 3
+        assert db.read_changes(0).truncated
+        recent = db.read_changes(db.get_change_cursor() - 2)
+        assert not recent.truncated
+        assert recent.tracks == {"t3", "t4"}
+        # Cursor survives pruning everything
+        cursor = db.get_change_cursor()
+        db.prune_change_log(retain=0)
+        assert db.get_change_cursor() == cursor
+
+
+@patch("psm.services.watch_build_service.write_index_page")
+@patch("psm.services.watch_build_service.write_match_reports")
+@patch("psm.services.watch_build_service._export_playlists")
+@patch("psm.services.watch_build_service.match_changed_tracks", return_value=1)
+def test_watch_handles_only_journaled_changes(mock_match_tracks, mock_export, mock_reports, mock_index, tmp_path):
+    db_path = tmp_path / "psm.db"
+    with Database(db_path) as db:
+        db.upsert_track(_track("t1"), provider="spotify")
+        db.upsert_track(_track("t2", name="Other"), provider="spotify")
+        db.upsert_playlist("p1", "Has t1", "s1", provider="spotify")
+        db.upsert_playlist("p2", "Has t2", "s2", provider="spotify")
+        db.replace_playlist_tracks("p1", [(0, "t1", None)], provider="spotify")
+        db.replace_playlist_tracks("p2", [(0, "t2", None)], provider="spotify")
+        db.commit()
+        cursor = db.get_change_cursor()
+
+        # An external pull changes t1 only
+        db.upsert_track(_track("t1", name="Remastered"), provider="spotify")
+        db.commit()
+        changes = db.read_changes(cursor)
+
+    config = {
+        "database": {"path": str(db_path)},
+        "provider": "spotify",
+        "matching": {},
+        "export": {"directory": str(tmp_path / "export")},
+        "reports": {"directory": str(tmp_path / "reports")},
+    }
+    watch_config = WatchBuildConfig(config=config, get_db_func=lambda cfg: Database(db_path))
+
+    foreign = _handle_database_changes(watch_config, changes)
+
+    assert foreign is not None and foreign.cursor >= changes.cursor and foreign.empty
+    assert mock_match_tracks.call_args.kwargs["track_ids"] == ["t1"]
+    assert mock_export.call_args.kwargs["playlist_ids"] == ["p1"]
+    assert mock_reports.call_args.kwargs["affected_playlist_ids"] == ["p1"]
+
+
+def test_exclude_own_keeps_only_other_connections_changes(tmp_path):
+    db_path = tmp_path / "psm.db"
+    with Database(db_path) as db, Database(db_path) as other:
+        cursor = db.get_change_cursor()
+        db.upsert_track(_track("mine"), provider="spotify")
+        db.commit()
+        other.upsert_track(_track("theirs"), provider="spotify")
+        other.commit()
+        db.upsert_track(_track("mine2"), provider="spotify")
+        db.commit()
+
+        assert db.read_changes(cursor).tracks == {"mine", "theirs", "mine2"}
+        own_excluded = db.read_changes(cursor, exclude_own=True)
+        assert own_excluded.tracks == {"theirs"}
+        assert own_excluded.cursor == db.get_change_cursor()
+        assert other.read_changes(cursor, exclude_own=True).tracks == {"mine", "mine2"}
+
+
+@patch("psm.services.watch_build_service.write_index_page")
+@patch("psm.services.watch_build_service.write_match_reports")
+@patch("psm.services.watch_build_service._export_playlists")
+@patch("psm.services.watch_build_service.match_changed_tracks")
+def test_watch_handler_returns_writes_committed_concurrently(
+    mock_match_tracks, mock_export, mock_reports, mock_index, tmp_path
+):
+    db_path = tmp_path / "psm.db"
+    with Database(db_path) as db:
+        cursor = db.get_change_cursor()
+        db.upsert_track(_track("t1"), provider="spotify")
+        db.commit()
+        changes = db.read_changes(cursor)
+
+    def match_while_pull_runs(db, config, track_ids, index):
+        db.upsert_track(_track("t1", name="Renamed by watch"), provider="spotify")  # Handler's own write
+        db.commit()
+        with Database(db_path) as pull:  # Another process commits mid-handler
+            pull.upsert_track(_track("t2"), provider="spotify")
+            pull.commit()
+        return 0
+
+    mock_match_tracks.side_effect = match_while_pull_runs
+    config = {
+        "database": {"path": str(db_path)},
+        "provider": "spotify",
+        "matching": {},
+        "export": {"directory": str(tmp_path / "export")},
+        "reports": {"directory": str(tmp_path / "reports")},
+    }
+    watch_config = WatchBuildConfig(config=config, get_db_func=lambda cfg: Database(db_path))
+
+    foreign = _handle_database_changes(watch_config, changes)
+
+    assert foreign is not None and foreign.tracks == {"t2"}  # Not skipped, and t1 is not handled twice
+    with Database(db_path) as db:
+        assert foreign.cursor == db.get_change_cursor()
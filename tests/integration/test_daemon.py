@@ -0,0 +1,153 @@
+"""psm serve daemon: commands run in-process over the localhost API, streaming output."""
+
+from __future__ import annotations
+import http.client
+import json
+import sys
+import threading
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from psm.daemon import DaemonClient, find_daemon, runs_locally, state_path
+from psm.daemon.server import PsmDaemon
+from psm.db import Database
+
+
+@pytest.fixture
+def daemon(test_config):
+    daemon = PsmDaemon(state_path(test_config), config=test_config)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.stop()
+    thread.join(timeout=5)
+
+
+def _run(info, args, on_event=None):
+    lines = []
+    code = DaemonClient(info, timeout=30).run(
+        args, on_line=lines.append, env={"PSM_SKIP_FIRST_RUN_CHECK": "1"}, on_event=on_event
+    )
+    return code, lines
+
+
+def test_runs_locally():
+    assert runs_locally(["build", "--watch"])
+    assert runs_locally(["gui"])
+    assert runs_locally(["--progress-interval", "5", "login"])
+    assert runs_locally(["--help"])
+    assert not runs_locally(["match", "--full"])
+    assert not runs_locally(["--no-progress", "playlist", "match", "login"])
+
+
+def test_daemon_runs_commands_and_streams_output(daemon, test_config):
+    info = find_daemon(test_config)
+    assert info is not None and info.port == daemon.port
+
+    code, lines = _run(info, ["config", "--section", "database"])
+    assert code == 0
+    assert any(test_config["database"]["path"] in line for line in lines)
+
+    code, lines = _run(info, ["no-such-command"])
+    assert code == 2
+    assert any("No such command" in line for line in lines)
+
+    assert DaemonClient(info).status()["commands_run"] == 2
+
+
+def test_daemon_match_uses_warm_index(daemon, test_config):
+    with Database(Path(test_config["database"]["path"])) as db:
+        db.upsert_track(
+            {
+                "id": "t1",
+                "name": "Take Five",
+                "artist": "Dave Brubeck",
+                "album": "Time Out",
+                "year": 1959,
+                "duration_ms": 324000,
+                "normalized": "take five dave brubeck",
+            },
+            provider="spotify",
+        )
+        db.add_library_file(
+            {
+                "path": "/music/take_five.mp3",
+                "title": "Take Five",
+                "artist": "Dave Brubeck",
+                "album": "Time Out",
+                "duration": 324.0,
+                "normalized": "take five dave brubeck",
+                "size": 1,
+                "mtime": 1.0,
+            }
+        )
+        db.commit()
+
+    info = find_daemon(test_config)
+    received = []
+    code, lines = _run(info, ["match"], on_event=received.append)
+    assert code == 0, lines
+    assert "Matched 1 tracks" in lines
+    assert [(e["type"], e["stage"]) for e in received if e["type"].startswith("stage")] == [
+        ("stage_start", "Matching tracks"),
+        ("stage_end", "Matching tracks"),
+    ]
+    assert not any('"type"' in line for line in lines)
+
+    index = daemon.match_index_for(test_config)
+    assert index.loads == 2  # tracks + files, kept for the next command
+    code, _ = _run(info, ["match", "--full"])
+    assert code == 0
+    assert index.loads == 2
+
+
+def test_daemon_rejects_bad_token_and_local_only_commands(daemon, test_config):
+    info = find_daemon(test_config)
+    with pytest.raises(ConnectionError):
+        DaemonClient(replace(info, token="wrong")).status()
+    with pytest.raises(ConnectionError):
+        DaemonClient(info).run(["build", "--watch"], on_line=lambda line: None)
+
+
+@pytest.mark.parametrize("body", [b"[]", b'"x"', b"null", b'{"args": "scan"}', b"{"])
+def test_daemon_rejects_malformed_run_body(daemon, test_config, body):
+    info = find_daemon(test_config)
+    conn = http.client.HTTPConnection(info.host, info.port, timeout=10)
+    try:
+        conn.request("POST", "/run", body=body, headers={"Authorization": f"Bearer {info.token}"})
+        response = conn.getresponse()
+        assert response.status == 400
+        assert json.loads(response.read())["error"].startswith("bad request")
+    finally:
+        conn.close()
+
+
+def test_shutdown_removes_state_file(test_config):
+    daemon = PsmDaemon(state_path(test_config), config=test_config)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    assert state_path(test_config).exists()
+
+    DaemonClient(find_daemon(test_config), timeout=5).shutdown()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not state_path(test_config).exists()
+    assert find_daemon(test_config) is None
+
+
+def test_prompts_read_empty_stdin_instead_of_blocking(test_config, monkeypatch):
+    daemon = PsmDaemon(state_path(test_config), config=test_config)
+    stdin = sys.stdin
+    seen = []
+
+    def invoke(args):
+        seen.append(sys.stdin.read())  # The daemon's terminal would block here
+        return 1
+
+    monkeypatch.setattr(daemon, "_invoke", invoke)
+    assert daemon.run_command(["export"], emit=lambda line: None) == 1
+    assert seen == [""] and sys.stdin is stdin
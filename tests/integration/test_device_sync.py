@@ -0,0 +1,161 @@
+"""Device sync: incremental copy of playlist files to a target directory with M3Us relative to it."""
+
+import os
+import time
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from psm.cli import cli
+from psm.db import Database
+from psm.services.device_sync_service import BandwidthLimiter, sync_device
+
+
+def _library(db: Database, music: Path, count: int = 3) -> None:
+    for i in range(1, count + 1):
+        path = music / "Artist" / f"{i} Song.mp3"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"audio" * 100 * i)
+        db.upsert_track({"id": f"t{i}", "name": f"Song {i}", "artist": "Artist", "normalized": f"song {i}"}, "spotify")
+        db.add_library_file({"path": str(path), "title": f"Song {i}", "size": i, "mtime": 1.0})
+        db.add_match(f"t{i}", i, 0.9, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.upsert_playlist("p1", "Road Trip", "s", provider="spotify")
+    db.replace_playlist_tracks("p1", [(0, "t2", None), (1, "t1", None), (2, "t4", None)], provider="spotify")
+    db.upsert_playlist("p2", "Focus", "s", provider="spotify")
+    db.replace_playlist_tracks("p2", [(0, "t3", None)], provider="spotify")
+    db.commit()
+
+
+def test_sync_copies_incrementally_and_removes_orphans(tmp_path: Path):
+    music, device = tmp_path / "music", tmp_path / "device"
+    with Database(tmp_path / "db.sqlite") as db:
+        _library(db, music)
+
+        first = sync_device(db, device, library_paths=[str(music)], liked_songs=False)
+        assert (first.files_copied, first.files_unchanged, first.playlist_count) == (3, 0, 2)
+        assert first.bytes_copied == 500 + 1000 + 1500
+        copy = device / "Music" / "music" / "Artist" / "1 Song.mp3"
+        assert copy.read_bytes() == (music / "Artist" / "1 Song.mp3").read_bytes()
+        m3u = device / "Playlists" / "Road Trip_p1.m3u"
+        entries = [line for line in m3u.read_text(encoding="utf-8").splitlines() if not line.startswith("#")]
+        assert entries == ["../Music/music/Artist/2 Song.mp3", "../Music/music/Artist/1 Song.mp3"]
+
+        # Nothing changed: nothing is copied
+        second = sync_device(db, device, library_paths=[str(music)], liked_songs=False)
+        assert (second.files_copied, second.files_unchanged) == (0, 3)
+
+        # A changed source file is copied again
+        source = music / "Artist" / "2 Song.mp3"
+        source.write_bytes(b"remastered" * 200)
+        os.utime(source, (time.time() + 10, time.time() + 10))
+        third = sync_device(db, device, library_paths=[str(music)], liked_songs=False)
+        assert third.files_copied == 1
+        assert (device / "Music" / "music" / "Artist" / "2 Song.mp3").read_bytes() == source.read_bytes()
+
+        # Only "Focus" selected: Road Trip stays on the device
+        fourth = sync_device(db, device, library_paths=[str(music)], playlist_ids=["p2"], liked_songs=False)
+        assert (fourth.playlist_count, fourth.orphans_removed) == (1, [])
+
+        # Road Trip deleted: a full sync removes its files and playlist
+        db.conn.execute("DELETE FROM playlists WHERE id = 'p1'")
+        db.commit()
+        fifth = sync_device(db, device, library_paths=[str(music)], liked_songs=False)
+        assert sorted(Path(p).name for p in fifth.orphans_removed) == ["1 Song.mp3", "2 Song.mp3", "Road Trip_p1.m3u"]
+        assert sorted(p.name for p in device.rglob("*") if p.is_file()) == [
+            ".psm-device.json",
+            "3 Song.mp3",
+            "Focus_p2.m3u",
+        ]
+
+
+def test_sync_never_removes_files_it_did_not_write(tmp_path: Path):
+    music, device = tmp_path / "music", tmp_path / "device"
+    own_music = device / "Music" / "Albums" / "Mine.mp3"
+    own_music.parent.mkdir(parents=True)
+    own_music.write_bytes(b"mine")
+    own_playlist = device / "Playlists" / "Mine.m3u"
+    own_playlist.parent.mkdir()
+    own_playlist.write_text("#EXTM3U\n", encoding="utf-8")
+    with Database(tmp_path / "db.sqlite") as db:
+        _library(db, music)
+        # Already on the device with the same size and mtime as the source: not psm's copy
+        source = music / "Artist" / "3 Song.mp3"
+        preexisting = device / "Music" / "music" / "Artist" / "3 Song.mp3"
+        preexisting.parent.mkdir(parents=True)
+        preexisting.write_bytes(source.read_bytes())
+        os.utime(preexisting, (source.stat().st_atime, source.stat().st_mtime))
+
+        first = sync_device(db, device, library_paths=[str(music)], liked_songs=False)
+        assert (first.files_copied, first.files_unchanged) == (2, 1)
+
+        db.conn.execute("DELETE FROM playlists")
+        db.commit()
+        second = sync_device(db, device, library_paths=[str(music)], liked_songs=False)
+        assert sorted(Path(p).name for p in second.orphans_removed) == [
+            "1 Song.mp3",
+            "2 Song.mp3",
+            "Focus_p2.m3u",
+            "Road Trip_p1.m3u",
+        ]
+    assert own_music.exists() and own_playlist.exists() and preexisting.exists()
+
+
+def test_missing_source_is_left_out_of_playlist(tmp_path: Path):
+    music, device = tmp_path / "music", tmp_path / "device"
+    with Database(tmp_path / "db.sqlite") as db:
+        _library(db, music)
+        (music / "Artist" / "1 Song.mp3").unlink()
+
+        result = sync_device(db, device, library_paths=[str(music)], playlist_ids=["p1"], liked_songs=False)
+        assert (result.files_copied, result.files_missing) == (1, 1)
+        text = (device / "Playlists" / "Road Trip_p1.m3u").read_text(encoding="utf-8")
+        assert "2 Song.mp3" in text and "1 Song.mp3" not in text
+
+
+def test_bandwidth_limiter_caps_rate():
+    limiter = BandwidthLimiter(1_000_000)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.consume(50_000)
+    # 250 kB at 1 MB/s: the last chunk may start after 0.2 s
+    assert time.monotonic() - start >= 0.19
+
+
+def test_sync_device_command(tmp_path: Path, test_config):
+    music = Path(test_config["library"]["paths"][0])
+    with Database(Path(test_config["database"]["path"])) as db:
+        _library(db, music)
+
+    result = CliRunner().invoke(
+        cli, ["sync-device", "--target", str(tmp_path / "device"), "--workers", "2"], obj=test_config
+    )
+    assert result.exit_code == 0, result.output
+    assert "Copied 3 file(s)" in result.output
+    assert "Synced 2 playlist(s)" in result.output
+
+
+def test_colliding_device_paths_get_distinct_copies(tmp_path: Path):
+    music, target = tmp_path / "music", tmp_path / "device"
+    names = ["a?b.mp3", "a_b.mp3", "Song.mp3", "song.MP3"]  # Same name after sanitizing / on FAT
+    (music / "Artist").mkdir(parents=True)
+    with Database(tmp_path / "psm.db") as db:
+        for i, name in enumerate(names, start=1):
+            path = music / "Artist" / name
+            path.write_bytes(name.encode() * 10)
+            db.upsert_track({"id": f"t{i}", "name": name, "artist": "Artist", "normalized": name}, "spotify")
+            db.add_library_file({"path": str(path), "title": name, "size": i, "mtime": 1.0})
+            db.add_match(f"t{i}", i, 0.9, "score:HIGH", provider="spotify", confidence="HIGH")
+        db.upsert_playlist("p1", "Mix", "s", provider="spotify")
+        db.replace_playlist_tracks("p1", [(i, f"t{i + 1}", None) for i in range(4)], provider="spotify")
+        db.commit()
+        result = sync_device(db, target, library_paths=[str(music)], liked_songs=False)
+
+    assert result.files_copied == 4
+    lines = [
+        line
+        for line in (target / "Playlists" / "Mix_p1.m3u").read_text(encoding="utf-8").splitlines()
+        if not line.startswith("#")
+    ]
+    assert len({line.casefold() for line in lines}) == 4
+    for name, line in zip(names, lines):
+        assert (target / "Playlists" / line).read_bytes() == name.encode() * 10
@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from psm.export.manifest import MANIFEST_NAME
 from psm.services.export_service import (
     export_playlists,
     _find_existing_m3u_files,
@@ -192,3 +193,56 @@ def test_clean_export_directory_nonexistent(tmp_path):
     deleted = _clean_export_directory(export_dir)
 
     assert len(deleted) == 0
+
+
+def test_reexport_skips_unchanged_files(tmp_path, sample_db):
+    """Re-exporting identical content leaves files (and their mtimes) untouched."""
+    export_config = {
+        "directory": str(tmp_path / "export"),
+        "mode": "mirrored",
+        "detect_obsolete": False,
+        "include_liked_songs": False,
+    }
+
+    first = export_playlists(sample_db, export_config)
+    assert len(first.write_stats.written) == 1 and first.write_stats.unchanged == []
+    exported = Path(first.exported_files[0])
+    stamp = exported.stat().st_mtime_ns
+
+    second = export_playlists(sample_db, export_config)
+    assert second.write_stats.written == [] and second.write_stats.unchanged == [str(exported)]
+    assert exported.stat().st_mtime_ns == stamp
+
+    sample_db.upsert_playlist("playlist123", "Test Playlist", "snap2", owner_id="owner1", owner_name="TestOwner")
+    sample_db.replace_playlist_tracks("playlist123", [])
+    third = export_playlists(sample_db, export_config)
+    assert third.write_stats.written == [str(exported)]
+    assert "Song" not in exported.read_text(encoding="utf-8")
+    leftovers = [p.name for p in exported.parent.iterdir() if p.name != MANIFEST_NAME]
+    assert leftovers == [exported.name]  # no temp files left behind
+
+
+def test_parallel_export_matches_serial(tmp_path):
+    """export.workers > 1 writes the same files and keeps exported_files in playlist order."""
+    db = MockDatabase()
+    for i in range(12):
+        db.upsert_track({"id": f"t{i}", "name": f"Song {i}", "artist": "Artist", "duration_ms": 1000})
+        db.upsert_playlist(f"pl{i:02d}", f"Playlist {i}", "s", owner_id=f"u{i % 3}", owner_name=f"Owner {i % 3}")
+        db.replace_playlist_tracks(f"pl{i:02d}", [(pos, f"t{(i + pos) % 12}", None) for pos in range(i + 1)])
+
+    results = {}
+    for workers in (1, 4):
+        export_config = {
+            "directory": str(tmp_path / f"w{workers}"),
+            "mode": "placeholders",
+            "detect_obsolete": False,
+            "include_liked_songs": False,
+            "workers": workers,
+        }
+        result = export_playlists(db, export_config, organize_by_owner=True)
+        results[workers] = [Path(f).relative_to(export_config["directory"]) for f in result.exported_files]
+        assert len(result.write_stats.written) == 12
+
+    assert results[4] == results[1]
+    for rel in results[1]:
+        assert (tmp_path / "w4" / rel).read_bytes() == (tmp_path / "w1" / rel).read_bytes()
@@ -0,0 +1,108 @@
+"""Export manifest: generations, delta bundles and manifest-based obsolete detection."""
+
+import json
+import zipfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from psm.cli import cli
+from psm.db import Database
+from psm.export.manifest import MANIFEST_NAME, ExportManifest
+from psm.services import export_service
+from psm.services.export_service import export_playlists
+
+
+def _populate(db: Database) -> None:
+    for i in range(1, 4):
+        db.upsert_track({"id": f"t{i}", "name": f"Song {i}", "artist": "A", "normalized": f"song {i}"}, "spotify")
+        db.add_library_file({"path": f"/music/{i}.mp3", "title": f"Song {i}", "size": 1, "mtime": 1.0})
+        db.add_match(f"t{i}", i, 0.9, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.upsert_playlist("p1", "Road Trip", "s", provider="spotify")
+    db.replace_playlist_tracks("p1", [(0, "t1", None), (1, "t2", None)], provider="spotify")
+    db.upsert_playlist("p2", "Focus", "s", provider="spotify")
+    db.replace_playlist_tracks("p2", [(0, "t3", None)], provider="spotify")
+    db.commit()
+
+
+def _config(export_dir: Path) -> dict:
+    return {"directory": str(export_dir), "mode": "strict", "include_liked_songs": False}
+
+
+def test_generations_and_delta(tmp_path: Path, monkeypatch):
+    export_dir = tmp_path / "export"
+    with Database(tmp_path / "db.sqlite") as db:
+        _populate(db)
+
+        first = export_playlists(db, _config(export_dir))
+        assert first.manifest_generation == 1
+        manifest = ExportManifest.load(export_dir)
+        assert manifest.playlists["p1"].file == "Road Trip_p1.m3u"
+        assert (manifest.playlists["p1"].tracks, manifest.playlists["p2"].tracks) == (2, 1)
+
+        # Nothing changed: same generation, manifest not rewritten
+        mtime = (export_dir / MANIFEST_NAME).stat().st_mtime_ns
+        assert export_playlists(db, _config(export_dir)).manifest_generation == 1
+        assert (export_dir / MANIFEST_NAME).stat().st_mtime_ns == mtime
+
+        # With a manifest, obsolete detection no longer scans the export directory
+        monkeypatch.setattr(export_service, "_find_existing_m3u_files", None)
+        db.replace_playlist_tracks("p1", [(0, "t1", None)], provider="spotify")
+        db.conn.execute("DELETE FROM playlists WHERE id = 'p2'")
+        db.commit()
+        third = export_playlists(db, _config(export_dir))
+        assert third.manifest_generation == 2
+        assert [Path(f).name for f in third.obsolete_files] == ["Focus_p2.m3u"]
+
+    delta = ExportManifest.load(export_dir).delta(1)
+    assert (list(delta["added"]), list(delta["changed"]), list(delta["removed"])) == ([], ["p1"], ["p2"])
+    assert delta["removed_files"] == ["Focus_p2.m3u"]
+    assert ExportManifest.load(export_dir).delta(2)["changed"] == {}
+    assert list(ExportManifest.load(export_dir).delta(0)["added"]) == ["p1"]
+
+
+def test_scoped_export_keeps_other_entries(tmp_path: Path):
+    export_dir = tmp_path / "export"
+    with Database(tmp_path / "db.sqlite") as db:
+        _populate(db)
+        export_playlists(db, _config(export_dir))
+        db.replace_playlist_tracks("p2", [(0, "t3", None), (1, "t1", None)], provider="spotify")
+        db.commit()
+        assert export_playlists(db, _config(export_dir), playlist_ids=["p2"]).manifest_generation == 2
+
+    manifest = ExportManifest.load(export_dir)
+    assert sorted(manifest.playlists) == ["p1", "p2"] and manifest.removed == {}
+    assert (manifest.playlists["p1"].generation, manifest.playlists["p2"].generation) == (1, 2)
+
+
+def test_stale_files_found_by_first_scan_are_remembered(tmp_path: Path):
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    stale = export_dir / "Old_12345678.m3u"
+    stale.write_text("#EXTM3U\n", encoding="utf-8")
+    with Database(tmp_path / "db.sqlite") as db:
+        _populate(db)
+        assert export_playlists(db, _config(export_dir)).obsolete_files == [str(stale)]
+        assert export_playlists(db, _config(export_dir)).obsolete_files == [str(stale)]
+        stale.unlink()
+        assert export_playlists(db, _config(export_dir)).obsolete_files == []
+
+
+def test_export_delta_bundle_command(tmp_path: Path, test_config):
+    with Database(Path(test_config["database"]["path"])) as db:
+        _populate(db)
+    bundle = tmp_path / "delta.zip"
+
+    result = CliRunner().invoke(cli, ["export", "--delta-since", "0", "--bundle", str(bundle)], obj=test_config)
+    assert result.exit_code == 0, result.output
+    assert "Manifest generation: 1" in result.output
+    with zipfile.ZipFile(bundle) as zf:
+        delta = json.loads(zf.read("delta.json"))
+        assert sorted(delta["added"]) == ["p1", "p2"]
+        assert sorted(name for name in zf.namelist() if name != "delta.json") == sorted(
+            entry["file"] for entry in delta["added"].values()
+        )
+
+    result = CliRunner().invoke(cli, ["export", "--delta-since", "5"], obj=test_config)
+    assert result.exit_code != 0
+    assert "outside 0..1" in result.output
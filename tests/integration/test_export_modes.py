@@ -1,4 +1,6 @@
+import os
 from pathlib import Path
+from psm.export import playlists
 from psm.export.playlists import export_strict, export_mirrored, export_placeholders
 
 
@@ -72,3 +74,41 @@ def test_export_placeholders(tmp_path: Path):
     # EXTINF lines should be 3
     extinf = [l for l in lines if l.startswith("#EXTINF")]
     assert len(extinf) == 3
+
+
+def test_placeholders_share_one_file_and_are_collected(tmp_path: Path):
+    pl = {"name": "Placeholders", "id": "placehold12345"}
+    tracks = _sample_tracks()
+    export_placeholders(pl, tracks, tmp_path)
+    placeholder_dir = tmp_path / "Placeholders_placehol_placeholders"
+    first, second = sorted(placeholder_dir.glob("*.missing"))
+    # Hardlinks of one shared placeholder rather than a file per track
+    assert os.path.samefile(first, second)
+    assert os.path.samefile(first, tmp_path / ".psm-placeholder.missing")
+    inode = first.stat().st_ino
+
+    # Re-export reuses existing placeholders
+    export_placeholders(pl, tracks, tmp_path)
+    assert first.stat().st_ino == inode
+
+    # Track 2 got matched: its placeholder is garbage-collected
+    tracks[1]["local_path"] = Path("file2.mp3")
+    export_placeholders(pl, tracks, tmp_path)
+    assert [p.name for p in placeholder_dir.glob("*.missing")] == [second.name]
+
+    # Everything matched: the placeholder directory goes away
+    tracks[2]["local_path"] = Path("file3.mp3")
+    export_placeholders(pl, tracks, tmp_path)
+    assert not placeholder_dir.exists()
+
+
+def test_placeholders_fall_back_to_copies(tmp_path: Path, monkeypatch):
+    def no_links(src, dst):
+        raise OSError("hardlinks not supported")
+
+    monkeypatch.setattr(playlists.os, "link", no_links)
+    export_placeholders({"name": "Copies", "id": "copies12345678"}, _sample_tracks(), tmp_path)
+    files = sorted((tmp_path / "Copies_copies12_placeholders").glob("*.missing"))
+    assert len(files) == 2
+    assert not os.path.samefile(files[0], files[1])
+    assert all(f.read_bytes() == b"Missing track placeholder" for f in files)
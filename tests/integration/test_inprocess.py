@@ -0,0 +1,157 @@
+"""GUI in-process execution: commands run on a worker thread with routed output and cancellation."""
+
+from __future__ import annotations
+import threading
+from pathlib import Path
+
+import pytest
+
+from psm.db import Database
+from psm.gui import inprocess
+from psm.gui.inprocess import InProcessCommand, runs_in_process
+from psm.utils.cancellation import OperationCancelled
+
+
+def _seed_match_data(db_path: Path) -> None:
+    with Database(db_path) as db:
+        db.upsert_track(
+            {
+                "id": "t1",
+                "name": "Take Five",
+                "artist": "Dave Brubeck",
+                "album": "Time Out",
+                "year": 1959,
+                "duration_ms": 324000,
+                "normalized": "take five dave brubeck",
+            },
+            provider="spotify",
+        )
+        db.add_library_file(
+            {
+                "path": "/music/take_five.mp3",
+                "title": "Take Five",
+                "artist": "Dave Brubeck",
+                "album": "Time Out",
+                "duration": 324.0,
+                "normalized": "take five dave brubeck",
+                "size": 1,
+                "mtime": 1.0,
+            }
+        )
+        db.commit()
+
+
+def _run_on_thread(command: InProcessCommand):
+    """Run command on a worker thread like CliRunner does; returns (exit code or exception)."""
+    outcome = []
+
+    def target():
+        try:
+            outcome.append(command.run())
+        except OperationCancelled as e:
+            outcome.append(e)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join(timeout=60)
+    return outcome[0]
+
+
+def test_runs_in_process():
+    assert runs_in_process(["match", "--full"])
+    assert runs_in_process(["playlist", "export", "abc"])
+    assert runs_in_process(["scan", "--quick"])
+    assert not runs_in_process(["pull"])
+    assert not runs_in_process(["build", "--no-report"])
+    assert not runs_in_process(["playlist", "push", "abc"])
+    assert not runs_in_process(["scan", "--watch"])
+    assert not runs_in_process(["--progress", "match"])
+    assert not runs_in_process([])
+
+
+def test_match_runs_in_process_with_warm_index(test_config):
+    _seed_match_data(Path(test_config["database"]["path"]))
+    lines, received = [], []
+
+    code = _run_on_thread(InProcessCommand(["match"], lines.append, received.append, config=test_config))
+    assert code == 0, lines
+    assert "Matched 1 tracks" in lines
+    assert [(e["type"], e["stage"]) for e in received if e["type"].startswith("stage")] == [
+        ("stage_start", "Matching tracks"),
+        ("stage_end", "Matching tracks"),
+    ]
+
+    index = inprocess._match_indexes.get(test_config)
+    loads = index.loads
+    code = _run_on_thread(InProcessCommand(["match", "--full"], lines.append, config=test_config))
+    assert code == 0
+    assert index.loads == loads  # catalog stayed warm between actions
+
+
+def test_prompts_abort_instead_of_blocking(tmp_path: Path, test_config):
+    export_dir = tmp_path / "playlists"
+    export_dir.mkdir()
+    (export_dir / "old.m3u").write_text("#EXTM3U\n", encoding="utf-8")
+    test_config["export"]["directory"] = str(export_dir)
+    test_config["export"]["detect_obsolete"] = True
+    lines = []
+
+    code = _run_on_thread(InProcessCommand(["export"], lines.append, config=test_config))
+    assert code == 1
+    assert lines[-1].endswith("Aborted!")
+    assert (export_dir / "old.m3u").exists()
+
+
+def test_cancelled_match_raises(test_config):
+    _seed_match_data(Path(test_config["database"]["path"]))
+    command = InProcessCommand(["match", "--full"], lambda line: None, config=test_config)
+    command.cancel()
+    assert isinstance(_run_on_thread(command), OperationCancelled)
+
+    with Database(Path(test_config["database"]["path"])) as db:
+        assert db.conn.execute("SELECT count(*) FROM matches").fetchone()[0] == 0
+
+
+def test_cancelled_scan_keeps_unseen_files(tmp_path: Path, test_config):
+    music_dir = tmp_path / "music"
+    music_dir.mkdir()
+    for name in ("a.mp3", "b.mp3", "c.mp3"):
+        (music_dir / name).write_bytes(b"ID3dummy")
+    test_config["library"]["paths"] = [str(music_dir)]
+
+    assert _run_on_thread(InProcessCommand(["scan"], lambda line: None, config=test_config)) == 0
+    (music_dir / "c.mp3").unlink()
+
+    command = InProcessCommand(["scan"], lambda line: None, config=test_config)
+    command.cancel()
+    assert isinstance(_run_on_thread(command), OperationCancelled)
+
+    # The walk stopped early, so files it did not reach must not be treated as deleted
+    with Database(Path(test_config["database"]["path"])) as db:
+        assert db.conn.execute("SELECT count(*) FROM library_files").fetchone()[0] == 3
+
+
+def test_output_of_other_threads_is_not_captured(test_config, capsys):
+    lines = []
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_line(line):
+        lines.append(line)
+        started.set()
+        release.wait(timeout=10)
+
+    command = InProcessCommand(["config", "--section", "database"], blocking_line, config=test_config)
+    thread = threading.Thread(target=command.run)
+    thread.start()
+    assert started.wait(timeout=30)
+    print("from the main thread")
+    release.set()
+    thread.join(timeout=30)
+
+    assert not any("from the main thread" in line for line in lines)
+    assert any(test_config["database"]["path"] in line for line in lines)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_match_indexes(monkeypatch):
+    monkeypatch.setattr(inprocess, "_match_indexes", inprocess.MatchIndexPool())
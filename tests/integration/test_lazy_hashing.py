@@ -0,0 +1,58 @@
+"""Partial hashes are computed on demand, not during scans."""
+
+from pathlib import Path
+
+from psm.db import Database
+from psm.ingest.library import scan_library, ensure_partial_hashes, find_duplicate_files
+from psm.utils.hashing import partial_hash
+from psm.utils.latency import PhaseTimings
+
+
+def test_scan_does_not_hash_and_ensure_fills_lazily(tmp_path, test_config):
+    music_dir = tmp_path / "music"
+    music_dir.mkdir()
+    (music_dir / "a.mp3").write_bytes(b"a" * 5000)
+    (music_dir / "b.mp3").write_bytes(b"b" * 5000)
+    test_config["library"]["paths"] = [str(music_dir)]
+
+    with Database(tmp_path / "db.sqlite") as db:
+        scan_library(db, test_config)
+        rows = db.conn.execute("SELECT id, partial_hash FROM library_files ORDER BY path").fetchall()
+        assert len(rows) == 2
+        assert all(r["partial_hash"] is None for r in rows)
+
+        first_id = rows[0]["id"]
+        hashes = ensure_partial_hashes(db, [first_id], algorithm="blake2b")
+        assert hashes[first_id].startswith("blake2b:")
+
+        stored = db.conn.execute("SELECT id, partial_hash FROM library_files ORDER BY path").fetchall()
+        assert stored[0]["partial_hash"] == hashes[first_id]
+        assert stored[1]["partial_hash"] is None  # untouched until requested
+
+        # Second call reuses the stored value
+        assert ensure_partial_hashes(db, [first_id], algorithm="sha1") == hashes
+
+
+def test_find_duplicate_files_hashes_only_same_size_candidates(tmp_path, test_config):
+    music_dir = tmp_path / "music"
+    music_dir.mkdir()
+    (music_dir / "a.mp3").write_bytes(b"x" * 5000)
+    (music_dir / "a copy.mp3").write_bytes(b"x" * 5000)
+    (music_dir / "b.mp3").write_bytes(b"y" * 5000)  # Same size, different content
+    (music_dir / "c.mp3").write_bytes(b"x" * 4000)  # Unique size: never hashed
+    test_config["library"]["paths"] = [str(music_dir)]
+
+    with Database(tmp_path / "db.sqlite") as db:
+        scan_library(db, test_config)
+        # A legacy SHA-1 value stored for one copy is verified by re-hashing with SHA-1
+        legacy = partial_hash(music_dir / "a.mp3")
+        db.conn.execute("UPDATE library_files SET partial_hash=? WHERE path LIKE ?", (legacy, "%/a.mp3"))
+        db.commit()
+
+        timings = PhaseTimings()
+        groups = find_duplicate_files(db, algorithm="blake2b", timings=timings)
+        assert [[Path(p).name for p in group] for group in groups] == [["a copy.mp3", "a.mp3"]]
+        assert timings.histogram("hash").count == 2  # a copy.mp3 and b.mp3; a.mp3 reused its stored hash
+
+        hashed = dict(db.conn.execute("SELECT path, partial_hash FROM library_files").fetchall())
+        assert hashed[str((music_dir / "c.mp3").resolve())] is None
@@ -1,5 +1,7 @@
 """Integration tests for Liked Songs virtual playlist export."""
 
+from pathlib import Path
+
 from psm.db import Database
 from psm.services.export_service import export_playlists
 from psm.reporting.reports.playlist_coverage import write_playlist_coverage_report
@@ -272,3 +274,26 @@ def test_liked_songs_preserves_newest_first_order(tmp_path):
     assert (
         track3_pos < track1_pos
     ), f"Tracks not in newest-first order. track3 at {track3_pos}, track1 at {track1_pos}\nContent:\n{content}"
+
+
+def test_scoped_export_of_liked_songs_only(tmp_path):
+    """A scoped export with liked_songs=True writes only Liked Songs and leaves playlists alone."""
+    export_dir = tmp_path / "export"
+    with Database(tmp_path / "test.db") as db:
+        db.upsert_track({"id": "track1", "name": "Song", "artist": "Artist", "normalized": "song artist"}, "spotify")
+        db.upsert_liked("track1", "2025-01-01T12:00:00Z", provider="spotify")
+        db.upsert_playlist("pl1", "Playlist", "snap", provider="spotify")
+        db.replace_playlist_tracks("pl1", [(0, "track1", None)], provider="spotify")
+        db.commit()
+        export_config = {"directory": str(export_dir), "mode": "mirrored", "detect_obsolete": True}
+
+        full = export_playlists(db, export_config)
+        assert full.playlist_count == 2
+
+        liked = export_playlists(db, export_config, playlist_ids=[], liked_songs=True)
+        assert liked.playlist_count == 1
+        assert [Path(p).name for p in liked.exported_files] == ["Liked Songs__liked_s.m3u"]
+        assert liked.obsolete_files == []  # Playlist files outside the scope are not obsolete
+
+        # Scoped exports without the flag still skip Liked Songs
+        assert export_playlists(db, export_config, playlist_ids=["pl1"]).playlist_count == 1
@@ -0,0 +1,88 @@
+"""Network (concurrent prefetch) scan mode produces the same library as the serial scan."""
+
+from psm.db import Database
+from psm.ingest.library import scan_library_incremental, _scan_library_internal
+
+
+def _snapshot(db):
+    rows = db.conn.execute("SELECT path, size, title, artist, normalized FROM library_files ORDER BY path").fetchall()
+    return [tuple(r) for r in rows]
+
+
+def _build_library(music_dir):
+    for i in range(30):
+        sub = music_dir / f"artist{i % 3}" / f"album{i % 5}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"Artist {i % 3} - Track {i}.mp3").write_bytes(b"not audio" * (i + 1))
+    (music_dir / ".hidden.mp3").write_bytes(b"x")
+    (music_dir / "notes.txt").write_text("ignored")
+
+
+def test_network_mode_matches_serial_scan(tmp_path, test_config):
+    music_dir = tmp_path / "music"
+    _build_library(music_dir)
+    test_config["library"]["paths"] = [str(music_dir)]
+    test_config["library"]["tag_cache"] = False  # Both databases would share one sidecar cache
+
+    with Database(tmp_path / "serial.db") as db:
+        serial = _scan_library_internal(db, test_config, test_config["library"])
+        expected = _snapshot(db)
+
+    test_config["library"]["network_mode"] = True
+    test_config["library"]["min_concurrency"] = 2
+    test_config["library"]["max_concurrency"] = 8
+    with Database(tmp_path / "network.db") as db:
+        result = _scan_library_internal(db, test_config, test_config["library"])
+        assert _snapshot(db) == expected
+
+        # Unchanged rescan skips everything; a deleted file is cleaned up
+        (music_dir / "artist0" / "album0" / "Artist 0 - Track 0.mp3").unlink()
+        rescan = _scan_library_internal(db, test_config, test_config["library"])
+
+    assert result.files_seen == serial.files_seen == 30
+    assert result.inserted == 30
+    assert result.phase_timings is not None
+    assert result.phase_timings.histogram("tags").count == 30
+    assert serial.phase_timings is None
+    assert rescan.skipped == 29
+    assert rescan.deleted == 1
+    assert rescan.inserted == rescan.updated == 0
+
+
+def test_network_mode_incremental_since(tmp_path, test_config):
+    music_dir = tmp_path / "music"
+    _build_library(music_dir)
+    test_config["library"]["paths"] = [str(music_dir)]
+    test_config["library"]["network_mode"] = True
+
+    with Database(tmp_path / "db.sqlite") as db:
+        _scan_library_internal(db, test_config, test_config["library"])
+        result = scan_library_incremental(db, test_config, changed_since=2**40)
+    assert result.skipped == 30
+    assert result.inserted == result.updated == 0
+
+
+def test_multiple_roots_scanned_in_parallel_with_per_root_stats(tmp_path, test_config):
+    roots = []
+    for name in ("disk1", "disk2"):
+        root = tmp_path / name
+        _build_library(root)
+        roots.append(str(root))
+    test_config["library"]["paths"] = roots
+
+    with Database(tmp_path / "parallel.db") as db:
+        result = _scan_library_internal(db, test_config, test_config["library"])
+        parallel = _snapshot(db)
+
+    test_config["library"]["parallel_roots"] = False
+    with Database(tmp_path / "serial.db") as db:
+        serial = _scan_library_internal(db, test_config, test_config["library"])
+        assert _snapshot(db) == parallel
+
+    assert result.files_seen == 60
+    assert set(result.root_stats) == set(roots)
+    for stats in result.root_stats.values():
+        assert stats.files_seen == stats.processed == 30
+        assert stats.duration_seconds > 0
+    assert result.phase_timings is None  # latency histograms are a network-mode report
+    assert serial.root_stats == {}
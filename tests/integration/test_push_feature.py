@@ -50,6 +50,25 @@ def test_m3u_parser_basic(tmp_path: Path):
     assert paths[1].endswith("b.mp3")
 
 
+def test_m3u_parser_resolves_symlinks_like_path_resolve(tmp_path: Path):
+    album = tmp_path / "store" / "Album"
+    album.mkdir(parents=True)
+    (album / "1.mp3").write_text("x")
+    (album / "real.mp3").write_text("y")
+    try:
+        (tmp_path / "linked").symlink_to(album, target_is_directory=True)
+        (album / "2.mp3").symlink_to(album / "real.mp3")
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks not supported on this system")
+    lines = ["linked/1.mp3", "linked/2.mp3", str(album / "1.mp3"), "linked/../Album/missing.mp3", "linked/3.mp3"]
+    playlist = tmp_path / "list.m3u"
+    playlist.write_text("#EXTM3U\n" + "\n".join(lines) + "\n")
+
+    expected = [str((tmp_path / line).resolve()) for line in lines]
+    assert parse_m3u_paths(playlist) == expected
+    assert expected[1] == str((album / "real.mp3").resolve())
+
+
 def test_push_db_mode_no_change(tmp_path: Path):
     db = _setup_db(tmp_path)
     # current user
@@ -187,3 +206,47 @@ def test_push_permission_denied(tmp_path: Path):
     client = StubClient(["t1"], owner_id="other")
     with pytest.raises(PermissionError):
         push_playlist(db=db, playlist_id="pl1", client=client, m3u_path=None, apply=False)
+
+
+def test_path_mapping_prefers_best_match_then_playlist(tmp_path: Path):
+    db = _setup_db(tmp_path)
+    for tid in ["single", "album", "compilation"]:
+        db.upsert_track({"id": tid, "name": tid, "artist": "A", "normalized": tid}, provider="spotify")
+    db.add_library_file({"path": "/music/song.mp3", "title": "song", "size": 1, "mtime": 0.0})
+    db.add_library_file({"path": "/music/song-live.mp3", "title": "song live", "size": 1, "mtime": 0.0})
+    # "single" scores highest on song.mp3 but its best match is the live file
+    db.add_match("single", 1, 0.95, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.add_match("single", 2, 0.99, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.add_match("album", 1, 0.9, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.add_match("compilation", 1, 0.92, "score:HIGH", provider="spotify", confidence="HIGH")
+    db.replace_playlist_tracks("pl1", [(0, "album", None)], provider="spotify")
+    db.commit()
+
+    # "album" and "compilation" both have song.mp3 as best match: the playlist breaks the tie
+    paths = ["/music/song.mp3", "/music/song-live.mp3", "/music/song.mp3", "/music/unknown.mp3"]
+    assert db.map_paths_to_track_ids(paths, "pl1", provider="spotify") == {
+        "/music/song.mp3": "album",
+        "/music/song-live.mp3": "single",
+    }
+    # Without a playlist, the higher score wins among best-match candidates
+    assert db.map_paths_to_track_ids(paths, provider="spotify")["/music/song.mp3"] == "compilation"
+
+
+def test_push_file_mode_maps_long_playlists_in_chunks(tmp_path: Path):
+    db = _setup_db(tmp_path)
+    db.set_meta("current_user_id", "me")
+    db.upsert_playlist("pl1", "Long", snapshot_id="s1", owner_id="me", owner_name="Me", provider="spotify")
+    count = 1234  # More than one IN (...) chunk
+    for i in range(count):
+        db.upsert_track({"id": f"t{i}", "name": str(i), "artist": "A", "normalized": str(i)}, provider="spotify")
+        db.add_library_file({"path": str(tmp_path / f"{i}.mp3"), "title": str(i), "size": 1, "mtime": 0.0})
+        db.add_match(f"t{i}", i + 1, 1.0, "exact", provider="spotify")
+    db.commit()
+    order = list(reversed(range(count))) + [0]
+    m3u = tmp_path / "long.m3u"
+    m3u.write_text("#EXTM3U\n" + "\n".join(str(tmp_path / f"{i}.mp3") for i in order) + "\n")
+
+    client = StubClient([])
+    preview = push_playlist(db=db, playlist_id="pl1", client=client, m3u_path=m3u, apply=True)
+    assert (preview.new_count, preview.unmatched_file_paths) == (count + 1, 0)
+    assert client.replaced_with == [f"t{i}" for i in order]
@@ -0,0 +1,110 @@
+"""Rebuilding the library database reuses the sidecar tag cache instead of re-parsing."""
+
+import sqlite3
+from types import SimpleNamespace
+
+import mutagen
+
+from psm.db import Database
+from psm.ingest import library as libmod
+from psm.ingest import tag_cache as tag_cache_mod
+from psm.ingest.library import scan_library_incremental, _scan_library_internal
+from psm.ingest.tag_cache import TagCache
+
+
+def _count_parses(monkeypatch):
+    calls = []
+
+    def fake_file(p):
+        calls.append(p)
+        return SimpleNamespace(tags={"title": f"T {p.stem}", "artist": "A"}, info=SimpleNamespace(length=100.0))
+
+    monkeypatch.setattr(mutagen, "File", fake_file)
+    monkeypatch.setattr(libmod, "read_fast_tags", lambda p: None)
+    return calls
+
+
+def _rows(db):
+    return [tuple(r) for r in db.conn.execute("SELECT path, title, artist, duration, normalized FROM library_files")]
+
+
+def test_database_rebuild_uses_tag_cache(tmp_path, test_config, monkeypatch):
+    music_dir = tmp_path / "music"
+    music_dir.mkdir()
+    for i in range(5):
+        (music_dir / f"{i}.mp3").write_bytes(b"x" * (i + 1))
+    test_config["library"]["paths"] = [str(music_dir)]
+    calls = _count_parses(monkeypatch)
+    db_path = tmp_path / "db" / "psm.db"
+
+    with Database(db_path) as db:
+        first = _scan_library_internal(db, test_config, test_config["library"])
+        expected = _rows(db)
+    assert len(calls) == 5
+    assert first.tag_cache_hits == 0
+    assert (tmp_path / "db" / "tag_cache.db").exists()
+
+    db_path.unlink()
+    with Database(db_path) as db:
+        rebuilt = _scan_library_internal(db, test_config, test_config["library"])
+        assert sorted(_rows(db)) == sorted(expected)
+    assert len(calls) == 5  # nothing re-parsed
+    assert rebuilt.tag_cache_hits == 5
+    assert rebuilt.inserted == 5
+
+    # A modified file misses the cache and is parsed again
+    (music_dir / "0.mp3").write_bytes(b"changed content")
+    db_path.unlink()
+    test_config["library"]["network_mode"] = True
+    with Database(db_path) as db:
+        result = scan_library_incremental(db, test_config)
+    assert len(calls) == 6
+    assert result.tag_cache_hits == 4
+
+
+def test_refresh_mode_reparses_and_rewrites_cache(tmp_path, test_config, monkeypatch):
+    music_dir = tmp_path / "music"
+    music_dir.mkdir()
+    for i in range(3):
+        (music_dir / f"{i}.mp3").write_bytes(b"x" * (i + 1))
+    test_config["library"]["paths"] = [str(music_dir)]
+    calls = _count_parses(monkeypatch)
+    db_path = tmp_path / "psm.db"
+
+    with Database(db_path) as db:
+        _scan_library_internal(db, test_config, test_config["library"])
+    db_path.unlink()
+    test_config["library"]["tag_cache_refresh"] = True
+    with Database(db_path) as db:
+        refreshed = _scan_library_internal(db, test_config, test_config["library"])
+    assert len(calls) == 6  # every file parsed again
+    assert refreshed.tag_cache_hits == 0
+
+    db_path.unlink()
+    test_config["library"]["tag_cache_refresh"] = False
+    with Database(db_path) as db:
+        assert _scan_library_internal(db, test_config, test_config["library"]).tag_cache_hits == 3
+
+
+def test_locked_cache_does_not_abort_scan(tmp_path, test_config, monkeypatch):
+    music_dir = tmp_path / "music"
+    music_dir.mkdir()
+    for i in range(3):
+        (music_dir / f"{i}.mp3").write_bytes(b"x" * (i + 1))
+    test_config["library"]["paths"] = [str(music_dir)]
+    test_config["library"]["commit_interval"] = 1
+    calls = _count_parses(monkeypatch)
+    monkeypatch.setattr(tag_cache_mod, "_BUSY_TIMEOUT", 0.05)
+
+    TagCache(tmp_path / "tag_cache.db").close()
+    other = sqlite3.connect(str(tmp_path / "tag_cache.db"))
+    other.execute("BEGIN IMMEDIATE")  # Another process is writing to the cache file
+    try:
+        with Database(tmp_path / "psm.db") as db:
+            result = _scan_library_internal(db, test_config, test_config["library"])
+            assert db.conn.execute("SELECT COUNT(*) FROM library_files").fetchone()[0] == 3
+    finally:
+        other.rollback()
+        other.close()
+    assert (result.inserted, result.errors, len(calls)) == (3, 0, 3)
+    assert len(TagCache(tmp_path / "tag_cache.db")) == 0  # Writes were dropped, not retried
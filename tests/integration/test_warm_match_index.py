@@ -0,0 +1,112 @@
+"""Watch-mode warm match index: resident tracks/files patched between events."""
+
+from psm.db import Database
+from psm.services.match_service import WarmMatchIndex, match_changed_files, match_changed_tracks
+
+
+def _track(db, track_id, name, artist, seconds):
+    db.upsert_track(
+        {
+            "id": track_id,
+            "name": name,
+            "artist": artist,
+            "album": "Album",
+            "year": 2000,
+            "duration_ms": seconds * 1000,
+            "normalized": f"{name} {artist}".lower(),
+        },
+        provider="spotify",
+    )
+
+
+def _file(db, path, title, artist, seconds):
+    db.add_library_file(
+        {
+            "path": str(path),
+            "title": title,
+            "artist": artist,
+            "album": "Album",
+            "duration": float(seconds),
+            "normalized": f"{title} {artist}".lower(),
+            "size": 100,
+            "mtime": 1.0,
+        }
+    )
+    db.commit()
+    return db.conn.execute("SELECT id FROM library_files WHERE path=?", (str(path),)).fetchone()["id"]
+
+
+def _matches(db):
+    return sorted(tuple(r) for r in db.conn.execute("SELECT track_id, file_id FROM matches"))
+
+
+def test_warm_index_matches_like_cold_path_without_reloading(tmp_path, test_config):
+    with Database(tmp_path / "psm.db") as db:
+        _track(db, "t1", "Take Five", "Dave Brubeck", 324)
+        _track(db, "t2", "So What", "Miles Davis", 545)
+        db.commit()
+        index = WarmMatchIndex(test_config)
+
+        f1 = _file(db, tmp_path / "take_five.mp3", "Take Five", "Dave Brubeck", 324)
+        assert match_changed_files(db, test_config, file_ids=[f1], index=index) == (1, ["t1"])
+        assert index.loads == 2  # tracks + files
+
+        f2 = _file(db, tmp_path / "so_what.mp3", "So What", "Miles Davis", 545)
+        warm = match_changed_files(db, test_config, file_ids=[f2], index=index)
+        assert index.loads == 2  # patched, not reloaded
+        assert f2 in index.files
+        warm_matches = _matches(db)
+
+        db.conn.execute("DELETE FROM matches")
+        match_changed_files(db, test_config, file_ids=[f1])
+        cold = match_changed_files(db, test_config, file_ids=[f2])
+        assert warm == cold
+        assert _matches(db) == warm_matches
+
+        # Pulled track is matched against the resident file list
+        _track(db, "t3", "Blue in Green", "Miles Davis", 337)
+        db.commit()
+        f3 = _file(db, tmp_path / "blue.mp3", "Blue in Green", "Miles Davis", 337)
+        db.set_meta("library_last_modified", "1")  # as written by an external 'psm scan'
+        assert match_changed_tracks(db, test_config, track_ids=["t3"], index=index) == 1
+        assert index.loads == 4  # track count and library stamp changed
+        assert ("t3", f3) in _matches(db)
+
+
+def test_warm_index_drops_deleted_and_reloads_after_external_scan(tmp_path, test_config):
+    with Database(tmp_path / "psm.db") as db:
+        _track(db, "t1", "Take Five", "Dave Brubeck", 324)
+        db.commit()
+        f1 = _file(db, tmp_path / "take_five.mp3", "Take Five", "Dave Brubeck", 324)
+        index = WarmMatchIndex(test_config)
+        index.ensure_fresh(db)
+        assert set(index.files) == {f1}
+
+        db.conn.execute("DELETE FROM library_files WHERE id=?", (f1,))
+        db.commit()
+        index.drop_paths([str(tmp_path / "take_five.mp3")])
+        assert index.files == {}
+
+        db.set_meta("library_last_modified", "123")
+        f2 = _file(db, tmp_path / "again.mp3", "Take Five", "Dave Brubeck", 324)
+        loads = index.loads
+        index.ensure_fresh(db)
+        assert index.loads == loads + 1
+        assert set(index.files) == {f2}
+
+
+def test_match_calls_check_freshness_once(tmp_path, test_config, monkeypatch):
+    with Database(tmp_path / "psm.db") as db:
+        _track(db, "t1", "Take Five", "Dave Brubeck", 324)
+        db.commit()
+        f1 = _file(db, tmp_path / "take_five.mp3", "Take Five", "Dave Brubeck", 324)
+        index = WarmMatchIndex(test_config)
+        index.ensure_fresh(db)
+
+        reads = []
+        read_changes = db.read_changes
+        monkeypatch.setattr(db, "read_changes", lambda *a, **kw: reads.append(a) or read_changes(*a, **kw))
+        index.match_files(db, [f1])
+        index.match_tracks(db, ["t1"])
+        assert len(reads) == 2
+        assert _matches(db) == [("t1", f1)]
@@ -10,6 +10,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 from psm.db import Database
+from psm.export.playlists import WriteStats
 from psm.services.watch_build_service import (
     WatchBuildConfig,
     _handle_library_changes,
@@ -274,7 +275,7 @@ class TestWatchModeIncrementalPipeline:
 
         # Patch export_playlists to capture the call
         with patch("psm.services.watch_build_service.export_playlists") as mock_export:
-            mock_export.return_value = Mock(playlist_count=2)
+            mock_export.return_value = Mock(playlist_count=2, write_stats=WriteStats())
 
             _export_playlists(temp_db, config, playlist_ids=["playlist1", "playlist2"])
 
@@ -283,6 +284,19 @@ class TestWatchModeIncrementalPipeline:
             call_args = mock_export.call_args
             assert call_args.kwargs["playlist_ids"] == ["playlist1", "playlist2"]
 
+    def test_export_playlists_helper_exports_liked_songs_only(self, temp_db: Database, tmp_path: Path):
+        """Test that a Liked Songs-only change exports just the virtual playlist, not everything."""
+        config = {"export": {"directory": str(tmp_path / "export"), "organize_by_owner": False}}
+
+        with patch("psm.services.watch_build_service.export_playlists") as mock_export:
+            mock_export.return_value = Mock(playlist_count=1, write_stats=WriteStats())
+
+            _export_playlists(temp_db, config, playlist_ids=[], liked_songs=True)
+
+            call_args = mock_export.call_args
+            assert call_args.kwargs["playlist_ids"] == []
+            assert call_args.kwargs["liked_songs"] is True
+
     def test_generate_reports_helper_skips_on_empty_list(self, temp_db: Database, tmp_path: Path):
         """Test that _generate_reports helper skips when playlist_ids is empty list."""
         config = {"reports": {"directory": str(tmp_path / "reports")}}
@@ -0,0 +1,121 @@
+"""Watch-mode library updates: moves/renames as in-place path updates, event-storm rescans."""
+
+from psm.db import Database
+from psm.ingest.library import apply_library_moves
+from psm.utils.fs import normalize_library_path
+
+
+def _add_file(db, path, title):
+    db.add_library_file(
+        {
+            "path": normalize_library_path(path),
+            "size": 100,
+            "mtime": 1.0,
+            "title": title,
+            "album": "Album",
+            "artist": "Artist",
+            "duration": 200.0,
+            "normalized": f"{title.lower()} artist",
+        }
+    )
+    db.commit()
+    return db.conn.execute("SELECT id FROM library_files WHERE path=?", (normalize_library_path(path),)).fetchone()[
+        "id"
+    ]
+
+
+def _path_of(db, file_id):
+    row = db.conn.execute("SELECT path FROM library_files WHERE id=?", (file_id,)).fetchone()
+    return row["path"] if row else None
+
+
+def test_file_and_directory_moves_keep_ids_and_matches(tmp_path):
+    old_dir, new_dir = tmp_path / "Old Album", tmp_path / "New Album"
+    with Database(tmp_path / "psm.db") as db:
+        a = _add_file(db, old_dir / "1.mp3", "One")
+        b = _add_file(db, old_dir / "disc2" / "2.mp3", "Two")
+        sibling = _add_file(db, tmp_path / "Old Album 2" / "3.mp3", "Three")  # shares the name prefix
+        c = _add_file(db, tmp_path / "single.mp3", "Single")
+        db.add_match("t1", a, 0.95, "score", provider="spotify")
+        db.commit()
+
+        result = apply_library_moves(
+            db,
+            [
+                (old_dir, new_dir, True),
+                (tmp_path / "single.mp3", tmp_path / "renamed.mp3", False),
+            ],
+        )
+
+        assert result.moved == 3
+        assert sorted(result.moved_file_ids) == sorted([a, b, c])
+        assert _path_of(db, a) == normalize_library_path(new_dir / "1.mp3")
+        assert _path_of(db, b) == normalize_library_path(new_dir / "disc2" / "2.mp3")
+        assert _path_of(db, sibling) == normalize_library_path(tmp_path / "Old Album 2" / "3.mp3")
+        assert _path_of(db, c) == normalize_library_path(tmp_path / "renamed.mp3")
+        match = db.conn.execute("SELECT file_id FROM matches WHERE track_id='t1'").fetchone()
+        assert match["file_id"] == a
+
+
+def test_move_onto_existing_file_replaces_it_and_unknown_source_is_unresolved(tmp_path):
+    with Database(tmp_path / "psm.db") as db:
+        src = _add_file(db, tmp_path / "new.mp3", "New")
+        old = _add_file(db, tmp_path / "old.mp3", "Old")
+        db.add_match("t_old", old, 0.9, "score", provider="spotify")
+        db.commit()
+
+        result = apply_library_moves(
+            db,
+            [
+                (tmp_path / "new.mp3", tmp_path / "old.mp3", False),
+                (tmp_path / "download.mp3.tmp", tmp_path / "download.mp3", False),
+            ],
+        )
+
+        assert result.moved == 1
+        assert result.replaced == 1
+        assert _path_of(db, src) == normalize_library_path(tmp_path / "old.mp3")
+        assert _path_of(db, old) is None
+        assert db.conn.execute("SELECT COUNT(*) FROM matches WHERE file_id=?", (old,)).fetchone()[0] == 0
+        assert result.unresolved == [tmp_path / "download.mp3"]
+
+
+def test_bulk_lookup_and_directory_scoped_rescan(tmp_path, test_config):
+    from psm.ingest.library import file_ids_under, lookup_file_ids, scan_library_incremental
+
+    music = tmp_path / "music"
+    (music / "kept").mkdir(parents=True)
+    (music / "storm").mkdir(parents=True)
+    (music / "storm" / "new.mp3").write_bytes(b"x")
+    test_config["library"]["paths"] = [str(music)]
+    with Database(tmp_path / "psm.db") as db:
+        kept = _add_file(db, music / "kept" / "not_on_disk.mp3", "Kept")
+        gone = _add_file(db, music / "storm" / "gone.mp3", "Gone")
+
+        result = scan_library_incremental(db, test_config, specific_paths=[music / "storm"])
+
+        # Only files below the rescanned directory can be detected as deleted
+        assert result.deleted == 1
+        assert _path_of(db, gone) is None
+        assert _path_of(db, kept) is not None
+        ids = lookup_file_ids(db, [music / "storm" / "new.mp3", music / "kept" / "not_on_disk.mp3", music / "x.mp3"])
+        assert set(ids) == {normalize_library_path(music / "storm" / "new.mp3"), _path_of(db, kept)}
+        assert file_ids_under(db, [music / "storm"]) == [ids[normalize_library_path(music / "storm" / "new.mp3")]]
+
+
+def test_rescan_of_vanished_directory_deletes_its_files(tmp_path, test_config):
+    from psm.ingest.library import scan_library_incremental
+
+    music = tmp_path / "music"
+    (music / "kept").mkdir(parents=True)
+    test_config["library"]["paths"] = [str(music)]
+    with Database(tmp_path / "psm.db") as db:
+        gone = [_add_file(db, music / "trashed" / f"{i}.mp3", "Gone") for i in range(2)]
+        kept = _add_file(db, music / "kept" / "not_on_disk.mp3", "Kept")
+
+        # A directory moved out of the library (e.g. into an ignored trash folder)
+        result = scan_library_incremental(db, test_config, specific_paths=[music / "trashed"])
+
+        assert result.deleted == 2
+        assert [_path_of(db, file_id) for file_id in gone] == [None, None]
+        assert _path_of(db, kept) is not None
@@ -5,9 +5,9 @@ from __future__ import annotations
 Stores data in simple Python data structures; provides minimal behavior
 needed by service-layer logic. Extend incrementally.
 """
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from psm.db import DatabaseInterface
-from psm.db.models import TrackRow, LibraryFileRow, PlaylistRow
+from psm.db.models import TrackRow, LibraryFileRow, PlaylistRow, ChangeSet
 
 
 class MockRow(dict):
@@ -270,6 +270,13 @@ class MockDatabase(DatabaseInterface):
     def get_meta(self, key: str) -> Optional[str]:
         return self.meta.get(key)
 
+    # Change journal (not tracked by the mock)
+    def get_change_cursor(self) -> int:
+        return 0
+
+    def read_changes(self, after_seq: int, exclude_own: bool = False) -> ChangeSet:
+        return ChangeSet(cursor=after_seq)
+
     def commit(self):  # no-op
         pass
 
@@ -542,7 +549,7 @@ class MockDatabase(DatabaseInterface):
                 }
             )
         # Sort by owner_name then name
-        playlists.sort(key=lambda p: (p.get("owner_name") or "", p.get("name") or ""))
+        playlists.sort(key=lambda p: (p.get("owner_name") or "", p.get("name") or "", p["id"]))
         return playlists
 
     def get_playlist_tracks_with_local_paths(
@@ -589,6 +596,40 @@ class MockDatabase(DatabaseInterface):
 
         return result
 
+    def iter_playlists_with_local_paths(
+        self, playlist_ids: Optional[List[str]] = None, provider: str | None = None
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Stream playlists with their tracks and best local paths."""
+        for playlist in self.list_playlists(playlist_ids, provider):
+            yield playlist, self.get_playlist_tracks_with_local_paths(playlist["id"], provider)
+
+    def map_paths_to_track_ids(
+        self, paths: Sequence[str], playlist_id: str | None = None, provider: str | None = None
+    ) -> Dict[str, str]:
+        """Resolve local file paths to matched tracks (best match for the file, then playlist, then score)."""
+        provider = provider or "spotify"
+        file_ids = {path: i + 1 for i, path in enumerate(self.library_files)}
+        best: Dict[str, Dict[str, Any]] = {}
+        for m in self.matches:
+            if m["provider"] == provider and (m["track_id"] not in best or m["score"] > best[m["track_id"]]["score"]):
+                best[m["track_id"]] = m
+        in_playlist = {tid for _, tid, _ in self.playlist_tracks.get((playlist_id, provider), [])}
+        result: Dict[str, str] = {}
+        for path in dict.fromkeys(paths):
+            candidates = [m for m in self.matches if m["provider"] == provider and m["file_id"] == file_ids.get(path)]
+            if candidates:
+                chosen = min(
+                    candidates,
+                    key=lambda m: (
+                        best[m["track_id"]]["file_id"] != m["file_id"],
+                        m["track_id"] not in in_playlist,
+                        -m["score"],
+                        m["track_id"],
+                    ),
+                )
+                result[path] = chosen["track_id"]
+        return result
+
     def get_liked_tracks_with_local_paths(self, provider: str | None = None) -> List[Dict[str, Any]]:
         """Get liked tracks with matched local file paths (best match only per track), newest first."""
         provider = provider or "spotify"
@@ -0,0 +1,165 @@
+"""Tests for the concurrent prefetching scan pipeline (network mode)."""
+
+import threading
+import time
+
+from psm.ingest.prefetch import AdaptiveLimiter, PrefetchScanner
+from psm.utils.latency import LatencyHistogram, PhaseTimings
+
+
+def _make_tree(root):
+    (root / "a" / "b").mkdir(parents=True)
+    for rel in ["one.mp3", "a/two.flac", "a/b/three.mp3", "a/b/cover.jpg", "a/.hidden.mp3"]:
+        (root / rel).write_bytes(b"x" * 10)
+
+
+def test_histogram_percentiles():
+    hist = LatencyHistogram()
+    for _ in range(90):
+        hist.record(0.001)  # 1 ms
+    for _ in range(10):
+        hist.record(0.100)  # 100 ms
+    assert hist.count == 100
+    assert 0.001 <= hist.percentile(50) < 0.002  # log2 bucket upper bound
+    assert hist.percentile(99) == hist.max == 0.100
+    assert abs(hist.mean - 0.0109) < 1e-9
+
+
+def test_phase_timings_summary():
+    timings = PhaseTimings()
+    with timings.measure("stat"):
+        pass
+    timings.record("tags", 0.005)
+    lines = timings.summary_lines()
+    assert [line.split()[0] for line in lines] == ["stat", "tags"]
+
+
+def test_limiter_bounds_in_flight():
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=8)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+    limiter.release()
+    assert limiter.try_acquire()
+
+
+class _FakeClock:
+    """perf_counter replacement advancing by ``step`` seconds per call."""
+
+    def __init__(self, step=1.0):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def _saturated_window(limiter):
+    while limiter.try_acquire():
+        pass
+    limiter.release()  # window=1: every completion triggers an adjustment
+    while limiter.in_flight:
+        limiter.in_flight -= 1
+
+
+def test_limiter_grows_while_saturated(monkeypatch):
+    monkeypatch.setattr("psm.ingest.prefetch.time.perf_counter", _FakeClock())
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=16, window=1)
+    for _ in range(20):
+        _saturated_window(limiter)
+    assert limiter.limit == 16
+
+
+def test_limiter_backs_off_when_throughput_drops(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr("psm.ingest.prefetch.time.perf_counter", clock)
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=64, window=1)
+    for _ in range(6):
+        _saturated_window(limiter)
+    peak = limiter.limit
+    clock.step = 10.0  # completions suddenly take much longer
+    _saturated_window(limiter)
+    assert limiter.limit < peak
+
+
+def test_limiter_holds_when_work_starved(monkeypatch):
+    monkeypatch.setattr("psm.ingest.prefetch.time.perf_counter", _FakeClock())
+    limiter = AdaptiveLimiter(min_limit=4, max_limit=16, window=1)
+    for _ in range(10):
+        assert limiter.try_acquire()
+        limiter.release()
+    assert limiter.limit == 4
+
+
+def test_scanner_walks_filters_and_reads(tmp_path):
+    _make_tree(tmp_path)
+    seen, read = [], {}
+    timings = PhaseTimings()
+
+    def slow_read(path):
+        time.sleep(0.002)
+        return path.name.upper()
+
+    scanner = PrefetchScanner(
+        [str(tmp_path)], [".mp3", ".flac"], [".*"], False, slow_read, min_concurrency=2, timings=timings
+    )
+
+    def on_stat(cand):
+        seen.append(cand.path_str)
+        assert cand.stat is not None and cand.stat.st_size == 10
+        return cand.path.name != "one.mp3"  # skip one file
+
+    def on_read(cand, value):
+        read[cand.path.name] = value
+
+    done_roots = []
+    scanner.run(on_stat, on_read, lambda root, seconds: done_roots.append(root))
+
+    assert sorted(seen) == sorted(
+        str(p.resolve()) for p in tmp_path.rglob("*") if p.name in {"one.mp3", "two.flac", "three.mp3"}
+    )
+    assert read == {"two.flac": "TWO.FLAC", "three.mp3": "THREE.MP3"}
+    assert done_roots == [str(tmp_path)]
+    assert timings.histogram("listdir").count == 3
+    assert timings.histogram("stat").count == 3
+    assert timings.histogram("tags").count == 2
+
+
+def test_scanner_skips_missing_roots(tmp_path):
+    scanner = PrefetchScanner([str(tmp_path / "missing")], [".mp3"], [], False, lambda p: None)
+    scanner.run(lambda c: True, lambda c, v: None)
+
+
+def test_scanner_runs_roots_in_parallel_under_global_cap(tmp_path):
+    roots = []
+    for name in ("disk1", "disk2", "disk3"):
+        root = tmp_path / name
+        _make_tree(root)
+        roots.append(str(root))
+
+    in_flight = {"now": 0, "peak": 0, "roots": set(), "overlap": False}
+    lock = threading.Lock()
+
+    def tracked_read(path):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            in_flight["roots"].add(path.relative_to(tmp_path).parts[0])
+            if len(in_flight["roots"]) > 1:
+                in_flight["overlap"] = True
+        time.sleep(0.01)
+        with lock:
+            in_flight["now"] -= 1
+            in_flight["roots"].discard(path.relative_to(tmp_path).parts[0])
+        return None
+
+    scanner = PrefetchScanner(
+        roots, [".mp3", ".flac"], [".*"], False, tracked_read, min_concurrency=1, max_concurrency=2
+    )
+    done = {}
+    scanner.run(lambda c: True, lambda c, v: None, lambda root, seconds: done.setdefault(root, seconds))
+
+    assert set(done) == set(roots)
+    assert scanner.root_durations == done
+    assert in_flight["peak"] <= 2
+    assert in_flight["overlap"]  # reads from different roots were in flight together
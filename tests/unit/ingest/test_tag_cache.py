@@ -0,0 +1,126 @@
+"""Tests for the persistent sidecar tag cache."""
+
+import os
+import sqlite3
+import time
+
+from psm.ingest.tag_cache import TagCache, open_tag_cache, tag_cache_path
+
+RECORD = {"title": "Song", "artist": "Artist", "album": "Album", "year": 2001, "duration": 180.5, "bitrate_kbps": 320}
+
+
+def _write(path, data=b"audio"):
+    path.write_bytes(data)
+    return os.stat(path)
+
+
+def test_hit_after_flush_and_reopen(tmp_path):
+    f = tmp_path / "a.mp3"
+    st = _write(f)
+    cache = TagCache(tmp_path / "cache.db")
+    assert cache.get(str(f), st) is None
+    cache.put(str(f), st, {**RECORD, "normalized": "ignored"}, False)
+    cache.close()
+
+    cache = TagCache(tmp_path / "cache.db")
+    fields, parse_error = cache.get(str(f), st)
+    assert fields == RECORD
+    assert parse_error is False
+    assert (cache.hits, cache.misses) == (1, 0)
+    cache.close()
+
+
+def test_changed_file_misses_and_is_replaced(tmp_path):
+    f = tmp_path / "a.mp3"
+    st = _write(f)
+    cache = TagCache(tmp_path / "cache.db")
+    cache.put(str(f), st, RECORD, False)
+    cache.flush()
+
+    st2 = _write(f, b"different length")
+    assert cache.get(str(f), st2) is None
+    cache.put(str(f), st2, {**RECORD, "title": "New"}, False)
+    cache.flush()
+    assert len(cache) == 1
+    assert cache.get(str(f), st2)[0]["title"] == "New"
+    cache.close()
+
+
+def test_moved_file_still_hits(tmp_path):
+    f = tmp_path / "a.mp3"
+    st = _write(f)
+    cache = TagCache(tmp_path / "cache.db")
+    cache.put(str(f), st, RECORD, True)
+    cache.flush()
+
+    moved = tmp_path / "renamed.mp3"
+    f.rename(moved)
+    fields, parse_error = cache.get(str(moved), os.stat(moved))
+    assert fields["title"] == "Song"
+    assert parse_error is True
+    cache.close()
+
+
+def test_evict_stale(tmp_path):
+    f = tmp_path / "a.mp3"
+    st = _write(f)
+    cache = TagCache(tmp_path / "cache.db", max_age_days=30)
+    cache.put(str(f), st, RECORD, False)
+    cache.flush()
+    assert cache.evict_stale() == 0
+
+    cache.conn.execute("UPDATE tags SET last_seen=?", (time.time() - 31 * 86400,))
+    assert cache.evict_stale() == 1
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_old_hit_refreshes_last_seen(tmp_path):
+    f = tmp_path / "a.mp3"
+    st = _write(f)
+    cache = TagCache(tmp_path / "cache.db", max_age_days=30)
+    cache.put(str(f), st, RECORD, False)
+    cache.flush()
+    cache.conn.execute("UPDATE tags SET last_seen=?", (time.time() - 29 * 86400,))
+    cache.conn.commit()
+    cache.close()
+
+    cache = TagCache(tmp_path / "cache.db", max_age_days=30)
+    assert cache.get(str(f), st) is not None
+    cache.flush()
+    assert cache.evict_stale() == 0
+    cache.close()
+
+
+def test_version_mismatch_discards_entries(tmp_path):
+    f = tmp_path / "a.mp3"
+    st = _write(f)
+    cache = TagCache(tmp_path / "cache.db")
+    cache.put(str(f), st, RECORD, False)
+    cache.close()
+
+    conn = sqlite3.connect(tmp_path / "cache.db")
+    conn.execute("PRAGMA user_version=0")
+    conn.commit()
+    conn.close()
+
+    cache = TagCache(tmp_path / "cache.db")
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_open_tag_cache_location_and_disable(tmp_path):
+    cfg = {"library": {}}
+    assert tag_cache_path(cfg, tmp_path / "db" / "psm.db") == tmp_path / "db" / "tag_cache.db"
+    assert tag_cache_path(cfg, None) is None
+    assert tag_cache_path({"library": {"tag_cache_path": str(tmp_path / "x.db")}}) == tmp_path / "x.db"
+
+    assert open_tag_cache({"library": {"tag_cache": False}}, tmp_path / "psm.db") is None
+    cache = open_tag_cache(cfg, tmp_path / "psm.db")
+    assert cache is not None and cache.path == tmp_path / "tag_cache.db"
+    cache.close()
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    (tmp_path / "tag_cache.db").write_bytes(b"not a database" * 100)
+    assert open_tag_cache({"library": {}}, tmp_path / "psm.db") is None
@@ -0,0 +1,94 @@
+"""Fast MP3/FLAC tag reader agrees with mutagen on synthetic files."""
+
+import struct
+from pathlib import Path
+
+import mutagen
+import pytest
+
+from psm.ingest.library import extract_tags
+from psm.ingest.tag_reader import read_fast_tags
+
+MPEG_FRAME_HEADER = b"\xff\xfb\x90\x00"  # MPEG1 Layer III, 128 kbps, 44.1 kHz, stereo
+MPEG_FRAME_LEN = 417
+
+
+def _id3_text(frame_id: bytes, text: str) -> bytes:
+    payload = b"\x03" + text.encode("utf-8")
+    return frame_id + struct.pack(">I", len(payload)) + b"\x00\x00" + payload
+
+
+def _syncsafe(n: int) -> bytes:
+    return bytes([(n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F])
+
+
+def write_mp3(path: Path, frames: int = 200, vbr: bool = True) -> Path:
+    body = b"".join(
+        [
+            _id3_text(b"TIT2", "Fast Song"),
+            _id3_text(b"TPE1", "Fast Artist"),
+            _id3_text(b"TALB", "Fast Album"),
+            _id3_text(b"TYER", "2019"),
+        ]
+    )
+    body += b"\x00" * 64  # padding
+    tag = b"ID3\x03\x00\x00" + _syncsafe(len(body)) + body
+    audio = b""
+    if vbr:
+        xing = MPEG_FRAME_HEADER + b"\x00" * 32 + b"Xing" + struct.pack(">III", 3, frames, frames * MPEG_FRAME_LEN)
+        audio += xing + b"\x00" * (MPEG_FRAME_LEN - len(xing))
+    audio += (MPEG_FRAME_HEADER + b"\x00" * (MPEG_FRAME_LEN - 4)) * frames
+    path.write_bytes(tag + audio)
+    return path
+
+
+def write_flac(path: Path, seconds: int = 3) -> Path:
+    sample_rate, channels, bps = 44100, 2, 16
+    total = sample_rate * seconds
+    packed = (sample_rate << 44) | ((channels - 1) << 41) | ((bps - 1) << 36) | total
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\x00" * 6 + packed.to_bytes(8, "big") + b"\x00" * 16
+    comments = [b"TITLE=Flac Song", b"ARTIST=Flac Artist", b"ALBUM=Flac Album", b"DATE=2021-05-01"]
+    vendor = b"psm-test"
+    vc = struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", len(comments))
+    vc += b"".join(struct.pack("<I", len(c)) + c for c in comments)
+    mime, image = b"image/jpeg", b"\x00" * 2048
+    picture = struct.pack(">II", 3, len(mime)) + mime + struct.pack(">IIIIII", 0, 1, 1, 24, 0, len(image)) + image
+    blocks = b"\x00" + len(streaminfo).to_bytes(3, "big") + streaminfo
+    blocks += b"\x06" + len(picture).to_bytes(3, "big") + picture
+    blocks += b"\x84" + len(vc).to_bytes(3, "big") + vc
+    path.write_bytes(b"fLaC" + blocks + b"\x00" * 10_000)
+    return path
+
+
+@pytest.mark.parametrize("vbr", [True, False])
+def test_mp3_matches_mutagen(tmp_path, vbr):
+    p = write_mp3(tmp_path / "song.mp3", vbr=vbr)
+    fast = read_fast_tags(p)
+    ref = mutagen.File(p)
+    assert fast is not None
+    assert extract_tags(fast) == {k: v for k, v in extract_tags(ref).items()}
+    assert fast.info.length == pytest.approx(ref.info.length, rel=0.02)
+    assert fast.info.bitrate // 1000 == pytest.approx(ref.info.bitrate // 1000, abs=2)
+
+
+def test_flac_matches_mutagen(tmp_path):
+    p = write_flac(tmp_path / "song.flac")
+    fast = read_fast_tags(p)
+    ref = mutagen.File(p)
+    assert fast is not None
+    assert extract_tags(fast) == extract_tags(ref)
+    assert fast.info.length == pytest.approx(ref.info.length)
+    assert fast.info.sample_rate == ref.info.sample_rate
+    assert fast.info.bits_per_sample == ref.info.bits_per_sample
+
+
+def test_unsupported_inputs_fall_back(tmp_path):
+    no_id3 = tmp_path / "plain.mp3"
+    no_id3.write_bytes(MPEG_FRAME_HEADER + b"\x00" * 1000)
+    bad_version = tmp_path / "bad.mp3"
+    bad_version.write_bytes(b"ID3" + b"\0" * 1024)
+    other = tmp_path / "song.m4a"
+    other.write_bytes(b"\x00" * 100)
+    assert read_fast_tags(no_id3) is None
+    assert read_fast_tags(bad_version) is None
+    assert read_fast_tags(other) is None
@@ -0,0 +1,41 @@
+"""Tests for lazy subcommand loading in the root CLI group."""
+
+import importlib
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from psm.cli import cli
+from psm.cli.helpers import LAZY_COMMANDS
+
+HEAVY_MODULES = ("mutagen", "rapidfuzz", "requests", "psm.match.matching_engine", "psm.services.pull_service")
+
+
+def test_lazy_commands_match_registered_commands():
+    """LAZY_COMMANDS names every command each module registers, and nothing else."""
+    for module in sorted(set(LAZY_COMMANDS.values())):
+        importlib.import_module(f"psm.cli.{module}")
+    assert sorted(cli.commands) == sorted(LAZY_COMMANDS)
+    for name, command in cli.commands.items():
+        assert command.callback.__module__ == f"psm.cli.{LAZY_COMMANDS[name]}", name
+
+
+def test_import_cli_skips_heavy_modules():
+    """Importing the CLI (and resolving a light command) loads no matching, tag or HTTP code."""
+    code = (
+        "import sys\n"
+        "from psm.cli import cli\n"
+        "import click\n"
+        "cli.get_command(click.Context(cli), 'config')\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip().splitlines()[-1] == "[]"
+
+
+def test_help_lists_lazy_commands():
+    result = CliRunner().invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for name in ("build", "match", "serve", "token-info"):
+        assert name in result.output
@@ -14,3 +14,35 @@ def test_partial_hash_tmp(tmp_path: Path):
         fh.write(b"b" * 10)
     h3 = partial_hash(p)
     assert h3 != h1
+
+
+def test_partial_hash_sha1_matches_legacy_layout(tmp_path: Path):
+    import hashlib
+
+    p = tmp_path / "big.bin"
+    data = bytes(range(256)) * 1024  # 256KB > head+tail
+    p.write_bytes(data)
+    expected = hashlib.sha1(str(len(data)).encode() + data[: 64 * 1024] + data[-64 * 1024 :]).hexdigest()
+    assert partial_hash(p) == expected
+
+
+def test_partial_hash_records_algorithm(tmp_path: Path):
+    from psm.utils.hashing import split_hash, same_content
+
+    p = tmp_path / "file.bin"
+    p.write_bytes(b"x" * 200_000)
+    value = partial_hash(p, algorithm="blake2b")
+    assert value.startswith("blake2b:")
+    assert split_hash(value)[0] == "blake2b"
+    assert split_hash(partial_hash(p)) == ("sha1", partial_hash(p))
+    # Both new and legacy stored values remain comparable
+    assert same_content(p, value)
+    assert same_content(p, partial_hash(p))
+    p.write_bytes(b"y" * 200_000)
+    assert not same_content(p, value)
+
+
+def test_partial_hash_empty_file(tmp_path: Path):
+    p = tmp_path / "empty.bin"
+    p.write_bytes(b"")
+    assert partial_hash(p, algorithm="blake2b") == partial_hash(p, algorithm="blake2b")
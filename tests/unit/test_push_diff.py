@@ -0,0 +1,69 @@
+"""Unit tests for the minimal playlist edit planner used by push."""
+
+import random
+
+import pytest
+
+from psm.providers.base import InsertTracks, MoveRange, RemoveTracks
+from psm.push.diff import apply_edits, plan_playlist_edits, replace_call_count
+
+
+def _ids(n: int, prefix: str = "t") -> list[str]:
+    return [f"{prefix}{i}" for i in range(n)]
+
+
+def test_single_reorder_is_one_move():
+    current = _ids(3000)
+    desired = current[:]
+    desired.insert(1500, desired.pop(10))
+    plan = plan_playlist_edits(current, desired)
+    assert plan.ops == [MoveRange(range_start=10, range_length=1, insert_before=1501)]
+    assert replace_call_count(3000) == 31
+
+
+def test_adjacent_tracks_move_as_one_range():
+    current = _ids(10)
+    desired = current[:2] + current[5:8] + current[2:5] + current[8:]
+    plan = plan_playlist_edits(current, desired)
+    assert plan.api_calls == 1
+    assert apply_edits(current, plan.ops) == desired
+
+
+def test_removes_and_batched_inserts():
+    current = _ids(300)
+    desired = current[:100] + _ids(150, "new") + current[100:290]
+    plan = plan_playlist_edits(current, desired)
+    assert plan.ops[0] == RemoveTracks(tuple(current[290:]))
+    assert [type(op) for op in plan.ops[1:]] == [InsertTracks, InsertTracks]
+    assert plan.ops[1].position == 100 and len(plan.ops[1].track_ids) == 100
+    assert apply_edits(current, plan.ops) == desired
+
+
+def test_partially_kept_duplicates_are_reinserted():
+    # Remove endpoints drop every occurrence of a track
+    current = ["a", "b", "a", "c", "a"]
+    desired = ["b", "a", "c"]
+    plan = plan_playlist_edits(current, desired)
+    assert plan.ops[0] == RemoveTracks(("a",))
+    assert apply_edits(current, plan.ops) == desired
+
+
+def test_over_budget_returns_none():
+    current = _ids(300)
+    desired = current[::-1]
+    assert plan_playlist_edits(current, desired, max_calls=replace_call_count(300) - 1) is None
+
+
+def test_identical_orders_need_no_calls():
+    assert plan_playlist_edits(_ids(5), _ids(5)).ops == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_reach_desired_order(seed: int):
+    rng = random.Random(seed)
+    for _ in range(200):
+        pool = _ids(rng.randint(1, 20))
+        current = [rng.choice(pool) for _ in range(rng.randint(0, 40))]
+        desired = [rng.choice(pool) for _ in range(rng.randint(0, 40))]
+        plan = plan_playlist_edits(current, desired, batch_size=rng.choice([2, 5, 100]))
+        assert apply_edits(current, plan.ops) == desired
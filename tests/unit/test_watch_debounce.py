@@ -0,0 +1,249 @@
+"""Tests for the coalescing debounce worker in DebouncedLibraryWatcher."""
+
+import threading
+import time
+from pathlib import Path
+
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, DirCreatedEvent
+
+from psm.services.watch_service import DebouncedLibraryWatcher
+
+CONFIG = {"library": {"extensions": [".mp3", ".flac"], "ignore_patterns": []}}
+
+
+class Recorder:
+    def __init__(self):
+        self.batches = []
+        self.event = threading.Event()
+
+    def __call__(self, paths):
+        self.batches.append(list(paths))
+        self.event.set()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_events_coalesced_into_one_batch_after_quiet_period(tmp_path):
+    rec = Recorder()
+    watcher = DebouncedLibraryWatcher(CONFIG, rec, debounce_seconds=0.1)
+    a, b = tmp_path / "a.mp3", tmp_path / "b.flac"
+    for _ in range(5):
+        watcher.on_any_event(FileModifiedEvent(str(a)))
+    watcher.on_any_event(FileCreatedEvent(str(b)))
+    watcher.on_any_event(FileCreatedEvent(str(tmp_path / "cover.jpg")))  # filtered
+    watcher.on_any_event(DirCreatedEvent(str(tmp_path / "album")))  # filtered
+
+    assert rec.event.wait(2.0)
+    assert rec.batches == [[a, b]]
+    stats = watcher.stats()
+    assert stats["events_received"] == 6
+    assert stats["events_coalesced"] == 4
+    assert stats["queue_depth"] == 0
+    assert stats["batches_processed"] == 1
+    watcher.stop()
+
+
+def test_single_worker_thread_for_many_events(tmp_path):
+    rec = Recorder()
+    watcher = DebouncedLibraryWatcher(CONFIG, rec, debounce_seconds=0.2)
+    before = threading.active_count()
+    for i in range(2000):
+        watcher.on_any_event(FileCreatedEvent(str(tmp_path / f"{i}.mp3")))
+    assert threading.active_count() <= before + 1
+    assert watcher.queue_depth == 2000
+    watcher.stop()
+    assert sum(len(b) for b in rec.batches) == 2000
+
+
+def test_sustained_events_flushed_by_max_batch_latency(tmp_path):
+    rec = Recorder()
+    watcher = DebouncedLibraryWatcher(CONFIG, rec, debounce_seconds=0.2, max_batch_seconds=0.3)
+    start = time.monotonic()
+    i = 0
+    # Events every 50ms never leave a 200ms quiet period
+    while time.monotonic() - start < 1.0:
+        watcher.on_any_event(FileCreatedEvent(str(tmp_path / f"{i}.mp3")))
+        i += 1
+        time.sleep(0.05)
+    assert len(rec.batches) >= 2  # processed in chunks while the copy was still running
+    watcher.stop()
+    assert sum(len(b) for b in rec.batches) == i
+
+
+def test_bounded_queue_drops_and_counts(tmp_path):
+    rec = Recorder()
+    release = threading.Event()
+
+    def slow_callback(paths):
+        release.wait(2.0)
+        rec(paths)
+
+    watcher = DebouncedLibraryWatcher(CONFIG, slow_callback, debounce_seconds=5.0, max_pending=3)
+    for i in range(3):
+        watcher.on_any_event(FileCreatedEvent(str(tmp_path / f"{i}.mp3")))
+    # Full queue triggers immediate processing instead of waiting 5s for quiet
+    watcher.on_any_event(FileCreatedEvent(str(tmp_path / "overflow.mp3")))
+    assert _wait_for(lambda: watcher.queue_depth == 0)
+    release.set()
+    assert rec.event.wait(2.0)
+    assert rec.batches[0] == [tmp_path / f"{i}.mp3" for i in range(3)]
+    assert watcher.stats()["events_dropped"] == 1
+    watcher.stop()
+
+
+def test_stop_flushes_pending_and_ends_worker(tmp_path):
+    rec = Recorder()
+    watcher = DebouncedLibraryWatcher(CONFIG, rec, debounce_seconds=60)
+    watcher.on_any_event(FileCreatedEvent(str(tmp_path / "a.mp3")))
+    worker = watcher._worker
+    watcher.stop()
+    assert rec.batches == [[Path(tmp_path / "a.mp3")]]
+    assert not worker.is_alive()
+
+
+class MoveRecorder(Recorder):
+    def __init__(self, log):
+        super().__init__()
+        self.log = log
+
+    def __call__(self, moves):
+        self.log.append(("moves", list(moves)))
+
+
+def test_moves_delivered_before_changes_and_retarget_pending(tmp_path):
+    from watchdog.events import FileMovedEvent, DirMovedEvent
+    from psm.services.watch_service import PathMove
+
+    log = []
+    on_change = Recorder()
+    watcher = DebouncedLibraryWatcher(CONFIG, on_change, debounce_seconds=0.1, on_move_callback=MoveRecorder(log))
+    old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+    watcher.on_any_event(FileModifiedEvent(str(old_dir / "1.mp3")))
+    watcher.on_any_event(DirMovedEvent(str(old_dir), str(new_dir)))
+    # Child events some platforms emit for a directory move are implied by it
+    watcher.on_any_event(FileMovedEvent(str(old_dir / "2.mp3"), str(new_dir / "2.mp3")))
+    watcher.on_any_event(FileMovedEvent(str(tmp_path / "a.mp3"), str(tmp_path / "b.mp3")))
+    # Completed download: only the destination is a music file
+    watcher.on_any_event(FileMovedEvent(str(tmp_path / "c.mp3.part"), str(tmp_path / "c.mp3")))
+
+    assert on_change.event.wait(2.0)
+    assert log == [
+        (
+            "moves",
+            [PathMove(old_dir, new_dir, True), PathMove(tmp_path / "a.mp3", tmp_path / "b.mp3", False)],
+        )
+    ]
+    assert on_change.batches == [[new_dir / "1.mp3", tmp_path / "c.mp3"]]
+    assert watcher.stats()["events_coalesced"] == 1
+    watcher.stop()
+
+
+def test_moves_without_callback_fall_back_to_delete_and_create(tmp_path):
+    from watchdog.events import FileMovedEvent
+
+    rec = Recorder()
+    watcher = DebouncedLibraryWatcher(CONFIG, rec, debounce_seconds=0.1)
+    watcher.on_any_event(FileMovedEvent(str(tmp_path / "a.mp3"), str(tmp_path / "b.mp3")))
+    assert rec.event.wait(2.0)
+    assert rec.batches == [[tmp_path / "a.mp3", tmp_path / "b.mp3"]]
+    watcher.stop()
+
+
+def test_collapse_to_directories_drops_nested_and_stops_at_roots(tmp_path):
+    from psm.services.watch_service import collapse_to_directories
+
+    root = tmp_path / "music"
+    paths = [root / "A" / "x" / f"{i}.mp3" for i in range(3)] + [root / "A" / "1.mp3", root / "B" / "2.mp3"]
+    assert collapse_to_directories(paths, roots=[root]) == [root / "A", root / "B"]
+
+    many = [root / f"album{i}" / "disc1" / "1.mp3" for i in range(10)]
+    collapsed = collapse_to_directories(many, roots=[root], max_directories=4)
+    assert collapsed == [root]  # never climbs above the library root
+
+
+def test_event_storm_delivered_as_directories(tmp_path):
+    changes, storms = Recorder(), Recorder()
+    watcher = DebouncedLibraryWatcher(
+        CONFIG, changes, debounce_seconds=0.1, max_pending=50, on_storm_callback=storms, storm_threshold=20
+    )
+    for album in range(3):
+        for i in range(30):
+            watcher.on_any_event(FileCreatedEvent(str(tmp_path / f"album{album}" / f"{i}.mp3")))
+
+    assert storms.event.wait(2.0)
+    assert _wait_for(lambda: watcher.queue_depth == 0)
+    delivered = sorted({d for batch in storms.batches for d in batch})
+    assert delivered == [tmp_path / f"album{i}" for i in range(3)]
+    stats = watcher.stats()
+    assert stats["events_dropped"] == 0
+    assert stats["events_overflowed"] > 0
+    assert stats["storm_batches"] >= 1
+    watcher.stop()
+
+
+def test_directory_moved_to_ignored_destination_rescans_source(tmp_path):
+    from watchdog.events import DirMovedEvent
+
+    config = {"library": {"extensions": [".mp3"], "ignore_patterns": [".Trash"]}}
+    log, changes, storms = [], Recorder(), Recorder()
+    watcher = DebouncedLibraryWatcher(
+        config, changes, debounce_seconds=0.1, on_move_callback=MoveRecorder(log), on_storm_callback=storms
+    )
+    album = tmp_path / "music" / "album"
+    watcher.on_any_event(DirMovedEvent(str(album), str(tmp_path / ".Trash" / "album")))
+
+    assert storms.event.wait(2.0)
+    assert storms.batches == [[album]]  # The vanished subtree is rescanned, so its files are deleted
+    assert log == [] and changes.batches == []
+    watcher.stop()
+
+
+def test_directory_move_without_move_callback_rescans_both_sides(tmp_path):
+    from watchdog.events import DirMovedEvent
+
+    changes, storms = Recorder(), Recorder()
+    watcher = DebouncedLibraryWatcher(CONFIG, changes, debounce_seconds=0.1, on_storm_callback=storms)
+    watcher.on_any_event(DirMovedEvent(str(tmp_path / "a" / "old"), str(tmp_path / "b" / "new")))
+
+    assert storms.event.wait(2.0)
+    assert storms.batches == [[tmp_path / "a" / "old", tmp_path / "b" / "new"]]
+    watcher.stop()
+
+
+def test_directory_move_on_full_queue_is_rescanned_as_storm(tmp_path):
+    from watchdog.events import DirMovedEvent
+
+    log, changes, storms = [], Recorder(), Recorder()
+    release = threading.Event()
+
+    def slow_storms(directories):
+        release.wait(2.0)
+        storms(directories)
+
+    watcher = DebouncedLibraryWatcher(
+        CONFIG,
+        changes,
+        debounce_seconds=5.0,
+        max_pending=3,
+        on_move_callback=MoveRecorder(log),
+        on_storm_callback=slow_storms,
+    )
+    for i in range(3):
+        watcher.on_any_event(FileCreatedEvent(str(tmp_path / "new" / f"{i}.mp3")))
+    # Queue is full: the rename must not be lost
+    watcher.on_any_event(DirMovedEvent(str(tmp_path / "music" / "old"), str(tmp_path / "music" / "renamed")))
+    release.set()
+
+    assert storms.event.wait(2.0)
+    assert storms.batches == [[tmp_path / "music" / "old", tmp_path / "music" / "renamed", tmp_path / "new"]]
+    assert log == []
+    stats = watcher.stats()
+    assert (stats["events_dropped"], stats["events_overflowed"]) == (0, 1)
+    watcher.stop()
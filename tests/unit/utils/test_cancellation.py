@@ -0,0 +1,42 @@
+"""Cooperative cancellation: tokens, scopes and checkpoints."""
+
+import threading
+
+import pytest
+
+from psm.utils.cancellation import CancelToken, OperationCancelled, cancel_scope, check_cancelled
+
+
+def test_check_cancelled_is_noop_outside_scope():
+    token = CancelToken()
+    token.cancel()
+    check_cancelled()  # no active token
+
+
+def test_scope_raises_after_cancel_and_resets():
+    token = CancelToken()
+    with cancel_scope(token):
+        check_cancelled()
+        token.cancel()
+        with pytest.raises(OperationCancelled):
+            check_cancelled()
+    check_cancelled()
+    assert token.cancelled
+
+
+def test_scope_is_per_thread():
+    token = CancelToken()
+    token.cancel()
+    errors = []
+
+    def worker():
+        try:
+            check_cancelled()
+        except OperationCancelled as e:
+            errors.append(e)
+
+    with cancel_scope(token):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    assert errors == []
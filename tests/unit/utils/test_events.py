@@ -0,0 +1,119 @@
+"""Tests for structured JSON-lines progress events (psm --events json)."""
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from psm.cli import cli
+from psm.gui.progress_parser import progress_from_event
+from psm.utils import events, progress
+from psm.utils.events import EventEmitter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def captured():
+    lines = []
+    events.enable(lines.append)
+    yield lines
+    events.disable()
+
+
+def _decode(lines):
+    return [json.loads(json.dumps(event)) for event in lines]  # Must be JSON-serializable
+
+
+def test_progress_events_are_throttled_and_coalesced():
+    lines = []
+    clock = FakeClock()
+    emitter = EventEmitter(lines.append, min_interval=10, clock=clock)
+
+    for current in range(1, 50):
+        clock.now = current
+        emitter.progress(item="tracks", current=current, total=100)
+    # First update passes, then one per min_interval
+    assert [e["current"] for e in _decode(lines)] == [1, 11, 21, 31, 41]
+
+    emitter.progress(item="tracks", current=49, total=100)
+    emitter.emit("stage_end", stage="Matching")  # Flushes the held-back update first
+    decoded = _decode(lines)
+    assert [(e["type"], e.get("current")) for e in decoded[-2:]] == [("progress", 49), ("stage_end", None)]
+
+    emitter.progress(item="tracks", current=100, total=100)  # Final update is never dropped
+    assert _decode(lines)[-1]["current"] == 100
+    assert emitter.coalesced > 0
+
+
+def test_progress_logger_emits_typed_events(captured, capsys):
+    progress.step(1, 4, "Scanning changed files")
+    progress.items(50, 200, "files")
+    progress.status("Found 3 files")
+    progress.warning("1 file unreadable")
+    progress.complete("Incremental rebuild", 1.5)
+
+    decoded = _decode(captured)
+    assert [e["type"] for e in decoded] == ["stage_start", "progress", "status", "warning", "stage_end"]
+    assert decoded[0] == {**decoded[0], "stage": "Scanning changed files", "step": 1, "total_steps": 4, "v": 1}
+    assert decoded[1]["current"] == 50 and decoded[1]["total"] == 200 and decoded[1]["item"] == "files"
+    assert decoded[4]["elapsed"] == 1.5
+    # Human output is unchanged
+    assert "[1/4] Scanning changed files" in capsys.readouterr().out
+
+
+def test_log_progress_reports_rate_and_eta(captured):
+    from psm.utils.logging_helpers import log_progress
+
+    log_progress(processed=200, total=1000, new=150, skipped=50, elapsed_seconds=2.0, item_name="tracks")
+    (event,) = _decode(captured)
+    assert event["rate"] == 100.0
+    assert event["eta"] == 8.0
+    assert event["new"] == 150 and event["skipped"] == 50 and "updated" not in event
+
+
+def test_events_disabled_is_a_no_op(capsys):
+    assert not events.is_enabled()
+    progress.status("hello")
+    events.progress(1, 2, "items")
+    assert capsys.readouterr().out == "→ hello\n"
+
+
+def test_cli_events_json_writes_to_events_fd(test_config, monkeypatch):
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setenv("PSM_EVENTS_FD", str(write_fd))
+    monkeypatch.setenv("PSM_SKIP_FIRST_RUN_CHECK", "1")
+
+    result = CliRunner().invoke(cli, ["--events", "json", "match"], obj=test_config)
+    assert result.exit_code == 0, result.output
+    assert not events.is_enabled()  # Closed with the command context
+
+    with open(read_fd, encoding="utf-8") as stream:
+        decoded = [json.loads(line) for line in stream]
+    assert decoded[0]["type"] == "stage_start" and decoded[0]["stage"] == "Matching tracks"
+    assert decoded[-1]["type"] == "stage_end"
+    assert '"type"' not in result.output  # Events never mix into the log output
+
+
+def test_progress_from_event_maps_without_parsing():
+    assert progress_from_event({"type": "stage_start", "stage": "Export", "step": 3, "total_steps": 4}) == (
+        3,
+        4,
+        "Export",
+    )
+    assert progress_from_event({"type": "stage_start", "stage": "Matching tracks"}) == (0, 0, "→ Matching tracks")
+    assert progress_from_event({"type": "progress", "item": "tracks", "current": 5, "total": 10, "eta": 2.4}) == (
+        5,
+        10,
+        "tracks: 5/10 (~2s left)",
+    )
+    assert progress_from_event({"type": "progress", "item": "files", "current": 7}) == (7, 0, "files: 7")
+    assert progress_from_event({"type": "stage_end", "stage": "Matching tracks"}) == (100, 100, "✓ Matching tracks")
+    assert progress_from_event({"type": "warning", "message": "x"}) is None
@@ -0,0 +1,70 @@
+"""PathMapper: library-root reconstruction and relative paths for M3U export."""
+
+from pathlib import Path
+
+import pytest
+
+from psm.utils import path_format
+from psm.utils.path_format import PathMapper, format_path_for_m3u
+
+
+def _symlink(link: Path, target: Path) -> None:
+    try:
+        link.symlink_to(target, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        # Skip if symlinks not supported (e.g., Windows without admin)
+        pytest.skip("Symlinks not supported on this system")
+
+
+def _mapped_library(tmp_path: Path) -> tuple[Path, Path]:
+    """A configured root (symlink) that resolves to a different location, like Z:\\ -> \\\\server\\share."""
+    share = tmp_path / "share" / "music"
+    (share / "Artist").mkdir(parents=True)
+    drive = tmp_path / "Z"
+    _symlink(drive, share)
+    return share, drive
+
+
+def test_reconstructs_paths_under_configured_root(tmp_path: Path):
+    share, drive = _mapped_library(tmp_path)
+    mapper = PathMapper("absolute", [str(tmp_path / "elsewhere"), str(drive)])
+
+    stored = share.resolve() / "Artist" / "song.mp3"
+    assert mapper.format(str(stored), tmp_path / "out" / "p.m3u") == str(drive / "Artist" / "song.mp3")
+    other = str(tmp_path / "other" / "song.mp3")
+    assert mapper.format(other, tmp_path / "out" / "p.m3u") == other
+    assert format_path_for_m3u(str(stored), tmp_path / "p.m3u", "absolute", [str(drive)]) == str(
+        drive / "Artist" / "song.mp3"
+    )
+
+
+def test_most_specific_root_wins(tmp_path: Path):
+    share, drive = _mapped_library(tmp_path)
+    artist = tmp_path / "A"
+    _symlink(artist, share / "Artist")
+    mapper = PathMapper("absolute", [str(drive), str(artist)])
+
+    stored = share.resolve() / "Artist" / "song.mp3"
+    assert mapper.format(str(stored), tmp_path / "p.m3u") == str(artist / "song.mp3")
+
+
+def test_roots_resolved_once(tmp_path: Path, monkeypatch):
+    _, drive = _mapped_library(tmp_path)
+    calls = []
+    real_resolve = Path.resolve
+    monkeypatch.setattr(path_format.Path, "resolve", lambda self, *a: calls.append(self) or real_resolve(self, *a))
+
+    mapper = PathMapper("absolute", [str(drive)])
+    for i in range(100):
+        mapper.format(f"/music/{i}.mp3", tmp_path / "p.m3u")
+    assert len(calls) == 1
+
+
+def test_relative_paths_per_playlist_directory(tmp_path: Path):
+    mapper = PathMapper("relative")
+    song = tmp_path / "music" / "Artist" / "song.mp3"
+
+    assert mapper.format(song, tmp_path / "p.m3u") == str(Path("music") / "Artist" / "song.mp3")
+    assert mapper.format(song, tmp_path / "music" / "p.m3u") == str(Path("Artist") / "song.mp3")
+    # Not below the playlist directory: falls back to absolute
+    assert mapper.format(song, tmp_path / "lists" / "p.m3u") == str(song)